@@ -0,0 +1,82 @@
+"""
+Groundedness evidence matching: all-pairs difflib vs the pruned vocabulary matcher.
+
+Builds --messages synthetic messages, each with --chunks knowledge-base
+chunks of about --chunk-words words and --sentences evidence sentences
+(some words with typos), and times TextComparer.string_in_text against the
+previous all-pairs comparison. Both must agree on every pair.
+
+Usage: python contrib/benchmarks/groundedness_matcher.py [--messages 20] [--chunks 5] [--chunk-words 800]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nexus.settings")
+
+
+def _before(sentence, text, similarity_threshold=0.8):
+    return all(
+        any(SequenceMatcher(None, keyword, word).ratio() >= similarity_threshold for word in text.split())
+        for keyword in sentence.split()
+    )
+
+
+def _corpus(rng, messages, chunks, chunk_words, sentences):
+    vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 11))) for _ in range(5000)]
+    # Word frequencies follow a Zipf distribution, as in natural-language KB text.
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    corpus = []
+    for _ in range(messages):
+        texts = [" ".join(rng.choices(vocabulary, weights, k=chunk_words)) for _ in range(chunks)]
+        evidence = []
+        for _ in range(sentences):
+            words = rng.choice(texts).split()
+            start = rng.randrange(len(words) - 20)
+            sentence = words[start : start + rng.randint(8, 20)]
+            if rng.random() < 0.5:
+                position = rng.randrange(len(sentence))
+                sentence[position] = rng.choice(vocabulary)
+            evidence.append(" ".join(sentence))
+        corpus.append((texts, evidence))
+    return corpus
+
+
+def _run(corpus, matcher):
+    start = time.perf_counter()
+    results = [matcher(sentence, text) for texts, evidence in corpus for sentence in evidence for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--chunks", type=int, default=5)
+    parser.add_argument("--chunk-words", type=int, default=800)
+    parser.add_argument("--sentences", type=int, default=8)
+    args = parser.parse_args()
+    django.setup()
+
+    from nexus.logs.models import TextComparer
+
+    corpus = _corpus(random.Random(38), args.messages, args.chunks, args.chunk_words, args.sentences)
+    pairs = args.messages * args.chunks * args.sentences
+    before, expected = _run(corpus, _before)
+    after, results = _run(corpus, TextComparer.string_in_text)
+
+    assert results == expected, "matcher disagrees with the all-pairs comparison"
+    print(f"{pairs} sentence/chunk pairs, {args.chunk_words} words per chunk, {sum(results)} grounded")
+    print(f"all-pairs difflib   {before * 1000:10.1f} ms  {before * 1e3 / pairs:8.2f} ms/pair")
+    print(f"pruned vocabulary   {after * 1000:10.1f} ms  {after * 1e3 / pairs:8.2f} ms/pair  ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Signing overhead of per-turn tool JWTs, per 1,000 turns.
+
+Compares signing from the PEM string on every turn (previous behaviour),
+signing with the parsed key, and the cached JWTUsecase, for RS256 and EdDSA.
+
+Usage: python contrib/benchmarks/jwt_signing.py [--turns 1000] [--projects 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import django
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.conf import settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _private_pem(private_key) -> str:
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+KEYS = {
+    "RS256": _private_pem(rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+    "EdDSA": _private_pem(ed25519.Ed25519PrivateKey.generate()),
+}
+
+
+def _before(turns: int, projects: int, algorithm: str) -> float:
+    from datetime import datetime, timedelta, timezone
+
+    start = time.perf_counter()
+    for turn in range(turns):
+        now = datetime.now(timezone.utc)
+        payload = {"project_uuid": f"project-{turn % projects}", "exp": now + timedelta(hours=1), "iat": now}
+        jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=algorithm)
+    return time.perf_counter() - start
+
+
+def _parsed_key(turns: int, projects: int, algorithm: str) -> float:
+    from nexus.usecases.jwt.jwt_usecase import JWTUsecase
+
+    usecase = JWTUsecase()
+    start = time.perf_counter()
+    for turn in range(turns):
+        usecase._encode({"project_uuid": f"project-{turn % projects}"})
+    return time.perf_counter() - start
+
+
+def _cached(turns: int, projects: int, algorithm: str) -> float:
+    from nexus.usecases.jwt.jwt_usecase import JWTUsecase, clear_jwt_token_cache
+
+    clear_jwt_token_cache()
+    usecase = JWTUsecase()
+    start = time.perf_counter()
+    for turn in range(turns):
+        usecase.generate_jwt_token(f"project-{turn % projects}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=20)
+    args = parser.parse_args()
+
+    settings.configure(
+        JWT_SECRET_KEY=KEYS["RS256"],
+        JWT_SIGNING_ALGORITHM="RS256",
+        JWT_TOKEN_REUSE_MARGIN_SECONDS=300,
+        JWT_TOKEN_CACHE_MAX_ENTRIES=10000,
+        OIDC_RP_EMAIL="bench@example.com",
+    )
+    django.setup()
+
+    print(f"pyjwt {jwt.__version__}, {args.turns} turns over {args.projects} projects")
+    for algorithm, key in KEYS.items():
+        settings.JWT_SECRET_KEY = key
+        settings.JWT_SIGNING_ALGORITHM = algorithm
+        for label, runner in (("before", _before), ("parsed key", _parsed_key), ("token cache", _cached)):
+            elapsed = runner(args.turns, args.projects, algorithm)
+            print(f"{algorithm:6} {label:16} {elapsed * 1000:9.2f} ms total  {elapsed * 1e6 / args.turns:8.1f} us/turn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Knowledge-base multipart upload: serial part loop vs ConcurrentMultipartUploader.
+
+Uploads a --size-mb file of random bytes to a local S3 stand-in with the
+previous one-part-at-a-time loop, then with the concurrent uploader at each
+--concurrency level, and prints throughput. --latency-ms adds a fixed delay to
+every UploadPart request to model the round trip to a remote region, which is
+what concurrency hides.
+
+The stand-in is --endpoint-url (MinIO, LocalStack, ...) if given, otherwise
+moto's in-process S3 mock (pip install moto).
+
+Usage: python contrib/benchmarks/multipart_upload.py [--size-mb 200] [--latency-ms 80] [--concurrency 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nexus.settings")
+
+BUCKET = "nexus-multipart-bench"
+PART_SIZE = 5 * 1024 * 1024
+
+
+def _before(s3_client, key, file):
+    upload_id = s3_client.create_multipart_upload(Bucket=BUCKET, Key=key)["UploadId"]
+    parts = []
+    part_number = 1
+    while data := file.read(PART_SIZE):
+        response = s3_client.upload_part(Bucket=BUCKET, Key=key, PartNumber=part_number, UploadId=upload_id, Body=data)
+        parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+        part_number += 1
+    s3_client.complete_multipart_upload(Bucket=BUCKET, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts})
+
+
+def _after(s3_client, key, file, concurrency, size):
+    from nexus.task_managers.file_database.multipart import ConcurrentMultipartUploader
+
+    ConcurrentMultipartUploader(s3_client, BUCKET, key, max_workers=concurrency, max_retries=0).upload(file, size=size)
+
+
+def _client(endpoint_url, latency_ms, concurrency):
+    import boto3
+    from botocore.config import Config
+
+    client = boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        region_name="us-east-1",
+        aws_access_key_id=os.environ.get("AWS_ACCESS_KEY_ID", "bench"),
+        aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY", "bench"),
+        config=Config(max_pool_connections=max(concurrency, 10)),
+    )
+    if latency_ms:
+        client.meta.events.register("before-send.s3.UploadPart", lambda **kwargs: time.sleep(latency_ms / 1000))
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--endpoint-url")
+    args = parser.parse_args()
+    django.setup()
+
+    mock = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        from moto import mock_s3
+
+        mock = mock_s3()
+        mock.start()
+
+    try:
+        size = args.size_mb * 1024 * 1024
+        content = os.urandom(size)
+        setup_client = _client(endpoint_url, 0, 1)
+        setup_client.create_bucket(Bucket=BUCKET)
+        print(f"{args.size_mb} MB to {endpoint_url or 'moto'}, +{args.latency_ms:g} ms per part request")
+
+        runs = [("serial 5 MB parts", lambda client: _before(client, "serial", BytesIO(content)), 1)]
+        for concurrency in args.concurrency:
+            runs.append(
+                (
+                    f"concurrent x{concurrency}",
+                    lambda client, c=concurrency: _after(client, f"concurrent-{c}", BytesIO(content), c, size),
+                    concurrency,
+                )
+            )
+        for label, run, concurrency in runs:
+            client = _client(endpoint_url, args.latency_ms, concurrency)
+            start = time.perf_counter()
+            run(client)
+            elapsed = time.perf_counter() - start
+            print(f"{label:20} {elapsed:7.2f} s {args.size_mb / elapsed:8.1f} MB/s")
+    finally:
+        if mock is not None:
+            mock.stop()
+
+
+if __name__ == "__main__":
+    main()
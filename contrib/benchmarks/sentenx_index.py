@@ -0,0 +1,121 @@
+"""
+SentenX bulk indexing: one requests.put per document vs the pooled client.
+
+Starts a local stub of the SentenX index endpoint that answers every PUT after
+--latency-ms, then indexes --documents link documents three ways: the previous
+per-call requests.put, the pooled session one document at a time, and
+SentenXFileDataBase.index_documents at each --concurrency level. Prints
+throughput and how many TCP connections the stub accepted.
+
+Usage: python contrib/benchmarks/sentenx_index.py [--documents 400] [--latency-ms 20] [--concurrency 1 4 8 16]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nexus.settings")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle and delayed ACKs stall keep-alive clients.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+        time.sleep(self.server.latency)
+        payload = b'{"status": "indexing"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _stub(latency):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.lock = threading.Lock()
+    server.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _tasks(count):
+    return [
+        Mock(
+            uuid=f"task-{n}",
+            content_base_link=Mock(link=f"https://example.com/{n}", uuid=f"link-{n}", content_base=Mock(uuid="cb")),
+        )
+        for n in range(count)
+    ]
+
+
+def _before(sentenx, tasks):
+    import requests
+    from django.conf import settings
+
+    for task in tasks:
+        body = sentenx._link_body(task)
+        requests.put(url=settings.SENTENX_BASE_URL + "/content_base/index", headers=sentenx.headers, json=body)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+    django.setup()
+
+    from django.conf import settings
+
+    from nexus.task_managers.file_database import sentenx_file_database
+    from nexus.task_managers.file_database.sentenx_file_database import SentenXFileDataBase, _build_session
+
+    settings.SENTENX_POOL_MAXSIZE = max(args.concurrency)
+    sentenx_file_database._session = _build_session()
+    sentenx = SentenXFileDataBase()
+    tasks = _tasks(args.documents)
+    print(f"{args.documents} documents, +{args.latency_ms:g} ms per index request")
+
+    runs = [
+        ("requests.put per call", lambda: _before(sentenx, tasks)),
+        ("pooled, one at a time", lambda: [sentenx.add_link(task, None) for task in tasks]),
+    ]
+    for concurrency in args.concurrency:
+        runs.append(
+            (
+                f"index_documents x{concurrency}",
+                lambda c=concurrency: sentenx.index_documents(tasks, "link", None, max_workers=c),
+            )
+        )
+
+    for label, run in runs:
+        server = _stub(args.latency_ms / 1000)
+        settings.SENTENX_BASE_URL = f"http://127.0.0.1:{server.server_port}"
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        rate = args.documents / elapsed
+        print(f"{label:24} {elapsed:7.2f} s {rate:8.1f} docs/s {len(server.connections):5} connections")
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Tag percentage dashboard query: four-query version vs single conditional aggregate.
+
+Seeds a throwaway project with --rows message logs spread over --days days
+(inside a transaction that is rolled back), then times the previous
+exists() + three count() queries over ``created_at__date`` against
+TagPercentageViewSet._tag_percentages, and prints the plan of the latter.
+
+Needs a migrated Postgres database (DJANGO_SETTINGS_MODULE=nexus.settings).
+
+Usage: python contrib/benchmarks/tag_percentage.py [--rows 1000000] [--days 90] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nexus.settings")
+
+SEED_SQL = """
+CREATE TEMP TABLE bench_tag_rows ON COMMIT DROP AS
+SELECT n, gen_random_uuid() AS message_uuid, now() - (n %% (%(days)s * 86400)) * interval '1 second' AS created_at
+FROM generate_series(1, %(rows)s) AS n;
+
+INSERT INTO logs_message (uuid, text, contact_urn, status, exception, created_at, response_status_cache)
+SELECT message_uuid, '', 'tel:0', CASE WHEN n %% 20 = 0 THEN 'F' ELSE 'S' END, '', created_at,
+       CASE WHEN n %% 3 = 0 THEN 'F' ELSE 'S' END
+FROM bench_tag_rows;
+
+INSERT INTO logs_messagelog (message_id, prompt, llm_response, project_id, created_at, source, reflection_data)
+SELECT message_uuid, '', '', %(project)s, created_at, 'router',
+       jsonb_build_object('tag', CASE WHEN n %% 2 = 0 THEN 'action_started' ELSE 'other' END)
+FROM bench_tag_rows;
+
+ANALYZE logs_message;
+ANALYZE logs_messagelog;
+"""
+
+
+def _before(project_uuid, started_day, ended_day):
+    from nexus.logs.models import MessageLog
+
+    base_query = (
+        MessageLog.objects.select_related("message")
+        .filter(
+            created_at__date__gte=started_day,
+            created_at__date__lte=ended_day,
+            reflection_data__tag__isnull=False,
+            source="router",
+            project__uuid=str(project_uuid),
+        )
+        .exclude(message__status="F")
+    )
+    if not base_query.exists():
+        return {}
+    status_logs_base = base_query.exclude(reflection_data__tag="action_started")
+    return {
+        "action_count": base_query.filter(reflection_data__tag="action_started").count(),
+        "succeed_count": status_logs_base.filter(message__response_status_cache="S").count(),
+        "failed_count": status_logs_base.filter(message__response_status_cache="F").count(),
+    }
+
+
+def _after(project_uuid, started_day, ended_day):
+    from nexus.logs.api.views import TagPercentageViewSet
+
+    return TagPercentageViewSet._tag_percentages(project_uuid, "router", started_day, ended_day)
+
+
+def _best_of(repeat, runner, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        runner(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    django.setup()
+
+    import pendulum
+    from django.db import connection, transaction
+    from django.test.utils import CaptureQueriesContext
+
+    from nexus.usecases.projects.tests.project_factory import ProjectFactory
+
+    with transaction.atomic():
+        project = ProjectFactory()
+        with connection.cursor() as cursor:
+            cursor.execute(SEED_SQL, {"rows": args.rows, "days": args.days, "project": str(project.uuid)})
+
+        ended_day = pendulum.now().date()
+        started_day = ended_day.subtract(months=1)
+        print(f"{args.rows} message logs over {args.days} days, range {started_day} .. {ended_day}")
+        for label, runner in (("4 queries, __date", _before), ("1 aggregate, range", _after)):
+            elapsed = _best_of(args.repeat, runner, project.uuid, started_day, ended_day)
+            print(f"{label:20} {elapsed * 1000:9.1f} ms (best of {args.repeat})")
+
+        with CaptureQueriesContext(connection) as queries:
+            _after(project.uuid, started_day, ended_day)
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {queries.captured_queries[-1]['sql']}")
+            print("\n".join(row[0] for row in cursor.fetchall()))
+
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Flows report topic classification: a TfidfVectorizer per contact vs TopicClassifier.
+
+Builds --contacts synthetic conversations from the report's topic phrases
+plus filler words, times the previous per-contact fit on --baseline-sample
+of them (extrapolated to the full set), then times TopicClassifier on all of
+them (peak memory measured on a second run) and checks that both agree on
+the sample.
+
+Usage: python contrib/benchmarks/topic_classification.py [--contacts 50000] [--baseline-sample 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nexus.settings")
+
+
+def _conversations(groups, count, seed=7):
+    rng = random.Random(seed)
+    phrase_words = [word for subgroups in groups.values() for subgroup in subgroups for word in subgroup.split()]
+    filler = ["oi", "bom", "dia", "obrigado", "pedido", "quando", "chega", "preciso", "ajuda", "meu", "nao", "veio"]
+    conversations = []
+    for _ in range(count):
+        words = rng.choices(phrase_words, k=rng.randint(1, 8)) + rng.choices(filler, k=rng.randint(5, 60))
+        rng.shuffle(words)
+        conversations.append([{"text": " ".join(words[i : i + 8])} for i in range(0, len(words), 8)])
+    return conversations
+
+
+def _before(groups, conversations):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    group_mapping = [(group, subgroup) for group, subgroups in groups.items() for subgroup in subgroups]
+    phrases = [subgroup.lower() for _, subgroup in group_mapping]
+    results = []
+    for messages in conversations:
+        text = " ".join(m["text"] for m in messages if m.get("text")).lower()
+        tfidf_matrix = TfidfVectorizer().fit_transform([text] + phrases)
+        similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])
+        best_match_index = similarities.argmax()
+        if similarities[0, best_match_index] >= 0.1:
+            results.append(group_mapping[best_match_index])
+        else:
+            results.append(("Não Classificado", "Não Classificado (Similaridade Baixa)"))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=50000)
+    parser.add_argument("--baseline-sample", type=int, default=2000)
+    args = parser.parse_args()
+    django.setup()
+
+    from nexus.reports.flows_report.generate_output import TopicClassifier, groups
+
+    conversations = _conversations(groups, args.contacts)
+    sample = conversations[: args.baseline_sample]
+    print(f"{args.contacts} contacts, {sum(len(s) for s in groups.values())} topic phrases")
+
+    start = time.perf_counter()
+    expected = _before(groups, sample)
+    per_contact = (time.perf_counter() - start) / len(sample)
+    before = per_contact * args.contacts
+    print(f"{'vectorizer per contact':24} {before:8.2f} s (extrapolated from {len(sample)} contacts)")
+
+    classifier = TopicClassifier(groups)
+    start = time.perf_counter()
+    results = classifier.classify_many(conversations)
+    after = time.perf_counter() - start
+
+    tracemalloc.start()
+    classifier.classify_many(conversations)
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    print(f"{'TopicClassifier':24} {after:8.2f} s {before / after:6.1f}x faster, peak {peak:.1f} MiB")
+
+    agree = sum(a == b for a, b in zip(results, expected))
+    print(f"agreement on sample: {agree}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -175,7 +175,7 @@ class BedrockBackend(InlineAgentsBackend):
         )
 
         typing_usecase = TypingUsecase()
-        typing_usecase.send_typing_message(
+        typing_usecase.dispatch_typing_message(
             contact_urn=contact_urn, msg_external_id=msg_external_id, project_uuid=project_uuid, preview=preview
         )
 
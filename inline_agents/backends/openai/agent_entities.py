@@ -11,6 +11,7 @@ from django.conf import settings
 from openai.types.shared import Reasoning
 
 from inline_agents.backends.openai.entities import Context
+from nexus.cache import retrieval_cache
 from nexus.utils import get_datasource_id
 
 logger = logging.getLogger(__name__)
@@ -252,39 +253,44 @@ class Supervisor(Agent[Context], AgentModel):  # type: ignore[misc]
             question (str): Natural-language query. Example: "What are your shipping policies?"
         """
 
-        client = boto3.client("bedrock-agent-runtime", region_name=settings.AWS_BEDROCK_REGION_NAME)
         content_base_uuid: str | None = ctx.context.content_base.get("uuid")
+        data_source_id = get_datasource_id(ctx.context.project.get("uuid"))
 
-        retrieve_params = {
-            "knowledgeBaseId": settings.AWS_BEDROCK_KNOWLEDGE_BASE_ID,
-            "retrievalQuery": {"text": question},
-        }
+        def retrieve() -> str:
+            client = boto3.client("bedrock-agent-runtime", region_name=settings.AWS_BEDROCK_REGION_NAME)
 
-        combined_filter = {
-            "andAll": [
-                {"equals": {"key": "contentBaseUuid", "value": content_base_uuid}},
-                {
-                    "equals": {
-                        "key": "x-amz-bedrock-kb-data-source-id",
-                        "value": get_datasource_id(ctx.context.project.get("uuid")),
-                    }
-                },
-            ]
-        }
+            retrieve_params = {
+                "knowledgeBaseId": settings.AWS_BEDROCK_KNOWLEDGE_BASE_ID,
+                "retrievalQuery": {"text": question},
+            }
 
-        if content_base_uuid:
-            retrieve_params["retrievalConfiguration"] = {
-                "vectorSearchConfiguration": {
-                    "filter": combined_filter,
-                }
+            combined_filter = {
+                "andAll": [
+                    {"equals": {"key": "contentBaseUuid", "value": content_base_uuid}},
+                    {"equals": {"key": "x-amz-bedrock-kb-data-source-id", "value": data_source_id}},
+                ]
             }
 
-        response = client.retrieve(**retrieve_params)
+            if content_base_uuid:
+                retrieve_params["retrievalConfiguration"] = {
+                    "vectorSearchConfiguration": {
+                        "filter": combined_filter,
+                    }
+                }
+
+            response = client.retrieve(**retrieve_params)
 
-        if response.get("retrievalResults"):
-            all_results = []
-            for result in response["retrievalResults"]:
-                all_results.append(result["content"]["text"])
-            return "\n".join(all_results)
+            if response.get("retrievalResults"):
+                all_results = []
+                for result in response["retrievalResults"]:
+                    all_results.append(result["content"]["text"])
+                return "\n".join(all_results)
 
-        return "No response found in knowledge base."
+            return "No response found in knowledge base."
+
+        # Without a content base there is no filter, and nothing to invalidate the entry by.
+        if not content_base_uuid:
+            return retrieve()
+        return retrieval_cache.get_or_retrieve(
+            settings.AWS_BEDROCK_KNOWLEDGE_BASE_ID, data_source_id, content_base_uuid, question, None, retrieve
+        )
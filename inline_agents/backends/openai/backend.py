@@ -4,6 +4,7 @@ import hashlib
 import json
 import logging
 import re
+import threading
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -309,6 +310,7 @@ class OpenAIBackend(InlineAgentsBackend):
         manager_pipeline_version = kwargs.pop("manager_pipeline_version", None)
         supervisor_agent_uuid = kwargs.pop("supervisor_agent_uuid", None)
         injected_context = kwargs.pop("injected_context", None)
+        cancel_event = kwargs.pop("cancel_event", None)
         prompt_injection_filter_enabled = bool(kwargs.pop("prompt_injection_filter_enabled", False))
         kwargs.pop("guardrails_config", None)
         rationale_switch = rationale_switch_cached
@@ -575,6 +577,7 @@ class OpenAIBackend(InlineAgentsBackend):
                     formatter_agent_configurations=formatter_agent_configurations,
                     manager_pipeline_version=manager_pipeline_version,
                     injected_context=injected_context,
+                    cancel_event=cancel_event,
                 )
             )
 
@@ -904,6 +907,7 @@ class OpenAIBackend(InlineAgentsBackend):
         formatter_agent_configurations: Optional[Dict[str, Any]] = None,
         manager_pipeline_version: Optional[str] = None,
         injected_context: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Async wrapper to handle the streaming response"""
         with self.langfuse_c.start_as_current_span(name="OpenAI Agents trace: Agent workflow") as root_span:
@@ -934,6 +938,9 @@ class OpenAIBackend(InlineAgentsBackend):
                 )
 
                 delta_counter = 0
+                cancel_watcher = None
+                if cancel_event is not None:
+                    cancel_watcher = asyncio.create_task(self._cancel_run_when_set(result, cancel_event))
                 try:
                     # Only stream events if the result has stream_events method
                     stream_events = getattr(result, "stream_events", None)
@@ -1040,6 +1047,14 @@ class OpenAIBackend(InlineAgentsBackend):
                         _is_final_out_debug("E skip_components_merge=True (skip_outgoing_dispatch)")
 
                     return final_response
+                finally:
+                    if cancel_watcher is not None:
+                        cancel_watcher.cancel()
+
+                if cancel_event is not None and cancel_event.is_set():
+                    # The input guardrail blocked this turn mid-run; the caller sends the blocking message.
+                    logger.info("[OpenAIBackend] Run cancelled - project_uuid: %s", project_uuid)
+                    return ""
 
                 final_response = self._get_final_response(result)
 
@@ -1109,6 +1124,13 @@ class OpenAIBackend(InlineAgentsBackend):
 
             return final_response
 
+    @staticmethod
+    async def _cancel_run_when_set(result, cancel_event: threading.Event) -> None:
+        """Stop a streamed run once the caller signals it (e.g. the speculative guardrail blocked the input)."""
+        while not cancel_event.is_set():
+            await asyncio.sleep(0.05)
+        result.cancel()
+
     def _get_final_response(self, result):
         if isinstance(result.final_output, FinalResponse):
             final_response = result.final_output.final_response
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import pendulum
@@ -984,3 +986,14 @@ class TestInvokeAgentsAsyncFailurePath(TestCase):
         self.assertEqual(result.text, _TEST_ERROR_MESSAGES["en-us"])
         grpc_session.close.assert_called()
         grpc_client.close.assert_called()
+
+
+class CancelRunWhenSetTestCase(TestCase):
+    def test_run_is_cancelled_once_the_event_is_set(self):
+        result = MagicMock()
+        cancel_event = threading.Event()
+        threading.Timer(0.05, cancel_event.set).start()
+
+        asyncio.run(asyncio.wait_for(OpenAIBackend._cancel_run_when_set(result, cancel_event), timeout=2))
+
+        result.cancel.assert_called_once_with()
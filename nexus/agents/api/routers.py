@@ -14,6 +14,7 @@ from nexus.inline_agents.api.views import (
     ProjectActiveAgentsConfigView,
     ProjectEngineSourceView,
     ProjectModelProvidersView,
+    PushAgentsProgress,
 )
 from nexus.inline_agents.api.views import AgentsView as InlineAgentsView
 from nexus.inline_agents.api.views import ProjectComponentsView as InlineProjectComponentsView
@@ -31,6 +32,7 @@ from nexus.reports.views import ReportView
 
 urlpatterns = [
     path("agents/push", PushInlineAgents.as_view(), name="push-agents"),
+    path("agents/push/<str:job_id>", PushAgentsProgress.as_view(), name="push-agents-progress"),
     path("agents/<str:agent_uuid>/projects", AgentProjectsView.as_view(), name="agent-projects"),
     path("v1/official/agents", OfficialAgentsV1.as_view(), name="v1-official-agents"),
     path(
@@ -0,0 +1,17 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("agents", "0013_agent_source_type"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="agentmessage",
+            index=models.Index(fields=["project", "created_at", "id"], name="agents_msg_proj_created_id"),
+        ),
+    ]
@@ -216,6 +216,11 @@ class AgentMessage(models.Model):
     metadata = models.JSONField(default=dict)
     source = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "created_at", "id"], name="agents_msg_proj_created_id"),
+        ]
+
     def __str__(self):
         return f"AgentMessage - {self.contact_urn}"
 
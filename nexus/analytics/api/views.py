@@ -1,15 +1,16 @@
 from uuid import UUID
 
 import pendulum
-from django.db.models import Count, Q
+from django.db.models import Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils.dateparse import parse_date
 from mozilla_django_oidc.contrib.drf import OIDCAuthentication
 from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from nexus.analytics.models import ConversationDailyFact
 from nexus.authentication.authentication import ExternalTokenAuthentication
-from nexus.intelligences.models import Conversation
 from nexus.orgs import permissions as org_permissions
 from nexus.projects.models import Project
 from nexus.users.api.authentication import UserGlobalTokenAuthentication
@@ -59,6 +60,27 @@ def get_motor_from_backend(backend):
     return None
 
 
+def conversation_facts(start_date, end_date, project_uuid=None, motor=None):
+    """
+    Daily conversation counts (ConversationDailyFact) for the period.
+
+    Motor is resolved through the project's current backend, as the live
+    conversation queries did.
+    """
+    facts = ConversationDailyFact.objects.filter(day__gte=start_date, day__lte=end_date, count__gt=0)
+    if project_uuid:
+        facts = facts.filter(project__uuid=project_uuid)
+    if motor:
+        facts = facts.filter(project__agents_backend=MOTOR_BACKEND_MAP[motor])
+    return facts
+
+
+def sum_conversations(resolution=None):
+    """Sum of fact counts, optionally for one resolution; 0 instead of NULL when nothing matches."""
+    resolution_filter = Q(resolution=resolution) if resolution is not None else None
+    return Coalesce(Sum("count", filter=resolution_filter), 0)
+
+
 def validate_and_parse_dates(start_date_str, end_date_str):
     """Validate and parse date strings, returning defaults if not provided"""
     if not start_date_str:
@@ -180,30 +202,17 @@ class ResolutionRateAverageView(APIView):
         min_conversations = params["min_conversations"]
         project_uuid = params["project_uuid"]
 
-        conversations = (
-            Conversation.objects.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date,
-                resolution__in=["0", "1", "2", "3", "4"],
-            )
-            .exclude(resolution__isnull=True)
-            .select_related("project")
+        facts = conversation_facts(start_date, end_date, project_uuid, motor).filter(
+            resolution__in=["0", "1", "2", "3", "4"]
         )
 
-        if project_uuid:
-            conversations = conversations.filter(project__uuid=project_uuid)
-
-        if motor:
-            backend_value = MOTOR_BACKEND_MAP[motor]
-            conversations = conversations.filter(project__agents_backend=backend_value)
-
-        project_stats = conversations.values("project__uuid").annotate(
-            total_conversations=Count("uuid"),
-            resolved_cnt=Count("uuid", filter=Q(resolution="0")),
-            unresolved_cnt=Count("uuid", filter=Q(resolution="1")),
-            in_progress_cnt=Count("uuid", filter=Q(resolution="2")),
-            unclassified_cnt=Count("uuid", filter=Q(resolution="3")),
-            has_chat_cnt=Count("uuid", filter=Q(resolution="4")),
+        project_stats = facts.values("project__uuid").annotate(
+            total_conversations=sum_conversations(),
+            resolved_cnt=sum_conversations("0"),
+            unresolved_cnt=sum_conversations("1"),
+            in_progress_cnt=sum_conversations("2"),
+            unclassified_cnt=sum_conversations("3"),
+            has_chat_cnt=sum_conversations("4"),
         )
 
         if min_conversations is not None:
@@ -317,28 +326,16 @@ class ResolutionRateIndividualView(APIView):
         filter_project_uuid = request.query_params.get("filter_project_uuid")
         filter_project_name = request.query_params.get("filter_project_name")
 
-        # Build base query across all projects
-        conversations = Conversation.objects.filter(
-            created_at__date__gte=start_date,
-            created_at__date__lte=end_date,
-        ).select_related("project")
-
-        # Filter by project_uuid if provided
-        if project_uuid:
-            conversations = conversations.filter(project__uuid=project_uuid)
-
-        # Filter by motor if provided
-        if motor:
-            backend_value = MOTOR_BACKEND_MAP[motor]
-            conversations = conversations.filter(project__agents_backend=backend_value)
+        # Daily facts across all projects (or the given project / motor)
+        facts = conversation_facts(start_date, end_date, project_uuid, motor)
 
         # Group by project and calculate metrics
         project_stats = (
-            conversations.values("project__uuid", "project__name", "project__agents_backend")
+            facts.values("project__uuid", "project__name", "project__agents_backend")
             .annotate(
-                total=Count("uuid"),
-                resolved=Count("uuid", filter=Q(resolution="0")),
-                unresolved=Count("uuid", filter=Q(resolution="1")),
+                total=sum_conversations(),
+                resolved=sum_conversations("0"),
+                unresolved=sum_conversations("1"),
             )
             .order_by("-total")
         )
@@ -429,33 +426,21 @@ class UnresolvedRateView(APIView):
         min_conversations = params["min_conversations"]
         project_uuid = params["project_uuid"]
 
-        # Build base query (across all projects, or filtered by project_uuid)
-        conversations = Conversation.objects.filter(
-            created_at__date__gte=start_date,
-            created_at__date__lte=end_date,
-        ).select_related("project")
-
-        # Filter by project_uuid if provided
-        if project_uuid:
-            conversations = conversations.filter(project__uuid=project_uuid)
-
-        # Filter by motor if provided
-        if motor:
-            backend_value = MOTOR_BACKEND_MAP[motor]
-            conversations = conversations.filter(project__agents_backend=backend_value)
+        # Daily facts across all projects (or filtered by project_uuid / motor)
+        facts = conversation_facts(start_date, end_date, project_uuid, motor)
 
         # Filter by min_conversations
         if min_conversations is not None:
             project_counts = (
-                conversations.values("project__uuid").annotate(count=Count("uuid")).filter(count__gte=min_conversations)
+                facts.values("project__uuid").annotate(total=sum_conversations()).filter(total__gte=min_conversations)
             )
             project_uuids = [pc["project__uuid"] for pc in project_counts]
-            conversations = conversations.filter(project__uuid__in=project_uuids)
+            facts = facts.filter(project__uuid__in=project_uuids)
 
         # Aggregate statistics (focus on unresolved)
-        stats = conversations.aggregate(
-            total=Count("uuid"),
-            unresolved=Count("uuid", filter=Q(resolution="1")),
+        stats = facts.aggregate(
+            total=sum_conversations(),
+            unresolved=sum_conversations("1"),
         )
 
         # Calculate unresolved rate
@@ -517,8 +502,8 @@ class ProjectsByMotorView(APIView):
             if error_response:
                 return error_response
             date_filter = Q(
-                conversations__created_at__date__gte=start_date,
-                conversations__created_at__date__lte=end_date,
+                conversation_daily_facts__day__gte=start_date,
+                conversation_daily_facts__day__lte=end_date,
             )
         elif start_date_str or end_date_str:
             # Both must be provided if either is provided
@@ -535,13 +520,15 @@ class ProjectsByMotorView(APIView):
 
             if date_filter:
                 ab2_projects = (
-                    ab2_query.annotate(conversation_count=Count("conversations", filter=date_filter))
+                    ab2_query.annotate(
+                        conversation_count=Coalesce(Sum("conversation_daily_facts__count", filter=date_filter), 0)
+                    )
                     .values("uuid", "name", "conversation_count")
                     .order_by("-conversation_count")
                 )
             else:
                 ab2_projects = (
-                    ab2_query.annotate(conversation_count=Count("conversations"))
+                    ab2_query.annotate(conversation_count=Coalesce(Sum("conversation_daily_facts__count"), 0))
                     .values("uuid", "name", "conversation_count")
                     .order_by("-conversation_count")
                 )
@@ -555,13 +542,15 @@ class ProjectsByMotorView(APIView):
 
             if date_filter:
                 ab2_5_projects = (
-                    ab2_5_query.annotate(conversation_count=Count("conversations", filter=date_filter))
+                    ab2_5_query.annotate(
+                        conversation_count=Coalesce(Sum("conversation_daily_facts__count", filter=date_filter), 0)
+                    )
                     .values("uuid", "name", "conversation_count")
                     .order_by("-conversation_count")
                 )
             else:
                 ab2_5_projects = (
-                    ab2_5_query.annotate(conversation_count=Count("conversations"))
+                    ab2_5_query.annotate(conversation_count=Coalesce(Sum("conversation_daily_facts__count"), 0))
                     .values("uuid", "name", "conversation_count")
                     .order_by("-conversation_count")
                 )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AnalyticsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "nexus.analytics"
+
+    def ready(self):
+        import nexus.analytics.signals  # noqa: F401
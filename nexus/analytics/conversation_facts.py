@@ -0,0 +1,172 @@
+"""Incremental maintenance of ConversationDailyFact (conversations per project/day/resolution)."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, QuerySet
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from nexus.analytics.models import ConversationDailyFact
+
+logger = logging.getLogger(__name__)
+
+# Conversation fields that decide which fact row a conversation counts towards.
+FACT_FIELDS = frozenset({"project", "project_id", "created_at", "resolution"})
+_PK_BATCH_SIZE = 500
+
+FactKey = Tuple[str, date, str]
+
+
+def fact_day(created_at: datetime) -> date:
+    if timezone.is_naive(created_at):
+        created_at = timezone.make_aware(created_at)
+    return timezone.localdate(created_at)
+
+
+def fact_key(project_id, created_at: Optional[datetime], resolution) -> Optional[FactKey]:
+    if project_id is None or created_at is None or resolution is None:
+        return None
+    return str(project_id), fact_day(created_at), str(resolution)
+
+
+def apply_fact_deltas(deltas: Dict[FactKey, int]) -> None:
+    for (project_id, day, resolution), delta in deltas.items():
+        if not delta:
+            continue
+        facts = ConversationDailyFact.objects.filter(project_id=project_id, day=day, resolution=resolution)
+        if facts.update(count=F("count") + delta) or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                ConversationDailyFact.objects.create(project_id=project_id, day=day, resolution=resolution, count=delta)
+        except IntegrityError:
+            facts.update(count=F("count") + delta)
+
+
+def _key_deltas(removed: Iterable[Optional[FactKey]], added: Iterable[Optional[FactKey]]) -> Dict[FactKey, int]:
+    deltas: Counter = Counter()
+    for key in removed:
+        if key is not None:
+            deltas[key] -= 1
+    for key in added:
+        if key is not None:
+            deltas[key] += 1
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def snapshot_key(conversation) -> Optional[FactKey]:
+    """Fact key as last read from or written to the database (set by Conversation.from_db)."""
+    snapshot = getattr(conversation, "_fact_snapshot", None)
+    return fact_key(*snapshot) if snapshot else None
+
+
+def record_conversation_saved(conversation, created: bool) -> None:
+    current = fact_key(conversation.project_id, conversation.created_at, conversation.resolution)
+    previous = None if created else snapshot_key(conversation)
+    if created or previous is not None:
+        apply_fact_deltas(_key_deltas([previous], [current]))
+    # Instances saved without a loaded snapshot (e.g. deferred fields) are left to the nightly reconcile.
+    conversation._fact_snapshot = (conversation.project_id, conversation.created_at, conversation.resolution)
+
+
+def record_conversation_deleted(conversation) -> None:
+    key = snapshot_key(conversation) or fact_key(
+        conversation.project_id, conversation.created_at, conversation.resolution
+    )
+    apply_fact_deltas(_key_deltas([key], []))
+
+
+def _fact_keys_by_pk(queryset: QuerySet) -> Dict:
+    return {
+        pk: fact_key(project_id, created_at, resolution)
+        for pk, project_id, created_at, resolution in queryset.values_list(
+            "pk", "project_id", "created_at", "resolution"
+        )
+    }
+
+
+def track_bulk_update(queryset: QuerySet, update: Callable[[], int]) -> int:
+    """Run a queryset ``update()`` that changes fact fields and apply the resulting fact deltas."""
+    with transaction.atomic(using=queryset.db):
+        before = _fact_keys_by_pk(queryset)
+        rows = update()
+        pks: List = list(before)
+        after: Dict = {}
+        for start in range(0, len(pks), _PK_BATCH_SIZE):
+            after.update(
+                _fact_keys_by_pk(queryset.model._base_manager.filter(pk__in=pks[start : start + _PK_BATCH_SIZE]))
+            )
+        apply_fact_deltas(_key_deltas(before.values(), after.values()))
+    return rows
+
+
+def _day_start(day: date) -> datetime:
+    """Start of ``day`` in the current time zone, the boundary fact_day() buckets by."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def reconcile_conversation_facts(start_date: date, end_date: date) -> int:
+    """
+    Rebuild facts for [start_date, end_date] from the conversations table. Returns rows written.
+
+    The fact rows are locked before the conversations are counted and then rewritten
+    in place, so a concurrent apply_fact_deltas waits and adds on top of the rebuilt count.
+    """
+    from nexus.intelligences.models import Conversation
+
+    with transaction.atomic():
+        existing = {
+            (str(fact.project_id), fact.day, fact.resolution): fact
+            for fact in ConversationDailyFact.objects.select_for_update().filter(day__gte=start_date, day__lte=end_date)
+        }
+        counts = (
+            Conversation.objects.filter(
+                created_at__gte=_day_start(start_date), created_at__lt=_day_start(end_date + timedelta(days=1))
+            )
+            .annotate(day=TruncDate("created_at"))
+            .values("project_id", "day", "resolution")
+            .annotate(total=Count("pk"))
+            .order_by()
+        )
+        changed, created = [], []
+        for row in counts:
+            key = (str(row["project_id"]), row["day"], str(row["resolution"]))
+            fact = existing.pop(key, None)
+            if fact is None:
+                created.append(
+                    ConversationDailyFact(project_id=key[0], day=key[1], resolution=key[2], count=row["total"])
+                )
+            elif fact.count != row["total"]:
+                fact.count = row["total"]
+                changed.append(fact)
+        ConversationDailyFact.objects.filter(pk__in=[fact.pk for fact in existing.values()]).delete()
+        ConversationDailyFact.objects.bulk_update(changed, ["count"], batch_size=1000)
+        ConversationDailyFact.objects.bulk_create(created, batch_size=1000)
+    return len(changed) + len(created)
+
+
+def first_conversation_day() -> Optional[date]:
+    from nexus.intelligences.models import Conversation
+
+    oldest = Conversation.objects.order_by("created_at").values_list("created_at", flat=True).first()
+    return fact_day(oldest) if oldest else None
+
+
+def reconcile_recent_conversation_facts(days: Optional[int] = None) -> int:
+    days = settings.CONVERSATION_FACTS_RECONCILE_DAYS if days is None else days
+    # Only closed days: today's conversations are still arriving and are kept by apply_fact_deltas.
+    end_date = timezone.localdate() - timedelta(days=1)
+    start_date = end_date - timedelta(days=days - 1)
+    rows = reconcile_conversation_facts(start_date, end_date)
+    logger.info(
+        "Reconciled conversation daily facts",
+        extra={"start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "rows": rows},
+    )
+    return rows
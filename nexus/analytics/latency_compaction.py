@@ -0,0 +1,183 @@
+"""Compact hourly inline agent latency rollups into daily and monthly rows."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Max, QuerySet, Sum
+
+from nexus.analytics.latency_phases import merge_bucket_counts
+from nexus.analytics.models import (
+    InlineAgentLatencyDaily,
+    InlineAgentLatencyHourly,
+    InlineAgentLatencyMonthly,
+    LatencyRollupFields,
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_GROUP_FIELDS = ("project_uuid", "execution_path", "phase")
+# Last closed day whose daily rows were rebuilt by compact_recent_latency_rollups.
+COMPACTED_THROUGH_KEY = "analytics:inline_agent_latency:compacted_through"
+COUNT_MAP_FIELDS = ("buckets", "sketch")
+
+GroupKey = Tuple
+
+
+def _group_key(values: Iterable) -> GroupKey:
+    return tuple(str(value) for value in values)
+
+
+def merged_count_maps(
+    queryset: QuerySet, column: str, group_fields: Tuple[str, ...] = ()
+) -> Dict[GroupKey, Dict[str, int]]:
+    """
+    Add up a {key: count} JSON column per group.
+
+    On Postgres the merge runs in SQL over jsonb_each_text; other databases
+    (SQLite in tests) merge the loaded maps in Python.
+    """
+    rows = queryset.order_by().values(*group_fields, column)
+    merged: Dict[GroupKey, Dict[str, int]] = {}
+
+    if connection.vendor == "postgresql":
+        inner_sql, params = rows.query.sql_with_params()
+        group_sql = ", ".join(f"r.{name}" for name in group_fields)
+        select_groups = f"{group_sql}, " if group_fields else ""
+        sql = (
+            f"SELECT {select_groups}e.key, SUM(e.value::bigint) "
+            f"FROM ({inner_sql}) AS r, jsonb_each_text(r.{column}) AS e "
+            f"GROUP BY {select_groups}e.key"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for *groups, key, count in cursor.fetchall():
+                merged.setdefault(_group_key(groups), {})[key] = int(count)
+        return merged
+
+    for row in rows:
+        key = _group_key(row[name] for name in group_fields)
+        merged[key] = merge_bucket_counts(merged.get(key, {}), row[column])
+    return merged
+
+
+def aggregate_rollups(queryset: QuerySet, group_fields: Tuple[str, ...] = ROLLUP_GROUP_FIELDS) -> Dict[GroupKey, Dict]:
+    """Sum rollup counters per group with GROUP BY, plus the merged bucket and sketch maps."""
+    aggregates = {
+        "total_turn_count": Sum("turn_count"),
+        "total_sum_ms": Sum("sum_ms"),
+        "total_max_ms": Max("max_ms"),
+        "total_error_count": Sum("error_count"),
+        "total_blocked_count": Sum("blocked_count"),
+        "total_schema_version": Max("schema_version"),
+    }
+    if group_fields:
+        totals = list(queryset.order_by().values(*group_fields).annotate(**aggregates))
+    else:
+        row = queryset.order_by().aggregate(**aggregates)
+        totals = [row] if row["total_turn_count"] is not None else []
+    count_maps = {column: merged_count_maps(queryset, column, group_fields) for column in COUNT_MAP_FIELDS}
+
+    aggregated: Dict[GroupKey, Dict] = {}
+    for row in totals:
+        key = _group_key(row[name] for name in group_fields)
+        aggregated[key] = {
+            "turn_count": row["total_turn_count"] or 0,
+            "sum_ms": row["total_sum_ms"] or 0,
+            "max_ms": row["total_max_ms"] or 0,
+            "error_count": row["total_error_count"] or 0,
+            "blocked_count": row["total_blocked_count"] or 0,
+            "schema_version": row["total_schema_version"] or 1,
+            **{column: count_maps[column].get(key, {}) for column in COUNT_MAP_FIELDS},
+        }
+    return aggregated
+
+
+def _replace_rollups(
+    model: Type[LatencyRollupFields],
+    period_field: str,
+    period: date,
+    source: QuerySet,
+) -> int:
+    aggregated = aggregate_rollups(source)
+    rows: List[LatencyRollupFields] = [
+        model(
+            project_uuid=project_uuid,
+            execution_path=execution_path,
+            phase=phase,
+            **{period_field: period},
+            **values,
+        )
+        for (project_uuid, execution_path, phase), values in aggregated.items()
+    ]
+    # Rebuilding the whole period keeps compaction idempotent and lets it
+    # pick up hourly rows that were flushed after the previous run.
+    with transaction.atomic():
+        model.objects.filter(**{period_field: period}).delete()
+        model.objects.bulk_create(rows)
+    return len(rows)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def compact_day(day: date) -> int:
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    source = InlineAgentLatencyHourly.objects.filter(hour_ts__gte=start, hour_ts__lt=start + timedelta(days=1))
+    return _replace_rollups(InlineAgentLatencyDaily, "day", day, source)
+
+
+def compact_month(month: date) -> int:
+    month = month_start(month)
+    source = InlineAgentLatencyDaily.objects.filter(day__gte=month, day__lt=next_month(month))
+    return _replace_rollups(InlineAgentLatencyMonthly, "month", month, source)
+
+
+def _compacted_through() -> Optional[date]:
+    watermark = cache.get(COMPACTED_THROUGH_KEY)
+    if watermark:
+        return date.fromisoformat(watermark)
+    # Without the cached watermark, the newest daily row is the last day known to be compacted.
+    return InlineAgentLatencyDaily.objects.aggregate(last_day=Max("day"))["last_day"]
+
+
+def compact_recent_latency_rollups(now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Rebuild the daily rows from the last compacted day through today, then the months they fall in.
+
+    Yesterday is always rebuilt, since hourly rows flushed around midnight may
+    land after it was first compacted. Days missed while the task was not
+    running are caught up INLINE_AGENT_LATENCY_COMPACTION_MAX_DAYS at a time,
+    oldest first, because the latency API reads closed days only from the
+    daily and monthly tables.
+    """
+    today = (now or datetime.now(timezone.utc)).astimezone(timezone.utc).date()
+    yesterday = today - timedelta(days=1)
+    compacted_through = _compacted_through()
+    first_day = min(compacted_through + timedelta(days=1), yesterday) if compacted_through else yesterday
+    last_day = min(today, first_day + timedelta(days=settings.INLINE_AGENT_LATENCY_COMPACTION_MAX_DAYS - 1))
+    days = [first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1)]
+
+    daily_rows = sum(compact_day(day) for day in days)
+    monthly_rows = sum(compact_month(month) for month in sorted({month_start(day) for day in days}))
+    cache.set(COMPACTED_THROUGH_KEY, min(last_day, yesterday).isoformat(), None)
+    logger.info(
+        "Compacted inline agent latency rollups",
+        extra={
+            "start_date": first_day.isoformat(),
+            "end_date": last_day.isoformat(),
+            "daily_rows": daily_rows,
+            "monthly_rows": monthly_rows,
+        },
+    )
+    return {"daily_rows": daily_rows, "monthly_rows": monthly_rows}
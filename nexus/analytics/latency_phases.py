@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from math import inf
-from typing import Dict, Iterable, List
+from math import ceil, inf, log
+from typing import Dict, Iterable, List, Optional
 
 EXECUTION_PATH_INLINE_AGENTS = "inline_agents"
 
@@ -64,6 +64,58 @@ def increment_buckets(buckets: Dict[str, int], duration_ms: int) -> Dict[str, in
     return merged
 
 
+def merge_bucket_counts(left: Dict[str, int], right: Dict[str, int]) -> Dict[str, int]:
+    """Add two bucket-count maps key by key."""
+    merged = dict(left or {})
+    for key, count in (right or {}).items():
+        merged[key] = merged.get(key, 0) + int(count)
+    return merged
+
+
+# Log-bucketed quantile sketch (DDSketch-style): bucket i holds values in
+# (GAMMA**(i-1), GAMMA**i], so any quantile read back is within
+# SKETCH_RELATIVE_ACCURACY of the true value. Sparse {index: count} maps merge
+# by adding counts, exactly like the fixed buckets above.
+SKETCH_RELATIVE_ACCURACY = 0.01
+SKETCH_GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+# Values are clamped to [1 ms, 1 h], which bounds a sketch to ~760 keys.
+SKETCH_MIN_MS = 1
+SKETCH_MAX_MS = 3_600_000
+
+_LOG_GAMMA = log(SKETCH_GAMMA)
+
+
+def sketch_key(duration_ms: int) -> str:
+    value = min(max(duration_ms, SKETCH_MIN_MS), SKETCH_MAX_MS)
+    return str(ceil(log(value) / _LOG_GAMMA))
+
+
+def increment_sketch(sketch: Dict[str, int], duration_ms: int) -> Dict[str, int]:
+    """Add one observation to a quantile sketch."""
+    merged = dict(sketch or {})
+    key = sketch_key(duration_ms)
+    merged[key] = merged.get(key, 0) + 1
+    return merged
+
+
+def sketch_count(sketch: Dict[str, int]) -> int:
+    return sum(int(count) for count in (sketch or {}).values())
+
+
+def sketch_quantile(sketch: Dict[str, int], quantile: float) -> Optional[int]:
+    """Estimate the value at ``quantile`` (0..1) from a sketch; None when empty."""
+    total = sketch_count(sketch)
+    if total <= 0:
+        return None
+    rank = quantile * (total - 1)
+    cumulative = 0
+    for index in sorted(int(key) for key in sketch):
+        cumulative += int(sketch[str(index)])
+        if cumulative > rank:
+            return int(round(2 * SKETCH_GAMMA**index / (SKETCH_GAMMA + 1)))
+    return None
+
+
 def phases_for_execution_path(execution_path: str) -> Iterable[str]:
     if execution_path == EXECUTION_PATH_INLINE_AGENTS:
         return list(PHASES_INLINE_AGENTS)
@@ -6,17 +6,33 @@ from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
+from django.db.models.functions import TruncDate
 
+from nexus.analytics.latency_compaction import aggregate_rollups, month_start, next_month
 from nexus.analytics.latency_phases import (
     BUCKET_UPPER_BOUNDS_MS,
     PHASE_TOTAL,
     bucket_key,
     cumulative_bucket_key_for_threshold,
+    merge_bucket_counts,
+    sketch_count,
+    sketch_quantile,
+)
+from nexus.analytics.models import (
+    InlineAgentLatencyDaily,
+    InlineAgentLatencyHourly,
+    InlineAgentLatencyMonthly,
+    InlineAgentTurnOutlier,
 )
-from nexus.analytics.models import InlineAgentLatencyHourly, InlineAgentTurnOutlier
 
 MAX_QUERY_DAYS = 90
+# Today and yesterday are still being compacted, so they are read from hourly rows.
+HOURLY_WINDOW_DAYS = 2
+TIMESERIES_HOURLY_MAX_DAYS = 2
+
+GRANULARITY_HOUR = "hour"
+GRANULARITY_DAY = "day"
 
 
 def validate_project_uuid(project_uuid: str) -> Optional[str]:
@@ -60,8 +76,7 @@ def _hourly_queryset(
 def merge_buckets(rows: Iterable[InlineAgentLatencyHourly]) -> Dict[str, int]:
     merged: Dict[str, int] = {}
     for row in rows:
-        for key, count in (row.buckets or {}).items():
-            merged[key] = merged.get(key, 0) + int(count)
+        merged = merge_bucket_counts(merged, row.buckets)
     return merged
 
 
@@ -82,6 +97,28 @@ def estimate_p95_ms(buckets: Dict[str, int], total_count: int) -> Optional[int]:
     return None
 
 
+def estimate_percentiles_ms(
+    sketch: Dict[str, int], buckets: Dict[str, int], total_count: int
+) -> Dict[str, Optional[int]]:
+    """
+    p50/p95/p99 from the quantile sketch (~1% relative error).
+
+    Rows written before sketches existed only have fixed buckets; when the
+    sketch does not cover every turn, fall back to the bucket upper bound for p95.
+    """
+    if total_count > 0 and sketch_count(sketch) == total_count:
+        return {
+            "p50_estimate_ms": sketch_quantile(sketch, 0.50),
+            "p95_estimate_ms": sketch_quantile(sketch, 0.95),
+            "p99_estimate_ms": sketch_quantile(sketch, 0.99),
+        }
+    return {
+        "p50_estimate_ms": None,
+        "p95_estimate_ms": estimate_p95_ms(buckets, total_count),
+        "p99_estimate_ms": None,
+    }
+
+
 def pct_at_or_below_bucket(buckets: Dict[str, int], total_count: int, upper_ms: int) -> Optional[float]:
     if total_count <= 0:
         return None
@@ -90,6 +127,82 @@ def pct_at_or_below_bucket(buckets: Dict[str, int], total_count: int, upper_ms:
     return round(100.0 * count / total_count, 2)
 
 
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _rollup_querysets(
+    project_uuid: str,
+    start_date: date,
+    end_date: date,
+    *,
+    execution_path: str,
+    phase: str,
+    use_months: bool = True,
+) -> Tuple[List[QuerySet], Optional[QuerySet]]:
+    """
+    Split a date range over the coarsest rollup tables that cover it.
+
+    Whole months before the hourly window come from the monthly table and the
+    remaining closed days (before and after those months) from the daily
+    table. The last HOURLY_WINDOW_DAYS (today and yesterday) are still being
+    compacted, so they are read from the hourly rows. At most three tables are
+    queried and the row count is bounded whatever the range length.
+
+    Returns the compacted querysets and the hourly queryset (or None).
+    """
+    filters = {"project_uuid": project_uuid, "execution_path": execution_path, "phase": phase}
+    hourly_from = _utc_today() - timedelta(days=HOURLY_WINDOW_DAYS - 1)
+    compacted: List[QuerySet] = []
+
+    compacted_end = min(end_date, hourly_from - timedelta(days=1))
+    if start_date <= compacted_end:
+        day_ranges = [(start_date, compacted_end)]
+        if use_months:
+            first_month = month_start(start_date)
+            if first_month < start_date:
+                first_month = next_month(first_month)
+            months_end = first_month
+            while next_month(months_end) - timedelta(days=1) <= compacted_end:
+                months_end = next_month(months_end)
+            if first_month < months_end:
+                compacted.append(
+                    InlineAgentLatencyMonthly.objects.filter(month__gte=first_month, month__lt=months_end, **filters)
+                )
+                day_ranges = [(start_date, first_month - timedelta(days=1)), (months_end, compacted_end)]
+
+        days = Q()
+        for day_from, day_to in day_ranges:
+            if day_from <= day_to:
+                days |= Q(day__gte=day_from, day__lte=day_to)
+        if days:
+            compacted.append(InlineAgentLatencyDaily.objects.filter(days, **filters))
+
+    hourly = None
+    if end_date >= hourly_from:
+        hourly = _hourly_queryset(
+            project_uuid, max(start_date, hourly_from), end_date, execution_path=execution_path, phase=phase
+        )
+    return compacted, hourly
+
+
+def _combine_aggregates(aggregates: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    combined: Dict[str, Any] = {
+        "turn_count": 0,
+        "sum_ms": 0,
+        "max_ms": 0,
+        "buckets": {},
+        "sketch": {},
+    }
+    for aggregate in aggregates:
+        combined["turn_count"] += aggregate["turn_count"]
+        combined["sum_ms"] += aggregate["sum_ms"]
+        combined["max_ms"] = max(combined["max_ms"], aggregate["max_ms"])
+        combined["buckets"] = merge_bucket_counts(combined["buckets"], aggregate["buckets"])
+        combined["sketch"] = merge_bucket_counts(combined["sketch"], aggregate["sketch"])
+    return combined
+
+
 def build_summary(
     project_uuid: str,
     start_date: date,
@@ -97,11 +210,15 @@ def build_summary(
     *,
     execution_path: str = "inline_agents",
 ) -> Dict[str, Any]:
-    rows = list(_hourly_queryset(project_uuid, start_date, end_date, execution_path=execution_path))
-    turn_count = sum(row.turn_count for row in rows)
-    sum_ms = sum(row.sum_ms for row in rows)
-    max_ms = max((row.max_ms for row in rows), default=0)
-    buckets = merge_buckets(rows)
+    compacted, hourly = _rollup_querysets(
+        project_uuid, start_date, end_date, execution_path=execution_path, phase=PHASE_TOTAL
+    )
+    querysets = compacted + ([hourly] if hourly is not None else [])
+    totals = _combine_aggregates(
+        aggregate for queryset in querysets for aggregate in aggregate_rollups(queryset, group_fields=()).values()
+    )
+    turn_count = totals["turn_count"]
+    buckets = totals["buckets"]
 
     target_high = int(getattr(settings, "INLINE_AGENT_LATENCY_TARGET_MS_HIGH", 20000))
     outlier_ms = int(getattr(settings, "INLINE_AGENT_LATENCY_OUTLIER_MS", 30000))
@@ -112,9 +229,9 @@ def build_summary(
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
         "turn_count": turn_count,
-        "avg_ms": round(sum_ms / turn_count, 2) if turn_count else None,
-        "max_ms": max_ms,
-        "p95_estimate_ms": estimate_p95_ms(buckets, turn_count),
+        "avg_ms": round(totals["sum_ms"] / turn_count, 2) if turn_count else None,
+        "max_ms": totals["max_ms"],
+        **estimate_percentiles_ms(totals["sketch"], buckets, turn_count),
         "pct_under_target_high_ms": pct_at_or_below_bucket(buckets, turn_count, target_high),
         "pct_over_max_tolerable_ms": _pct_over_max_tolerable(buckets, turn_count, outlier_ms),
     }
@@ -129,6 +246,19 @@ def _pct_over_max_tolerable(buckets: Dict[str, int], total_count: int, outlier_m
     return round(100.0 * over / total_count, 2)
 
 
+def _series_point(period_start: datetime, granularity: str, phase: str, aggregate: Dict[str, Any]) -> Dict[str, Any]:
+    turn_count = aggregate["turn_count"]
+    return {
+        "hour_ts": period_start.isoformat().replace("+00:00", "Z"),
+        "granularity": granularity,
+        "phase": phase,
+        "turn_count": turn_count,
+        "avg_ms": round(aggregate["sum_ms"] / turn_count, 2) if turn_count else None,
+        "max_ms": aggregate["max_ms"],
+        **estimate_percentiles_ms(aggregate["sketch"] or {}, aggregate["buckets"] or {}, turn_count),
+    }
+
+
 def build_timeseries(
     project_uuid: str,
     start_date: date,
@@ -137,23 +267,48 @@ def build_timeseries(
     execution_path: str = "inline_agents",
     phase: str = PHASE_TOTAL,
 ) -> List[Dict[str, Any]]:
-    rows = _hourly_queryset(
-        project_uuid, start_date, end_date, execution_path=execution_path, phase=phase
+    """
+    Hourly points for ranges up to TIMESERIES_HOURLY_MAX_DAYS, daily points beyond that.
+
+    Each point's ``hour_ts`` is the start of its period.
+    """
+    if (end_date - start_date).days < TIMESERIES_HOURLY_MAX_DAYS:
+        rows = _hourly_queryset(project_uuid, start_date, end_date, execution_path=execution_path, phase=phase)
+        return [
+            _series_point(
+                row.hour_ts,
+                GRANULARITY_HOUR,
+                row.phase,
+                {
+                    "turn_count": row.turn_count,
+                    "sum_ms": row.sum_ms,
+                    "max_ms": row.max_ms,
+                    "buckets": row.buckets,
+                    "sketch": row.sketch,
+                },
+            )
+            for row in rows
+        ]
+
+    compacted, hourly = _rollup_querysets(
+        project_uuid, start_date, end_date, execution_path=execution_path, phase=phase, use_months=False
     )
-    series: List[Dict[str, Any]] = []
-    for row in rows:
-        turn_count = row.turn_count
-        series.append(
-            {
-                "hour_ts": row.hour_ts.isoformat().replace("+00:00", "Z"),
-                "phase": row.phase,
-                "turn_count": turn_count,
-                "avg_ms": round(row.sum_ms / turn_count, 2) if turn_count else None,
-                "max_ms": row.max_ms,
-                "p95_estimate_ms": estimate_p95_ms(row.buckets or {}, turn_count),
-            }
+    per_day: Dict[Tuple, Dict[str, Any]] = {}
+    for queryset in compacted:
+        per_day.update(aggregate_rollups(queryset, group_fields=("day",)))
+    if hourly is not None:
+        hourly = hourly.annotate(day=TruncDate("hour_ts", tzinfo=timezone.utc))
+        per_day.update(aggregate_rollups(hourly, group_fields=("day",)))
+
+    return [
+        _series_point(
+            datetime.combine(date.fromisoformat(day), time.min, tzinfo=timezone.utc),
+            GRANULARITY_DAY,
+            phase,
+            per_day[(day,)],
         )
-    return series
+        for (day,) in sorted(per_day)
+    ]
 
 
 def list_outliers(
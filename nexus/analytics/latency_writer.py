@@ -1,21 +1,27 @@
-"""Persist inline agent turn latency to Postgres (Plan B)."""
+"""Persist inline agent turn latency to Postgres (Plan B), buffered per worker process."""
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import os
 import random
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import sentry_sdk
 from django.conf import settings
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 
 from nexus.analytics.latency_phases import (
     EXECUTION_PATH_INLINE_AGENTS,
     increment_buckets,
+    increment_sketch,
+    merge_bucket_counts,
     rollup_phases_for_turn,
 )
 from nexus.analytics.models import InlineAgentLatencyHourly, InlineAgentTurnOutlier
@@ -29,6 +35,9 @@ SAMPLE_REASON_BROKER = "broker_threshold"
 SAMPLE_REASON_ELEVATED = "elevated_sample"
 SAMPLE_REASON_RANDOM = "random_sample"
 
+# 2: rows carry a quantile sketch alongside the fixed buckets
+ROLLUP_SCHEMA_VERSION = 2
+
 
 @dataclass
 class TurnCorrelation:
@@ -46,6 +55,8 @@ def _latency_settings() -> Dict[str, Any]:
         "elevated_ms": int(getattr(settings, "INLINE_AGENT_LATENCY_ELEVATED_MS", 15000)),
         "sample_rate": float(getattr(settings, "INLINE_AGENT_LATENCY_SAMPLE_RATE", 0.001)),
         "elevated_sample_rate": float(getattr(settings, "INLINE_AGENT_LATENCY_ELEVATED_SAMPLE_RATE", 0.01)),
+        "flush_interval": float(getattr(settings, "INLINE_AGENT_LATENCY_FLUSH_INTERVAL_SECONDS", 10)),
+        "buffer_max_rows": int(getattr(settings, "INLINE_AGENT_LATENCY_BUFFER_MAX_ROWS", 5000)),
     }
 
 
@@ -89,15 +100,172 @@ def decide_outlier_sample(
     return False, None
 
 
+@dataclass
+class RollupDelta:
+    """Counts accumulated for one (project, hour, execution_path, phase) row before flushing."""
+
+    turn_count: int = 0
+    sum_ms: int = 0
+    max_ms: int = 0
+    buckets: Dict[str, int] = field(default_factory=dict)
+    sketch: Dict[str, int] = field(default_factory=dict)
+    error_count: int = 0
+    blocked_count: int = 0
+
+    def add(self, duration_ms: int, status: str) -> None:
+        self.turn_count += 1
+        self.sum_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets = increment_buckets(self.buckets, duration_ms)
+        self.sketch = increment_sketch(self.sketch, duration_ms)
+        if status == "failed":
+            self.error_count += 1
+        if status == "blocked":
+            self.blocked_count += 1
+
+    def merge(self, other: RollupDelta) -> None:
+        self.turn_count += other.turn_count
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.buckets = merge_bucket_counts(self.buckets, other.buckets)
+        self.sketch = merge_bucket_counts(self.sketch, other.sketch)
+        self.error_count += other.error_count
+        self.blocked_count += other.blocked_count
+
+
+RollupKey = Tuple[str, datetime, str, str]
+
+
+class LatencyRollupBuffer:
+    """
+    Per-process aggregation of hourly rollups and sampled outliers.
+
+    Turns only touch memory; flush_turn_latency() writes everything with one
+    additive merge per row, so concurrent workers still produce exact totals.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rollups: Dict[RollupKey, RollupDelta] = {}
+        self._outliers: List[InlineAgentTurnOutlier] = []
+
+    def __len__(self) -> int:
+        return len(self._rollups) + len(self._outliers)
+
+    def add_turn(
+        self,
+        *,
+        project_uuid: str,
+        hour_ts: datetime,
+        execution_path: str,
+        phase_durations: Dict[str, int],
+        status: str,
+        outlier: Optional[InlineAgentTurnOutlier] = None,
+    ) -> None:
+        with self._lock:
+            for phase, duration_ms in phase_durations.items():
+                key = (str(project_uuid), hour_ts, execution_path, phase)
+                self._rollups.setdefault(key, RollupDelta()).add(duration_ms, status)
+            if outlier is not None:
+                self._outliers.append(outlier)
+
+    def drain(self) -> Tuple[Dict[RollupKey, RollupDelta], List[InlineAgentTurnOutlier]]:
+        with self._lock:
+            rollups, outliers = self._rollups, self._outliers
+            self._rollups, self._outliers = {}, []
+        return rollups, outliers
+
+    def restore(self, rollups: Dict[RollupKey, RollupDelta], outliers: List[InlineAgentTurnOutlier]) -> None:
+        """Put back a batch whose flush failed, unless the buffer is already full."""
+        with self._lock:
+            if len(self._rollups) + len(rollups) > _latency_settings()["buffer_max_rows"]:
+                logger.warning("Latency rollup buffer full, dropping %s unflushed rows", len(rollups))
+                return
+            for key, delta in rollups.items():
+                self._rollups.setdefault(key, RollupDelta()).merge(delta)
+            self._outliers.extend(outliers)
+
+
+_buffer = LatencyRollupBuffer()
+_flush_requested = threading.Event()
+_flusher_lock = threading.Lock()
+_flusher_pid: Optional[int] = None
+
+# Adds two {key: count} jsonb maps key by key.
+_JSONB_COUNTS_MERGE = """(
+        SELECT COALESCE(
+            jsonb_object_agg(
+                k, COALESCE((t.{column} ->> k)::bigint, 0) + COALESCE((EXCLUDED.{column} ->> k)::bigint, 0)
+            ),
+            jsonb_build_object()
+        )
+        FROM (
+            SELECT jsonb_object_keys(t.{column}) AS k
+            UNION
+            SELECT jsonb_object_keys(EXCLUDED.{column})
+        ) AS merged_keys
+    )"""
+
+_MERGE_SQL = """
+INSERT INTO inline_agent_latency_hourly AS t (
+    project_uuid, hour_ts, execution_path, phase,
+    turn_count, sum_ms, max_ms, buckets, sketch, error_count, blocked_count, schema_version
+)
+VALUES {{values}}
+ON CONFLICT (project_uuid, hour_ts, execution_path, phase) DO UPDATE SET
+    turn_count = t.turn_count + EXCLUDED.turn_count,
+    sum_ms = t.sum_ms + EXCLUDED.sum_ms,
+    max_ms = GREATEST(t.max_ms, EXCLUDED.max_ms),
+    error_count = t.error_count + EXCLUDED.error_count,
+    blocked_count = t.blocked_count + EXCLUDED.blocked_count,
+    buckets = {buckets},
+    sketch = {sketch},
+    schema_version = GREATEST(t.schema_version, EXCLUDED.schema_version)
+""".format(
+    buckets=_JSONB_COUNTS_MERGE.format(column="buckets"),
+    sketch=_JSONB_COUNTS_MERGE.format(column="sketch"),
+)
+_MERGE_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s::jsonb, %s, %s, %s)"
+_MERGE_BATCH_SIZE = 500
+
+
+def _merge_rollups_postgres(rollups: Dict[RollupKey, RollupDelta]) -> None:
+    # Key order, not insertion order: concurrent flushes then take row locks in the same order and cannot deadlock.
+    items = sorted(rollups.items(), key=lambda item: item[0])
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), _MERGE_BATCH_SIZE):
+            batch = items[start : start + _MERGE_BATCH_SIZE]
+            params: List[Any] = []
+            for (project_uuid, hour_ts, execution_path, phase), delta in batch:
+                params.extend(
+                    [
+                        project_uuid,
+                        hour_ts,
+                        execution_path,
+                        phase,
+                        delta.turn_count,
+                        delta.sum_ms,
+                        delta.max_ms,
+                        json.dumps(delta.buckets),
+                        json.dumps(delta.sketch),
+                        delta.error_count,
+                        delta.blocked_count,
+                        ROLLUP_SCHEMA_VERSION,
+                    ]
+                )
+            values = ", ".join([_MERGE_ROW_PLACEHOLDER] * len(batch))
+            cursor.execute(_MERGE_SQL.format(values=values), params)
+
+
 def _upsert_rollup_row(
     *,
     project_uuid: str,
     hour_ts: datetime,
     execution_path: str,
     phase: str,
-    duration_ms: int,
-    status: str,
+    delta: RollupDelta,
 ) -> None:
+    """Row-locked merge used where INSERT ... ON CONFLICT with jsonb is unavailable (SQLite in tests)."""
     filters = {
         "project_uuid": project_uuid,
         "hour_ts": hour_ts,
@@ -105,12 +273,14 @@ def _upsert_rollup_row(
         "phase": phase,
     }
     create_defaults = {
-        "turn_count": 1,
-        "sum_ms": duration_ms,
-        "max_ms": duration_ms,
-        "buckets": increment_buckets({}, duration_ms),
-        "error_count": 1 if status == "failed" else 0,
-        "blocked_count": 1 if status == "blocked" else 0,
+        "turn_count": delta.turn_count,
+        "sum_ms": delta.sum_ms,
+        "max_ms": delta.max_ms,
+        "buckets": dict(delta.buckets),
+        "sketch": dict(delta.sketch),
+        "error_count": delta.error_count,
+        "blocked_count": delta.blocked_count,
+        "schema_version": ROLLUP_SCHEMA_VERSION,
     }
 
     try:
@@ -123,26 +293,93 @@ def _upsert_rollup_row(
         except IntegrityError:
             row = InlineAgentLatencyHourly.objects.select_for_update().get(**filters)
 
-    row.turn_count += 1
-    row.sum_ms += duration_ms
-    row.max_ms = max(row.max_ms, duration_ms)
-    row.buckets = increment_buckets(row.buckets, duration_ms)
-    if status == "failed":
-        row.error_count += 1
-    if status == "blocked":
-        row.blocked_count += 1
+    row.turn_count += delta.turn_count
+    row.sum_ms += delta.sum_ms
+    row.max_ms = max(row.max_ms, delta.max_ms)
+    row.buckets = merge_bucket_counts(row.buckets, delta.buckets)
+    row.sketch = merge_bucket_counts(row.sketch, delta.sketch)
+    row.schema_version = max(row.schema_version, ROLLUP_SCHEMA_VERSION)
+    row.error_count += delta.error_count
+    row.blocked_count += delta.blocked_count
     row.save(
         update_fields=[
             "turn_count",
             "sum_ms",
             "max_ms",
             "buckets",
+            "sketch",
             "error_count",
             "blocked_count",
+            "schema_version",
         ]
     )
 
 
+def _merge_rollups(rollups: Dict[RollupKey, RollupDelta]) -> None:
+    if not rollups:
+        return
+    if connection.vendor == "postgresql":
+        _merge_rollups_postgres(rollups)
+        return
+    for (project_uuid, hour_ts, execution_path, phase), delta in sorted(rollups.items(), key=lambda item: item[0]):
+        _upsert_rollup_row(
+            project_uuid=project_uuid,
+            hour_ts=hour_ts,
+            execution_path=execution_path,
+            phase=phase,
+            delta=delta,
+        )
+
+
+def flush_turn_latency() -> int:
+    """Write buffered rollups and outliers for this process. Returns the number of rollup rows merged."""
+    rollups, outliers = _buffer.drain()
+    if not rollups and not outliers:
+        return 0
+
+    try:
+        with transaction.atomic():
+            _merge_rollups(rollups)
+            if outliers:
+                InlineAgentTurnOutlier.objects.bulk_create(outliers)
+    except Exception as exc:
+        logger.exception(
+            "Failed to persist inline agent latency",
+            extra={"rollup_rows": len(rollups), "outliers": len(outliers)},
+        )
+        sentry_sdk.capture_exception(exc)
+        _buffer.restore(rollups, outliers)
+        return 0
+    return len(rollups)
+
+
+def _flush_loop(interval: float) -> None:
+    while True:
+        _flush_requested.wait(interval)
+        _flush_requested.clear()
+        try:
+            flush_turn_latency()
+        except Exception:
+            logger.exception("Inline agent latency flush loop error")
+        finally:
+            connection.close()
+
+
+def _ensure_flusher() -> None:
+    """Start the flush thread once per process (Celery prefork children included)."""
+    global _flusher_pid
+    pid = os.getpid()
+    if _flusher_pid == pid:
+        return
+    with _flusher_lock:
+        if _flusher_pid == pid:
+            return
+        interval = _latency_settings()["flush_interval"]
+        threading.Thread(target=_flush_loop, args=(interval,), name="latency_flush", daemon=True).start()
+        atexit.register(flush_turn_latency)
+        _flusher_pid = pid
+
+
 def record_turn_latency(
     *,
     project_uuid: str,
@@ -158,6 +395,12 @@ def record_turn_latency(
     context: Optional[Dict[str, Any]] = None,
     finished_at: Optional[datetime] = None,
 ) -> None:
+    """
+    Buffer one turn's rollups (and outlier sample) in memory; no database round-trip.
+
+    The process flush thread writes the buffer every INLINE_AGENT_LATENCY_FLUSH_INTERVAL_SECONDS.
+    With an interval of 0 the turn is flushed synchronously.
+    """
     cfg = _latency_settings()
     if not cfg["enabled"]:
         return
@@ -176,59 +419,70 @@ def record_turn_latency(
     broker_wait_ms = boundaries_ms.get("broker_queue_wait")
 
     try:
-        with transaction.atomic():
-            phase_durations = rollup_phases_for_turn(
-                correlation.execution_path,
-                total_ms=total_ms,
-                phase_ms=phase_ms,
-                boundaries_ms=boundaries_ms,
-            )
-            for phase, duration_ms in phase_durations.items():
-                _upsert_rollup_row(
-                    project_uuid=project_uuid,
-                    hour_ts=hour_ts,
-                    execution_path=correlation.execution_path,
-                    phase=phase,
-                    duration_ms=duration_ms,
-                    status=status,
-                )
+        phase_durations = rollup_phases_for_turn(
+            correlation.execution_path,
+            total_ms=total_ms,
+            phase_ms=phase_ms,
+            boundaries_ms=boundaries_ms,
+        )
 
-            store, sample_reason = decide_outlier_sample(
+        outlier = None
+        store, sample_reason = decide_outlier_sample(
+            status=status,
+            total_ms=total_ms,
+            broker_wait_ms=broker_wait_ms,
+            cfg=cfg,
+        )
+        if store and sample_reason:
+            router_dt = None
+            if router_received_at is not None:
+                router_dt = datetime.fromtimestamp(router_received_at, tz=timezone.utc)
+            log_uuid = None
+            if correlation.message_conversation_log_uuid:
+                try:
+                    log_uuid = UUID(str(correlation.message_conversation_log_uuid))
+                except (ValueError, TypeError, AttributeError):
+                    log_uuid = None
+            outlier = InlineAgentTurnOutlier(
+                project_uuid=project_uuid,
+                execution_path=correlation.execution_path,
+                turn_finished_at=finished,
+                contact_urn=correlation.contact_urn[:512],
+                turn_id=turn_id[:255],
+                message_conversation_log_uuid=log_uuid,
+                channel_type=(correlation.channel_type or "")[:32],
+                celery_task_id=(task_id or "")[:255],
                 status=status,
                 total_ms=total_ms,
-                broker_wait_ms=broker_wait_ms,
-                cfg=cfg,
+                boundaries_ms=boundaries_ms,
+                phase_ms=phase_ms,
+                context=context or {},
+                router_received_at=router_dt,
+                sample_reason=sample_reason,
             )
-            if store and sample_reason:
-                router_dt = None
-                if router_received_at is not None:
-                    router_dt = datetime.fromtimestamp(router_received_at, tz=timezone.utc)
-                log_uuid = None
-                if correlation.message_conversation_log_uuid:
-                    try:
-                        log_uuid = UUID(str(correlation.message_conversation_log_uuid))
-                    except (ValueError, TypeError, AttributeError):
-                        log_uuid = None
-                InlineAgentTurnOutlier.objects.create(
-                    project_uuid=project_uuid,
-                    execution_path=correlation.execution_path,
-                    turn_finished_at=finished,
-                    contact_urn=correlation.contact_urn[:512],
-                    turn_id=turn_id[:255],
-                    message_conversation_log_uuid=log_uuid,
-                    channel_type=(correlation.channel_type or "")[:32],
-                    celery_task_id=(task_id or "")[:255],
-                    status=status,
-                    total_ms=total_ms,
-                    boundaries_ms=boundaries_ms,
-                    phase_ms=phase_ms,
-                    context=context or {},
-                    router_received_at=router_dt,
-                    sample_reason=sample_reason,
-                )
+
+        _buffer.add_turn(
+            project_uuid=project_uuid,
+            hour_ts=hour_ts,
+            execution_path=correlation.execution_path,
+            phase_durations=phase_durations,
+            status=status,
+            outlier=outlier,
+        )
     except Exception as exc:
         logger.exception(
-            "Failed to persist inline agent latency",
+            "Failed to buffer inline agent latency",
             extra={"project_uuid": project_uuid, "turn_id": turn_id, "task_id": task_id},
         )
         sentry_sdk.capture_exception(exc)
+        return
+
+    if cfg["flush_interval"] <= 0:
+        flush_turn_latency()
+        return
+    if getattr(settings, "TESTING", False):
+        return
+
+    _ensure_flusher()
+    if len(_buffer) >= cfg["buffer_max_rows"]:
+        _flush_requested.set()
@@ -0,0 +1,33 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nexus.analytics.latency_compaction import compact_day, compact_month, month_start
+
+
+class Command(BaseCommand):
+    help = "Rebuild daily and monthly inline agent latency rollups from the hourly rows (backfill)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start-date", type=date.fromisoformat, required=True)
+        parser.add_argument("--end-date", type=date.fromisoformat, default=None)
+
+    def handle(self, *args, **options):
+        start_date = options["start_date"]
+        end_date = options["end_date"] or date.today()
+        if start_date > end_date:
+            raise CommandError("start-date must be before or equal to end-date")
+
+        day = start_date
+        months = set()
+        while day <= end_date:
+            rows = compact_day(day)
+            months.add(month_start(day))
+            self.stdout.write(f"{day.isoformat()}: {rows} daily rows")
+            day += timedelta(days=1)
+
+        for month in sorted(months):
+            rows = compact_month(month)
+            self.stdout.write(f"{month.isoformat()[:7]}: {rows} monthly rows")
+
+        self.stdout.write(self.style.SUCCESS("Finished compacting inline agent latency rollups."))
@@ -0,0 +1,40 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from nexus.analytics.conversation_facts import first_conversation_day, reconcile_conversation_facts
+
+
+class Command(BaseCommand):
+    help = "Rebuild analytics conversation daily facts from the conversations table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start-date",
+            type=date.fromisoformat,
+            default=None,
+            help="Defaults to the day of the oldest conversation (full backfill)",
+        )
+        parser.add_argument(
+            "--end-date", type=date.fromisoformat, default=None, help="Defaults to yesterday, the last closed day"
+        )
+        parser.add_argument("--chunk-days", type=int, default=31)
+
+    def handle(self, *args, **options):
+        start_date = options["start_date"] or first_conversation_day()
+        end_date = options["end_date"] or timezone.localdate() - timedelta(days=1)
+        if start_date is None:
+            self.stdout.write("No conversations to reconcile.")
+            return
+        if start_date > end_date:
+            raise CommandError("start-date must be before or equal to end-date")
+
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(end_date, chunk_start + timedelta(days=options["chunk_days"] - 1))
+            rows = reconcile_conversation_facts(chunk_start, chunk_end)
+            self.stdout.write(f"{chunk_start.isoformat()}..{chunk_end.isoformat()}: {rows} fact rows")
+            chunk_start = chunk_end + timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS("Finished reconciling conversation facts."))
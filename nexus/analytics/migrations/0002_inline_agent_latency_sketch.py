@@ -0,0 +1,17 @@
+"""Add the mergeable quantile sketch to hourly latency rollups."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analytics", "0001_inline_agent_latency"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inlineagentlatencyhourly",
+            name="sketch",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
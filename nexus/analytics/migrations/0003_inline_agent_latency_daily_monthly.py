@@ -0,0 +1,66 @@
+"""Daily and monthly compactions of the hourly inline agent latency rollups."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analytics", "0002_inline_agent_latency_sketch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InlineAgentLatencyDaily",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("project_uuid", models.UUIDField(db_index=True)),
+                ("execution_path", models.CharField(default="inline_agents", max_length=64)),
+                ("phase", models.CharField(max_length=64)),
+                ("turn_count", models.PositiveIntegerField(default=0)),
+                ("sum_ms", models.BigIntegerField(default=0)),
+                ("max_ms", models.PositiveIntegerField(default=0)),
+                ("buckets", models.JSONField(blank=True, default=dict)),
+                ("sketch", models.JSONField(blank=True, default=dict)),
+                ("error_count", models.PositiveIntegerField(default=0)),
+                ("blocked_count", models.PositiveIntegerField(default=0)),
+                ("schema_version", models.PositiveSmallIntegerField(default=1)),
+                ("day", models.DateField()),
+            ],
+            options={
+                "db_table": "inline_agent_latency_daily",
+            },
+        ),
+        migrations.CreateModel(
+            name="InlineAgentLatencyMonthly",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("project_uuid", models.UUIDField(db_index=True)),
+                ("execution_path", models.CharField(default="inline_agents", max_length=64)),
+                ("phase", models.CharField(max_length=64)),
+                ("turn_count", models.PositiveIntegerField(default=0)),
+                ("sum_ms", models.BigIntegerField(default=0)),
+                ("max_ms", models.PositiveIntegerField(default=0)),
+                ("buckets", models.JSONField(blank=True, default=dict)),
+                ("sketch", models.JSONField(blank=True, default=dict)),
+                ("error_count", models.PositiveIntegerField(default=0)),
+                ("blocked_count", models.PositiveIntegerField(default=0)),
+                ("schema_version", models.PositiveSmallIntegerField(default=1)),
+                ("month", models.DateField()),
+            ],
+            options={
+                "db_table": "inline_agent_latency_monthly",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="inlineagentlatencymonthly",
+            constraint=models.UniqueConstraint(
+                fields=("project_uuid", "month", "execution_path", "phase"), name="inline_agent_latency_monthly_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="inlineagentlatencydaily",
+            constraint=models.UniqueConstraint(
+                fields=("project_uuid", "day", "execution_path", "phase"), name="inline_agent_latency_daily_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+"""Daily conversation counts per project and resolution.
+
+Ships the table empty; backfill it with ``manage.py reconcile_conversation_facts`` after deploying.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analytics", "0003_inline_agent_latency_daily_monthly"),
+        ("intelligences", "0032_instructioncategory_and_category_fk"),
+        ("projects", "0036_project_vtex_account_vtex_host_store_storefront_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConversationDailyFact",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField()),
+                ("resolution", models.CharField(max_length=255)),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="conversation_daily_facts",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "analytics_conversation_daily_fact",
+                "indexes": [models.Index(fields=["day"], name="analytics_conv_fact_day_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="conversationdailyfact",
+            constraint=models.UniqueConstraint(
+                fields=("project", "day", "resolution"), name="analytics_conversation_daily_fact_uniq"
+            ),
+        ),
+    ]
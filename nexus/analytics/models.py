@@ -3,21 +3,31 @@ from uuid import uuid4
 from django.db import models
 
 
-class InlineAgentLatencyHourly(models.Model):
-    """Hourly rollup for inline agent turn latency (Plan B)."""
+class LatencyRollupFields(models.Model):
+    """Counters shared by the hourly, daily and monthly latency rollups."""
 
     project_uuid = models.UUIDField(db_index=True)
-    hour_ts = models.DateTimeField(db_index=True)
     execution_path = models.CharField(max_length=64, default="inline_agents")
     phase = models.CharField(max_length=64)
     turn_count = models.PositiveIntegerField(default=0)
     sum_ms = models.BigIntegerField(default=0)
     max_ms = models.PositiveIntegerField(default=0)
     buckets = models.JSONField(default=dict, blank=True)
+    # Log-bucketed quantile sketch (see latency_phases.sketch_key); empty on schema_version 1 rows
+    sketch = models.JSONField(default=dict, blank=True)
     error_count = models.PositiveIntegerField(default=0)
     blocked_count = models.PositiveIntegerField(default=0)
     schema_version = models.PositiveSmallIntegerField(default=1)
 
+    class Meta:
+        abstract = True
+
+
+class InlineAgentLatencyHourly(LatencyRollupFields):
+    """Hourly rollup for inline agent turn latency (Plan B)."""
+
+    hour_ts = models.DateTimeField(db_index=True)
+
     class Meta:
         db_table = "inline_agent_latency_hourly"
         constraints = [
@@ -31,6 +41,36 @@ class InlineAgentLatencyHourly(models.Model):
         ]
 
 
+class InlineAgentLatencyDaily(LatencyRollupFields):
+    """Hourly rows compacted per UTC day; rebuilt by compact_inline_agent_latency_rollups."""
+
+    day = models.DateField()
+
+    class Meta:
+        db_table = "inline_agent_latency_daily"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("project_uuid", "day", "execution_path", "phase"),
+                name="inline_agent_latency_daily_uniq",
+            ),
+        ]
+
+
+class InlineAgentLatencyMonthly(LatencyRollupFields):
+    """Daily rows compacted per UTC month; ``month`` is the first day of the month."""
+
+    month = models.DateField()
+
+    class Meta:
+        db_table = "inline_agent_latency_monthly"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("project_uuid", "month", "execution_path", "phase"),
+                name="inline_agent_latency_monthly_uniq",
+            ),
+        ]
+
+
 class InlineAgentTurnOutlier(models.Model):
     """Slow, failed, or sampled turns for drill-down."""
 
@@ -85,3 +125,29 @@ class InlineAgentTurnOutlier(models.Model):
             models.Index(fields=["project_uuid", "-turn_finished_at"]),
             models.Index(fields=["project_uuid", "-total_ms"]),
         ]
+
+
+class ConversationDailyFact(models.Model):
+    """
+    Conversations per project, UTC day of ``created_at`` and resolution.
+
+    Maintained incrementally as conversations are written (see
+    nexus.analytics.conversation_facts) and rebuilt nightly for recent days.
+    """
+
+    project = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="conversation_daily_facts")
+    day = models.DateField()
+    resolution = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "analytics_conversation_daily_fact"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("project", "day", "resolution"),
+                name="analytics_conversation_daily_fact_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["day"], name="analytics_conv_fact_day_idx"),
+        ]
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from nexus.analytics.conversation_facts import record_conversation_deleted, record_conversation_saved
+from nexus.intelligences.models import Conversation
+
+
+@receiver(post_save, sender=Conversation)
+def update_conversation_facts_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    record_conversation_saved(instance, created)
+
+
+@receiver(post_delete, sender=Conversation)
+def update_conversation_facts_on_delete(sender, instance, **kwargs):
+    record_conversation_deleted(instance)
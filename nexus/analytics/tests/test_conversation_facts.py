@@ -0,0 +1,158 @@
+"""Tests for the incrementally maintained conversation daily facts."""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+from django.utils import timezone as django_timezone
+
+from nexus.analytics.api.views import conversation_facts, sum_conversations
+from nexus.analytics.conversation_facts import reconcile_conversation_facts, reconcile_recent_conversation_facts
+from nexus.analytics.models import ConversationDailyFact
+from nexus.intelligences.models import Conversation
+from nexus.usecases.intelligences.tests.intelligence_factory import ConversationFactory
+from nexus.usecases.projects.tests.project_factory import ProjectFactory
+
+
+def _facts(project):
+    return {
+        (fact.day, fact.resolution): fact.count
+        for fact in ConversationDailyFact.objects.filter(project=project, count__gt=0)
+    }
+
+
+class ConversationFactMaintenanceTestCase(TestCase):
+    def setUp(self):
+        self.project = ProjectFactory()
+
+    def _conversation(self, created_at, resolution):
+        conversation = ConversationFactory(project=self.project, resolution=resolution)
+        conversation.created_at = created_at
+        conversation.save(update_fields=["created_at"])
+        return conversation
+
+    def test_create_and_save_move_counts(self):
+        conversation = self._conversation(datetime(2026, 7, 16, 12, tzinfo=timezone.utc), 2)
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "2"): 1})
+
+        conversation.resolution = 0
+        conversation.save()
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "0"): 1})
+
+    def test_backfill_command_starts_at_the_oldest_conversation(self):
+        self._conversation(datetime(2026, 7, 10, 12, tzinfo=timezone.utc), 0)
+        self._conversation(datetime(2026, 7, 16, 12, tzinfo=timezone.utc), 1)
+        ConversationDailyFact.objects.all().delete()
+        out = StringIO()
+
+        call_command("reconcile_conversation_facts", "--end-date", "2026-07-17", "--chunk-days", "3", stdout=out)
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 10), "0"): 1, (date(2026, 7, 16), "1"): 1})
+        self.assertIn("2026-07-10..2026-07-12", out.getvalue())
+
+    def test_save_after_reload_uses_loaded_values(self):
+        conversation = self._conversation(datetime(2026, 7, 16, 12, tzinfo=timezone.utc), 2)
+
+        reloaded = Conversation.objects.get(pk=conversation.pk)
+        reloaded.resolution = "1"
+        reloaded.save()
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "1"): 1})
+
+    def test_queryset_update_moves_counts(self):
+        for hour in (10, 11, 12):
+            self._conversation(datetime(2026, 7, 16, hour, tzinfo=timezone.utc), 2)
+
+        updated = Conversation.objects.filter(project=self.project, resolution=2).order_by("-created_at")[1:]
+        Conversation.objects.filter(pk__in=[c.pk for c in updated]).update(resolution=3)
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "2"): 1, (date(2026, 7, 16), "3"): 2})
+
+    def test_update_without_fact_fields_skips_tracking(self):
+        self._conversation(datetime(2026, 7, 16, 12, tzinfo=timezone.utc), 2)
+
+        with self.assertNumQueries(1):
+            Conversation.objects.filter(project=self.project).update(contact_name="Name")
+
+    def test_delete_decrements(self):
+        conversation = self._conversation(datetime(2026, 7, 16, 12, tzinfo=timezone.utc), 4)
+        self._conversation(datetime(2026, 7, 16, 13, tzinfo=timezone.utc), 4)
+
+        conversation.delete()
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "4"): 1})
+
+    def test_reconcile_repairs_drift(self):
+        self._conversation(datetime(2026, 7, 16, 12, tzinfo=timezone.utc), 0)
+        ConversationDailyFact.objects.filter(project=self.project, day=date(2026, 7, 16)).update(count=42)
+        ConversationDailyFact.objects.create(project=self.project, day=date(2026, 7, 17), resolution="1", count=3)
+
+        reconcile_conversation_facts(date(2026, 7, 16), date(2026, 7, 17))
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "0"): 1})
+
+    def test_reconcile_counts_a_day_up_to_its_last_instant(self):
+        self._conversation(datetime(2026, 7, 16, 23, 59, 59, 999999, tzinfo=timezone.utc), 0)
+        self._conversation(datetime(2026, 7, 17, 0, 0, tzinfo=timezone.utc), 0)
+        ConversationDailyFact.objects.all().delete()
+
+        reconcile_conversation_facts(date(2026, 7, 16), date(2026, 7, 16))
+
+        self.assertEqual(_facts(self.project), {(date(2026, 7, 16), "0"): 1})
+
+    def test_recent_reconcile_leaves_today_to_the_live_deltas(self):
+        now = django_timezone.now()
+        self._conversation(now - timedelta(days=1), 0)
+        self._conversation(now, 0)
+        ConversationDailyFact.objects.update(count=42)
+
+        reconcile_recent_conversation_facts(days=1)
+
+        today = django_timezone.localdate(now)
+        self.assertEqual(_facts(self.project), {(today - timedelta(days=1), "0"): 1, (today, "0"): 42})
+
+
+class ConversationFactParityTestCase(TestCase):
+    """Fact-table aggregates must equal the live aggregates over Conversation."""
+
+    def test_matches_live_aggregates(self):
+        rng = random.Random(11)
+        projects = [
+            ProjectFactory(agents_backend="BedrockBackend"),
+            ProjectFactory(agents_backend="OpenAIBackend"),
+        ]
+        conversations = []
+        for _ in range(60):
+            conversation = ConversationFactory(project=rng.choice(projects), resolution=rng.randint(0, 4))
+            conversation.created_at = datetime(2026, 7, rng.randint(1, 31), rng.randint(0, 23), tzinfo=timezone.utc)
+            conversation.save(update_fields=["created_at"])
+            conversations.append(conversation)
+        for conversation in rng.sample(conversations, 15):
+            conversation.resolution = rng.randint(0, 4)
+            conversation.save()
+        Conversation.objects.filter(pk__in=[c.pk for c in rng.sample(conversations, 10)]).update(resolution="3")
+        rng.choice(conversations).delete()
+
+        start, end = date(2026, 7, 5), date(2026, 7, 25)
+        live = (
+            Conversation.objects.filter(created_at__date__gte=start, created_at__date__lte=end)
+            .values("project__uuid")
+            .annotate(
+                total=Count("uuid"),
+                resolved=Count("uuid", filter=Q(resolution="0")),
+                unresolved=Count("uuid", filter=Q(resolution="1")),
+            )
+            .order_by("project__uuid")
+        )
+        from_facts = (
+            conversation_facts(start, end)
+            .values("project__uuid")
+            .annotate(total=sum_conversations(), resolved=sum_conversations("0"), unresolved=sum_conversations("1"))
+            .order_by("project__uuid")
+        )
+
+        self.assertEqual(list(from_facts), list(live))
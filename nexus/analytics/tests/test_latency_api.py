@@ -1,5 +1,6 @@
 """Tests for inline agent latency API auth and query helpers."""
 
+import random
 from datetime import date
 from unittest import mock
 from uuid import uuid4
@@ -9,8 +10,14 @@ from django.test import SimpleTestCase, TestCase, override_settings
 from rest_framework.test import APIRequestFactory
 
 from nexus.analytics.api.permissions import InlineAgentLatencyAPIPermission
-from nexus.analytics.latency_phases import cumulative_bucket_key_for_threshold, increment_buckets
-from nexus.analytics.latency_queries import build_summary, validate_date_range
+from nexus.analytics.latency_phases import (
+    cumulative_bucket_key_for_threshold,
+    increment_buckets,
+    increment_sketch,
+    merge_bucket_counts,
+    sketch_quantile,
+)
+from nexus.analytics.latency_queries import build_summary, build_timeseries, validate_date_range
 from nexus.analytics.models import InlineAgentLatencyHourly
 
 
@@ -67,7 +74,46 @@ class LatencyPhasesBucketTestCase(SimpleTestCase):
         self.assertEqual(buckets["inf"], 1)
 
 
+class LatencySketchTestCase(SimpleTestCase):
+    def _sketch(self, values):
+        sketch = {}
+        for value in values:
+            sketch = increment_sketch(sketch, value)
+        return sketch
+
+    def test_quantiles_within_one_percent(self):
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(8, 0.6)) + 1 for _ in range(5000))
+        sketch = self._sketch(values)
+
+        for quantile in (0.5, 0.95, 0.99):
+            true_value = values[int(quantile * (len(values) - 1))]
+            estimate = sketch_quantile(sketch, quantile)
+            self.assertLessEqual(abs(estimate - true_value), true_value * 0.01 + 1)
+
+    def test_distinguishes_nearby_latencies(self):
+        self.assertNotEqual(
+            sketch_quantile(self._sketch([1200] * 100), 0.95),
+            sketch_quantile(self._sketch([1300] * 100), 0.95),
+        )
+
+    def test_merge_matches_single_sketch(self):
+        left, right = [100, 900, 12000], [4500, 30000, 30001]
+        merged = merge_bucket_counts(self._sketch(left), self._sketch(right))
+        self.assertEqual(merged, self._sketch(left + right))
+
+    def test_size_stays_bounded(self):
+        sketch = self._sketch(range(0, 10_000_000, 997))
+        self.assertLess(len(sketch), 800)
+
+
 class LatencyQueriesTestCase(TestCase):
+    def setUp(self):
+        # Rows below are on 2026-07-16, inside the hourly (not yet compacted) window.
+        patcher = mock.patch("nexus.analytics.latency_queries._utc_today", return_value=date(2026, 7, 17))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_validate_date_range_max_90_days(self):
         start = date(2026, 1, 1)
         end = date(2026, 6, 1)
@@ -105,3 +151,49 @@ class LatencyQueriesTestCase(TestCase):
         )
         summary = build_summary(project_uuid, date(2026, 7, 16), date(2026, 7, 16))
         self.assertEqual(summary["pct_under_target_high_ms"], 100.0)
+
+    def test_build_summary_merges_sketches_across_hours(self):
+        project_uuid = uuid4()
+        for hour, values in (("19", [1000] * 90), ("20", [1800] * 10)):
+            sketch, buckets = {}, {}
+            for value in values:
+                sketch = increment_sketch(sketch, value)
+                buckets = increment_buckets(buckets, value)
+            InlineAgentLatencyHourly.objects.create(
+                project_uuid=project_uuid,
+                hour_ts=f"2026-07-16T{hour}:00:00+00:00",
+                execution_path="inline_agents",
+                phase="total",
+                turn_count=len(values),
+                sum_ms=sum(values),
+                max_ms=max(values),
+                buckets=buckets,
+                sketch=sketch,
+                schema_version=2,
+            )
+
+        summary = build_summary(project_uuid, date(2026, 7, 16), date(2026, 7, 16))
+
+        self.assertAlmostEqual(summary["p50_estimate_ms"], 1000, delta=10)
+        self.assertAlmostEqual(summary["p95_estimate_ms"], 1800, delta=18)
+        self.assertAlmostEqual(summary["p99_estimate_ms"], 1800, delta=18)
+
+    def test_legacy_rows_fall_back_to_fixed_buckets(self):
+        project_uuid = uuid4()
+        InlineAgentLatencyHourly.objects.create(
+            project_uuid=project_uuid,
+            hour_ts="2026-07-16T19:00:00+00:00",
+            execution_path="inline_agents",
+            phase="total",
+            turn_count=2,
+            sum_ms=7000,
+            max_ms=4000,
+            buckets=increment_buckets(increment_buckets({}, 3000), 4000),
+        )
+
+        summary = build_summary(project_uuid, date(2026, 7, 16), date(2026, 7, 16))
+        series = build_timeseries(project_uuid, date(2026, 7, 16), date(2026, 7, 16))
+
+        self.assertEqual(summary["p95_estimate_ms"], 5000)
+        self.assertIsNone(summary["p99_estimate_ms"])
+        self.assertEqual(series[0]["p95_estimate_ms"], 5000)
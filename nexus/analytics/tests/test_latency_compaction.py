@@ -0,0 +1,187 @@
+"""Tests for daily/monthly latency compaction and range routing."""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from nexus.analytics.latency_compaction import (
+    COMPACTED_THROUGH_KEY,
+    compact_day,
+    compact_month,
+    compact_recent_latency_rollups,
+)
+from nexus.analytics.latency_phases import increment_buckets, increment_sketch
+from nexus.analytics.latency_queries import build_summary, build_timeseries
+from nexus.analytics.models import InlineAgentLatencyDaily, InlineAgentLatencyHourly, InlineAgentLatencyMonthly
+
+
+def _hourly_row(project_uuid, hour_ts, values, phase="total"):
+    buckets, sketch = {}, {}
+    for value in values:
+        buckets = increment_buckets(buckets, value)
+        sketch = increment_sketch(sketch, value)
+    return InlineAgentLatencyHourly.objects.create(
+        project_uuid=project_uuid,
+        hour_ts=hour_ts,
+        execution_path="inline_agents",
+        phase=phase,
+        turn_count=len(values),
+        sum_ms=sum(values),
+        max_ms=max(values),
+        buckets=buckets,
+        sketch=sketch,
+        error_count=1,
+        schema_version=2,
+    )
+
+
+class LatencyCompactionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.project_uuid = str(uuid4())
+
+    def test_compact_day_merges_hours(self):
+        _hourly_row(self.project_uuid, datetime(2026, 7, 16, 9, tzinfo=timezone.utc), [1000, 2000])
+        _hourly_row(self.project_uuid, datetime(2026, 7, 16, 23, tzinfo=timezone.utc), [6000])
+        _hourly_row(self.project_uuid, datetime(2026, 7, 17, 0, tzinfo=timezone.utc), [9999])
+
+        self.assertEqual(compact_day(date(2026, 7, 16)), 1)
+
+        row = InlineAgentLatencyDaily.objects.get(project_uuid=self.project_uuid, day=date(2026, 7, 16))
+        self.assertEqual(row.turn_count, 3)
+        self.assertEqual(row.sum_ms, 9000)
+        self.assertEqual(row.max_ms, 6000)
+        self.assertEqual(row.error_count, 2)
+        self.assertEqual(row.schema_version, 2)
+        self.assertEqual(row.buckets["inf"], 3)
+        self.assertEqual(sum(row.sketch.values()), 3)
+
+    def test_compaction_is_idempotent(self):
+        _hourly_row(self.project_uuid, datetime(2026, 7, 16, 9, tzinfo=timezone.utc), [1000])
+        compact_day(date(2026, 7, 16))
+        _hourly_row(self.project_uuid, datetime(2026, 7, 16, 10, tzinfo=timezone.utc), [3000])
+        compact_day(date(2026, 7, 16))
+        compact_month(date(2026, 7, 16))
+        compact_month(date(2026, 7, 1))
+
+        self.assertEqual(InlineAgentLatencyDaily.objects.get(project_uuid=self.project_uuid).turn_count, 2)
+        monthly = InlineAgentLatencyMonthly.objects.get(project_uuid=self.project_uuid)
+        self.assertEqual(monthly.month, date(2026, 7, 1))
+        self.assertEqual(monthly.turn_count, 2)
+
+    def test_recent_compaction_covers_yesterday_across_month_boundary(self):
+        _hourly_row(self.project_uuid, datetime(2026, 7, 31, 22, tzinfo=timezone.utc), [1000])
+        _hourly_row(self.project_uuid, datetime(2026, 8, 1, 0, tzinfo=timezone.utc), [2000])
+
+        result = compact_recent_latency_rollups(now=datetime(2026, 8, 1, 0, 15, tzinfo=timezone.utc))
+
+        self.assertEqual(result, {"daily_rows": 2, "monthly_rows": 2})
+        self.assertEqual(
+            set(InlineAgentLatencyMonthly.objects.values_list("month", flat=True)),
+            {date(2026, 7, 1), date(2026, 8, 1)},
+        )
+
+    def test_recent_compaction_catches_up_from_the_watermark(self):
+        for day in (14, 15, 16, 17):
+            _hourly_row(self.project_uuid, datetime(2026, 7, day, 12, tzinfo=timezone.utc), [1000])
+        cache.set(COMPACTED_THROUGH_KEY, "2026-07-13")
+
+        compact_recent_latency_rollups(now=datetime(2026, 7, 17, 13, tzinfo=timezone.utc))
+
+        self.assertEqual(
+            sorted(InlineAgentLatencyDaily.objects.values_list("day", flat=True)),
+            [date(2026, 7, 14), date(2026, 7, 15), date(2026, 7, 16), date(2026, 7, 17)],
+        )
+        self.assertEqual(cache.get(COMPACTED_THROUGH_KEY), "2026-07-16")
+
+    @override_settings(INLINE_AGENT_LATENCY_COMPACTION_MAX_DAYS=2)
+    def test_recent_compaction_resumes_after_the_newest_daily_row(self):
+        _hourly_row(self.project_uuid, datetime(2026, 7, 10, 12, tzinfo=timezone.utc), [1000])
+        compact_day(date(2026, 7, 10))
+        for day in (11, 12, 13):
+            _hourly_row(self.project_uuid, datetime(2026, 7, day, 12, tzinfo=timezone.utc), [1000])
+        now = datetime(2026, 7, 17, 13, tzinfo=timezone.utc)
+
+        compact_recent_latency_rollups(now=now)
+        self.assertEqual(cache.get(COMPACTED_THROUGH_KEY), "2026-07-12")
+        compact_recent_latency_rollups(now=now)
+
+        self.assertEqual(
+            sorted(InlineAgentLatencyDaily.objects.values_list("day", flat=True)),
+            [date(2026, 7, 10), date(2026, 7, 11), date(2026, 7, 12), date(2026, 7, 13)],
+        )
+        self.assertEqual(cache.get(COMPACTED_THROUGH_KEY), "2026-07-14")
+
+    def test_backfill_command(self):
+        _hourly_row(self.project_uuid, datetime(2026, 6, 30, 12, tzinfo=timezone.utc), [1000])
+        _hourly_row(self.project_uuid, datetime(2026, 7, 2, 12, tzinfo=timezone.utc), [1000])
+
+        call_command(
+            "compact_inline_agent_latency", "--start-date", "2026-06-30", "--end-date", "2026-07-02", stdout=mock.Mock()
+        )
+
+        self.assertEqual(InlineAgentLatencyDaily.objects.count(), 2)
+        self.assertEqual(InlineAgentLatencyMonthly.objects.count(), 2)
+
+
+@mock.patch("nexus.analytics.latency_queries._utc_today", return_value=date(2026, 10, 20))
+class LatencyRangeRoutingTestCase(TestCase):
+    def setUp(self):
+        self.project_uuid = str(uuid4())
+        day = date(2026, 7, 20)
+        while day <= date(2026, 10, 20):
+            _hourly_row(
+                self.project_uuid, datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc), [1000 + day.day]
+            )
+            day += timedelta(days=1)
+        call_command(
+            "compact_inline_agent_latency", "--start-date", "2026-07-20", "--end-date", "2026-10-20", stdout=mock.Mock()
+        )
+
+    def test_summary_matches_hourly_totals(self, _mock_today):
+        start, end = date(2026, 7, 22), date(2026, 10, 20)
+        hourly = InlineAgentLatencyHourly.objects.filter(
+            project_uuid=self.project_uuid, hour_ts__date__gte=start, hour_ts__date__lte=end
+        )
+
+        summary = build_summary(self.project_uuid, start, end)
+
+        self.assertEqual(summary["turn_count"], hourly.count())
+        self.assertEqual(summary["max_ms"], max(row.max_ms for row in hourly))
+        self.assertAlmostEqual(summary["avg_ms"], sum(row.sum_ms for row in hourly) / hourly.count(), places=2)
+
+    def test_summary_reads_monthly_rows_for_whole_months(self, _mock_today):
+        # Hourly rows for closed days are ignored once compacted, so a stale monthly row shows through.
+        InlineAgentLatencyMonthly.objects.filter(project_uuid=self.project_uuid, month=date(2026, 8, 1)).update(
+            turn_count=1000
+        )
+
+        summary = build_summary(self.project_uuid, date(2026, 8, 1), date(2026, 8, 31))
+
+        self.assertEqual(summary["turn_count"], 1000)
+
+    def test_query_count_independent_of_range(self, _mock_today):
+        with self.assertNumQueries(9):
+            build_summary(self.project_uuid, date(2026, 7, 22), date(2026, 10, 20))
+        with self.assertNumQueries(9):
+            build_summary(self.project_uuid, date(2026, 8, 15), date(2026, 10, 20))
+
+    def test_long_timeseries_is_daily(self, _mock_today):
+        series = build_timeseries(self.project_uuid, date(2026, 10, 1), date(2026, 10, 20))
+
+        self.assertEqual(len(series), 20)
+        self.assertEqual({point["granularity"] for point in series}, {"day"})
+        self.assertEqual(series[0]["hour_ts"], "2026-10-01T00:00:00Z")
+        self.assertEqual(series[-1]["hour_ts"], "2026-10-20T00:00:00Z")
+        self.assertEqual(series[-1]["max_ms"], 1020)
+
+    def test_short_timeseries_is_hourly(self, _mock_today):
+        series = build_timeseries(self.project_uuid, date(2026, 10, 19), date(2026, 10, 20))
+
+        self.assertEqual(len(series), 2)
+        self.assertEqual(series[0]["granularity"], "hour")
+        self.assertEqual(series[0]["hour_ts"], "2026-10-19T12:00:00Z")
@@ -9,7 +9,14 @@ from django.test import SimpleTestCase, TestCase
 
 from nexus.analytics.latency_conversation_lookup import build_conversation_lookup
 from nexus.analytics.latency_phases import increment_buckets
-from nexus.analytics.latency_writer import TurnCorrelation, decide_outlier_sample, record_turn_latency
+from nexus.analytics.latency_writer import (
+    RollupDelta,
+    TurnCorrelation,
+    _merge_rollups_postgres,
+    decide_outlier_sample,
+    flush_turn_latency,
+    record_turn_latency,
+)
 from nexus.analytics.models import InlineAgentLatencyHourly, InlineAgentTurnOutlier
 
 
@@ -35,7 +42,13 @@ class OutlierRulesTestCase(SimpleTestCase):
         self.assertEqual(reason, "threshold")
 
     def test_failed_always_stored(self):
-        cfg = {"outlier_ms": 30000, "broker_outlier_ms": 2000, "elevated_ms": 15000, "sample_rate": 0, "elevated_sample_rate": 0}
+        cfg = {
+            "outlier_ms": 30000,
+            "broker_outlier_ms": 2000,
+            "elevated_ms": 15000,
+            "sample_rate": 0,
+            "elevated_sample_rate": 0,
+        }
         store, reason = decide_outlier_sample(status="failed", total_ms=100, broker_wait_ms=0, cfg=cfg)
         self.assertTrue(store)
         self.assertEqual(reason, "failed")
@@ -54,7 +67,31 @@ class ConversationLookupTestCase(SimpleTestCase):
         self.assertEqual(lookup["correlation_id"], "turn-abc")
 
 
+class MergeRollupsPostgresTestCase(SimpleTestCase):
+    @patch("nexus.analytics.latency_writer._MERGE_BATCH_SIZE", 2)
+    @patch("nexus.analytics.latency_writer.connection")
+    def test_rows_are_upserted_in_key_order(self, mock_connection):
+        hour = datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+        keys = [("p2", hour, "path", "total"), ("p1", hour, "path", "total"), ("p1", hour, "path", "agent")]
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+        _merge_rollups_postgres({key: RollupDelta(turn_count=1) for key in keys})
+
+        # 12 params per row: project_uuid first, phase fourth
+        batches = [call.args[1] for call in cursor.execute.call_args_list]
+        self.assertEqual(
+            [list(zip(batch[0::12], batch[3::12])) for batch in batches],
+            [
+                [("p1", "agent"), ("p1", "total")],
+                [("p2", "total")],
+            ],
+        )
+
+
 class LatencyWriterIntegrationTestCase(TestCase):
+    def setUp(self):
+        flush_turn_latency()
+
     @patch("nexus.analytics.latency_writer.random.random", return_value=0.99)
     def test_record_turn_creates_rollup(self, _mock_random):
         project_uuid = str(uuid4())
@@ -70,6 +107,7 @@ class LatencyWriterIntegrationTestCase(TestCase):
             started_at=1000.05,
             finished_at=datetime(2026, 7, 16, 19, 0, 0, tzinfo=timezone.utc),
         )
+        flush_turn_latency()
         total_row = InlineAgentLatencyHourly.objects.get(project_uuid=project_uuid, phase="total")
         self.assertEqual(total_row.turn_count, 1)
         self.assertEqual(total_row.sum_ms, 3500)
@@ -88,6 +126,7 @@ class LatencyWriterIntegrationTestCase(TestCase):
             turn_id="turn-2",
             finished_at=datetime(2026, 7, 16, 20, 0, 0, tzinfo=timezone.utc),
         )
+        flush_turn_latency()
         self.assertEqual(InlineAgentTurnOutlier.objects.filter(project_uuid=project_uuid).count(), 1)
 
     @patch("nexus.analytics.latency_writer.random.random", return_value=0.99)
@@ -122,6 +161,7 @@ class LatencyWriterIntegrationTestCase(TestCase):
                 turn_id="turn-3",
                 finished_at=finished_at,
             )
+            flush_turn_latency()
 
         existing_row.refresh_from_db()
         self.assertEqual(existing_row.turn_count, 2)
@@ -146,6 +186,68 @@ class LatencyWriterIntegrationTestCase(TestCase):
                 turn_id="turn-4",
                 finished_at=datetime(2026, 7, 16, 19, 0, 0, tzinfo=timezone.utc),
             )
+            flush_turn_latency()
 
         mock_capture_exception.assert_called_once()
         self.assertIsInstance(mock_capture_exception.call_args.args[0], RuntimeError)
+
+        flush_turn_latency()
+        self.assertEqual(InlineAgentLatencyHourly.objects.get(project_uuid=project_uuid, phase="total").turn_count, 1)
+
+    @patch("nexus.analytics.latency_writer.random.random", return_value=0.99)
+    def test_record_turn_only_buffers(self, _mock_random):
+        project_uuid = str(uuid4())
+        with self.assertNumQueries(0):
+            record_turn_latency(
+                project_uuid=project_uuid,
+                status="success",
+                total_seconds=1.0,
+                phase_seconds={},
+                correlation=TurnCorrelation(contact_urn="telegram:5"),
+                task_id="celery-5",
+                turn_id="turn-5",
+                finished_at=datetime(2026, 7, 16, 19, 0, 0, tzinfo=timezone.utc),
+            )
+        self.assertFalse(InlineAgentLatencyHourly.objects.filter(project_uuid=project_uuid).exists())
+
+    @patch("nexus.analytics.latency_writer.random.random", return_value=0.99)
+    def test_flush_merges_buffered_turns_into_existing_row(self, _mock_random):
+        project_uuid = str(uuid4())
+        finished_at = datetime(2026, 7, 16, 19, 30, 0, tzinfo=timezone.utc)
+        InlineAgentLatencyHourly.objects.create(
+            project_uuid=project_uuid,
+            hour_ts=finished_at.replace(minute=0),
+            execution_path="inline_agents",
+            phase="total",
+            turn_count=1,
+            sum_ms=1000,
+            max_ms=1000,
+            buckets=increment_buckets({}, 1000),
+        )
+        for i, (seconds, status) in enumerate([(2.0, "success"), (6.5, "failed"), (0.5, "blocked")]):
+            record_turn_latency(
+                project_uuid=project_uuid,
+                status=status,
+                total_seconds=seconds,
+                phase_seconds={},
+                correlation=TurnCorrelation(contact_urn="telegram:6"),
+                task_id=f"celery-6-{i}",
+                turn_id=f"turn-6-{i}",
+                finished_at=finished_at,
+            )
+
+        self.assertEqual(flush_turn_latency(), 1)
+
+        row = InlineAgentLatencyHourly.objects.get(project_uuid=project_uuid, phase="total")
+        expected_buckets = {}
+        for duration_ms in (1000, 2000, 6500, 500):
+            expected_buckets = increment_buckets(expected_buckets, duration_ms)
+        self.assertEqual(row.turn_count, 4)
+        self.assertEqual(row.sum_ms, 10000)
+        self.assertEqual(row.max_ms, 6500)
+        self.assertEqual(row.error_count, 1)
+        self.assertEqual(row.blocked_count, 1)
+        self.assertEqual(row.buckets, expected_buckets)
+        self.assertEqual(row.schema_version, 2)
+        self.assertEqual(sum(row.sketch.values()), 3)
+        self.assertEqual(InlineAgentTurnOutlier.objects.filter(project_uuid=project_uuid).count(), 2)
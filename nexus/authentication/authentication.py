@@ -1,3 +1,4 @@
+import copy
 import logging
 from urllib.error import HTTPError as UrllibHTTPError
 from urllib.parse import parse_qs
@@ -12,6 +13,7 @@ from requests.exceptions import HTTPError as RequestsHTTPError
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
+from nexus.authentication.token_cache import jwt_token_cache, oidc_token_cache, unverified_expiry
 from nexus.orgs import permissions
 from nexus.usecases.users import CreateUserUseCase
 
@@ -19,6 +21,16 @@ LOGGER = logging.getLogger("weni_django_oidc")
 
 
 class WeniOIDCAuthenticationBackend(OIDCAuthenticationBackend):
+    def get_or_create_user(self, access_token, id_token, payload):
+        cached_user = oidc_token_cache.get(access_token)
+        if cached_user is not None:
+            return copy.copy(cached_user)
+
+        user = super().get_or_create_user(access_token, id_token, payload)
+        if user is not None:
+            oidc_token_cache.set(access_token, copy.copy(user), exp=unverified_expiry(access_token))
+        return user
+
     def verify_claims(self, claims):
         verified = super().verify_claims(claims)
         return verified
@@ -98,17 +110,29 @@ class JWTAuthentication(authentication.BaseAuthentication):
 
         token = auth_header.split(" ")[1]
 
+        payload = jwt_token_cache.get(token)
+        if payload is None:
+            payload = self._verify(token, public_key)
+            jwt_token_cache.set(token, payload, exp=payload.get("exp"))
+
+        project_uuid = payload["project_uuid"]
+
+        request.project_uuid = project_uuid
+        request.jwt_payload = dict(payload)
+
+        return (None, None)
+
+    @staticmethod
+    def _verify(token: str, public_key: str) -> dict:
         try:
-            payload = jwt.decode(token, public_key, algorithms=["RS256"], options={"verify_aud": False})
+            payload = jwt.decode(
+                token, public_key, algorithms=[settings.JWT_SIGNING_ALGORITHM], options={"verify_aud": False}
+            )
         except jwt.ExpiredSignatureError as e:
             raise AuthenticationFailed("Token has expired") from e
         except jwt.InvalidTokenError as e:
             raise AuthenticationFailed("Invalid token") from e
-        project_uuid = payload.get("project_uuid")
-        if not project_uuid:
-            raise AuthenticationFailed("Project UUID is required")
-
-        request.project_uuid = project_uuid
-        request.jwt_payload = payload
 
-        return (None, None)
+        if not payload.get("project_uuid"):
+            raise AuthenticationFailed("Project UUID is required")
+        return payload
@@ -0,0 +1,120 @@
+import time
+from unittest import mock
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from nexus.authentication.authentication import JWTAuthentication, WeniOIDCAuthenticationBackend
+from nexus.authentication.token_cache import VerifiedTokenCache, jwt_token_cache, oidc_token_cache
+
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PUBLIC_KEY = (
+    _private_key.public_key()
+    .public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo)
+    .decode()
+)
+
+
+def _token(exp_in: int = 3600, **claims) -> str:
+    payload = {"project_uuid": "project-1", "exp": int(time.time()) + exp_in, **claims}
+    return jwt.encode(payload, _private_key, algorithm="RS256")
+
+
+class VerifiedTokenCacheTests(SimpleTestCase):
+    def test_entry_is_capped_by_token_expiry(self):
+        cache = VerifiedTokenCache(ttl_seconds=60, max_entries=10)
+        cache.set("token", "principal", exp=time.time() - 1)
+
+        self.assertIsNone(cache.get("token"))
+
+    def test_entry_expires_after_ttl(self):
+        cache = VerifiedTokenCache(ttl_seconds=60, max_entries=10)
+        cache.set("token", "principal")
+
+        with mock.patch("nexus.authentication.token_cache.time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get("token"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = VerifiedTokenCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_disabled_with_zero_ttl(self):
+        cache = VerifiedTokenCache(ttl_seconds=0, max_entries=10)
+        cache.set("token", "principal")
+
+        self.assertIsNone(cache.get("token"))
+
+
+@override_settings(JWT_PUBLIC_KEY=PUBLIC_KEY, JWT_SIGNING_ALGORITHM="RS256")
+class JWTAuthenticationCacheTests(SimpleTestCase):
+    def setUp(self):
+        jwt_token_cache.clear()
+        self.factory = APIRequestFactory()
+
+    def _authenticate(self, token):
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        JWTAuthentication().authenticate(request)
+        return request
+
+    def test_repeated_token_is_verified_once(self):
+        token = _token()
+
+        with mock.patch("nexus.authentication.authentication.jwt.decode", wraps=jwt.decode) as mock_decode:
+            first = self._authenticate(token)
+            second = self._authenticate(token)
+
+        mock_decode.assert_called_once()
+        self.assertEqual(first.project_uuid, "project-1")
+        self.assertEqual(second.project_uuid, "project-1")
+        self.assertEqual(second.jwt_payload["project_uuid"], "project-1")
+
+    def test_expired_token_is_rejected(self):
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(_token(exp_in=-10))
+
+    def test_token_without_project_is_not_cached(self):
+        token = _token(project_uuid=None)
+
+        for _ in range(2):
+            with self.assertRaises(AuthenticationFailed):
+                self._authenticate(token)
+
+
+class OIDCBackendCacheTests(SimpleTestCase):
+    def setUp(self):
+        oidc_token_cache.clear()
+
+    @mock.patch("mozilla_django_oidc.auth.OIDCAuthenticationBackend.get_or_create_user")
+    def test_repeated_access_token_skips_userinfo(self, mock_get_or_create):
+        user = mock.Mock(email="user@example.com")
+        mock_get_or_create.return_value = user
+        backend = WeniOIDCAuthenticationBackend()
+        token = _token()
+
+        first = backend.get_or_create_user(token, None, None)
+        second = WeniOIDCAuthenticationBackend().get_or_create_user(token, None, None)
+
+        mock_get_or_create.assert_called_once()
+        self.assertEqual(first.email, "user@example.com")
+        self.assertEqual(second.email, "user@example.com")
+
+    @mock.patch("mozilla_django_oidc.auth.OIDCAuthenticationBackend.get_or_create_user")
+    def test_failed_lookup_is_not_cached(self, mock_get_or_create):
+        mock_get_or_create.return_value = None
+        backend = WeniOIDCAuthenticationBackend()
+
+        backend.get_or_create_user("opaque-token", None, None)
+        backend.get_or_create_user("opaque-token", None, None)
+
+        self.assertEqual(mock_get_or_create.call_count, 2)
@@ -0,0 +1,86 @@
+"""In-process cache of verified bearer tokens to the principal they resolved to."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import jwt
+from django.conf import settings
+
+
+def unverified_expiry(token: str) -> Optional[float]:
+    """Read the ``exp`` claim without verifying; only used to cap cache lifetime."""
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+    exp = claims.get("exp")
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of sha256(token) -> principal.
+
+    Entries live for at most ``ttl_seconds`` and never past the token's own
+    ``exp``, so a hit is always something that would still verify.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Any]:
+        if not token or self.ttl_seconds <= 0:
+            return None
+
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            principal, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def set(self, token: str, principal: Any, exp: Optional[float] = None) -> None:
+        if not token or self.ttl_seconds <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        if expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (principal, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+jwt_token_cache = VerifiedTokenCache(
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+)
+oidc_token_cache = VerifiedTokenCache(
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+)
@@ -1,3 +1,4 @@
-from .token import TokenCache
+from .retrieval import RetrievalCache, retrieval_cache
+from .token import SharedTokenProvider, TokenCache
 
-__all__ = ["TokenCache"]
+__all__ = ["RetrievalCache", "SharedTokenProvider", "TokenCache", "retrieval_cache"]
@@ -0,0 +1,219 @@
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRIEVAL_CACHE_LOCAL_HIT = "local_hit"
+RETRIEVAL_CACHE_SHARED_HIT = "shared_hit"
+RETRIEVAL_CACHE_MISS = "miss"
+RETRIEVAL_CACHE_BYPASS = "bypass"
+
+retrieval_cache_total = Counter(
+    "nexus_retrieval_cache_total",
+    "Knowledge-base retrievals, by cache result",
+    ["result"],
+)
+
+
+class RetrievalCache:
+    """
+    Two-tier cache for knowledge-base retrieval results.
+
+    Entries are keyed by knowledge base, data source, content base,
+    normalized query and top-k, and live in an in-process LRU (hits cost
+    microseconds) in front of the shared Django cache. Each content base has
+    a generation counter that is part of the key: ``invalidate`` bumps it, so
+    older entries are never read again and simply expire. Other processes
+    notice a bump within ``generation_refresh`` seconds.
+
+    ``hold`` makes lookups of a content base skip the cache until ``release``
+    (or its timeout), for changes the knowledge base only serves later, such
+    as a document that is still returned until its deletion is ingested.
+    """
+
+    def __init__(
+        self,
+        key_prefix: str = "retrieval",
+        ttl: Optional[int] = None,
+        local_max_entries: Optional[int] = None,
+        generation_refresh: Optional[float] = None,
+    ):
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.local_max_entries = local_max_entries
+        self.generation_refresh = generation_refresh
+        self._local: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[str, tuple[int, bool, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def _ttl(self) -> int:
+        return self.ttl if self.ttl is not None else settings.RETRIEVAL_CACHE_TTL_SECONDS
+
+    @property
+    def _local_max_entries(self) -> int:
+        if self.local_max_entries is not None:
+            return self.local_max_entries
+        return settings.RETRIEVAL_CACHE_LOCAL_MAX_ENTRIES
+
+    @property
+    def _generation_refresh(self) -> float:
+        if self.generation_refresh is not None:
+            return self.generation_refresh
+        return settings.RETRIEVAL_CACHE_GENERATION_REFRESH_SECONDS
+
+    @staticmethod
+    def normalize_query(text: str) -> str:
+        return " ".join(text.split()).casefold()
+
+    def _generation_key(self, content_base_uuid: str) -> str:
+        return f"{self.key_prefix}:generation:{content_base_uuid}"
+
+    def _hold_key(self, content_base_uuid: str) -> str:
+        return f"{self.key_prefix}:hold:{content_base_uuid}"
+
+    def _state(self, content_base_uuid: str) -> tuple[int, bool]:
+        """Generation of the content base and whether it is on hold."""
+        now = time.monotonic()
+        known = self._generations.get(content_base_uuid)
+        if known and now - known[2] < self._generation_refresh:
+            return known[0], known[1]
+        generation_key, hold_key = self._generation_key(content_base_uuid), self._hold_key(content_base_uuid)
+        try:
+            values = cache.get_many([generation_key, hold_key])
+        except Exception as e:
+            logger.warning(f"Retrieval cache generation unavailable: {e}")
+            return (known[0], known[1]) if known else (0, False)
+        generation, held = values.get(generation_key, 0), bool(values.get(hold_key))
+        self._generations[content_base_uuid] = (generation, held, now)
+        return generation, held
+
+    def make_key(
+        self,
+        knowledge_base_id: str,
+        data_source_id: str,
+        content_base_uuid: str,
+        query: str,
+        top_k: Optional[int],
+    ) -> str:
+        digest = hashlib.sha256(
+            json.dumps([knowledge_base_id, data_source_id, self.normalize_query(query), top_k]).encode()
+        ).hexdigest()
+        return f"{self.key_prefix}:{content_base_uuid}:{self._state(content_base_uuid)[0]}:{digest}"
+
+    def _get_local(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry[1]
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + self._ttl, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def get_or_retrieve(
+        self,
+        knowledge_base_id: str,
+        data_source_id: str,
+        content_base_uuid: str,
+        query: str,
+        top_k: Optional[int],
+        retrieve: Callable[[], T],
+    ) -> T:
+        """Return the cached result for the lookup, calling ``retrieve`` and caching its result on a miss."""
+        if not settings.RETRIEVAL_CACHE_ENABLED:
+            return retrieve()
+        if self._state(content_base_uuid)[1]:
+            retrieval_cache_total.labels(result=RETRIEVAL_CACHE_BYPASS).inc()
+            return retrieve()
+
+        key = self.make_key(knowledge_base_id, data_source_id, content_base_uuid, query, top_k)
+
+        value = self._get_local(key)
+        if value is not None:
+            retrieval_cache_total.labels(result=RETRIEVAL_CACHE_LOCAL_HIT).inc()
+            return copy.deepcopy(value)
+
+        try:
+            value = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Retrieval cache unavailable: {e}")
+            value = None
+        if value is not None:
+            retrieval_cache_total.labels(result=RETRIEVAL_CACHE_SHARED_HIT).inc()
+            self._set_local(key, value)
+            return copy.deepcopy(value)
+
+        retrieval_cache_total.labels(result=RETRIEVAL_CACHE_MISS).inc()
+        value = retrieve()
+        self._set_local(key, copy.deepcopy(value))
+        try:
+            cache.set(key, value, self._ttl)
+        except Exception as e:
+            logger.warning(f"Retrieval cache unavailable: {e}")
+        return value
+
+    def invalidate(self, content_base_uuid: str, held: Optional[bool] = None) -> None:
+        """Drop every cached retrieval of the content base, in all processes."""
+        generation_key = self._generation_key(content_base_uuid)
+        try:
+            cache.add(generation_key, 0, None)
+            generation = cache.incr(generation_key)
+        except Exception as e:
+            logger.warning(f"Could not invalidate retrieval cache for {content_base_uuid}: {e}")
+            return
+        if held is None:
+            known = self._generations.get(content_base_uuid)
+            held = known[1] if known else False
+        self._generations[content_base_uuid] = (generation, held, time.monotonic())
+
+        prefix = f"{self.key_prefix}:{content_base_uuid}:"
+        with self._lock:
+            for key in [key for key in self._local if key.startswith(prefix)]:
+                del self._local[key]
+        logger.debug(f"Invalidated retrieval cache for: {content_base_uuid} (generation {generation})")
+
+    def hold(self, content_base_uuid: str, timeout: int) -> None:
+        """Skip the cache for the content base, in all processes, until ``release`` or ``timeout`` seconds."""
+        try:
+            cache.set(self._hold_key(content_base_uuid), 1, timeout)
+        except Exception as e:
+            logger.warning(f"Could not hold retrieval cache for {content_base_uuid}: {e}")
+            return
+        self.invalidate(content_base_uuid, held=True)
+
+    def release(self, content_base_uuid: str) -> None:
+        """End a ``hold`` and drop what was cached before it."""
+        try:
+            cache.delete(self._hold_key(content_base_uuid))
+        except Exception as e:
+            logger.warning(f"Could not release retrieval cache hold for {content_base_uuid}: {e}")
+        self.invalidate(content_base_uuid, held=False)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+            self._generations.clear()
+
+
+retrieval_cache = RetrievalCache()
@@ -0,0 +1,153 @@
+import time
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from nexus.cache import RetrievalCache, retrieval_cache
+from nexus.cache.retrieval import retrieval_cache_total
+from nexus.task_managers.file_database.bedrock import BedrockFileDatabase
+
+
+def _hits(result: str) -> float:
+    return retrieval_cache_total.labels(result=result)._value.get()
+
+
+@override_settings(RETRIEVAL_CACHE_ENABLED=True)
+class RetrievalCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.retrieval_cache = RetrievalCache(key_prefix="test_retrieval", ttl=60, local_max_entries=3)
+        self.calls = 0
+
+    def _retrieve(self):
+        self.calls += 1
+        return {"status": 200, "data": {"response": [{"full_page": f"chunk {self.calls}"}]}}
+
+    def _lookup(self, query="What are your opening hours?", content_base_uuid="cb-1", top_k=5, cache_=None):
+        return (cache_ or self.retrieval_cache).get_or_retrieve(
+            "kb-id", "ds-id", content_base_uuid, query, top_k, self._retrieve
+        )
+
+    def test_normalized_repeats_are_served_from_cache(self):
+        first = self._lookup()
+        second = self._lookup("  what are your   OPENING hours?")
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(first, second)
+
+    def test_key_includes_content_base_and_top_k(self):
+        self._lookup()
+        self._lookup(content_base_uuid="cb-2")
+        self._lookup(top_k=1)
+
+        self.assertEqual(self.calls, 3)
+
+    def test_local_hit_is_well_under_a_millisecond(self):
+        self._lookup()
+        local_hits = _hits("local_hit")
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            self._lookup()
+        per_lookup = (time.perf_counter() - start) / 1000
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(_hits("local_hit") - local_hits, 1000)
+        self.assertLess(per_lookup, 0.0005)
+
+    def test_callers_cannot_mutate_the_cached_result(self):
+        self._lookup()["data"]["response"].clear()
+
+        self.assertEqual(len(self._lookup()["data"]["response"]), 1)
+
+    def test_other_processes_share_entries(self):
+        self._lookup()
+        shared_hits = _hits("shared_hit")
+
+        other_process = RetrievalCache(key_prefix="test_retrieval", ttl=60)
+        self._lookup(cache_=other_process)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(_hits("shared_hit") - shared_hits, 1)
+
+    def test_invalidate_drops_only_that_content_base(self):
+        self._lookup()
+        self._lookup(content_base_uuid="cb-2")
+
+        self.retrieval_cache.invalidate("cb-1")
+        refreshed = self._lookup()
+        self._lookup(content_base_uuid="cb-2")
+
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(refreshed["data"]["response"][0]["full_page"], "chunk 3")
+
+    def test_invalidation_reaches_other_processes_after_refresh(self):
+        other_process = RetrievalCache(key_prefix="test_retrieval", ttl=60, generation_refresh=0)
+        self._lookup(cache_=other_process)
+
+        self.retrieval_cache.invalidate("cb-1")
+        self._lookup(cache_=other_process)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_hold_skips_the_cache_in_every_process_until_release(self):
+        other_process = RetrievalCache(key_prefix="test_retrieval", ttl=60, generation_refresh=0)
+        self._lookup(cache_=other_process)
+
+        self.retrieval_cache.hold("cb-1", timeout=60)
+        self._lookup()
+        self._lookup(cache_=other_process)
+        self._lookup("other question", content_base_uuid="cb-2")
+        self._lookup("other question", content_base_uuid="cb-2")
+
+        self.assertEqual(self.calls, 4)
+
+        self.retrieval_cache.release("cb-1")
+        self._lookup(cache_=other_process)
+        self._lookup(cache_=other_process)
+
+        self.assertEqual(self.calls, 5)
+
+    def test_local_entries_are_bounded(self):
+        for query in ["a", "b", "c", "d"]:
+            self._lookup(query)
+
+        self.assertEqual(len(self.retrieval_cache._local), 3)
+
+    @override_settings(RETRIEVAL_CACHE_ENABLED=False)
+    def test_disabled_cache_always_retrieves(self):
+        self._lookup()
+        self._lookup()
+
+        self.assertEqual(self.calls, 2)
+
+
+@override_settings(RETRIEVAL_CACHE_ENABLED=True)
+class BedrockSearchDataCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        retrieval_cache.clear_local()
+        self.bedrock = BedrockFileDatabase.__new__(BedrockFileDatabase)
+        self.bedrock.knowledge_base_id = "kb-search-cache"
+        self.bedrock.data_source_id = "ds-id"
+        self.bedrock.bedrock_agent_runtime = MagicMock()
+        self.bedrock.bedrock_agent_runtime.retrieve.return_value = {
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+            "retrievalResults": [
+                {"content": {"text": "We open at 9am"}, "metadata": {"filename": "faq.pdf", "fileUuid": "f-1"}}
+            ],
+        }
+
+    def test_repeated_search_calls_retrieve_once(self):
+        first = self.bedrock.search_data("cb-search", "opening hours")
+        second = self.bedrock.search_data("cb-search", "Opening hours")
+
+        self.assertEqual(first, second)
+        self.bedrock.bedrock_agent_runtime.retrieve.assert_called_once()
+
+    def test_use_cache_false_always_retrieves(self):
+        self.bedrock.search_data("cb-probe", "test", number_of_results=1, use_cache=False)
+        self.bedrock.search_data("cb-probe", "test", number_of_results=1, use_cache=False)
+
+        self.assertEqual(self.bedrock.bedrock_agent_runtime.retrieve.call_count, 2)
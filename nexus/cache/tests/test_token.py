@@ -0,0 +1,94 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from nexus.cache import SharedTokenProvider, TokenCache
+
+
+class SharedTokenProviderTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.token_cache = TokenCache(cache_key_prefix="test_shared_token")
+        self.fetch_count = 0
+        self.fetch_lock = threading.Lock()
+
+    def _factory(self):
+        with self.fetch_lock:
+            self.fetch_count += 1
+            count = self.fetch_count
+        time.sleep(0.05)
+        return f"token-{count}", 3600
+
+    def _provider(self):
+        return SharedTokenProvider(
+            token_cache=self.token_cache,
+            identifier="main",
+            token_factory=self._factory,
+            poll_interval=0.01,
+        )
+
+    def _seed(self, token: str, cached_ago: float, expires_in: float):
+        now = time.time()
+        cache.set(
+            self.token_cache._make_key("main"),
+            {"token": token, "expires_at": now + expires_in, "cached_at": now - cached_ago},
+        )
+
+    def test_expiry_under_100_concurrent_callers_fetches_once(self):
+        self._seed("expired-token", cached_ago=3600, expires_in=-1)
+        # Several providers stand in for separate worker processes sharing the cache
+        providers = [self._provider() for _ in range(10)]
+
+        with ThreadPoolExecutor(max_workers=100) as executor:
+            tokens = list(executor.map(lambda i: providers[i % 10].get_token(), range(100)))
+
+        self.assertEqual(self.fetch_count, 1)
+        self.assertEqual(set(tokens), {"token-1"})
+
+    def test_proactive_refresh_keeps_serving_current_token(self):
+        self._seed("current-token", cached_ago=3200, expires_in=400)
+        cache.add(self._provider().lock_key, 1, 30)
+
+        token = self._provider().get_token()
+
+        self.assertEqual(token, "current-token")
+        self.assertEqual(self.fetch_count, 0)
+
+    def test_fresh_token_is_served_from_process_copy(self):
+        provider = self._provider()
+        provider.get_token()
+        cache.clear()
+
+        self.assertEqual(provider.get_token(), "token-1")
+        self.assertEqual(self.fetch_count, 1)
+
+    def test_short_lived_token_is_reused(self):
+        self._seed("short-token", cached_ago=10, expires_in=290)
+
+        self.assertEqual(self._provider().get_token(), "short-token")
+        self.assertEqual(self.fetch_count, 0)
+
+    def test_invalidate_ignores_already_replaced_token(self):
+        provider = self._provider()
+        provider.get_token()
+        provider.invalidate("token-1")
+        provider.get_token()
+
+        provider.invalidate("token-1")
+
+        self.assertEqual(provider.get_token(), "token-2")
+        self.assertEqual(self.fetch_count, 2)
+
+    def test_lock_winner_uses_token_published_after_its_first_read(self):
+        self._seed("published-token", cached_ago=0, expires_in=3600)
+        stale = {"token": "expired-token", "expires_at": time.time() - 1, "cached_at": time.time() - 3600}
+        reads = iter([stale])
+        get_entry = self.token_cache.get_entry
+        # The first read happens before another process publishes its token and releases the lock
+        self.token_cache.get_entry = lambda identifier: next(reads, None) or get_entry(identifier)
+
+        self.assertEqual(self._provider().get_token(), "published-token")
+        self.assertEqual(self.fetch_count, 0)
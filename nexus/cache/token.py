@@ -1,6 +1,7 @@
 import logging
+import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from django.core.cache import cache
 
@@ -42,6 +43,15 @@ class TokenCache:
 
         return None
 
+    def get_entry(self, identifier: str) -> Optional[dict]:
+        """
+        Retrieves the raw cache entry (token and expiry) without expiring it.
+        """
+        cached_data = cache.get(self._make_key(identifier))
+        if cached_data and isinstance(cached_data, dict) and cached_data.get("token"):
+            return cached_data
+        return None
+
     def set(self, identifier: str, token: str, ttl_seconds: Optional[int] = None) -> None:
         """
         Stores token in cache.
@@ -93,3 +103,120 @@ class TokenCache:
     def invalidate(self, identifier: str) -> None:
         """Alias for delete() - more semantic for tokens."""
         self.delete(identifier)
+
+
+class SharedTokenProvider:
+    """
+    Process-wide token provider on top of TokenCache.
+
+    Keeps an in-process copy of the token so the hot path skips the cache
+    round-trip, refreshes it ahead of expiry and lets only one caller across
+    all processes fetch a new token at a time (lock held in the shared cache).
+    Other callers keep using the current token while it is still valid, or
+    wait for the lock holder to publish the new one.
+    """
+
+    def __init__(
+        self,
+        token_cache: TokenCache,
+        identifier: str,
+        token_factory: Callable[[], Tuple[str, Optional[int]]],
+        refresh_margin: int = 10 * 60,
+        lock_timeout: int = 30,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ):
+        self.token_cache = token_cache
+        self.identifier = identifier
+        self.token_factory = token_factory
+        self.refresh_margin = refresh_margin
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._refresh_at: float = 0.0
+
+    @property
+    def lock_key(self) -> str:
+        return f"{self.token_cache._make_key(self.identifier)}:refresh_lock"
+
+    def _margins(self, entry: dict) -> Tuple[float, float]:
+        """
+        Returns (refresh_at, usable_until) for a cache entry. Margins are capped
+        to a fraction of the token lifetime so short-lived tokens still get reused.
+        """
+        expires_at = entry["expires_at"]
+        lifetime = max(expires_at - entry.get("cached_at", expires_at), 0)
+        refresh_at = expires_at - min(self.refresh_margin, lifetime * 0.25)
+        usable_until = expires_at - min(self.token_cache.safety_margin, lifetime * 0.1)
+        return refresh_at, usable_until
+
+    def _remember(self, entry: dict) -> str:
+        self._refresh_at, _ = self._margins(entry)
+        self._token = entry["token"]
+        return self._token
+
+    def get_token(self) -> str:
+        token = self._token
+        if token and time.time() < self._refresh_at:
+            return token
+
+        with self._lock:
+            if self._token and time.time() < self._refresh_at:
+                return self._token
+            return self._refresh()
+
+    def _refresh(self) -> str:
+        entry = self.token_cache.get_entry(self.identifier)
+        if entry and time.time() < self._margins(entry)[0]:
+            return self._remember(entry)
+
+        if cache.add(self.lock_key, 1, self.lock_timeout):
+            try:
+                # Another process may have published a token and released the lock since the read above.
+                fresh = self.token_cache.get_entry(self.identifier)
+                if fresh and time.time() < self._margins(fresh)[0]:
+                    return self._remember(fresh)
+                return self._fetch()
+            finally:
+                cache.delete(self.lock_key)
+
+        if entry and time.time() < self._margins(entry)[1]:
+            logger.debug(f"Token refresh in progress elsewhere, using current token for: {self.identifier}")
+            return self._remember(entry)
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            entry = self.token_cache.get_entry(self.identifier)
+            if entry and time.time() < self._margins(entry)[1]:
+                return self._remember(entry)
+
+        logger.warning(f"Timed out waiting for token refresh, fetching directly for: {self.identifier}")
+        return self._fetch()
+
+    def _fetch(self) -> str:
+        logger.debug(f"Refreshing token for: {self.identifier}")
+        token, ttl_seconds = self.token_factory()
+        if not token:
+            raise ValueError("Token factory returned empty token")
+
+        now = time.time()
+        self.token_cache.set(self.identifier, token, ttl_seconds)
+        ttl = ttl_seconds or self.token_cache.default_ttl
+        return self._remember({"token": token, "expires_at": now + ttl, "cached_at": now})
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Drops the current token. When `token` is given, only drops it if it is
+        still the current one, so a burst of 401s triggers a single refresh.
+        """
+        with self._lock:
+            if token is not None and token != self._token:
+                entry = self.token_cache.get_entry(self.identifier)
+                if not entry or entry.get("token") != token:
+                    return
+            self._token = None
+            self._refresh_at = 0.0
+            self.token_cache.invalidate(self.identifier)
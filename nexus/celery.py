@@ -55,6 +55,18 @@ app.conf.beat_schedule = {
     "delete_old_activities": {"task": "delete_old_activities", "schedule": schedules.crontab(hour=23, minute=0)},
     "healthcheck": {"task": "healthcheck", "schedule": schedules.crontab(minute="*/1")},
     "classification_healthcheck": {"task": "classification_healthcheck", "schedule": schedules.crontab(minute="*/5")},
+    "reconcile_conversation_facts": {
+        "task": "reconcile_conversation_facts",
+        "schedule": schedules.crontab(hour=3, minute=0),
+    },
+    "sweep_flows_db_cohort_deadlines": {
+        "task": "nexus.projects.tasks.sweep_flows_db_cohort_deadlines_task",
+        "schedule": schedules.crontab(minute="*/5"),
+    },
+    "compact_inline_agent_latency_rollups": {
+        "task": "compact_inline_agent_latency_rollups",
+        "schedule": schedules.crontab(minute="*/15"),
+    },
 }
 
 if "test" in sys.argv or getattr(settings, "CELERY_ALWAYS_EAGER", False):
@@ -11,7 +11,7 @@ import time
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from celery.signals import before_task_publish, task_prerun, task_received
+from celery.signals import before_task_publish, task_prerun, task_received, worker_process_shutdown
 
 from nexus.inline_agent_latency_headers import (
     HEADER_ENQUEUED_AT,
@@ -77,3 +77,14 @@ def stamp_inline_agent_started_at(task_id=None, task=None, **kwargs) -> None:
     hdrs = _ensure_headers(getattr(task.request, "headers", None))
     hdrs[HEADER_STARTED_AT] = str(time.time())
     task.request.headers = hdrs
+
+
+@worker_process_shutdown.connect
+def flush_inline_agent_latency(**kwargs) -> None:
+    """Prefork children exit without running atexit hooks; write buffered rollups first."""
+    from nexus.analytics.latency_writer import flush_turn_latency
+
+    try:
+        flush_turn_latency()
+    except Exception:
+        logger.exception("Failed to flush inline agent latency on worker shutdown")
@@ -1,5 +1,6 @@
 import json
 import logging
+import uuid
 
 import pendulum
 from django.conf import settings
@@ -41,10 +42,12 @@ from nexus.inline_agents.api.services.official_catalog import (
 from nexus.inline_agents.backends.openai.models import ManagerAgent, ModelProvider, ProjectModelProvider
 from nexus.inline_agents.backends.openai.models import OpenAISupervisor as DeprecatedManagerAgent
 from nexus.inline_agents.models import MCP, Agent, AgentGroup, IntegratedAgent
+from nexus.inline_agents.tasks import push_agents_task
 from nexus.projects.api.permissions import CombinedExternalProjectPermission, ProjectPermission
 from nexus.projects.api.serializers import ProjectMinimalSerializer
 from nexus.projects.exceptions import ProjectDoesNotExist
 from nexus.projects.models import Project
+from nexus.task_managers.file_manager.claim_check import stash_upload
 from nexus.usecases.agents.exceptions import SkillFileTooLarge
 from nexus.usecases.inline_agents.assign import AssignAgentsUsecase
 from nexus.usecases.inline_agents.bedrock import (
@@ -54,6 +57,7 @@ from nexus.usecases.inline_agents.bedrock import (
 )
 from nexus.usecases.inline_agents.create import CreateAgentUseCase
 from nexus.usecases.inline_agents.get import GetInlineAgentsUsecase, GetInlineCredentialsUsecase, GetLogGroupUsecase
+from nexus.usecases.inline_agents.push import get_push_events, push_agents, start_push_job
 from nexus.usecases.inline_agents.update import UpdateAgentUseCase
 from nexus.usecases.intelligences.get_by_uuid import (
     create_inline_agents_configuration,
@@ -227,9 +231,6 @@ class PushAgents(APIView):
         return None
 
     def post(self, request, *args, **kwargs):
-        agent_usecase = CreateAgentUseCase()
-        update_agent_usecase = UpdateAgentUseCase()
-
         try:
             files, agents, project_uuid, apm_instrumentation = self._validate_request(request)
             agents = agents["agents"]
@@ -273,31 +274,65 @@ class PushAgents(APIView):
 
         try:
             project = Project.objects.get(uuid=project_uuid)
-            for key in agents:
-                agent_qs = Agent.objects.filter(slug=key, project=project)
-                existing_agent = agent_qs.exists()
-                if existing_agent:
-                    logger.info(f"Updating agent - key: {key}")
-                    update_agent_usecase.update_agent(
-                        agent_qs.first(), agents[key], project, files, apm_instrumentation
-                    )
-                else:
-                    logger.info(f"Creating agent - key: {key}")
-                    agent_usecase.create_agent(key, agents[key], project, files, apm_instrumentation)
+        except Project.DoesNotExist:
+            return Response({"error": "Project not found"}, status=404)
 
-            # Fire cache invalidation event for team update (agents are part of team) (async observer)
-            notify_async(
-                event="cache_invalidation:team",
-                project_uuid=project_uuid,
-            )
+        if str(request.query_params.get("stream", "")).lower() in ("true", "1"):
+            return self._queue_push(request, agents, project, files, apm_instrumentation)
 
+        try:
+            push_agents(agents, project, files, apm_instrumentation)
         except APMNotConfiguredError as e:
             return Response({"error": str(e)}, status=400)
-        except Project.DoesNotExist:
-            return Response({"error": "Project not found"}, status=404)
 
         return Response({})
 
+    def _queue_push(self, request, agents, project, files, apm_instrumentation):
+        """
+        Hand the push to a Celery worker and return its job id right away.
+
+        Opt-in with ``?stream=true``. Uploaded skill zips go through claim-check
+        storage; progress events are read from ``PushAgentsProgress``.
+        """
+        job_id = str(uuid.uuid4())
+        claim_checks = {name: stash_upload(files[name], name) for name in files}
+        start_push_job(job_id, owner=request.user.email)
+        push_agents_task.apply_async(
+            kwargs={
+                "job_id": job_id,
+                "agents": agents,
+                "project_uuid": str(project.uuid),
+                "claim_checks": claim_checks,
+                "apm_instrumentation": apm_instrumentation,
+            },
+            task_id=job_id,
+        )
+        return Response({"job_id": job_id}, status=202)
+
+
+class PushAgentsProgress(APIView):
+    """
+    Progress events of a background agent push, as queued by ``PushAgents``.
+
+    ``?since=<n>`` skips the first n events, so clients only fetch new ones.
+    The last event is either ``{"event": "done"}`` or ``{"event": "error", ...}``.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id, *args, **kwargs):
+        try:
+            since = max(int(request.query_params.get("since", 0)), 0)
+        except ValueError:
+            return Response({"error": "since must be an integer"}, status=400)
+
+        events = get_push_events(job_id, owner=request.user.email, since=since)
+        if events is None:
+            return Response({"error": "Push job not found"}, status=404)
+
+        finished = bool(events) and events[-1]["event"] in ("done", "error")
+        return Response({"events": events, "next": since + len(events), "finished": finished})
+
 
 class OfficialAgentsV1(OfficialAgentAssignmentMixin, APIView):
     authentication_classes = AUTHENTICATION_CLASSES
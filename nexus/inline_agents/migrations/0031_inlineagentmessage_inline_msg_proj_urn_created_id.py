@@ -0,0 +1,19 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("inline_agents", "0030_agentconstant"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inlineagentmessage",
+            index=models.Index(
+                fields=["project", "contact_urn", "created_at", "id"], name="inline_msg_proj_urn_created_id"
+            ),
+        ),
+    ]
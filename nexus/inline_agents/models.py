@@ -239,6 +239,7 @@ class InlineAgentMessage(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["project", "created_at", "contact_urn"]),
+            models.Index(fields=["project", "contact_urn", "created_at", "id"], name="inline_msg_proj_urn_created_id"),
         ]
 
     def __str__(self):
@@ -0,0 +1,44 @@
+import logging
+from contextlib import ExitStack
+from functools import partial
+from typing import Dict, Optional
+
+from nexus.celery import app
+from nexus.projects.models import Project
+from nexus.task_managers.file_manager.claim_check import claimed_upload
+from nexus.usecases.inline_agents.bedrock import APMNotConfiguredError
+from nexus.usecases.inline_agents.push import push_agents, record_push_event
+from nexus.usecases.inline_agents.update import invalidate_integrated_team_caches
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(name="nexus.inline_agents.tasks.invalidate_integrated_team_caches_task")
+def invalidate_integrated_team_caches_task(agent_uuid: str, exclude_project_uuid: Optional[str] = None) -> int:
+    """Drop the team caches of every project integrating the agent, in chunks."""
+    return invalidate_integrated_team_caches(agent_uuid, exclude_project_uuid=exclude_project_uuid)
+
+
+@app.task(name="nexus.inline_agents.tasks.push_agents_task")
+def push_agents_task(
+    job_id: str, agents: Dict, project_uuid: str, claim_checks: Dict[str, str], apm_instrumentation: str
+) -> None:
+    """
+    Push agents in the background, publishing progress under ``job_id``.
+    The last event is either ``{"event": "done"}`` or ``{"event": "error", ...}``.
+    """
+    on_progress = partial(record_push_event, job_id)
+    try:
+        with ExitStack() as stack:
+            files = {
+                name: stack.enter_context(claimed_upload(claim_check, name))
+                for name, claim_check in claim_checks.items()
+            }
+            project = Project.objects.get(uuid=project_uuid)
+            push_agents(agents, project, files, apm_instrumentation, on_progress=on_progress)
+        on_progress({"event": "done"})
+    except APMNotConfiguredError as e:
+        on_progress({"event": "error", "status": 400, "error": str(e)})
+    except Exception as e:
+        logger.exception("Background agent push failed", extra={"job_id": job_id})
+        on_progress({"event": "error", "status": 500, "error": str(e)})
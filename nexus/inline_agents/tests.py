@@ -1,10 +1,13 @@
 import json
 import logging
+import shutil
+import tempfile
 from io import BytesIO
 from unittest import skip
 from unittest.mock import Mock, patch
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.conf import settings
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils.datastructures import MultiValueDict
@@ -275,14 +278,89 @@ class TestPushAgentsMcpGuard(TestCase):
         self.assertIn("agents.agents", (res.json() or {}).get("error", ""))
 
 
+class TestPushAgentsStream(TestCase):
+    def setUp(self):
+        self.project = ProjectFactory(name="Router", brain_on=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.project.created_by)
+        self.payload = {"agents": {"my_agent": {"name": "My agent", "tools": []}}}
+
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        storages = override_settings(
+            STORAGES={
+                **settings.STORAGES,
+                "upload_claim_checks": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": location},
+                },
+            }
+        )
+        storages.enable()
+        self.addCleanup(storages.disable)
+
+    def _post(self, query="", **files):
+        return self.client.post(
+            reverse("push-agents") + query,
+            data={"agents": json.dumps(self.payload), "project_uuid": str(self.project.uuid), **files},
+            format="multipart",
+        )
+
+    def _progress(self, job_id, query=""):
+        return self.client.get(reverse("push-agents-progress", kwargs={"job_id": job_id}) + query)
+
+    @patch("nexus.usecases.inline_agents.push.notify_async")
+    @patch.object(CreateAgentUseCase, "create_agent", autospec=True)
+    def test_stream_queues_the_push_and_reports_progress(self, mock_create_agent, mock_notify):
+        received = {}
+
+        def create_agent(usecase, key, agent, project, files, apm_instrumentation):
+            received.update({name: upload.read() for name, upload in files.items()})
+            usecase.on_progress({"lambda": "tool-1", "done": 1, "total": 1, "status": "deployed"})
+
+        mock_create_agent.side_effect = create_agent
+
+        res = self._post("?stream=true", **{"my_agent:tool": SimpleUploadedFile("tool.zip", b"zip bytes")})
+        progress = self._progress(res.json()["job_id"]).json()
+
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(received, {"my_agent:tool": b"zip bytes"})
+        self.assertEqual(
+            progress["events"],
+            [
+                {"event": "agent", "agent": "my_agent", "action": "create", "status": "started"},
+                {"event": "lambda", "lambda": "tool-1", "done": 1, "total": 1, "status": "deployed"},
+                {"event": "agent", "agent": "my_agent", "action": "create", "status": "done"},
+                {"event": "done"},
+            ],
+        )
+        self.assertEqual((progress["next"], progress["finished"]), (4, True))
+        self.assertEqual(self._progress(res.json()["job_id"], "?since=3").json()["events"], [{"event": "done"}])
+        mock_notify.assert_called_once_with(event="cache_invalidation:team", project_uuid=str(self.project.uuid))
+
+    @patch.object(CreateAgentUseCase, "create_agent", side_effect=RuntimeError("boom"))
+    def test_stream_ends_with_error_event(self, mock_create_agent):
+        res = self._post("?stream=true")
+        events = self._progress(res.json()["job_id"]).json()["events"]
+
+        self.assertEqual(events[-1], {"event": "error", "status": 500, "error": "boom"})
+
+    @patch("nexus.usecases.inline_agents.push.notify_async")
+    @patch.object(CreateAgentUseCase, "create_agent")
+    def test_progress_is_only_visible_to_the_requester(self, mock_create_agent, mock_notify):
+        job_id = self._post("?stream=true").json()["job_id"]
+
+        self.client.force_authenticate(user=ProjectFactory().created_by)
+
+        self.assertEqual(self._progress(job_id).status_code, 404)
+
+
 class MockBedrockClient:
     def __init__(self):
         self.lambda_client = Mock()
         self.lambda_arn = "arn:aws:lambda:us-east-1:123456789012:function:test-agent"
 
-    def create_lambda_function(
-        self, lambda_name, lambda_role, skill_handler, zip_buffer, apm_instrumentation=None
-    ):
+    def create_lambda_function(self, lambda_name, lambda_role, skill_handler, zip_buffer, apm_instrumentation=None):
         return self.lambda_arn
 
     def update_lambda_function(self, lambda_name, zip_buffer, apm_instrumentation=None):
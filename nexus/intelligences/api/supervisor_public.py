@@ -1,18 +1,24 @@
+import base64
+import json
 import logging
 import math
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import pendulum
 import requests
 import sentry_sdk
 from django.conf import settings
-from django.db.models import Count
+from django.db.models import Count, Q
 from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiTypes,
     extend_schema,
 )
+from requests.adapters import HTTPAdapter
 from rest_framework import serializers, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -50,6 +56,28 @@ def _validate_supervisor_public_v2_query_dates(start, end):
         raise ValidationError({"date": "Invalid date format. Please use ISO 8601."}) from None
 
 
+def _build_conversations_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.SUPERVISOR_PUBLIC_V2_MAX_WORKERS,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_conversations_session = _build_conversations_session()
+
+
+def _budget_timeout(deadline, read_timeout):
+    """(connect, read) timeout for one upstream call, cut to what is left of the request budget."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.exceptions.Timeout("Request budget exhausted")
+    return min(settings.SUPERVISOR_PUBLIC_V2_CONNECT_TIMEOUT, remaining), min(read_timeout, remaining)
+
+
 # Resolution choices matching nexus-conversations model (for status_summary keys)
 NEXUS_CONVERSATIONS_RESOLUTION_KEYS = ("0", "1", "2", "3", "4")
 
@@ -78,6 +106,7 @@ class SupervisorPublicConversationListSerializer(serializers.Serializer):
     status_summary = serializers.DictField()
     page = serializers.IntegerField()
     page_size = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
     results = SupervisorPublicConversationItemSerializer(many=True)
 
 
@@ -115,61 +144,123 @@ class SupervisorPublicConversationsView(APIView):
         except Exception:
             return str(val)
 
-    def _get_messages(self, conv, project_uuid, start_dt, end_dt, message_service):
-        messages = []
+    def _message_window(self, conv, start_dt, end_dt):
         fetch_start = start_dt or conv.start_date
         fetch_end = end_dt or conv.end_date
+        if not (conv.contact_urn and fetch_start and fetch_end):
+            return None
+        return fetch_start, fetch_end
+
+    def _report_message_error(self, e, project_uuid, conversations):
+        logger.warning(
+            f"Error fetching messages for {len(conversations)} conversations: {str(e)}",
+            extra={
+                "project_uuid": project_uuid,
+                "conversation_uuids": [str(conv.uuid) for conv in conversations],
+            },
+        )
+        sentry_sdk.set_tag("project_uuid", project_uuid)
+        sentry_sdk.capture_exception(e)
+
+    def _get_inline_messages(self, project_uuid, conversations, windows):
+        """One InlineAgentMessage query covering every conversation window, grouped back per conversation."""
+        by_urn = {}
+        conditions = Q()
+        for conv in conversations:
+            by_urn.setdefault(conv.contact_urn, []).append(conv)
+            conditions |= Q(contact_urn=conv.contact_urn, created_at__range=windows[conv.uuid])
+
+        messages = {conv.uuid: [] for conv in conversations}
+        inline_qs = (
+            InlineAgentMessage.objects.filter(conditions, project__uuid=str(project_uuid))
+            .only("text", "source_type", "contact_urn", "created_at")
+            .order_by("created_at")
+        )
+        for message in inline_qs:
+            formatted = {
+                "text": message.text,
+                "source": "user" if message.source_type == "user" else "agent",
+                "created_at": message.created_at.isoformat(),
+            }
+            for conv in by_urn[message.contact_urn]:
+                window_start, window_end = windows[conv.uuid]
+                if window_start <= message.created_at <= window_end:
+                    messages[conv.uuid].append(formatted)
+        return messages
+
+    def _get_messages(self, conversations, project_uuid, start_dt, end_dt, message_service):
+        """
+        Load the messages of a whole page of conversations, keyed by conversation uuid.
 
-        can_fetch = bool(conv.contact_urn and fetch_start and fetch_end)
-        if not can_fetch:
+        DynamoDB is read once for the page (one query per conversation key,
+        run concurrently); conversations with nothing there, or whose query
+        failed, fall back to a single InlineAgentMessage query.
+        """
+        messages = {conv.uuid: [] for conv in conversations}
+        windows = {}
+        for conv in conversations:
+            window = self._message_window(conv, start_dt, end_dt)
+            if window:
+                windows[conv.uuid] = window
+        fetchable = [conv for conv in conversations if conv.uuid in windows]
+        if not fetchable:
             return messages
 
         try:
-            start_iso = self._to_utc_iso(fetch_start)
-            end_iso = self._to_utc_iso(fetch_end)
-
-            messages = message_service.get_messages_for_conversation(
+            dynamo_messages = message_service.get_messages_for_conversations(
                 project_uuid=str(project_uuid),
-                contact_urn=conv.contact_urn,
-                channel_uuid=str(conv.channel_uuid),
-                start_date=start_iso,
-                end_date=end_iso,
-                resolution_status=None,
+                conversations=[
+                    {
+                        "contact_urn": conv.contact_urn,
+                        "channel_uuid": str(conv.channel_uuid),
+                        "start_date": self._to_utc_iso(windows[conv.uuid][0]),
+                        "end_date": self._to_utc_iso(windows[conv.uuid][1]),
+                    }
+                    for conv in fetchable
+                ],
+                max_workers=settings.DYNAMODB_QUERY_CONCURRENCY,
             )
-            if not messages:
-                start_utc = pendulum.instance(fetch_start).in_timezone("UTC")
-                end_utc = pendulum.instance(fetch_end).in_timezone("UTC")
-
-                inline_qs = InlineAgentMessage.objects.filter(
-                    project__uuid=str(project_uuid),
-                    contact_urn=conv.contact_urn,
-                    created_at__range=(start_utc, end_utc),
-                ).order_by("created_at")
-
-                if inline_qs.exists():
-                    messages = [
-                        {
-                            "text": message.text,
-                            "source": "user" if message.source_type == "user" else "agent",
-                            "created_at": message.created_at.isoformat(),
-                        }
-                        for message in inline_qs
-                    ]
         except Exception as e:
-            logger.warning(
-                f"Error fetching messages for conversation {conv.uuid}: {str(e)}",
-                extra={
-                    "project_uuid": project_uuid,
-                    "conversation_uuid": str(conv.uuid),
-                    "contact_urn": conv.contact_urn,
-                    "channel_uuid": str(conv.channel_uuid) if conv.channel_uuid else None,
-                },
-            )
-            sentry_sdk.set_tag("project_uuid", project_uuid)
-            sentry_sdk.set_tag("conversation_uuid", str(conv.uuid))
-            sentry_sdk.capture_exception(e)
+            self._report_message_error(e, project_uuid, fetchable)
+            dynamo_messages = [None] * len(fetchable)
+        for conv, conv_messages in zip(fetchable, dynamo_messages):
+            messages[conv.uuid] = conv_messages or []
+
+        missing = [conv for conv in fetchable if not messages[conv.uuid]]
+        if missing:
+            try:
+                messages.update(self._get_inline_messages(project_uuid, missing, windows))
+            except Exception as e:
+                self._report_message_error(e, project_uuid, missing)
         return messages
 
+    def _get_status_summary(self, qs):
+        """Count conversations per status with one grouped query; the raw counts also give the total."""
+        status_summary = {str(key): 0 for key, _ in Conversation.RESOLUTION_CHOICES}
+        raw_counts = {}
+        for item in qs.values("resolution").annotate(count=Count("pk")).order_by():
+            res = str(item["resolution"])
+            raw_counts[res] = raw_counts.get(res, 0) + item["count"]
+            if res in status_summary:
+                status_summary[res] += item["count"]
+            else:
+                # If resolution is None or not in choices, we map it to "3" (Unclassified)
+                status_summary["3"] += item["count"]
+        return status_summary, raw_counts
+
+    def _encode_cursor(self, conv):
+        payload = json.dumps([conv.created_at.isoformat(), str(conv.uuid)])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _apply_cursor(self, qs, cursor):
+        try:
+            created_at, conv_uuid = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            created_at = datetime.fromisoformat(created_at)
+            conv_uuid = uuid.UUID(conv_uuid)
+        except Exception:
+            raise ValidationError({"cursor": "Invalid cursor."}) from None
+        return qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, uuid__lt=conv_uuid))
+
     @extend_schema(
         summary="List Conversations",
         description="Retrieve a list of conversations for a project with optional filtering by date range and status.",
@@ -204,24 +295,26 @@ class SupervisorPublicConversationsView(APIView):
                 required=False,
                 type=OpenApiTypes.INT,
             ),
+            OpenApiParameter(
+                name="cursor",
+                description="next_cursor of the previous page; takes precedence over page",
+                required=False,
+                type=OpenApiTypes.STR,
+            ),
         ],
         responses={200: SupervisorPublicConversationListSerializer},
     )
     def get(self, request, project_uuid):
         try:
-            qs = Conversation.objects.filter(project__uuid=project_uuid).order_by("-created_at")
+            qs = (
+                Conversation.objects.filter(project__uuid=project_uuid)
+                .select_related("topic")
+                .order_by("-created_at", "-uuid")
+            )
             qs, start_dt, end_dt = self._apply_filters(qs, request)
 
             # Calculate summary stats before pagination and status filtering
-            status_summary = {str(key): 0 for key, _ in Conversation.RESOLUTION_CHOICES}
-            status_counts = qs.values("resolution").annotate(count=Count("resolution")).order_by()
-            for item in status_counts:
-                res = str(item["resolution"])
-                if res in status_summary:
-                    status_summary[res] += item["count"]
-                else:
-                    # If resolution is None or not in choices, we map it to "3" (Unclassified)
-                    status_summary["3"] += item["count"]
+            status_summary, raw_counts = self._get_status_summary(qs)
 
             status_param = request.query_params.get("status")
             if status_param:
@@ -229,9 +322,10 @@ class SupervisorPublicConversationsView(APIView):
                 if status_param not in valid_statuses:
                     raise ValidationError({"status": f"Invalid status. Choices are: {', '.join(valid_statuses)}"})
                 qs = qs.filter(resolution=status_param)
+                total_count = raw_counts.get(status_param, 0)
+            else:
+                total_count = sum(raw_counts.values())
 
-            # Calculate summary stats before pagination
-            total_count = qs.count()
             page_size = int(request.query_params.get("page_size", 50))
             if page_size < 1:
                 page_size = 50
@@ -240,25 +334,29 @@ class SupervisorPublicConversationsView(APIView):
             page = int(request.query_params.get("page", 1))
             if page < 1:
                 page = 1
-            offset = (page - 1) * page_size
-            results = []
+            cursor = request.query_params.get("cursor")
+            if cursor:
+                conversations = list(self._apply_cursor(qs, cursor)[:page_size])
+            else:
+                offset = (page - 1) * page_size
+                conversations = list(qs[offset : offset + page_size])
+            next_cursor = self._encode_cursor(conversations[-1]) if len(conversations) == page_size else None
 
-            message_service = MessageService()
-            for conv in qs[offset : offset + page_size]:
-                messages = self._get_messages(conv, project_uuid, start_dt, end_dt, message_service)
-                results.append(
-                    {
-                        "conversation_uuid": str(conv.uuid),
-                        "start_date": conv.start_date.isoformat() if conv.start_date else None,
-                        "created_at": conv.created_at.isoformat(),
-                        "ended_at": conv.end_date.isoformat() if conv.end_date else None,
-                        "status": conv.get_resolution_display(),
-                        "topic": conv.get_topic() if conv.topic else None,
-                        "channel_uuid": str(conv.channel_uuid) if conv.channel_uuid else None,
-                        "contact_urn": conv.contact_urn,
-                        "messages": messages,
-                    }
-                )
+            messages = self._get_messages(conversations, project_uuid, start_dt, end_dt, MessageService())
+            results = [
+                {
+                    "conversation_uuid": str(conv.uuid),
+                    "start_date": conv.start_date.isoformat() if conv.start_date else None,
+                    "created_at": conv.created_at.isoformat(),
+                    "ended_at": conv.end_date.isoformat() if conv.end_date else None,
+                    "status": conv.get_resolution_display(),
+                    "topic": conv.get_topic() if conv.topic else None,
+                    "channel_uuid": str(conv.channel_uuid) if conv.channel_uuid else None,
+                    "contact_urn": conv.contact_urn,
+                    "messages": messages[conv.uuid],
+                }
+                for conv in conversations
+            ]
 
             return Response(
                 {
@@ -267,6 +365,7 @@ class SupervisorPublicConversationsView(APIView):
                     "total_pages": total_pages,
                     "page_size": page_size,
                     "status_summary": status_summary,
+                    "next_cursor": next_cursor,
                     "results": results,
                 }
             )
@@ -292,6 +391,7 @@ class SupervisorPublicConversationListV2Serializer(serializers.Serializer):
     results = SupervisorPublicConversationItemSerializer(many=True)
     next = serializers.URLField(allow_null=True, required=False)
     previous = serializers.URLField(allow_null=True, required=False)
+    partial = serializers.BooleanField(required=False)
 
 
 class SupervisorPublicConversationsViewV2(APIView):
@@ -309,11 +409,20 @@ class SupervisorPublicConversationsViewV2(APIView):
             "Authorization": f"Bearer {settings.CONVERSATIONS_TOKEN}",
         }
 
-    def _call_conversations_api(self, project_uuid, params):
+    @staticmethod
+    def _new_deadline():
+        return time.monotonic() + settings.SUPERVISOR_PUBLIC_V2_REQUEST_BUDGET_SECONDS
+
+    def _call_conversations_api(self, project_uuid, params, deadline=None):
         """Call nexus-conversations list API."""
         endpoint = f"/api/v1/projects/{project_uuid}/conversations/"
         url = settings.CONVERSATIONS_REST_ENDPOINT.rstrip("/") + endpoint
-        response = requests.get(url, headers=self._get_headers(), params=params, timeout=45)
+        response = _conversations_session.get(
+            url,
+            headers=self._get_headers(),
+            params=params,
+            timeout=_budget_timeout(deadline or self._new_deadline(), 45),
+        )
         response.raise_for_status()
         return response.json()
 
@@ -336,16 +445,20 @@ class SupervisorPublicConversationsViewV2(APIView):
                 out.append(self._normalize_message(m))
         return None
 
-    def _fetch_conversation_messages(self, project_uuid, conversation_uuid):
+    def _fetch_conversation_messages(self, project_uuid, conversation_uuid, deadline=None):
         """
         Fetch messages for a single conversation from nexus-conversations detail endpoint.
         For 'In Progress' conversations, nexus-conversations fetches from DynamoDB.
         Normalizes on the fly into a single list to avoid holding raw + normalized in memory.
+        Stops following message pages once the request budget runs out, keeping what it has.
         """
+        deadline = deadline or self._new_deadline()
         try:
             endpoint = f"/api/v1/projects/{project_uuid}/conversations/{conversation_uuid}/"
             url = settings.CONVERSATIONS_REST_ENDPOINT.rstrip("/") + endpoint
-            response = requests.get(url, headers=self._get_headers(), timeout=30)
+            response = _conversations_session.get(
+                url, headers=self._get_headers(), timeout=_budget_timeout(deadline, 30)
+            )
             response.raise_for_status()
             data = response.json()
         except Exception as e:
@@ -372,10 +485,10 @@ class SupervisorPublicConversationsViewV2(APIView):
                         else settings.CONVERSATIONS_REST_ENDPOINT.rstrip("/")
                         + (next_url if next_url.startswith("/") else f"/{next_url}")
                     )
-                    page_response = requests.get(
+                    page_response = _conversations_session.get(
                         page_url,
                         headers=self._get_headers(),
-                        timeout=30,
+                        timeout=_budget_timeout(deadline, 30),
                     )
                     page_response.raise_for_status()
                     page_data = page_response.json() or {}
@@ -442,35 +555,58 @@ class SupervisorPublicConversationsViewV2(APIView):
             summary[bucket] += 1
         return summary
 
-    def _fetch_messages_for_conversations(self, project_uuid, results_data, request):
-        """Fetch messages for all conversations in parallel (from DynamoDB for In Progress)."""
+    def _fetch_messages_for_conversations(self, project_uuid, results_data, request, deadline=None):
+        """
+        Fetch messages for all conversations in parallel (from DynamoDB for In Progress).
+
+        Returns (messages_by_uuid, partial). Waits no longer than the request
+        budget: conversations still loading when it runs out are returned
+        without messages and partial is True.
+        """
         include_messages = request.query_params.get("include_messages", "true").lower() in (
             "true",
             "1",
             "yes",
         )
         if not include_messages or not results_data:
-            return {}
+            return {}, False
 
+        deadline = deadline or self._new_deadline()
         messages_by_uuid = {}
-        max_workers = min(10, len(results_data))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        max_workers = min(settings.SUPERVISOR_PUBLIC_V2_MAX_WORKERS, len(results_data))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="supervisor_v2_messages")
+        try:
             future_to_uuid = {
                 executor.submit(
                     self._fetch_conversation_messages,
                     project_uuid,
                     str(item.get("uuid")),
+                    deadline=deadline,
                 ): str(item.get("uuid"))
                 for item in results_data
             }
-            for future in as_completed(future_to_uuid):
-                conv_uuid = future_to_uuid[future]
-                try:
-                    messages_by_uuid[conv_uuid] = future.result()
-                except Exception as e:
-                    logger.warning("Error fetching messages for %s: %s", conv_uuid, e)
-                    messages_by_uuid[conv_uuid] = []
-        return messages_by_uuid
+            done, not_done = wait(future_to_uuid, timeout=max(deadline - time.monotonic(), 0))
+        finally:
+            # In-flight requests end on their own budget-bound timeouts; do not block the response on them.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for future in done:
+            conv_uuid = future_to_uuid[future]
+            try:
+                messages_by_uuid[conv_uuid] = future.result()
+            except Exception as e:
+                logger.warning("Error fetching messages for %s: %s", conv_uuid, e)
+                messages_by_uuid[conv_uuid] = []
+
+        partial = bool(not_done) or time.monotonic() >= deadline
+        if partial:
+            logger.warning(
+                "Request budget exceeded fetching messages for project %s: %s of %s conversations loaded",
+                project_uuid,
+                len(done),
+                len(future_to_uuid),
+            )
+        return messages_by_uuid, partial
 
     @staticmethod
     def _parse_response_page(request):
@@ -494,6 +630,7 @@ class SupervisorPublicConversationsViewV2(APIView):
         next_url,
         previous_url,
         request,
+        partial=False,
     ):
         """Build list response: same key order as public supervisor V1, then cursor links."""
         return {
@@ -505,6 +642,7 @@ class SupervisorPublicConversationsViewV2(APIView):
             "results": results,
             "next": self._rewrite_pagination_url(next_url, request) if next_url else None,
             "previous": self._rewrite_pagination_url(previous_url, request) if previous_url else None,
+            "partial": partial,
         }
 
     @staticmethod
@@ -584,7 +722,8 @@ class SupervisorPublicConversationsViewV2(APIView):
             "count is the DB total for the current filters (including status). status_summary comes from "
             "nexus-conversations with status/resolution query params omitted (same mix semantics as public V1). "
             "Use next/previous to paginate; page echoes the optional page query param (default 1) like V1. "
-            "By default includes messages per conversation (DynamoDB for In Progress via nexus-conversations detail)."
+            "By default includes messages per conversation (DynamoDB for In Progress via nexus-conversations detail). "
+            "partial is true when the request time budget ran out and some conversations lack all their messages."
         ),
         parameters=[
             OpenApiParameter(
@@ -659,12 +798,15 @@ class SupervisorPublicConversationsViewV2(APIView):
     def get(self, request, project_uuid):
         try:
             params, page_size = self._parse_request_params(request)
-            data = self._call_conversations_api(project_uuid, params)
+            deadline = self._new_deadline()
+            data = self._call_conversations_api(project_uuid, params, deadline=deadline)
             results_data = data.get("results", [])
             next_url = data.get("next")
             previous_url = data.get("previous")
 
-            messages_by_uuid = self._fetch_messages_for_conversations(project_uuid, results_data, request)
+            messages_by_uuid, partial = self._fetch_messages_for_conversations(
+                project_uuid, results_data, request, deadline=deadline
+            )
             results = [
                 self._transform_conversation(
                     item,
@@ -702,6 +844,7 @@ class SupervisorPublicConversationsViewV2(APIView):
                     next_url=next_url,
                     previous_url=previous_url,
                     request=request,
+                    partial=partial,
                 ),
                 status=status.HTTP_200_OK,
             )
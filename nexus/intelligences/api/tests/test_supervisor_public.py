@@ -1,7 +1,11 @@
+import json
+import threading
+import time
 import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -50,8 +54,8 @@ class TestSupervisorPublicAPI(TestCase):
     def test_public_supervisor_conversations_filters_and_messages(self, MockMessageService):
         # Mock message service to return messages
         instance = MockMessageService.return_value
-        instance.get_messages_for_conversation.return_value = [
-            {"text": "hello", "source": "user", "created_at": "2025-01-01T10:00:00"}
+        instance.get_messages_for_conversations.return_value = [
+            [{"text": "hello", "source": "user", "created_at": "2025-01-01T10:00:00"}]
         ]
 
         url = reverse(
@@ -127,7 +131,9 @@ class TestSupervisorPublicAPI(TestCase):
     def test_status_summary_aggregation(self, MockMessageService):
         # Setup mock properly to avoid recursion
         instance = MockMessageService.return_value
-        instance.get_messages_for_conversation.return_value = []
+        instance.get_messages_for_conversations.side_effect = lambda project_uuid, conversations, **kwargs: [
+            [] for _ in conversations
+        ]
 
         # Create multiple conversations to verify aggregation
         from datetime import datetime, timedelta, timezone
@@ -172,6 +178,149 @@ class TestSupervisorPublicAPI(TestCase):
         # We created 5 conversations with resolution=0
         self.assertEqual(status_summary["0"], 5)
         self.assertEqual(status_summary["2"], 4)
+        self.assertEqual(data["count"], 9)
+
+    def _create_conversations(self, count, **kwargs):
+        from datetime import datetime, timedelta, timezone
+
+        start_dt = datetime.now(tz=timezone.utc) - timedelta(days=2)
+        end_dt = datetime.now(tz=timezone.utc) - timedelta(days=1)
+        for number in range(count):
+            Conversation.objects.create(
+                project=self.project,
+                contact_urn=f"whatsapp:55{number}",
+                channel_uuid=uuid.uuid4(),
+                start_date=start_dt,
+                end_date=end_dt,
+                **kwargs,
+            )
+
+    def _list(self, query=""):
+        url = reverse(
+            "public-supervisor-conversations",
+            kwargs={"project_uuid": str(self.project.uuid)},
+        )
+        return self.client.get(f"{url}?{query}", HTTP_AUTHORIZATION=f"ApiKey {self.raw_token}")
+
+    @mock.patch("nexus.intelligences.api.supervisor_public.MessageService")
+    def test_messages_are_loaded_once_per_page(self, MockMessageService):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        instance = MockMessageService.return_value
+        instance.get_messages_for_conversations.side_effect = lambda project_uuid, conversations, **kwargs: [
+            [] for _ in conversations
+        ]
+        self._create_conversations(11)
+
+        with CaptureQueriesContext(connection) as small_page:
+            self.assertEqual(self._list("page_size=2").status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as large_page:
+            response = self._list("page_size=12")
+
+        self.assertEqual(len(response.json()["results"]), 12)
+        self.assertEqual(len(large_page.captured_queries), len(small_page.captured_queries))
+        self.assertEqual(instance.get_messages_for_conversations.call_count, 2)
+        self.assertEqual(len(instance.get_messages_for_conversations.call_args.kwargs["conversations"]), 12)
+
+    @mock.patch("nexus.intelligences.api.supervisor_public.MessageService")
+    def test_inline_messages_fallback_is_grouped_per_conversation(self, MockMessageService):
+        from datetime import datetime, timedelta, timezone
+
+        from nexus.inline_agents.models import InlineAgentMessage
+
+        instance = MockMessageService.return_value
+        instance.get_messages_for_conversations.side_effect = lambda project_uuid, conversations, **kwargs: [
+            [] for _ in conversations
+        ]
+        other = Conversation.objects.create(
+            project=self.project,
+            contact_urn="whatsapp:5521888888888",
+            channel_uuid=uuid.uuid4(),
+            start_date=self.conversation.start_date,
+            end_date=self.conversation.end_date,
+        )
+        inside = self.conversation.start_date + timedelta(hours=1)
+        for contact_urn, text, created_at in [
+            (self.conversation.contact_urn, "hi", inside),
+            (other.contact_urn, "hello there", inside),
+            (other.contact_urn, "too late", datetime.now(tz=timezone.utc)),
+        ]:
+            message = InlineAgentMessage.objects.create(
+                project=self.project,
+                contact_urn=contact_urn,
+                text=text,
+                session_id="session",
+                source_type="user",
+                source="router",
+            )
+            InlineAgentMessage.objects.filter(pk=message.pk).update(created_at=created_at)
+
+        results = {item["contact_urn"]: item["messages"] for item in self._list().json()["results"]}
+
+        self.assertEqual([message["text"] for message in results[self.conversation.contact_urn]], ["hi"])
+        self.assertEqual([message["text"] for message in results[other.contact_urn]], ["hello there"])
+
+    @mock.patch("nexus.intelligences.api.supervisor_public.MessageService")
+    def test_failed_conversation_query_falls_back_to_inline_messages(self, MockMessageService):
+        from datetime import timedelta
+
+        from nexus.inline_agents.models import InlineAgentMessage
+
+        other = Conversation.objects.create(
+            project=self.project,
+            contact_urn="whatsapp:5521888888888",
+            channel_uuid=uuid.uuid4(),
+            start_date=self.conversation.start_date,
+            end_date=self.conversation.end_date,
+        )
+        instance = MockMessageService.return_value
+        instance.get_messages_for_conversations.side_effect = lambda project_uuid, conversations, **kwargs: [
+            None if conversation["contact_urn"] == other.contact_urn else [{"text": "from dynamo"}]
+            for conversation in conversations
+        ]
+        message = InlineAgentMessage.objects.create(
+            project=self.project,
+            contact_urn=other.contact_urn,
+            text="from inline",
+            session_id="session",
+            source_type="user",
+            source="router",
+        )
+        InlineAgentMessage.objects.filter(pk=message.pk).update(
+            created_at=self.conversation.start_date + timedelta(hours=1)
+        )
+
+        results = {item["contact_urn"]: item["messages"] for item in self._list().json()["results"]}
+
+        self.assertEqual([message["text"] for message in results[self.conversation.contact_urn]], ["from dynamo"])
+        self.assertEqual([message["text"] for message in results[other.contact_urn]], ["from inline"])
+
+    @mock.patch("nexus.intelligences.api.supervisor_public.MessageService")
+    def test_cursor_pagination_walks_every_conversation_once(self, MockMessageService):
+        instance = MockMessageService.return_value
+        instance.get_messages_for_conversations.side_effect = lambda project_uuid, conversations, **kwargs: [
+            [] for _ in conversations
+        ]
+        self._create_conversations(6)
+
+        seen = []
+        query = "page_size=3"
+        for _ in range(4):
+            if not query:
+                break
+            data = self._list(query).json()
+            seen.extend(item["conversation_uuid"] for item in data["results"])
+            query = f"page_size=3&cursor={data['next_cursor']}" if data["next_cursor"] else None
+
+        expected = Conversation.objects.filter(project=self.project).order_by("-created_at", "-uuid")
+        self.assertEqual(seen, [str(conv.uuid) for conv in expected])
+
+    def test_invalid_cursor(self):
+        response = self._list("cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.json())
 
     @mock.patch.object(SupervisorPublicConversationsViewV2, "_fetch_conversation_messages")
     @mock.patch.object(SupervisorPublicConversationsViewV2, "_call_conversations_api")
@@ -507,3 +656,132 @@ class TestSupervisorPublicAPI(TestCase):
         mock_call.assert_called_once()
         upstream_params = mock_call.call_args[0][1]
         self.assertEqual(upstream_params["topics"], "Sales,unclassified")
+
+
+class StubConversationsService(ThreadingHTTPServer):
+    """Local nexus-conversations stand-in: list and detail endpoints, messages in two pages."""
+
+    daemon_threads = True
+
+    def __init__(self, conversation_uuids, latency=0.0, slow_uuids=(), slow_latency=0.0):
+        super().__init__(("127.0.0.1", 0), StubConversationsHandler)
+        self.conversation_uuids = conversation_uuids
+        self.latency = latency
+        self.slow_uuids = set(slow_uuids)
+        self.slow_latency = slow_latency
+        self.lock = threading.Lock()
+        self.connections = set()
+        self.running = self.peak = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StubConversationsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _body(self, path, query):
+        parts = [part for part in path.split("/") if part]
+        if parts[-1] == "conversations":
+            results = [{"uuid": conv_uuid, "status": "Resolved"} for conv_uuid in self.server.conversation_uuids]
+            return {"results": results, "next": None, "previous": None, "total_count": len(results)}, 0.0
+
+        conv_uuid = parts[-1]
+        latency = self.server.slow_latency if conv_uuid in self.server.slow_uuids else self.server.latency
+        if query == "page=2":
+            return {"messages": {"results": [{"text": "second", "source": "agent"}], "next": None}}, latency
+        next_url = f"{self.path.split('?')[0]}?page=2"
+        return {"messages": {"results": [{"text": "first", "source": "user"}], "next": next_url}}, latency
+
+    def do_GET(self):
+        server = self.server
+        path, _, query = self.path.partition("?")
+        body, latency = self._body(path, query)
+        with server.lock:
+            server.running += 1
+            server.peak = max(server.peak, server.running)
+            server.connections.add(self.client_address)
+        time.sleep(latency)
+        with server.lock:
+            server.running -= 1
+
+        payload = json.dumps(body).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up waiting
+
+
+class TestSupervisorPublicV2Upstream(TestCase):
+    def setUp(self):
+        self.project = ProjectFactory()
+        token, salt, token_hash = ProjectApiToken.generate_token_pair()
+        ProjectApiToken.objects.create(
+            project=self.project,
+            name="public-api-token",
+            token_hash=token_hash,
+            salt=salt,
+            scope="read:supervisor_conversations",
+            enabled=True,
+            created_by=self.project.created_by,
+        )
+        self.raw_token = token
+        self.client = APIClient()
+
+    def _serve(self, *args, **kwargs):
+        server = StubConversationsService(*args, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _list(self, server):
+        url = reverse(
+            "public-supervisor-conversations-v2",
+            kwargs={"project_uuid": str(self.project.uuid)},
+        )
+        with override_settings(CONVERSATIONS_REST_ENDPOINT=server.url):
+            return self.client.get(url, HTTP_AUTHORIZATION=f"ApiKey {self.raw_token}")
+
+    def test_message_pages_are_fetched_concurrently_on_pooled_connections(self):
+        conversation_uuids = [str(uuid.uuid4()) for _ in range(30)]
+        server = self._serve(conversation_uuids, latency=0.02)
+
+        response = self._list(server)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertFalse(data["partial"])
+        self.assertEqual([item["conversation_uuid"] for item in data["results"]], conversation_uuids)
+        for item in data["results"]:
+            self.assertEqual([message["text"] for message in item["messages"]], ["first", "second"])
+        self.assertLessEqual(server.peak, 10)
+        self.assertGreater(server.peak, 1)
+        # 1 list call + 60 message pages, over at most one keep-alive connection per worker
+        self.assertLessEqual(len(server.connections), 11)
+
+    @override_settings(SUPERVISOR_PUBLIC_V2_REQUEST_BUDGET_SECONDS=0.5)
+    def test_budget_exceeded_returns_partial_results(self):
+        conversation_uuids = [str(uuid.uuid4()) for _ in range(4)]
+        server = self._serve(conversation_uuids, slow_uuids=conversation_uuids[:1], slow_latency=2.0)
+
+        start = time.monotonic()
+        response = self._list(server)
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertTrue(data["partial"])
+        messages = {item["conversation_uuid"]: item["messages"] for item in data["results"]}
+        self.assertEqual(messages[conversation_uuids[0]], [])
+        for conv_uuid in conversation_uuids[1:]:
+            self.assertEqual(len(messages[conv_uuid]), 2)
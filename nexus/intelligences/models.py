@@ -248,6 +248,16 @@ class SubTopics(models.Model):
         return f"{self.topic.name} - {self.name}"
 
 
+class ConversationQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        from nexus.analytics.conversation_facts import FACT_FIELDS, track_bulk_update
+
+        if FACT_FIELDS.isdisjoint(kwargs):
+            return super().update(**kwargs)
+        parent_update = super().update
+        return track_bulk_update(self, lambda: parent_update(**kwargs))
+
+
 class Conversation(models.Model):
     RESOLUTION_CHOICES = [
         (0, "Resolved"),
@@ -283,6 +293,8 @@ class Conversation(models.Model):
     csat = models.CharField(max_length=255, choices=CSAT_CHOICES, null=True, blank=True)
     resolution = models.CharField(max_length=255, choices=RESOLUTION_CHOICES, default=2)
 
+    objects = ConversationQuerySet.as_manager()
+
     class Meta:
         indexes = [
             models.Index(fields=["project", "contact_urn", "start_date", "end_date", "channel_uuid"]),
@@ -291,6 +303,14 @@ class Conversation(models.Model):
     def __str__(self):
         return f"Conversation - {self.uuid} - {self.contact_name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the row counted towards in ConversationDailyFact, so a later save can move it.
+        fields = instance.__dict__
+        instance._fact_snapshot = (fields.get("project_id"), fields.get("created_at"), fields.get("resolution"))
+        return instance
+
     def get_topic(self):
         return self.topic.name if self.topic else None
 
@@ -1,9 +1,10 @@
 import logging
+from typing import Optional, Tuple
 
 import requests
 from django.conf import settings
 
-from nexus.cache import TokenCache
+from nexus.cache import SharedTokenProvider, TokenCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,14 +15,17 @@ class InternalAuthenticationTokenError(Exception):
 
 class InternalAuthentication:
     """
-    Internal authentication client with simple token cache.
+    Internal authentication client backed by a process-wide Keycloak token provider.
     """
 
-    def __init__(self):
-        self.token_cache = TokenCache(cache_key_prefix="keycloak_internal")
+    def __init__(self, session: requests.Session = None):
+        self.token_cache = _keycloak_token_cache
+        self.token_provider = _keycloak_token_provider
+        self.session = session
 
-    def _fetch_token_from_keycloak(self) -> str:
-        """Fetch new token from Keycloak."""
+    @staticmethod
+    def _fetch_token_with_ttl() -> Tuple[str, Optional[int]]:
+        """Fetch new token from Keycloak, along with its lifetime in seconds."""
         logger.debug("Fetching new token from Keycloak")
 
         try:
@@ -36,10 +40,11 @@ class InternalAuthentication:
             )
             response.raise_for_status()
 
-            token = response.json().get("access_token")
+            payload = response.json()
+            token = payload.get("access_token")
 
             if token:
-                return f"Bearer {token}"
+                return f"Bearer {token}", payload.get("expires_in")
 
             raise InternalAuthenticationTokenError("Access token not found in response")
 
@@ -47,17 +52,22 @@ class InternalAuthentication:
             logger.error(f"Failed to fetch Keycloak token: {e}")
             raise InternalAuthenticationTokenError(f"Failed to fetch token: {e}") from e
 
+    def _fetch_token_from_keycloak(self) -> str:
+        """Fetch new token from Keycloak."""
+        token, _ = self._fetch_token_with_ttl()
+        return token
+
     def _get_module_token(self):
-        """Get token using cache."""
+        """Get token from the shared provider."""
         try:
-            return self.token_cache.get_or_generate(identifier="main", token_factory=self._fetch_token_from_keycloak)
+            return self.token_provider.get_token()
         except Exception as e:
             logger.error(f"Error getting token: {e}")
             raise InternalAuthenticationTokenError(f"Token retrieval failed: {e}") from e
 
-    def invalidate_cache(self):
+    def invalidate_cache(self, token: Optional[str] = None):
         """Invalidate token cache - useful for retry in case of 401/403."""
-        self.token_cache.invalidate("main")
+        self.token_provider.invalidate(token)
 
     @property
     def headers(self):
@@ -72,18 +82,28 @@ class InternalAuthentication:
         """
         headers = kwargs.pop("headers", {})
         headers.update(self.headers)
+        sent_token = headers["Authorization"]
+        http = self.session or requests
 
-        response = requests.request(method, url, headers=headers, **kwargs)
+        response = http.request(method, url, headers=headers, **kwargs)
 
         if response.status_code in (401, 403):
             logger.warning(f"Auth error (HTTP {response.status_code}), retrying with fresh token")
-            self.invalidate_cache()
+            self.invalidate_cache(sent_token)
 
             headers.update(self.headers)
-            response = requests.request(method, url, headers=headers, **kwargs)
+            response = http.request(method, url, headers=headers, **kwargs)
 
         return response
 
 
 class RestClient:
     pass
+
+
+_keycloak_token_cache = TokenCache(cache_key_prefix="keycloak_internal")
+_keycloak_token_provider = SharedTokenProvider(
+    token_cache=_keycloak_token_cache,
+    identifier="main",
+    token_factory=InternalAuthentication._fetch_token_with_ttl,
+)
@@ -1,10 +1,12 @@
 import json
+from datetime import datetime, timezone
 from unittest import skip
 from unittest.mock import patch
 from uuid import uuid4
 
 import pendulum
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from freezegun import freeze_time
 from rest_framework import status
@@ -178,6 +180,69 @@ class LogsViewSetTestCase(TestCase):
         self.assertListEqual(fields, list(content.keys()))
 
 
+class LogsKeysetPaginationTestCase(TestCase):
+    def setUp(self) -> None:
+        self.factory = APIRequestFactory()
+        self.project = ProjectFactory()
+        self.user = self.project.created_by
+        logs = MessageLogFactory.create_batch(25, project=self.project)
+        # Half of the rows share one timestamp so pages must break ties on id.
+        MessageLog.objects.filter(pk__in=[log.pk for log in logs[:13]]).update(
+            created_at=datetime(2026, 7, 16, 12, tzinfo=timezone.utc)
+        )
+        MessageLog.objects.filter(pk__in=[log.pk for log in logs[13:]]).update(
+            created_at=datetime(2026, 7, 15, 12, tzinfo=timezone.utc)
+        )
+        self.expected = list(
+            MessageLog.objects.filter(project=self.project).order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+
+    def _get(self, url):
+        request = self.factory.get(url)
+        force_authenticate(request, user=self.user)
+        response = LogsViewset.as_view({"get": "list"})(request, project_uuid=str(self.project.uuid))
+        response.render()
+        return json.loads(response.content), response.status_code
+
+    def test_walks_forward_and_back_without_gaps_or_count(self):
+        url = f"http://testserver/api/{self.project.uuid}/logs/?order_by=desc&limit=10"
+        seen, pages = [], []
+        while url:
+            with self.assertNumQueries(1):
+                content, _ = self._get(url)
+            pages.append(content)
+            seen.extend(log["id"] for log in content["results"])
+            url = content["next"]
+
+        self.assertEqual(seen, self.expected)
+        self.assertEqual([len(page["results"]) for page in pages], [10, 10, 5])
+        self.assertIsNone(pages[0]["count"])
+        self.assertIsNone(pages[0]["previous"])
+
+        content, _ = self._get(pages[2]["previous"])
+        self.assertEqual([log["id"] for log in content["results"]], self.expected[10:20])
+        content, _ = self._get(content["previous"])
+        self.assertEqual([log["id"] for log in content["results"]], self.expected[:10])
+        self.assertIsNone(content["previous"])
+
+    def test_ascending_order_follows_queryset(self):
+        content, _ = self._get(f"http://testserver/api/{self.project.uuid}/logs/?order_by=asc&limit=20")
+        following, _ = self._get(content["next"])
+
+        ids = [log["id"] for log in content["results"] + following["results"]]
+        self.assertEqual(ids, self.expected[::-1])
+
+    def test_opt_in_count(self):
+        content, _ = self._get(f"http://testserver/api/{self.project.uuid}/logs/?limit=10&with_count=true")
+
+        self.assertEqual(content["count"], 25)
+
+    def test_invalid_cursor(self):
+        _, status_code = self._get(f"http://testserver/api/{self.project.uuid}/logs/?limit=10&cursor=bm9wZQ==")
+
+        self.assertEqual(status_code, 404)
+
+
 class RecentActivitiesViewSetTestCase(TestCase):
     def setUp(self) -> None:
         self.factory = APIRequestFactory()
@@ -443,6 +508,76 @@ class TagPercentageViewSetTestCase(APITestCase):
         self.assertEqual(response.data["error"], "Invalid date format for started_day or ended_day")
 
 
+@override_settings(SUPERVISOR_SERVICE_AVAILABLE=True)
+class TagPercentageAggregateTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.project = ProjectFactory()
+        self.user = self.project.created_by
+        self.view = TagPercentageViewSet.as_view({"get": "list"})
+        self.url = reverse("list-tag-percentage", kwargs={"project_uuid": str(self.project.uuid)})
+
+        self._logs(5, "action_started", None)
+        self._logs(3, "other", "S")
+        self._logs(2, "other", "F")
+        # Not counted: failed message, other source, other project, outside the range.
+        self._logs(4, "action_started", None, message_status="F")
+        self._logs(4, "action_started", None, source="preview")
+        MessageLogFactory(source="router", reflection_data={"tag": "action_started"})
+        self._logs(4, "action_started", None, created_at=datetime(2026, 7, 16, tzinfo=timezone.utc))
+
+        MessageLog.objects.filter(created_at__gt=datetime(2026, 7, 16, tzinfo=timezone.utc)).update(
+            created_at=datetime(2026, 7, 15, 23, 59, 59, tzinfo=timezone.utc)
+        )
+
+    def _logs(self, count, tag, response_status, message_status="S", source="router", created_at=None):
+        logs = MessageLogFactory.create_batch(
+            count,
+            project=self.project,
+            source=source,
+            reflection_data={"tag": tag},
+            message__status=message_status,
+            message__response_status_cache=response_status,
+        )
+        if created_at is not None:
+            MessageLog.objects.filter(pk__in=[log.pk for log in logs]).update(created_at=created_at)
+
+    def _get(self, params):
+        request = self.factory.get(self.url, params)
+        force_authenticate(request, user=self.user)
+        response = self.view(request, project_uuid=str(self.project.uuid))
+        response.render()
+        return response
+
+    @patch("nexus.projects.api.permissions.ProjectPermission.has_permission", return_value=True)
+    def test_single_aggregate_query(self, mock_permission):
+        with self.assertNumQueries(1):
+            response = self._get({"started_day": "2026-07-01", "ended_day": "2026-07-15"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["action_percentage"], 50.0)
+        self.assertEqual(response.data["succeed_percentage"], 30.0)
+        self.assertEqual(response.data["failed_percentage"], 20.0)
+
+    @patch("nexus.projects.api.permissions.ProjectPermission.has_permission", return_value=True)
+    def test_polling_is_served_from_cache(self, mock_permission):
+        params = {"started_day": "2026-07-01", "ended_day": "2026-07-15"}
+        first = self._get(params)
+
+        with self.assertNumQueries(0):
+            second = self._get(params)
+
+        self.assertEqual(second.data, first.data)
+
+    @patch("nexus.projects.api.permissions.ProjectPermission.has_permission", return_value=True)
+    def test_empty_range(self, mock_permission):
+        response = self._get({"started_day": "2026-07-17", "ended_day": "2026-07-20"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+
 class MessageDetailViewSetTestCase(TestCase):
     def setUp(self) -> None:
         self.project = ProjectFactory()
@@ -1,12 +1,16 @@
 import logging
+from datetime import datetime, time, timedelta
 
 import pendulum
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 from rest_framework import views
 from rest_framework.exceptions import ValidationError
 from rest_framework.mixins import ListModelMixin
-from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ReadOnlyModelViewSet
@@ -23,7 +27,7 @@ from nexus.logs.api.serializers import (
     TagPercentageSerializer,
 )
 from nexus.logs.models import MessageLog, RecentActivities
-from nexus.paginations import InlineConversationsCursorPagination
+from nexus.paginations import InlineConversationsCursorPagination, KeysetPagination, LogsKeysetPagination
 from nexus.projects.api.permissions import ProjectPermission
 from nexus.projects.models import Project
 from nexus.usecases.agents.agents import AgentUsecase
@@ -34,6 +38,14 @@ from nexus.usecases.logs.retrieve import RetrieveMessageLogUseCase
 logger = logging.getLogger(__name__)
 
 
+def _day_range(started_day, ended_day):
+    """Half-open [start of started_day, start of the day after ended_day) in the current timezone."""
+    tz = timezone.get_current_timezone()
+    started_at = timezone.make_aware(datetime.combine(started_day, time.min), tz)
+    ended_before = timezone.make_aware(datetime.combine(ended_day + timedelta(days=1), time.min), tz)
+    return started_at, ended_before
+
+
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
@@ -77,52 +89,52 @@ class TagPercentageViewSet(ListModelMixin, GenericViewSet):
 
         source = request.query_params.get("source", "router")
 
-        base_query = (
-            MessageLog.objects.select_related("message")
-            .filter(
-                created_at__date__gte=started_day,
-                created_at__date__lte=ended_day,
+        cache_key = f"tag_percentage:{project_uuid}:{source}:{started_day.isoformat()}:{ended_day.isoformat()}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._tag_percentages(project_uuid, source, started_day, ended_day)
+            cache.set(cache_key, data, settings.TAG_PERCENTAGE_CACHE_TTL_SECONDS)
+
+        if not data:
+            return Response([], status=200)
+        serializer = TagPercentageSerializer(data)
+        return Response(serializer.data)
+
+    @staticmethod
+    def _tag_percentages(project_uuid, source, started_day, ended_day) -> dict:
+        # Half-open range on the raw column so the (project, created_at, tag) index applies.
+        started_at, ended_before = _day_range(started_day, ended_day)
+
+        action_started = Q(reflection_data__tag="action_started")
+        tag_counts = (
+            MessageLog.objects.filter(
+                created_at__gte=started_at,
+                created_at__lt=ended_before,
                 reflection_data__tag__isnull=False,
                 source=source,
                 project__uuid=str(project_uuid),
             )
             .exclude(message__status="F")
+            .aggregate(
+                action_count=Count("pk", filter=action_started),
+                succeed_count=Count("pk", filter=~action_started & Q(message__response_status_cache="S")),
+                failed_count=Count("pk", filter=~action_started & Q(message__response_status_cache="F")),
+            )
         )
 
-        if not base_query.exists():
-            return Response([], status=200)
-
-        tag_counts = {}
-
-        action_count = base_query.filter(reflection_data__tag="action_started").count()
-        tag_counts["action_count"] = action_count
-
-        status_logs_base = base_query.exclude(reflection_data__tag="action_started")
-
-        tag_counts["succeed_count"] = status_logs_base.filter(message__response_status_cache="S").count()
-
-        tag_counts["failed_count"] = status_logs_base.filter(message__response_status_cache="F").count()
-
         total_logs = sum(tag_counts.values())
         if total_logs == 0:
-            return Response([], status=200)
+            return {}
 
-        action_percentage = (tag_counts["action_count"] / total_logs) * 100
-        succeed_percentage = (tag_counts["succeed_count"] / total_logs) * 100
-        failed_percentage = (tag_counts["failed_count"] / total_logs) * 100
-
-        data = {
-            "action_percentage": action_percentage,
-            "succeed_percentage": succeed_percentage,
-            "failed_percentage": failed_percentage,
+        return {
+            "action_percentage": (tag_counts["action_count"] / total_logs) * 100,
+            "succeed_percentage": (tag_counts["succeed_count"] / total_logs) * 100,
+            "failed_percentage": (tag_counts["failed_count"] / total_logs) * 100,
         }
 
-        serializer = TagPercentageSerializer(data)
-        return Response(serializer.data)
-
 
 class MessageHistoryViewset(ListModelMixin, GenericViewSet):
-    pagination_class = CustomPageNumberPagination
+    pagination_class = KeysetPagination
     serializer_class = MessageHistorySerializer
     permission_classes = [ProjectPermission]
 
@@ -146,8 +158,7 @@ class MessageHistoryViewset(ListModelMixin, GenericViewSet):
         if not service_available and project_uuid not in service_available_projects:
             return MessageLog.objects.none()
 
-        params["created_at__date__gte"] = started_day
-        params["created_at__date__lte"] = ended_day
+        params["created_at__gte"], params["created_at__lt"] = _day_range(started_day, ended_day)
 
         tag_param = self.request.query_params.get("tag")
         text_param = self.request.query_params.get("text")
@@ -196,7 +207,7 @@ class MessageHistoryViewset(ListModelMixin, GenericViewSet):
 class LogsViewset(ReadOnlyModelViewSet):
     serializer_class = MessageLogSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = LimitOffsetPagination
+    pagination_class = LogsKeysetPagination
     lookup_url_kwarg = "log_id"
 
     def get_queryset(self):
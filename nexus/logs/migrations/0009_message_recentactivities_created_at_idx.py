@@ -0,0 +1,23 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building it
+    # concurrently avoids locking the (large) log tables against writes.
+    atomic = False
+
+    dependencies = [
+        ("logs", "0008_message_groundedness_details_cache_and_more"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="message",
+            index=models.Index(fields=["created_at"], name="logs_message_created_at_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="recentactivities",
+            index=models.Index(fields=["created_at"], name="logs_recentact_created_at_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+import django.db.models.fields.json
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("logs", "0009_message_recentactivities_created_at_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="messagelog",
+            index=models.Index(
+                models.F("project"),
+                models.F("created_at"),
+                django.db.models.fields.json.KeyTransform("tag", "reflection_data"),
+                name="logs_msglog_proj_created_tag",
+            ),
+        ),
+    ]
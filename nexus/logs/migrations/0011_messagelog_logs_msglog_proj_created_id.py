@@ -0,0 +1,17 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("logs", "0010_messagelog_logs_msglog_proj_created_tag"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="messagelog",
+            index=models.Index(fields=["project", "created_at", "id"], name="logs_msglog_proj_created_id"),
+        ),
+    ]
@@ -1,18 +1,48 @@
 import re
 import string
 import unicodedata
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.db.models.fields.json import KeyTransform
 
 from nexus.intelligences.models import ContentBase, Intelligence
 from nexus.projects.models import Project
 from nexus.users.models import User
 
 
+def _char_counts(word: str) -> Dict[str, int]:
+    return {char: word.count(char) for char in set(word)}
+
+
+class _Vocabulary:
+    """Distinct words of a text grouped by length; character counts are built per length on first use."""
+
+    def __init__(self, text: str):
+        self.words = set(text.split())
+        self.by_length: Dict[int, List[str]] = {}
+        for word in self.words:
+            self.by_length.setdefault(len(word), []).append(word)
+        self._counted: Dict[int, List[Tuple[str, Dict[str, int]]]] = {}
+        self.matches: Dict[Tuple[str, float], bool] = {}
+
+    def counted(self, length: int) -> List[Tuple[str, Dict[str, int]]]:
+        counted = self._counted.get(length)
+        if counted is None:
+            counted = self._counted[length] = [(word, _char_counts(word)) for word in self.by_length[length]]
+        return counted
+
+
+@lru_cache(maxsize=64)
+def _vocabulary(text: str) -> _Vocabulary:
+    # The same chunk is matched against every evidence sentence of a message.
+    return _Vocabulary(text)
+
+
 class TextComparer:
     @staticmethod
     def similarity(sentence_a: str, sentence_b: str) -> float:
@@ -28,6 +58,41 @@ class TextComparer:
         s = re.sub(f"[{re.escape(string.punctuation)}]", "", s)
         return s
 
+    @staticmethod
+    def word_in_vocabulary(keyword: str, vocabulary: _Vocabulary, similarity_threshold: float) -> bool:
+        """True if any word of ``vocabulary`` has ``similarity(keyword, word) >= similarity_threshold``."""
+        if similarity_threshold <= 1.0 and keyword in vocabulary.words:
+            return True
+        key = (keyword, similarity_threshold)
+        if key not in vocabulary.matches:
+            vocabulary.matches[key] = TextComparer._fuzzy_match(keyword, vocabulary, similarity_threshold)
+        return vocabulary.matches[key]
+
+    @staticmethod
+    def _fuzzy_match(keyword: str, vocabulary: _Vocabulary, similarity_threshold: float) -> bool:
+        """
+        Candidates are pruned with the upper bounds SequenceMatcher itself
+        uses (length ratio, then shared character counts), so ``ratio()`` only
+        runs on words that can still reach the threshold and the result is the
+        same as comparing against every word.
+        """
+        from difflib import SequenceMatcher
+
+        size = len(keyword)
+        counts = _char_counts(keyword)
+        matcher = SequenceMatcher(None, keyword, "")
+        for length in sorted(vocabulary.by_length, key=lambda length: abs(length - size)):
+            if 2.0 * min(size, length) / (size + length) < similarity_threshold:
+                continue
+            for word, word_counts in vocabulary.counted(length):
+                shared = sum(min(count, word_counts.get(char, 0)) for char, count in counts.items())
+                if 2.0 * shared / (size + length) < similarity_threshold:
+                    continue
+                matcher.set_seq2(word)
+                if matcher.ratio() >= similarity_threshold:
+                    return True
+        return False
+
     @staticmethod
     def string_in_text(
         sentence: str, text: str, compare_similarity: bool = True, similarity_threshold: float = 0.8
@@ -35,13 +100,11 @@ class TextComparer:
         keywords: List[str] = sentence.split()
 
         if compare_similarity:
-            keywords_in_text = []
-            for keyword in keywords:
-                keyword_in_text = any(
-                    TextComparer.similarity(keyword, word) >= similarity_threshold for word in text.split()
-                )
-                keywords_in_text.append(keyword_in_text)
-            return all(keywords_in_text)
+            vocabulary = _vocabulary(text)
+            return all(
+                TextComparer.word_in_vocabulary(keyword, vocabulary, similarity_threshold)
+                for keyword in dict.fromkeys(keywords)
+            )
 
         keywords_in_text = [keyword in text for keyword in keywords]
         return all(keywords_in_text)
@@ -59,6 +122,11 @@ class Message(models.Model):
     groundedness_details_cache = models.JSONField(null=True, blank=True)
     response_status_cache = models.CharField(max_length=1, choices=STATUS_CHOICES, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="logs_message_created_at_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.status} - {self.contact_urn}"
 
@@ -79,17 +147,19 @@ class Message(models.Model):
                 if reflection_data and "sentence_rankings" in reflection_data:
                     sentences = groundedness.extract_score_and_sentences(reflection_data.get("sentence_rankings"))
                     groundedness_details: List[Dict[str, str]] = []
+                    clean_chunks = [
+                        (chunk, TextComparer.clean_string(chunk.get("full_page", "")))
+                        for chunk in self.messagelog.chunks_json
+                    ]
                     for sentence in sentences:
                         sentence_stats = {
                             "sentence": sentence.get("sentence"),
                             "sources": [],
                             "score": sentence.get("score"),
                         }
-                        for chunk in self.messagelog.chunks_json:
-                            evidence: str = sentence.get("evidence", "")
-                            clean_evidence: str = TextComparer.clean_string(evidence)
-                            clean_chunk: str = TextComparer.clean_string(chunk.get("full_page", ""))
-
+                        evidence: str = sentence.get("evidence", "")
+                        clean_evidence: str = TextComparer.clean_string(evidence)
+                        for chunk, clean_chunk in clean_chunks:
                             if TextComparer.string_in_text(clean_evidence, clean_chunk):
                                 sentence_stats["sources"].append(
                                     {"filename": chunk.get("filename"), "file_uuid": chunk.get("file_uuid")}
@@ -152,6 +222,20 @@ class MessageLog(models.Model):
 
     is_approved = models.BooleanField(null=True)
 
+    class Meta:
+        indexes = [
+            # Serves the tag percentage dashboard: project equality, created_at
+            # range, and the reflection tag read from the index entry.
+            models.Index(
+                "project",
+                "created_at",
+                KeyTransform("tag", "reflection_data"),
+                name="logs_msglog_proj_created_tag",
+            ),
+            # Keyset pagination of project logs on (created_at, id).
+            models.Index(fields=["project", "created_at", "id"], name="logs_msglog_proj_created_id"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.message}"
 
@@ -169,5 +253,10 @@ class RecentActivities(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.CASCADE)
     intelligence = models.ForeignKey(Intelligence, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="logs_recentact_created_at_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.uuid} - {self.action_type}"
@@ -1,13 +1,26 @@
-from django.test import TestCase
+import random
+import string
+from difflib import SequenceMatcher
+
+from django.test import SimpleTestCase, TestCase
 
 from nexus.usecases.intelligences.tests.intelligence_factory import IntelligenceFactory
 from nexus.usecases.projects.tests.project_factory import ProjectFactory
 
 from ..models import (
     RecentActivities,
+    TextComparer,
 )
 
 
+def _reference_string_in_text(sentence, text, similarity_threshold=0.8):
+    """The previous all-pairs implementation."""
+    return all(
+        any(SequenceMatcher(None, keyword, word).ratio() >= similarity_threshold for word in text.split())
+        for keyword in sentence.split()
+    )
+
+
 class TestRecentActivities(TestCase):
     def setUp(self) -> None:
         self.project = ProjectFactory()
@@ -26,3 +39,31 @@ class TestRecentActivities(TestCase):
         self.assertEqual(recent_activities.project, self.project)
         self.assertEqual(recent_activities.created_by, self.project.created_by)
         self.assertEqual(recent_activities.intelligence, self.intelligence)
+
+
+class TestTextComparer(SimpleTestCase):
+    def _typo(self, rng, word):
+        position = rng.randrange(len(word))
+        return word[:position] + rng.choice(string.ascii_lowercase) + word[position + 1 :]
+
+    def test_matches_all_pairs_comparison(self):
+        rng = random.Random(38)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 12))) for _ in range(400)]
+        for _ in range(200):
+            text = " ".join(rng.choices(words, k=rng.randint(0, 300)))
+            keywords = rng.choices(words, k=rng.randint(1, 12))
+            sentence = " ".join(self._typo(rng, word) if rng.random() < 0.4 else word for word in keywords)
+            for threshold in (0.5, 0.8, 0.95):
+                self.assertEqual(
+                    TextComparer.string_in_text(sentence, text, similarity_threshold=threshold),
+                    _reference_string_in_text(sentence, text, threshold),
+                    (sentence, threshold),
+                )
+
+    def test_fuzzy_and_exact_modes(self):
+        text = "o prazo de entrega e de cinco dias uteis"
+
+        self.assertTrue(TextComparer.string_in_text("prazo entraga", text))
+        self.assertFalse(TextComparer.string_in_text("prazo reembolso", text))
+        self.assertTrue(TextComparer.string_in_text("", text))
+        self.assertFalse(TextComparer.string_in_text("prazo entraga", text, compare_similarity=False))
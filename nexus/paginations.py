@@ -1,4 +1,37 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Planner estimates below this are cheap enough to replace with an exact count.
+APPROXIMATE_COUNT_EXACT_BELOW = 10_000
+
+
+def approximate_count(queryset: QuerySet, exact_below: int = APPROXIMATE_COUNT_EXACT_BELOW) -> int:
+    """
+    Row count of ``queryset`` from the Postgres planner estimate.
+
+    Small results (and other databases) are counted exactly.
+    """
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate >= exact_below:
+            return estimate
+    return queryset.count()
 
 
 class CustomCursorPagination(CursorPagination):
@@ -12,11 +45,136 @@ class InlineContentBaseTextCursorPagination(CustomCursorPagination):
     ordering = "-_sort_at"
 
 
-class InlineConversationsCursorPagination(CursorPagination):
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination on (created_at, pk).
+
+    Each page is ``WHERE (created_at, pk) < (last row)`` plus ``LIMIT`` over a
+    composite index, so page 1,000 costs the same as page 1 and no
+    ``COUNT(*)`` runs. ``?with_count=true`` adds an approximate ``count``.
+
+    Ordering is ``ordering`` when set, otherwise the direction of the
+    queryset's own ``created_at`` ordering.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = None
+    timestamp_field = "created_at"
+    count_query_param = "with_count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("1", "true"):
+            self.count = approximate_count(queryset)
+
+        descending = self._descending(queryset)
+        reverse = bool(self.cursor and self.cursor["r"])
+        walk_descending = descending != reverse
+        field = self.timestamp_field
+        order = (f"-{field}", "-pk") if walk_descending else (field, "pk")
+
+        if self.cursor:
+            position = datetime.fromisoformat(self.cursor["t"])
+            if walk_descending:
+                after = Q(**{f"{field}__lt": position}) | Q(**{field: position, "pk__lt": self.cursor["k"]})
+            else:
+                after = Q(**{f"{field}__gt": position}) | Q(**{field: position, "pk__gt": self.cursor["k"]})
+            queryset = queryset.filter(after)
+
+        rows = list(queryset.order_by(*order)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    def _descending(self, queryset) -> bool:
+        ordering = self.ordering or next(
+            (name for name in queryset.query.order_by if str(name).lstrip("-") == self.timestamp_field),
+            f"-{self.timestamp_field}",
+        )
+        return str(ordering).startswith("-")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            datetime.fromisoformat(cursor["t"])
+            if not {"k", "r"} <= cursor.keys():
+                raise ValueError
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message) from None
+        return cursor
+
+    def _link(self, row, reverse: bool):
+        cursor = {"t": getattr(row, self.timestamp_field).isoformat(), "k": str(row.pk), "r": int(reverse)}
+        encoded = urlsafe_b64encode(json.dumps(cursor, separators=(",", ":")).encode()).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"] = {"type": "integer", "nullable": True, "example": 123}
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Include an approximate total count.",
+                "schema": {"type": "boolean"},
+            }
+        ]
+
+
+class LogsKeysetPagination(KeysetPagination):
+    """Unpaginated unless ``?limit=`` is given, as with the LimitOffsetPagination it replaces."""
+
+    page_size = None
+    page_size_query_param = "limit"
+
+
+class InlineConversationsCursorPagination(KeysetPagination):
     page_size = 12
     ordering = "-created_at"
-    page_size_query_param = "page_size"
-    cursor_query_param = "cursor"
+    max_page_size = None
 
 
 class SupervisorPagination(PageNumberPagination):
@@ -17,19 +17,14 @@ def store_flows_api_token(job_id: str, token: str, *, timeout: int | None = None
     cache.set(f"{_CACHE_PREFIX}{job_id}", token, timeout=timeout or _default_ttl())
 
 
+def get_flows_api_token(job_id: str) -> str | None:
+    """Read the token without consuming it (day-window tasks of the same job share it)."""
+    return cache.get(f"{_CACHE_PREFIX}{job_id}")
+
+
 def pop_flows_api_token(job_id: str) -> str | None:
     key = f"{_CACHE_PREFIX}{job_id}"
     token = cache.get(key)
     if token is not None:
         cache.delete(key)
     return token
-
-
-def attach_flows_api_token(cfg: dict, job_id: str) -> dict:
-    """Return a copy of ``cfg`` with ``flows_api_token`` loaded from cache (one-time)."""
-    token = pop_flows_api_token(job_id)
-    if not token:
-        raise ValueError("Flows API token expired or missing for this job")
-    merged = dict(cfg)
-    merged["flows_api_token"] = token
-    return merged
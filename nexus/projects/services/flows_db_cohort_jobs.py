@@ -0,0 +1,120 @@
+"""Cache-backed state for emailed reconciles that run as parallel day windows."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+_CACHE_PREFIX = "flows_db_cohort:job:"
+# Jobs are numbered in planning order so the deadline sweep can walk the ones still running.
+_REGISTRY_PREFIX = "flows_db_cohort:registry:"
+_REGISTRY_SEQ = f"{_REGISTRY_PREFIX}seq"
+_REGISTRY_SWEEP = f"{_REGISTRY_PREFIX}sweep"
+
+# Set by prepare_calendar_range_cfg as date objects; day cfgs carry _calendar_day instead.
+_NON_QUEUEABLE_KEYS = ("_calendar_range", "flows_api_token")
+
+
+def _window_time_limit() -> int:
+    return int(getattr(settings, "FLOWS_DB_COHORT_TASK_TIME_LIMIT", 3600))
+
+
+def job_deadline(windows: int) -> int:
+    """Seconds after planning by which every window has run, even if they queue one after another."""
+    return max(windows, 1) * _window_time_limit() + 300
+
+
+def job_ttl(windows: int) -> int:
+    """Job state and token outlive the deadline so the next deadline sweep can still aggregate."""
+    return job_deadline(windows) + 900
+
+
+def _ttl(job_id: str) -> int:
+    manifest = get_manifest(job_id)
+    return manifest["ttl"] if manifest else job_ttl(1)
+
+
+def queueable_cfg(cfg: dict[str, Any]) -> dict[str, Any]:
+    """Copy of ``cfg`` safe to pass as a JSON Celery argument (no dates, no token)."""
+    return {k: v for k, v in cfg.items() if k not in _NON_QUEUEABLE_KEYS}
+
+
+def split_day_windows(daily_cfgs: list[dict[str, Any]], max_windows: int) -> list[list[dict[str, Any]]]:
+    """Deal the days round-robin into at most ``max_windows`` windows."""
+    count = max(1, min(max_windows, len(daily_cfgs)))
+    return [daily_cfgs[index::count] for index in range(count)]
+
+
+def start_job(job_id: str, manifest: dict[str, Any]) -> int:
+    """Store the job state for the whole job, register it for the deadline sweep and return its TTL."""
+    ttl = job_ttl(manifest["windows"])
+    deadline_at = time.time() + job_deadline(manifest["windows"])
+    cache.set(f"{_CACHE_PREFIX}{job_id}:manifest", {**manifest, "ttl": ttl, "deadline_at": deadline_at}, timeout=ttl)
+    cache.set(f"{_CACHE_PREFIX}{job_id}:done", 0, timeout=ttl)
+    cache.add(_REGISTRY_SEQ, 0, timeout=None)
+    cache.set(f"{_REGISTRY_PREFIX}{cache.incr(_REGISTRY_SEQ)}", job_id, timeout=ttl)
+    return ttl
+
+
+def overdue_jobs(now: float | None = None) -> list[str]:
+    """
+    Ids of registered jobs still holding state after their deadline.
+
+    Entries whose job is gone (finished or expired) are skipped on later sweeps
+    once everything before them is gone too. A number taken after the previous
+    sweep may still be waiting for its entry, so it is never skipped yet.
+    """
+    now = time.time() if now is None else now
+    sweep = cache.get(_REGISTRY_SWEEP) or {"cursor": 0, "seen": 0}
+    last = cache.get(_REGISTRY_SEQ) or 0
+    cursor, overdue = sweep["cursor"], []
+    for seq in range(sweep["cursor"] + 1, last + 1):
+        job_id = cache.get(f"{_REGISTRY_PREFIX}{seq}")
+        manifest = get_manifest(job_id) if job_id else None
+        if manifest is None:
+            if cursor == seq - 1 and (job_id or seq <= sweep["seen"]):
+                cursor = seq
+            continue
+        if manifest["deadline_at"] <= now:
+            overdue.append(job_id)
+    cache.set(_REGISTRY_SWEEP, {"cursor": cursor, "seen": last}, timeout=None)
+    return overdue
+
+
+def get_manifest(job_id: str) -> dict[str, Any] | None:
+    return cache.get(f"{_CACHE_PREFIX}{job_id}:manifest")
+
+
+def load_day_report(job_id: str, day: str) -> dict[str, Any] | None:
+    return cache.get(f"{_CACHE_PREFIX}{job_id}:day:{day}")
+
+
+def store_day_report(job_id: str, report: dict[str, Any]) -> None:
+    """Checkpoint one day; writing the same day again replaces it, so redelivered windows are harmless."""
+    cache.set(f"{_CACHE_PREFIX}{job_id}:day:{report['day']}", report, timeout=_ttl(job_id))
+
+
+def mark_window_done(job_id: str, window_index: int) -> bool:
+    """Count a finished window once; True only for the call that completes the job."""
+    manifest = get_manifest(job_id)
+    if manifest is None:
+        return False
+    if not cache.add(f"{_CACHE_PREFIX}{job_id}:window:{window_index}", True, timeout=manifest["ttl"]):
+        return False
+    return cache.incr(f"{_CACHE_PREFIX}{job_id}:done") == manifest["windows"]
+
+
+def claim_finish(job_id: str) -> bool:
+    """True for the one caller that gets to aggregate and email the job (last window or deadline sweep)."""
+    return cache.add(f"{_CACHE_PREFIX}{job_id}:finished", True, timeout=_ttl(job_id))
+
+
+def clear_job(job_id: str) -> None:
+    manifest = get_manifest(job_id) or {"days": [], "windows": 0}
+    keys = [f"{_CACHE_PREFIX}{job_id}:{suffix}" for suffix in ("manifest", "done")]
+    keys += [f"{_CACHE_PREFIX}{job_id}:day:{day}" for day in manifest["days"]]
+    keys += [f"{_CACHE_PREFIX}{job_id}:window:{index}" for index in range(manifest["windows"])]
+    cache.delete_many(keys)
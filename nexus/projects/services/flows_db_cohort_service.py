@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
-from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 from uuid import UUID
 
 import pendulum
+import requests
+from celery.exceptions import SoftTimeLimitExceeded
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 from nexus.internals.conversations import ConversationsRESTClient
 
@@ -31,6 +31,18 @@ def _http_timeout() -> int:
     return int(getattr(settings, "FLOWS_DB_COHORT_HTTP_TIMEOUT", 300))
 
 
+def _build_session() -> requests.Session:
+    # Pages of a day are read one after another, so one kept-alive connection per worker process is enough.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
 def _format_api_instant(dt: pendulum.DateTime) -> str:
     return dt.in_timezone("UTC").format("YYYY-MM-DDTHH:mm:ss[Z]")
 
@@ -173,27 +185,26 @@ def _validate_flows_pagination_params(cfg: dict[str, Any]) -> tuple[str, int, in
     return token, limit, offset, max_pages
 
 
-def _read_flows_events_page(url: str, req: Request) -> list[Any]:
+def _read_flows_events_page(url: str, headers: dict[str, str]) -> list[Any]:
+    timeout = (float(getattr(settings, "FLOWS_DB_COHORT_CONNECT_TIMEOUT", 10)), _http_timeout())
     try:
-        with urlopen(req, timeout=_http_timeout()) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-        try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError as e:
-            logger.warning(
-                "[flows_db_cohort] Invalid JSON from Flows url=%s response_bytes=%s",
-                url,
-                len(raw),
-            )
-            raise URLError(f"Invalid JSON response from Flows: {e}") from e
-    except HTTPError as e:
-        if e.fp:
-            e.read()
-        logger.warning("[flows_db_cohort] HTTPError %s url=%s", e.code, url)
+        response = _session.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        logger.warning("[flows_db_cohort] HTTPError %s url=%s", e.response.status_code, url)
         raise
-    except URLError as e:
-        logger.warning("[flows_db_cohort] URLError url=%s err=%s", url, e)
+    except requests.RequestException as e:
+        logger.warning("[flows_db_cohort] RequestException url=%s err=%s", url, e)
         raise
+    try:
+        payload = response.json()
+    except ValueError as e:
+        logger.warning(
+            "[flows_db_cohort] Invalid JSON from Flows url=%s response_bytes=%s",
+            url,
+            len(response.content),
+        )
+        raise ValueError(f"Invalid JSON response from Flows: {e}") from e
     return events_list_from_payload(payload)
 
 
@@ -214,6 +225,10 @@ def _collect_flow_cohort_pages(
     events_with_key = 0
     page_idx = 0
     cur_offset = offset
+    headers = {
+        "Authorization": f"{auth_prefix} {token}",
+        "Accept": "application/json",
+    }
     while True:
         if max_pages is not None and page_idx >= max_pages:
             logger.warning("[flows_db_cohort] stopped at flows_max_pages=%s", max_pages)
@@ -221,15 +236,7 @@ def _collect_flow_cohort_pages(
         params = dict(base_params)
         params["offset"] = cur_offset
         url = flows_base_url + "?" + urlencode(params)
-        req = Request(
-            url,
-            headers={
-                "Authorization": f"{auth_prefix} {token}",
-                "Accept": "application/json",
-            },
-            method="GET",
-        )
-        chunk = _read_flows_events_page(url, req)
+        chunk = _read_flows_events_page(url, headers)
         if not chunk:
             break
         for event in chunk:
@@ -501,59 +508,61 @@ def run_flows_db_cohort_reconcile(cfg: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def run_flows_db_cohort_reconcile_range(base_cfg: dict[str, Any]) -> dict[str, Any]:
+def plan_reconcile_day_cfgs(base_cfg: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Resolve the requested range and split it into one cfg per (project calendar or UTC) day."""
     from nexus.projects.services.reconcile_window import iter_project_calendar_day_cfgs, prepare_calendar_range_cfg
 
     base_cfg = prepare_calendar_range_cfg(base_cfg)
     daily_cfgs = iter_project_calendar_day_cfgs(base_cfg)
     if not daily_cfgs:
         daily_cfgs = iter_daily_reconcile_cfgs(base_cfg)
-    day_reports: list[dict[str, Any]] = []
-    errors: list[dict[str, Any]] = []
+    return base_cfg, daily_cfgs
+
+
+def reconcile_day_label(day_cfg: dict[str, Any]) -> str:
+    return day_cfg.get("_calendar_day") or day_cfg["date_start"][:10]
+
+
+def reconcile_day(day_cfg: dict[str, Any]) -> dict[str, Any]:
+    """Reconcile one day and summarize it; failures are reported in the summary instead of raised."""
+    day_label = reconcile_day_label(day_cfg)
+    try:
+        result = run_flows_db_cohort_reconcile(day_cfg)
+    except SoftTimeLimitExceeded:
+        # The whole window is out of time; the caller records the days it did not finish.
+        raise
+    except Exception as exc:
+        logger.exception("[flows_db_cohort] Day %s failed", day_label)
+        return {
+            "day": day_label,
+            "status": "error",
+            "from_inclusive": day_cfg["date_start"],
+            "to_inclusive": day_cfg["date_end"],
+            "error": str(exc),
+        }
+
+    ids = result["id_comparison_between_flows_and_database"]
+    return {
+        "day": day_label,
+        "status": classify_day_result(result),
+        "from_inclusive": day_cfg["date_start"],
+        "to_inclusive": day_cfg["date_end"],
+        "flows_events_inside_selected_dates": result["flows_service_results"]["flows_events_inside_selected_dates"],
+        "conversations_inside_date_rules": result["database_results"]["conversations_inside_date_rules"],
+        "matching_start_and_end_times": result["timestamp_comparison"]["totals"]["matching_start_and_end_times"],
+        "count_only_in_flows": ids["count_only_in_flows"],
+        "count_only_in_database": ids["count_only_in_database"],
+        "ids_only_in_flows": ids["ids_only_in_flows"],
+        "ids_only_in_database": ids["ids_only_in_database"],
+        "ids_timestamp_differ": result.get("ids_timestamp_differ", []),
+    }
 
-    for day_cfg in daily_cfgs:
-        day_label = day_cfg.get("_calendar_day") or day_cfg["date_start"][:10]
-        try:
-            result = run_flows_db_cohort_reconcile(day_cfg)
-            status = classify_day_result(result)
-            day_reports.append(
-                {
-                    "day": day_label,
-                    "status": status,
-                    "from_inclusive": day_cfg["date_start"],
-                    "to_inclusive": day_cfg["date_end"],
-                    "flows_events_inside_selected_dates": result["flows_service_results"][
-                        "flows_events_inside_selected_dates"
-                    ],
-                    "conversations_inside_date_rules": result["database_results"]["conversations_inside_date_rules"],
-                    "matching_start_and_end_times": result["timestamp_comparison"]["totals"][
-                        "matching_start_and_end_times"
-                    ],
-                    "count_only_in_flows": result["id_comparison_between_flows_and_database"]["count_only_in_flows"],
-                    "count_only_in_database": result["id_comparison_between_flows_and_database"][
-                        "count_only_in_database"
-                    ],
-                    "ids_only_in_flows": result["id_comparison_between_flows_and_database"]["ids_only_in_flows"],
-                    "ids_only_in_database": result["id_comparison_between_flows_and_database"]["ids_only_in_database"],
-                    "ids_timestamp_differ": result.get("ids_timestamp_differ", []),
-                }
-            )
-        except Exception as exc:
-            logger.exception("[flows_db_cohort] Day %s failed", day_label)
-            errors.append({"day": day_label, "error": str(exc)})
-            day_reports.append(
-                {
-                    "day": day_label,
-                    "status": "error",
-                    "from_inclusive": day_cfg["date_start"],
-                    "to_inclusive": day_cfg["date_end"],
-                    "error": str(exc),
-                }
-            )
 
+def aggregate_day_reports(base_cfg: dict[str, Any], day_reports: list[dict[str, Any]]) -> dict[str, Any]:
+    errors = [{"day": r["day"], "error": r["error"]} for r in day_reports if r["status"] == "error"]
     statuses = {r["status"] for r in day_reports}
     if errors:
-        overall = "partial_failure" if len(errors) < len(daily_cfgs) else "failed"
+        overall = "partial_failure" if len(errors) < len(day_reports) else "failed"
     elif statuses <= {"aligned", "no_data"}:
         overall = "aligned"
     else:
@@ -565,8 +574,13 @@ def run_flows_db_cohort_reconcile_range(base_cfg: dict[str, Any]) -> dict[str, A
             "from_inclusive": base_cfg["date_start"],
             "to_inclusive": base_cfg["date_end"],
         },
-        "days_in_range": len(daily_cfgs),
+        "days_in_range": len(day_reports),
         "overall_status": overall,
         "day_summaries": day_reports,
         "day_errors": errors,
     }
+
+
+def run_flows_db_cohort_reconcile_range(base_cfg: dict[str, Any]) -> dict[str, Any]:
+    base_cfg, daily_cfgs = plan_reconcile_day_cfgs(base_cfg)
+    return aggregate_day_reports(base_cfg, [reconcile_day(day_cfg) for day_cfg in daily_cfgs])
@@ -0,0 +1,229 @@
+from datetime import date
+from unittest import mock
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from nexus.projects.services.flows_db_cohort_credentials import get_flows_api_token, store_flows_api_token
+from nexus.projects.services.flows_db_cohort_jobs import (
+    clear_job,
+    get_manifest,
+    job_ttl,
+    load_day_report,
+    mark_window_done,
+    overdue_jobs,
+    queueable_cfg,
+    split_day_windows,
+    start_job,
+    store_day_report,
+)
+from nexus.projects.services.flows_db_cohort_service import run_flows_db_cohort_reconcile_range
+from nexus.projects.tasks import (
+    finish_flows_db_cohort_reconcile_task,
+    reconcile_flows_db_cohort_email_task,
+    reconcile_flows_db_cohort_window_task,
+    sweep_flows_db_cohort_deadlines_task,
+)
+
+_RUN_DAY = "nexus.projects.services.flows_db_cohort_service.run_flows_db_cohort_reconcile"
+_DELIVER = "nexus.projects.tasks._deliver_email_result"
+_CLOCK = "nexus.projects.services.flows_db_cohort_jobs.time"
+
+PROJECT = "385c8443-249e-462e-a287-f4a0dc292915"
+
+
+def _day_result(cfg):
+    if cfg["date_start"].startswith("2026-06-02"):
+        raise ValueError("Flows unavailable")
+    return {
+        "flows_service_results": {"flows_events_inside_selected_dates": 1},
+        "database_results": {"conversations_inside_date_rules": 1},
+        "timestamp_comparison": {
+            "totals": {"conversations_compared": 1, "matching_start_and_end_times": 1},
+            "examples_where_timestamps_differ": [],
+        },
+        "id_comparison_between_flows_and_database": {
+            "count_only_in_flows": 0,
+            "count_only_in_database": 0,
+            "ids_only_in_flows": [],
+            "ids_only_in_database": [],
+        },
+        "ids_timestamp_differ": [],
+    }
+
+
+def _range_cfg():
+    # Explicit UTC instants: split into UTC days without a project timezone lookup
+    return {"project": PROJECT, "date_start": "2026-06-01T03:00:00Z", "date_end": "2026-06-04T02:59:59Z"}
+
+
+class DayWindowHelpersTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_split_day_windows_is_bounded_and_keeps_every_day(self):
+        days = [{"day": n} for n in range(5)]
+
+        windows = split_day_windows(days, 2)
+
+        self.assertEqual(windows, [[days[0], days[2], days[4]], [days[1], days[3]]])
+        self.assertEqual(split_day_windows(days[:1], 8), [days[:1]])
+
+    def test_queueable_cfg_drops_dates_and_token(self):
+        cfg = {"project": PROJECT, "_calendar_range": (date(2026, 6, 1), date(2026, 6, 2)), "flows_api_token": "t"}
+
+        self.assertEqual(queueable_cfg(cfg), {"project": PROJECT})
+
+    def test_window_is_counted_once(self):
+        start_job("job-1", {"days": [], "windows": 2})
+
+        self.assertFalse(mark_window_done("job-1", 0))
+        self.assertFalse(mark_window_done("job-1", 0))
+        self.assertTrue(mark_window_done("job-1", 1))
+
+    @override_settings(FLOWS_DB_COHORT_TASK_TIME_LIMIT=600)
+    def test_job_state_lives_as_long_as_every_window_could_queue(self):
+        self.assertEqual(start_job("job-1", {"days": [], "windows": 4}), 4 * 600 + 1200)
+        self.assertEqual(job_ttl(4), 4 * 600 + 1200)
+        self.assertEqual(get_manifest("job-1")["ttl"], 4 * 600 + 1200)
+
+    @override_settings(FLOWS_DB_COHORT_TASK_TIME_LIMIT=600)
+    def test_overdue_jobs_skip_running_and_finished_jobs(self):
+        start_job("job-1", {"days": [], "windows": 1})
+        start_job("job-2", {"days": [], "windows": 1})
+        start_job("job-3", {"days": [], "windows": 2})
+        clear_job("job-1")
+
+        self.assertEqual(overdue_jobs(), [])
+        self.assertEqual(overdue_jobs(now=get_manifest("job-2")["deadline_at"]), ["job-2"])
+        clear_job("job-2")
+        self.assertEqual(overdue_jobs(now=get_manifest("job-3")["deadline_at"]), ["job-3"])
+        self.assertEqual(cache.get("flows_db_cohort:registry:sweep")["cursor"], 2)
+
+
+@override_settings(FLOWS_DB_COHORT_MAX_PARALLEL_WINDOWS=2)
+class DayWindowTasksTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_windows_match_the_sequential_report(self):
+        with mock.patch(_RUN_DAY, side_effect=_day_result):
+            expected = run_flows_db_cohort_reconcile_range({**_range_cfg(), "flows_api_token": "secret"})
+
+        store_flows_api_token("job-1", "secret")
+        with mock.patch(_RUN_DAY, side_effect=_day_result) as run_day, mock.patch(_DELIVER) as deliver:
+            queued = reconcile_flows_db_cohort_email_task.apply(args=[_range_cfg(), "ops@example.com"], task_id="job-1")
+
+        self.assertEqual(queued.result, {"job_id": "job-1", "days_in_range": 4, "windows": 2})
+        self.assertEqual({call.args[0]["flows_api_token"] for call in run_day.call_args_list}, {"secret"})
+        report = deliver.call_args.kwargs["report"]
+        self.assertEqual(report, expected)
+        self.assertEqual(report["overall_status"], "partial_failure")
+        self.assertEqual(
+            [day["day"] for day in report["day_summaries"]], ["2026-06-01", "2026-06-02", "2026-06-03", "2026-06-04"]
+        )
+        self.assertEqual(deliver.call_args.kwargs["recipient_email"], "ops@example.com")
+        self.assertIsNone(get_flows_api_token("job-1"))
+        self.assertIsNone(get_manifest("job-1"))
+
+    def test_missing_token_fails_before_queueing_windows(self):
+        with mock.patch(_RUN_DAY) as run_day, mock.patch(
+            "nexus.projects.tasks.send_reconcile_failure_email"
+        ) as failure:
+            with self.assertRaises(ValueError):
+                reconcile_flows_db_cohort_email_task.apply(
+                    args=[_range_cfg(), "ops@example.com"], task_id="job-2"
+                ).get()
+
+        run_day.assert_not_called()
+        self.assertIn("token", failure.call_args.kwargs["error_message"])
+
+    def test_redelivered_window_only_reruns_unfinished_days(self):
+        store_flows_api_token("job-3", "secret")
+        day_cfgs = [
+            {"project": PROJECT, "date_start": f"2026-06-0{n}T00:00:00Z", "date_end": f"2026-06-0{n}T23:59:59Z"}
+            for n in (1, 2, 3)
+        ]
+        start_job("job-3", {"days": ["2026-06-01", "2026-06-02", "2026-06-03"], "windows": 2})
+        store_day_report("job-3", {"day": "2026-06-01", "status": "aligned"})
+        store_day_report("job-3", {"day": "2026-06-02", "status": "error", "error": "timed out"})
+
+        with mock.patch(_RUN_DAY, side_effect=_day_result) as run_day:
+            reconcile_flows_db_cohort_window_task(job_id="job-3", window_index=0, day_cfgs=day_cfgs)
+
+        self.assertEqual(
+            [call.args[0]["date_start"][:10] for call in run_day.call_args_list], ["2026-06-02", "2026-06-03"]
+        )
+        self.assertEqual(load_day_report("job-3", "2026-06-01"), {"day": "2026-06-01", "status": "aligned"})
+        self.assertEqual(load_day_report("job-3", "2026-06-02")["error"], "Flows unavailable")
+        self.assertEqual(load_day_report("job-3", "2026-06-03")["status"], "aligned")
+
+    def _start_job(self, job_id, windows=1):
+        day_cfgs = [
+            {"project": PROJECT, "date_start": f"2026-06-0{n}T00:00:00Z", "date_end": f"2026-06-0{n}T23:59:59Z"}
+            for n in (1, 3)
+        ]
+        start_job(
+            job_id,
+            {
+                "base_cfg": {"project": PROJECT, "date_start": "2026-06-01", "date_end": "2026-06-03"},
+                "days": ["2026-06-01", "2026-06-03"],
+                "windows": windows,
+                "recipient_email": "ops@example.com",
+                "project_id": PROJECT,
+                "date_start": "2026-06-01",
+                "date_end": "2026-06-03",
+            },
+        )
+        return day_cfgs
+
+    def test_window_without_token_still_emails_the_failure(self):
+        day_cfgs = self._start_job("job-4")
+
+        with mock.patch(_RUN_DAY) as run_day, mock.patch(_DELIVER) as deliver:
+            reconcile_flows_db_cohort_window_task(job_id="job-4", window_index=0, day_cfgs=day_cfgs)
+
+        run_day.assert_not_called()
+        report = deliver.call_args.kwargs["report"]
+        self.assertEqual(report["overall_status"], "failed")
+        self.assertIn("token", report["day_errors"][0]["error"])
+
+    def test_window_out_of_time_reports_the_days_it_finished(self):
+        store_flows_api_token("job-5", "secret")
+        day_cfgs = self._start_job("job-5")
+
+        def run_day(cfg):
+            if cfg["date_start"].startswith("2026-06-03"):
+                raise SoftTimeLimitExceeded()
+            return _day_result(cfg)
+
+        with mock.patch(_RUN_DAY, side_effect=run_day), mock.patch(_DELIVER) as deliver:
+            reconcile_flows_db_cohort_window_task(job_id="job-5", window_index=0, day_cfgs=day_cfgs)
+
+        report = deliver.call_args.kwargs["report"]
+        self.assertEqual(report["overall_status"], "partial_failure")
+        self.assertEqual([day["status"] for day in report["day_summaries"]], ["aligned", "error"])
+
+    def test_deadline_emails_once_when_a_window_never_reports(self):
+        store_flows_api_token("job-6", "secret")
+        day_cfgs = self._start_job("job-6", windows=2)
+
+        with mock.patch(_RUN_DAY, side_effect=_day_result), mock.patch(_DELIVER) as deliver:
+            reconcile_flows_db_cohort_window_task(job_id="job-6", window_index=0, day_cfgs=day_cfgs[:1])
+            deliver.assert_not_called()
+
+            sweep_flows_db_cohort_deadlines_task()
+            deliver.assert_not_called()
+
+            with mock.patch(_CLOCK) as clock:
+                clock.time.return_value = get_manifest("job-6")["deadline_at"]
+                sweep_flows_db_cohort_deadlines_task()
+            finish_flows_db_cohort_reconcile_task(job_id="job-6", deadline=True)
+
+        deliver.assert_called_once()
+        report = deliver.call_args.kwargs["report"]
+        self.assertEqual(report["overall_status"], "partial_failure")
+        self.assertEqual(report["day_errors"][0]["error"], "Day did not finish before the job deadline")
+        self.assertIsNone(get_flows_api_token("job-6"))
+        self.assertIsNone(get_manifest("job-6"))
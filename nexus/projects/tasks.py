@@ -1,10 +1,38 @@
+import logging
+
+from celery import group
+from django.conf import settings
+
 from nexus.celery import app
-from nexus.projects.services.flows_db_cohort_credentials import attach_flows_api_token
+from nexus.projects.services.flows_db_cohort_credentials import (
+    get_flows_api_token,
+    pop_flows_api_token,
+    store_flows_api_token,
+)
 from nexus.projects.services.flows_db_cohort_email import (
     send_reconcile_failure_email,
     send_reconcile_result_email,
 )
-from nexus.projects.services.flows_db_cohort_service import run_flows_db_cohort_reconcile_range
+from nexus.projects.services.flows_db_cohort_jobs import (
+    claim_finish,
+    clear_job,
+    get_manifest,
+    load_day_report,
+    mark_window_done,
+    overdue_jobs,
+    queueable_cfg,
+    split_day_windows,
+    start_job,
+    store_day_report,
+)
+from nexus.projects.services.flows_db_cohort_service import (
+    aggregate_day_reports,
+    plan_reconcile_day_cfgs,
+    reconcile_day,
+    reconcile_day_label,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def _deliver_email_result(
@@ -32,27 +60,45 @@ def _deliver_email_result(
         send_reconcile_result_email(recipient_email, report, job_id=job_id)
 
 
+def _window_time_limits() -> tuple[int, int]:
+    celery_hard = int(getattr(settings, "FLOWS_DB_COHORT_TASK_TIME_LIMIT", 3600))
+    return max(celery_hard - 100, 60), celery_hard
+
+
 @app.task(name="nexus.projects.tasks.reconcile_flows_db_cohort_email_task", bind=True)
 def reconcile_flows_db_cohort_email_task(self, cfg: dict, recipient_email: str):
-    """Run multi-day Flows vs DB reconcile and email the aggregated report."""
+    """Split a multi-day Flows vs DB reconcile into day windows and queue them; the last window emails the report."""
     project_id = str(cfg.get("project", ""))
     date_start = str(cfg.get("date_start", ""))
     date_end = str(cfg.get("date_end", ""))
     job_id = str(self.request.id)
 
     try:
-        cfg_with_token = attach_flows_api_token(cfg, job_id)
-        report = run_flows_db_cohort_reconcile_range(cfg_with_token)
-        _deliver_email_result(
-            recipient_email=recipient_email,
-            report=report,
-            project_id=project_id,
-            date_start=date_start,
-            date_end=date_end,
-            job_id=job_id,
+        token = get_flows_api_token(job_id)
+        if not token:
+            raise ValueError("Flows API token expired or missing for this job")
+
+        base_cfg, daily_cfgs = plan_reconcile_day_cfgs(cfg)
+        windows = split_day_windows(
+            [queueable_cfg(day_cfg) for day_cfg in daily_cfgs],
+            int(getattr(settings, "FLOWS_DB_COHORT_MAX_PARALLEL_WINDOWS", 8)),
         )
-        return report
+        ttl = start_job(
+            job_id,
+            {
+                "base_cfg": queueable_cfg(base_cfg),
+                "days": [reconcile_day_label(day_cfg) for day_cfg in daily_cfgs],
+                "windows": len(windows),
+                "recipient_email": recipient_email,
+                "project_id": project_id,
+                "date_start": date_start,
+                "date_end": date_end,
+            },
+        )
+        # Windows may wait in the queue behind other work; keep the token as long as the job state.
+        store_flows_api_token(job_id, token, timeout=ttl)
     except Exception as exc:
+        pop_flows_api_token(job_id)
         send_reconcile_failure_email(
             recipient_email,
             project_id=project_id,
@@ -62,3 +108,91 @@ def reconcile_flows_db_cohort_email_task(self, cfg: dict, recipient_email: str):
             job_id=job_id,
         )
         raise
+
+    soft_time_limit, time_limit = _window_time_limits()
+    group(
+        reconcile_flows_db_cohort_window_task.si(job_id, index, window).set(
+            soft_time_limit=soft_time_limit, time_limit=time_limit
+        )
+        for index, window in enumerate(windows)
+    ).apply_async()
+    return {"job_id": job_id, "days_in_range": len(daily_cfgs), "windows": len(windows)}
+
+
+@app.task(
+    name="nexus.projects.tasks.reconcile_flows_db_cohort_window_task",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def reconcile_flows_db_cohort_window_task(job_id: str, window_index: int, day_cfgs: list):
+    """
+    Reconcile one window of days, checkpointing each day so a redelivered window skips finished days.
+
+    If the window fails (missing token, soft time limit), its unfinished days
+    are recorded as errors and the window still counts as done, so the job
+    emails a partial report instead of waiting for the deadline.
+    """
+    try:
+        token = get_flows_api_token(job_id)
+        if not token:
+            raise ValueError("Flows API token expired or missing for this job")
+        for day_cfg in day_cfgs:
+            if _day_finished(job_id, day_cfg):
+                continue
+            store_day_report(job_id, reconcile_day({**day_cfg, "flows_api_token": token}))
+    except Exception as exc:
+        logger.exception("[flows_db_cohort] Window %s of job %s failed", window_index, job_id)
+        for day_cfg in day_cfgs:
+            if not _day_finished(job_id, day_cfg):
+                store_day_report(job_id, {"day": reconcile_day_label(day_cfg), "status": "error", "error": str(exc)})
+
+    if mark_window_done(job_id, window_index):
+        finish_flows_db_cohort_reconcile_task.delay(job_id)
+
+
+def _day_finished(job_id: str, day_cfg: dict) -> bool:
+    checkpoint = load_day_report(job_id, reconcile_day_label(day_cfg))
+    return checkpoint is not None and checkpoint["status"] != "error"
+
+
+@app.task(name="nexus.projects.tasks.sweep_flows_db_cohort_deadlines_task")
+def sweep_flows_db_cohort_deadlines_task():
+    """Email every job past its deadline: a window killed at its hard time limit or lost never reports back."""
+    for job_id in overdue_jobs():
+        finish_flows_db_cohort_reconcile_task.delay(job_id, deadline=True)
+
+
+@app.task(name="nexus.projects.tasks.finish_flows_db_cohort_reconcile_task")
+def finish_flows_db_cohort_reconcile_task(job_id: str, deadline: bool = False):
+    """
+    Aggregate the checkpointed days of a job in calendar order and email the report.
+
+    Queued by the last window, or with ``deadline`` by the periodic deadline
+    sweep; whichever runs first emails, the other finds nothing to do.
+    """
+    manifest = get_manifest(job_id)
+    if manifest is None:
+        if not deadline:
+            logger.warning("[flows_db_cohort] Job %s state expired before aggregation", job_id)
+        return None
+    if not claim_finish(job_id):
+        return None
+
+    missing = "Day did not finish before the job deadline" if deadline else "Day result expired before aggregation"
+    day_reports = [
+        load_day_report(job_id, day) or {"day": day, "status": "error", "error": missing} for day in manifest["days"]
+    ]
+    report = aggregate_day_reports(manifest["base_cfg"], day_reports)
+    try:
+        _deliver_email_result(
+            recipient_email=manifest["recipient_email"],
+            report=report,
+            project_id=manifest["project_id"],
+            date_start=manifest["date_start"],
+            date_end=manifest["date_end"],
+            job_id=job_id,
+        )
+    finally:
+        pop_flows_api_token(job_id)
+        clear_job(job_id)
+    return report
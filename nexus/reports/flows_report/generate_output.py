@@ -1,17 +1,25 @@
 import concurrent.futures
+import csv
+import gzip
+import io
 import logging
 import os
 import re
+from collections import Counter
 from datetime import datetime
 
-import pandas as pd
+import numpy as np
 import pendulum
 import requests
+from celery.exceptions import SoftTimeLimitExceeded
 from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import EmailMessage
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from tqdm import tqdm
+from requests.adapters import HTTPAdapter
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from nexus.task_managers.file_database.s3_file_database import s3FileDatabase
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,19 @@ DATE_FORMAT_API = "%Y-%m-%dT%H:%M:%S.%f%z"  # Assumes TZ info is present like 'Z
 DATE_FORMAT_API_FALLBACK = "%Y-%m-%dT%H:%M:%S"
 DATE_FORMAT_BR = "%d/%m/%Y %H:%M:%S"
 MAX_WORKERS = 10
+CLASSIFY_CHUNK_SIZE = 1000
+REQUEST_TIMEOUT = (10, 120)  # (connect, read) seconds per Flows API call
+CHECKPOINT_TTL = 24 * 60 * 60
+REPORT_COLUMNS = [
+    "UUID",
+    "Cliente",
+    "Número do Cliente",
+    "CPF",
+    "Assuntos da conversa",
+    "Tabulação",
+    "Data da entrada",
+    "Data de fim",
+]
 
 BASE_URL = settings.FLOWS_REST_ENDPOINT
 
@@ -212,18 +233,52 @@ def format_datetime_br(datetime_str):
     return dt_obj.strftime(DATE_FORMAT_BR)
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_WORKERS + 1,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
+def get_page(url, headers):
+    response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
 def get_paginated_data(url, headers):
     """Fetches all data from a paginated API endpoint."""
     results = []
     while url:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        data = get_page(url, headers)
         results.extend(data.get("results", []))
         url = data.get("next")
     return results
 
 
+def iter_pages(url, headers):
+    """
+    Yield (results, next_url) for each page of a cursor-paginated endpoint, starting at url.
+
+    The next page is requested as soon as its cursor link arrives, so it
+    downloads while the caller is still working on the current page.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="flows_report_pages") as prefetcher:
+        future = prefetcher.submit(get_page, url, headers)
+        while future is not None:
+            data = future.result()
+            next_url = data.get("next")
+            future = prefetcher.submit(get_page, next_url, headers) if next_url else None
+            yield data.get("results", []), next_url
+
+
 def get_contact_messages(contact_uuid, base_url, headers):
     """Fetches all messages for a specific contact."""
     messages_url = (
@@ -232,56 +287,122 @@ def get_contact_messages(contact_uuid, base_url, headers):
     return get_paginated_data(messages_url, headers)
 
 
-def classify_conversation(messages_list, groups_dict, similarity_threshold=0.1):
-    """Classifies conversation based on TF-IDF cosine similarity to subgroup phrases."""
-    if not messages_list:
-        return "Não Classificado", "Sem Mensagens"
-
-    conversation_text = " ".join([msg.get("text", "") for msg in messages_list if msg.get("text")]).lower()
-
-    if not conversation_text.strip():
-        return "Não Classificado", "Mensagens Sem Texto"
-
-    all_subgroups_lower = []
-    group_mapping = []
-    for group, subgroups in groups_dict.items():
-        for subgroup in subgroups:
-            all_subgroups_lower.append(subgroup.lower())
-            group_mapping.append((group, subgroup))
+class TopicClassifier:
+    """
+    Classifies conversations by TF-IDF cosine similarity to the subgroup phrases of a topic set.
+
+    Scores match fitting a TfidfVectorizer on [conversation] + phrases for
+    every conversation, but the phrase vocabulary and IDF weights are built
+    once: a conversation only shifts the IDF of the terms it contains, and
+    that shift is applied to a whole chunk of conversations with sparse
+    matrix products.
+    """
+
+    def __init__(self, groups_dict, similarity_threshold=0.1, chunk_size=CLASSIFY_CHUNK_SIZE):
+        self.similarity_threshold = similarity_threshold
+        self.chunk_size = chunk_size
+        self.group_mapping = [(group, subgroup) for group, subgroups in groups_dict.items() for subgroup in subgroups]
+        if not self.group_mapping:
+            return
+
+        self.counter = CountVectorizer()
+        self.analyzer = self.counter.build_analyzer()
+        phrase_counts = self.counter.fit_transform([subgroup.lower() for _, subgroup in self.group_mapping])
+        phrase_counts = phrase_counts.astype(np.float64)
+
+        # Smoothed IDF over the phrases plus the one conversation being classified
+        documents = len(self.group_mapping) + 1
+        phrase_df = np.bincount(phrase_counts.indices, minlength=phrase_counts.shape[1])
+        self.idf_shared = np.log((documents + 1) / (phrase_df + 2)) + 1
+        idf_phrase_only = np.log((documents + 1) / (phrase_df + 1)) + 1
+        self.idf_conversation_only = np.log((documents + 1) / 2) + 1
+
+        squared_counts = phrase_counts.power(2)
+        self.phrase_shared_weights = phrase_counts.multiply(self.idf_shared).T.tocsr()
+        self.phrase_squared_norm = squared_counts @ idf_phrase_only**2
+        self.phrase_squared_norm_shift = squared_counts.multiply(self.idf_shared**2 - idf_phrase_only**2).T.tocsr()
+
+    def _count(self, texts):
+        """Term counts over the phrase vocabulary, plus the sum of squared counts of the other terms."""
+        vocabulary = self.counter.vocabulary_
+        rows, columns, values = [], [], []
+        other_squared = np.zeros(len(texts))
+        for row, text in enumerate(texts):
+            for term, count in Counter(self.analyzer(text)).items():
+                column = vocabulary.get(term)
+                if column is None:
+                    other_squared[row] += count * count
+                else:
+                    rows.append(row)
+                    columns.append(column)
+                    values.append(count)
+        counts = sparse.csr_matrix((values, (rows, columns)), shape=(len(texts), len(vocabulary)), dtype=np.float64)
+        return counts, other_squared
+
+    def _similarities(self, texts):
+        counts, other_squared = self._count(texts)
+        weighted = counts.multiply(self.idf_shared).tocsr()
+        conversation_norm = np.sqrt(
+            np.asarray(weighted.power(2).sum(axis=1)).ravel() + other_squared * self.idf_conversation_only**2
+        )
+        present = (counts > 0).astype(np.float64)
+        phrase_norm = np.sqrt(self.phrase_squared_norm + (present @ self.phrase_squared_norm_shift).toarray())
+        dots = (weighted @ self.phrase_shared_weights).toarray()
+        norms = conversation_norm[:, None] * phrase_norm
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+    def _classify_texts(self, texts):
+        results = []
+        for start in range(0, len(texts), self.chunk_size):
+            similarities = self._similarities(texts[start : start + self.chunk_size])
+            best_matches = similarities.argmax(axis=1)
+            for row, best_match_index in enumerate(best_matches):
+                if similarities[row, best_match_index] >= self.similarity_threshold:
+                    results.append(self.group_mapping[best_match_index])
+                else:
+                    results.append(("Não Classificado", "Não Classificado (Similaridade Baixa)"))
+        return results
+
+    def classify_many(self, messages_lists):
+        """Classify each conversation (a list of messages); returns one (group, subgroup) per conversation."""
+        results = [None] * len(messages_lists)
+        texts, positions = [], []
+        for position, messages_list in enumerate(messages_lists):
+            if not messages_list:
+                results[position] = ("Não Classificado", "Sem Mensagens")
+                continue
+            conversation_text = " ".join([msg.get("text", "") for msg in messages_list if msg.get("text")]).lower()
+            if not conversation_text.strip():
+                results[position] = ("Não Classificado", "Mensagens Sem Texto")
+            elif not self.group_mapping:
+                results[position] = ("Não Classificado", "Dicionário de Grupos Vazio")
+            else:
+                texts.append(conversation_text)
+                positions.append(position)
 
-    if not all_subgroups_lower:
-        return "Não Classificado", "Dicionário de Grupos Vazio"
+        for position, result in zip(positions, self._classify_texts(texts)):
+            results[position] = result
+        return results
 
-    vectorizer = TfidfVectorizer()
-    all_docs = [conversation_text] + all_subgroups_lower
 
+def classify_conversation(messages_list, groups_dict, similarity_threshold=0.1):
+    """Classifies conversation based on TF-IDF cosine similarity to subgroup phrases."""
     try:
-        tfidf_matrix = vectorizer.fit_transform(all_docs)
-
-        cosine_similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])
-
-        if cosine_similarities.size == 0:
-            return "Não Classificado", "Erro no Cálculo de Similaridade"
-
-        best_match_index = cosine_similarities.argmax()
-        max_similarity = cosine_similarities[0, best_match_index]
-
-        if max_similarity >= similarity_threshold:
-            return group_mapping[best_match_index]
-        else:
-            return "Não Classificado", "Não Classificado (Similaridade Baixa)"
-
+        return TopicClassifier(groups_dict, similarity_threshold).classify_many([messages_list])[0]
     except ValueError as e:
         logger.error("Error during TF-IDF/Similarity calculation", extra={"error": str(e)})
         if "empty vocabulary" in str(e):
             return "Não Classificado", "Texto Vazio ou Apenas Stopwords"
         return "Não Classificado", "Erro na Classificação"
 
-    return "Não Classificado", "Erro Inesperado na Classificação"
 
+def process_contact(contact, base_url, headers):
+    """
+    Process a single contact and return its report data with the fetched messages.
 
-def process_contact(contact, base_url, headers, groups):
-    """Process a single contact and return its report data."""
+    The conversation columns are filled in later by classify_report_rows,
+    which classifies many contacts at once.
+    """
     contact_uuid = contact.get("uuid")
     if not contact_uuid:
         logger.warning("Skipping contact due to missing UUID", extra={"contact": contact})
@@ -297,8 +418,6 @@ def process_contact(contact, base_url, headers, groups):
             "Failed to fetch messages for contact. Skipping classification.", extra={"contact_uuid": contact_uuid}
         )
     else:
-        conversation_group, conversation_tabulation = classify_conversation(messages, groups)
-
         if messages:
             try:
                 valid_messages = [m for m in messages if m.get("created_on")]
@@ -335,7 +454,7 @@ def process_contact(contact, base_url, headers, groups):
     created_on_str = contact.get("created_on")
     data_entrada_br = format_datetime_br(created_on_str)
 
-    return {
+    row = {
         "UUID": contact_uuid,
         "Cliente": cliente,
         "Número do Cliente": numero_cliente,
@@ -345,9 +464,154 @@ def process_contact(contact, base_url, headers, groups):
         "Data da entrada": data_entrada_br,
         "Data de fim": last_message_date_br,
     }
+    return row, messages
+
+
+def classify_report_rows(pending, classifier):
+    """Fill the conversation columns of (row, messages) pairs in one batch and return the rows."""
+    classified = [(row, messages) for row, messages in pending if messages is not None]
+    results = classifier.classify_many([messages for _, messages in classified])
+    for (row, _), (conversation_group, conversation_tabulation) in zip(classified, results):
+        row["Assuntos da conversa"] = conversation_group
+        row["Tabulação"] = conversation_tabulation
+    return [row for row, _ in pending]
 
 
-def main(auth_token: str, start_date: str = None, end_date: str = None):
+def _checkpoint_key(report_id):
+    return f"flows_report:checkpoint:{report_id}"
+
+
+def _load_checkpoint(report_id, path):
+    """Return the saved checkpoint of report_id if its output file still holds every checkpointed byte."""
+    if not report_id:
+        return None
+    checkpoint = cache.get(_checkpoint_key(report_id))
+    if not checkpoint:
+        return None
+    if not os.path.exists(path) or os.path.getsize(path) < checkpoint["offset"]:
+        logger.warning("Flows report output missing, starting over", extra={"report_id": report_id})
+        return None
+    return checkpoint
+
+
+def _delivery_key(report_id):
+    return f"flows_report:delivered:{report_id}"
+
+
+def _claim_delivery(report_id):
+    """True for the one run allowed to upload and email report_id."""
+    return not report_id or cache.add(_delivery_key(report_id), True, CHECKPOINT_TTL)
+
+
+def _discard_output(report_id, path):
+    if report_id:
+        cache.delete(_checkpoint_key(report_id))
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _write_rows(output, rows, header=False):
+    """Append rows to the report as one gzip member; concatenated members read back as a single CSV."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=REPORT_COLUMNS, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    output.write(gzip.compress(buffer.getvalue().encode("utf-8")))
+    output.flush()
+    os.fsync(output.fileno())
+    return output.tell()
+
+
+def _process_page(executor, contacts, base_url, headers, classifier):
+    """Fetch and classify the contacts of one page; rows keep the page order."""
+    futures = [executor.submit(process_contact, contact, base_url, headers) for contact in contacts]
+    pending = []
+    for contact, future in zip(contacts, futures):
+        try:
+            result = future.result()
+            if result:
+                pending.append(result)
+        except Exception as exc:
+            contact_uuid = contact.get("uuid", "unknown")
+            logger.error("Error processing contact", extra={"contact_uuid": contact_uuid, "error": str(exc)})
+    return classify_report_rows(pending, classifier)
+
+
+def write_report(path, contacts_url, headers, base_url, report_id=None, checkpoint=None, on_page=None):
+    """
+    Stream every contact from contacts_url into a gzip CSV at path and return the row count.
+
+    Each page is fetched, classified and appended before the next one, so
+    memory stays bounded by a page. After each page the position is saved
+    under report_id; with a checkpoint, the file is cut back to the last
+    saved page and the run continues from the page after it. on_page is
+    called after each saved page, e.g. to show the run is still alive.
+    """
+    checkpoint = checkpoint or {"contacts_url": contacts_url, "next_url": contacts_url, "rows": 0, "offset": 0}
+    if not checkpoint["next_url"]:
+        return checkpoint["rows"]
+
+    classifier = TopicClassifier(groups)
+    with (
+        open(path, "r+b" if checkpoint["offset"] else "wb") as output,
+        concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor,
+    ):
+        output.truncate(checkpoint["offset"])
+        output.seek(checkpoint["offset"])
+        if not checkpoint["offset"]:
+            checkpoint["offset"] = _write_rows(output, [], header=True)
+
+        for contacts, next_url in iter_pages(checkpoint["next_url"], headers):
+            rows = _process_page(executor, contacts, base_url, headers, classifier)
+            checkpoint["offset"] = _write_rows(output, rows)
+            checkpoint["rows"] += len(rows)
+            checkpoint["next_url"] = next_url
+            if report_id:
+                cache.set(_checkpoint_key(report_id), checkpoint, CHECKPOINT_TTL)
+            logger.info("Wrote flows report page", extra={"rows": checkpoint["rows"], "report_id": report_id})
+            if on_page:
+                on_page()
+
+    return checkpoint["rows"]
+
+
+def upload_report(path, filename):
+    """Upload the finished report to S3 and return a download link."""
+    storage = s3FileDatabase()
+    key = f"flows_reports/{filename}"
+    storage.s3_client.upload_file(
+        path,
+        settings.AWS_S3_BUCKET_NAME,
+        key,
+        # Served as the .gz file itself: a gzip Content-Encoding would make clients unpack it under the .gz name.
+        ExtraArgs={"ContentType": "application/gzip", "ContentDisposition": f'attachment; filename="{filename}"'},
+    )
+    return storage.create_presigned_url(key, expiration=settings.FLOWS_REPORT_LINK_EXPIRATION)
+
+
+def _report_window(start_date, end_date):
+    if start_date and end_date:
+        start_date = pendulum.parse(start_date)
+        end_date = pendulum.parse(end_date)
+        email_body = (
+            f'The report from {start_date.format("DD/MM/YYYY HH:mm")} '
+            f'to {end_date.format("DD/MM/YYYY HH:mm")} is ready.'
+        )
+        return start_date, end_date, email_body
+    now = pendulum.now()
+    return now.subtract(days=1), now, "The report from the last 24 hours is ready."
+
+
+def main(auth_token: str, start_date: str = None, end_date: str = None, report_id: str = None, on_page=None):
+    """
+    Build the contacts report and email a download link to REPORT_RECIPIENT_EMAILS.
+
+    Pass report_id (e.g. the Celery task id) to make the run resumable: a
+    rerun with the same report_id continues from the last completed page,
+    and only one run of a report_id uploads and emails it.
+    """
+    claimed = False
     try:
         if not auth_token:
             error_message = (
@@ -360,93 +624,69 @@ def main(auth_token: str, start_date: str = None, end_date: str = None):
         base_url = BASE_URL.rstrip("/")
         headers = {"Authorization": f"Token {auth_token}"}
 
-        contacts_url = f"{base_url}/api/{API_VERSION}/{CONTACTS_ENDPOINT}"
-
-        if start_date and end_date:
-            start_date = pendulum.parse(start_date)
-            end_date = pendulum.parse(end_date)
-            contacts_url += f"?after={start_date.to_iso8601_string()}&before={end_date.to_iso8601_string()}"
-            email_body = (
-                f'The attached file contains the report from {start_date.format("DD/MM/YYYY HH:mm")} '
-                f'to {end_date.format("DD/MM/YYYY HH:mm")}.'
-            )
+        os.makedirs(settings.FLOWS_REPORT_DIR, exist_ok=True)
+        path = os.path.join(settings.FLOWS_REPORT_DIR, f"{report_id or 'contacts_report'}.csv.gz")
+        checkpoint = _load_checkpoint(report_id, path)
+        if checkpoint:
+            logger.info("Resuming flows report", extra={"report_id": report_id, "rows": checkpoint["rows"]})
+            email_body, filename = checkpoint["email_body"], checkpoint["filename"]
         else:
-            now = pendulum.now()
-            yesterday = now.subtract(days=1)
-            contacts_url += f"?after={yesterday.to_iso8601_string()}&before={now.to_iso8601_string()}"
-            email_body = "The attached file contains the report from the last 24 hours."
-
-        logger.info("Fetching contacts", extra={"url": contacts_url})
-        all_contacts = get_paginated_data(contacts_url, headers)
-
-        if all_contacts is None:
-            error_message = "Failed to fetch contacts."
-            logger.error(error_message)
-            raise RuntimeError(error_message)
-
-        logger.info("Fetched contacts", extra={"count": len(all_contacts)})
-
-        report_data = []
-        total_contacts = len(all_contacts)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            future_to_contact = {
-                executor.submit(process_contact, contact, base_url, headers, groups): contact
-                for contact in all_contacts
+            window_start, window_end, email_body = _report_window(start_date, end_date)
+            contacts_url = (
+                f"{base_url}/api/{API_VERSION}/{CONTACTS_ENDPOINT}"
+                f"?after={window_start.to_iso8601_string()}&before={window_end.to_iso8601_string()}"
+            )
+            filename = f"contacts_report-{pendulum.yesterday().format('DD-MM-YYYY')}-{report_id or 'manual'}.csv.gz"
+            checkpoint = {
+                "contacts_url": contacts_url,
+                "next_url": contacts_url,
+                "rows": 0,
+                "offset": 0,
+                "email_body": email_body,
+                "filename": filename,
             }
 
-            for future in tqdm(
-                concurrent.futures.as_completed(future_to_contact), total=total_contacts, desc="Processing contacts"
-            ):
-                contact = future_to_contact[future]
-                try:
-                    result = future.result()
-                    if result:
-                        report_data.append(result)
-                except Exception as exc:
-                    contact_uuid = contact.get("uuid", "unknown")
-                    logger.error("Error processing contact", extra={"contact_uuid": contact_uuid, "error": str(exc)})
-
-        if not report_data:
+        logger.info("Fetching contacts", extra={"url": checkpoint["contacts_url"]})
+        total_rows = write_report(
+            path, checkpoint["contacts_url"], headers, base_url, report_id, checkpoint, on_page=on_page
+        )
+
+        if not total_rows:
             logger.warning("No data processed")
+            _discard_output(report_id, path)
             return []
 
-        columns_order = [
-            "UUID",
-            "Cliente",
-            "Número do Cliente",
-            "CPF",
-            "Assuntos da conversa",
-            "Tabulação",
-            "Data da entrada",
-            "Data de fim",
-        ]
+        if not _claim_delivery(report_id):
+            logger.info("Flows report already delivered by another run", extra={"report_id": report_id})
+            return True
+        claimed = bool(report_id)
 
-        filename = f"contacts_report-{pendulum.yesterday().format('DD-MM-YYYY')}.csv"
-        filepath = os.path.join("/tmp", filename)
-
-        logger.info("Generating CSV report", extra={"filename": filename})
-        df = pd.DataFrame(report_data, columns=columns_order)
-
-        df.to_csv(filepath, index=False, encoding="utf-8")
-        logger.info("Successfully generated report", extra={"filepath": filepath})
+        link = upload_report(path, filename)
+        logger.info("Uploaded report", extra={"report_filename": filename, "rows": total_rows})
 
+        expiration_days = settings.FLOWS_REPORT_LINK_EXPIRATION // (24 * 60 * 60)
         email = EmailMessage(
             subject="Contacts Report",
-            body=email_body,
+            body=(
+                f"{email_body}\n\n{total_rows} contacts. Download the CSV (gzip) within "
+                f"{expiration_days} days:\n{link}"
+            ),
             from_email=settings.DEFAULT_FROM_EMAIL,
             to=settings.REPORT_RECIPIENT_EMAILS,
         )
-
-        with open(filepath, "rb") as file:
-            email.attach(filename, file.read(), "text/csv")
-
         email.send()
-        logger.info("Successfully sent report via email", extra={"filename": filename})
+        logger.info("Successfully sent report link via email", extra={"report_filename": filename})
 
+        _discard_output(report_id, path)
         return True
 
+    except SoftTimeLimitExceeded:
+        # The task retries and resumes from the checkpoint; nothing to report yet.
+        raise
     except Exception as e:
+        if claimed:
+            # The link was not emailed, so a rerun may deliver the report.
+            cache.delete(_delivery_key(report_id))
         if "401 Client Error" in str(e):
             body = (
                 "An error occurred while generating or sending the contacts report: "
@@ -0,0 +1,245 @@
+import csv
+import gzip
+import os
+import random
+import shutil
+import tempfile
+from unittest import mock
+
+import requests
+from django.core import mail
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from nexus.reports.flows_report.generate_output import (
+    TopicClassifier,
+    _load_checkpoint,
+    classify_conversation,
+    classify_report_rows,
+    groups,
+    main,
+    upload_report,
+    write_report,
+)
+
+
+def _fit_per_conversation(conversation_text, groups_dict, similarity_threshold=0.1):
+    """The previous classifier: one TfidfVectorizer fitted per conversation."""
+    group_mapping = [(group, subgroup) for group, subgroups in groups_dict.items() for subgroup in subgroups]
+    tfidf_matrix = TfidfVectorizer().fit_transform([conversation_text] + [s.lower() for _, s in group_mapping])
+    similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])
+    best_match_index = similarities.argmax()
+    if similarities[0, best_match_index] >= similarity_threshold:
+        return group_mapping[best_match_index]
+    return "Não Classificado", "Não Classificado (Similaridade Baixa)"
+
+
+def _synthetic_conversations(count, seed=7):
+    rng = random.Random(seed)
+    phrase_words = [word for subgroups in groups.values() for subgroup in subgroups for word in subgroup.split()]
+    filler = ["oi", "bom", "dia", "obrigado", "pedido", "quando", "chega", "preciso", "ajuda", "123456"]
+    conversations = []
+    for _ in range(count):
+        words = rng.choices(phrase_words, k=rng.randint(1, 6)) + rng.choices(filler, k=rng.randint(0, 30))
+        rng.shuffle(words)
+        conversations.append([{"text": " ".join(words[:5])}, {"text": " ".join(words[5:])}])
+    return conversations
+
+
+class TopicClassifierTestCase(SimpleTestCase):
+    def test_batch_matches_fitting_per_conversation(self):
+        conversations = _synthetic_conversations(300)
+
+        results = TopicClassifier(groups, chunk_size=64).classify_many(conversations)
+
+        expected = [
+            _fit_per_conversation(" ".join(m["text"] for m in messages if m["text"]).lower(), groups)
+            for messages in conversations
+        ]
+        self.assertEqual(results, expected)
+
+    def test_conversations_without_text(self):
+        results = TopicClassifier(groups).classify_many([[], [{"text": ""}, {"other": "x"}], [{"text": "?!"}]])
+
+        self.assertEqual(
+            results,
+            [
+                ("Não Classificado", "Sem Mensagens"),
+                ("Não Classificado", "Mensagens Sem Texto"),
+                ("Não Classificado", "Não Classificado (Similaridade Baixa)"),
+            ],
+        )
+
+    def test_classify_conversation(self):
+        messages = [{"text": "Quero o estorno do valor do frete"}]
+
+        self.assertEqual(
+            classify_conversation(messages, groups), ("Cancelamentos/Estorno", "Estorno do valor do frete")
+        )
+        self.assertEqual(classify_conversation(messages, {}), ("Não Classificado", "Dicionário de Grupos Vazio"))
+
+    def test_classify_report_rows_keeps_fetch_errors(self):
+        failed = {"UUID": "a", "Assuntos da conversa": "Não Classificado", "Tabulação": "Erro ao buscar mensagens"}
+        fetched = {"UUID": "b", "Assuntos da conversa": "Não Classificado", "Tabulação": "Erro ao buscar mensagens"}
+
+        rows = classify_report_rows([(failed, None), (fetched, [])], TopicClassifier(groups))
+
+        self.assertEqual([row["Tabulação"] for row in rows], ["Erro ao buscar mensagens", "Sem Mensagens"])
+
+
+class FakeFlows:
+    """Serves contact pages linked by cursors and one message page per contact."""
+
+    def __init__(self, pages, fail_at=None):
+        self.pages = pages
+        self.fail_at = fail_at
+        self.requested = []
+
+    def url(self, page):
+        return f"http://flows.test/api/v2/contacts.json?cursor={page}"
+
+    def __call__(self, url, headers):
+        self.requested.append(url)
+        if "messages.json" in url:
+            return {"results": [{"text": "Solicitado o estorno", "created_on": "2025-06-01T10:00:00Z"}], "next": None}
+        page = int(url.split("cursor=")[1]) if "cursor=" in url else 0
+        if page == self.fail_at:
+            raise requests.exceptions.ConnectionError("worker lost")
+        contacts = [{"uuid": contact_uuid, "name": contact_uuid} for contact_uuid in self.pages[page]]
+        next_url = self.url(page + 1) if page + 1 < len(self.pages) else None
+        return {"results": contacts, "next": next_url}
+
+
+def _read_report(path):
+    with gzip.open(path, "rt", encoding="utf-8") as report:
+        return list(csv.DictReader(report))
+
+
+class WriteReportTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "report.csv.gz")
+        self.pages = [[f"c{page}-{n}" for n in range(3)] for page in range(4)]
+
+    def _write(self, flows, checkpoint=None):
+        with mock.patch("nexus.reports.flows_report.generate_output.get_page", flows):
+            return write_report(self.path, flows.url(0), {}, "http://flows.test", "report-1", checkpoint)
+
+    def test_pages_are_streamed_into_a_gzip_csv(self):
+        rows = self._write(FakeFlows(self.pages))
+
+        report = _read_report(self.path)
+        self.assertEqual(rows, 12)
+        self.assertEqual([row["UUID"] for row in report], [uuid for page in self.pages for uuid in page])
+        self.assertEqual({row["Tabulação"] for row in report}, {"Solicitado o estorno"})
+
+    def test_rerun_resumes_after_the_last_completed_page(self):
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self._write(FakeFlows(self.pages, fail_at=2))
+        checkpoint = _load_checkpoint("report-1", self.path)
+        self.assertEqual(checkpoint["rows"], 6)
+
+        # A partially written page after the checkpoint is cut off on resume
+        with open(self.path, "ab") as output:
+            output.write(b"garbage")
+        flows = FakeFlows(self.pages)
+        rows = self._write(flows, checkpoint)
+
+        self.assertEqual(rows, 12)
+        self.assertEqual([row["UUID"] for row in _read_report(self.path)], [u for page in self.pages for u in page])
+        self.assertNotIn(flows.url(0), flows.requested)
+        self.assertNotIn(flows.url(1), flows.requested)
+
+    def test_missing_output_starts_over(self):
+        cache.set("flows_report:checkpoint:report-1", {"offset": 100, "rows": 3, "next_url": None})
+
+        self.assertIsNone(_load_checkpoint("report-1", self.path))
+
+
+class MainTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_report_is_uploaded_and_emailed_as_a_link(self):
+        flows = FakeFlows([["c0-0", "c0-1"], ["c1-0"]])
+        uploaded = {}
+
+        def upload(path, filename):
+            uploaded["rows"] = _read_report(path)
+            uploaded["filename"] = filename
+            return "https://bucket.s3.amazonaws.com/flows_reports/report?signature"
+
+        with (
+            override_settings(FLOWS_REPORT_DIR=self.directory, REPORT_RECIPIENT_EMAILS=["ops@example.com"]),
+            mock.patch("nexus.reports.flows_report.generate_output.get_page", flows),
+            mock.patch("nexus.reports.flows_report.generate_output.upload_report", side_effect=upload),
+            mock.patch("nexus.reports.flows_report.generate_output.BASE_URL", "http://flows.test"),
+        ):
+            self.assertTrue(main("token", report_id="task-1"))
+
+        self.assertEqual(len(uploaded["rows"]), 3)
+        self.assertTrue(uploaded["filename"].endswith("-task-1.csv.gz"))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].attachments, [])
+        self.assertIn("https://bucket.s3.amazonaws.com/flows_reports/report?signature", mail.outbox[0].body)
+        self.assertIsNone(cache.get("flows_report:checkpoint:task-1"))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_only_one_run_of_a_report_delivers_it(self):
+        flows = FakeFlows([["c0-0", "c0-1"], ["c1-0"]])
+        on_page = mock.Mock()
+
+        with (
+            override_settings(FLOWS_REPORT_DIR=self.directory, REPORT_RECIPIENT_EMAILS=["ops@example.com"]),
+            mock.patch("nexus.reports.flows_report.generate_output.get_page", flows),
+            mock.patch(
+                "nexus.reports.flows_report.generate_output.upload_report", return_value="https://link"
+            ) as upload,
+            mock.patch("nexus.reports.flows_report.generate_output.BASE_URL", "http://flows.test"),
+        ):
+            self.assertTrue(main("token", report_id="task-1", on_page=on_page))
+            self.assertTrue(main("token", report_id="task-1"))
+
+        self.assertEqual(on_page.call_count, 2)
+        upload.assert_called_once()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_delivery_can_be_retried(self):
+        flows = FakeFlows([["c0-0"]])
+
+        with (
+            override_settings(FLOWS_REPORT_DIR=self.directory, REPORT_RECIPIENT_EMAILS=["ops@example.com"]),
+            mock.patch("nexus.reports.flows_report.generate_output.get_page", flows),
+            mock.patch(
+                "nexus.reports.flows_report.generate_output.upload_report",
+                side_effect=[Exception("S3 unavailable"), "https://link"],
+            ),
+            mock.patch("nexus.reports.flows_report.generate_output.BASE_URL", "http://flows.test"),
+        ):
+            with self.assertRaisesMessage(Exception, "S3 unavailable"):
+                main("token", report_id="task-1")
+            self.assertTrue(main("token", report_id="task-1"))
+
+        self.assertIn("https://link", mail.outbox[-1].body)
+
+    @override_settings(AWS_S3_BUCKET_NAME="reports-bucket", FLOWS_REPORT_LINK_EXPIRATION=3600)
+    @mock.patch("nexus.reports.flows_report.generate_output.s3FileDatabase")
+    def test_report_is_uploaded_as_a_gzip_download(self, mock_storage):
+        storage = mock_storage.return_value
+        storage.create_presigned_url.return_value = "https://link"
+
+        self.assertEqual(upload_report("/tmp/report.csv.gz", "report.csv.gz"), "https://link")
+
+        storage.s3_client.upload_file.assert_called_once_with(
+            "/tmp/report.csv.gz",
+            "reports-bucket",
+            "flows_reports/report.csv.gz",
+            ExtraArgs={"ContentType": "application/gzip", "ContentDisposition": 'attachment; filename="report.csv.gz"'},
+        )
+        storage.create_presigned_url.assert_called_once_with("flows_reports/report.csv.gz", expiration=3600)
@@ -194,6 +194,14 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
 # STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 # STORAGES = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    # Uploads handed to Celery by reference instead of as task arguments
+    "upload_claim_checks": {
+        "BACKEND": env.str("UPLOAD_CLAIM_CHECK_STORAGE_BACKEND", "nexus.storage.UploadClaimCheckStorage")
+    },
+}
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -258,6 +266,12 @@ EXTERNAL_SUPERUSERS_TOKENS = [
 SENTENX_BASE_URL = env.str("SENTENX_BASE_URL")
 SENTENX_AUTH_TOKEN = env.str("SENTENX_AUTH_TOKEN")
 SENTENX_THRESHOLD = env.float("SENTENX_THRESHOLD", default=1.0)
+SENTENX_CONNECT_TIMEOUT = env.float("SENTENX_CONNECT_TIMEOUT", default=5.0)
+SENTENX_READ_TIMEOUT = env.float("SENTENX_READ_TIMEOUT", default=60.0)
+# Documents indexed concurrently per batch task, documents per batch, and pooled connections per process
+SENTENX_INDEX_CONCURRENCY = env.int("SENTENX_INDEX_CONCURRENCY", default=8)
+SENTENX_INDEX_BATCH_SIZE = env.int("SENTENX_INDEX_BATCH_SIZE", default=50)
+SENTENX_POOL_MAXSIZE = env.int("SENTENX_POOL_MAXSIZE", default=8)
 
 # WENIGPT
 
@@ -337,6 +351,9 @@ OIDC_DRF_AUTH_BACKEND = env.str(
 )
 OIDC_RP_SCOPES = env.str("OIDC_RP_SCOPES", default="openid email")
 OIDC_RP_EMAIL = env.str("OIDC_RP_EMAIL", default="")
+# Verified bearer token -> principal cache (per process); 0 disables it
+AUTH_TOKEN_CACHE_TTL_SECONDS = env.int("AUTH_TOKEN_CACHE_TTL_SECONDS", default=60)
+AUTH_TOKEN_CACHE_MAX_ENTRIES = env.int("AUTH_TOKEN_CACHE_MAX_ENTRIES", default=10000)
 
 
 REST_FRAMEWORK = {
@@ -382,6 +399,9 @@ DJANGO_ALLOW_ASYNC_UNSAFE = env.bool("DJANGO_ALLOW_ASYNC_UNSAFE")
 TRULENS_DATABASE_URL = env.str("TRULENS_DATABASE_URL", "sqlite:///default.sqlite")
 
 FLOWS_REST_ENDPOINT = env.str("FLOWS_REST_ENDPOINT")
+TYPING_INDICATOR_TIMEOUT = env.int("TYPING_INDICATOR_TIMEOUT", default=10)
+TYPING_INDICATOR_MAX_WORKERS = env.int("TYPING_INDICATOR_MAX_WORKERS", default=4)
+TYPING_INDICATOR_COALESCE_SECONDS = env.int("TYPING_INDICATOR_COALESCE_SECONDS", default=5)
 BILLING_REST_ENDPOINT = env.str("BILLING_REST_ENDPOINT")
 CONNECT_REST_ENDPOINT = env.str("CONNECT_REST_ENDPOINT", "")
 CONVERSATIONS_REST_ENDPOINT = env.str("CONVERSATIONS_REST_ENDPOINT", "http://localhost:8000")
@@ -397,6 +417,11 @@ DEFAULT_ERROR_MESSAGES = env.json(
 CONVERSATIONS_TOKEN = env.str("CONVERSATIONS_TOKEN")
 CONVERSATIONS_AS_TOPICS_SOURCE = env.bool("CONVERSATIONS_AS_TOPICS_SOURCE", default=True)
 
+# Public supervisor V2: nexus-conversations fetches share a keep-alive pool and a per-request time budget
+SUPERVISOR_PUBLIC_V2_MAX_WORKERS = env.int("SUPERVISOR_PUBLIC_V2_MAX_WORKERS", default=10)
+SUPERVISOR_PUBLIC_V2_CONNECT_TIMEOUT = env.float("SUPERVISOR_PUBLIC_V2_CONNECT_TIMEOUT", default=3.0)
+SUPERVISOR_PUBLIC_V2_REQUEST_BUDGET_SECONDS = env.float("SUPERVISOR_PUBLIC_V2_REQUEST_BUDGET_SECONDS", default=40.0)
+
 DEFAULT_AGENT_NAME = env.str("DEFAULT_AGENT_NAME")
 DEFAULT_AGENT_ROLE = env.str("DEFAULT_AGENT_ROLE")
 DEFAULT_AGENT_PERSONALITY = env.str("DEFAULT_AGENT_PERSONALITY")
@@ -502,6 +527,33 @@ HC_WENI_TOKEN = env.str("HC_WENI_TOKEN", "")
 PROMETHEUS_AUTH_TOKEN = env.str("PROMETHEUS_AUTH_TOKEN", "")
 INLINE_AGENT_LATENCY_API_TOKEN = env.str("INLINE_AGENT_LATENCY_API_TOKEN", "")
 
+# Nightly rebuild window for analytics ConversationDailyFact (closed days before today)
+CONVERSATION_FACTS_RECONCILE_DAYS = env.int("CONVERSATION_FACTS_RECONCILE_DAYS", 7)
+
+# Retention deletes (log_cleanup_routine / delete_old_activities)
+LOG_RETENTION_BATCH_SIZE = env.int("LOG_RETENTION_BATCH_SIZE", 5000)
+LOG_RETENTION_BATCH_SLEEP_SECONDS = env.float("LOG_RETENTION_BATCH_SLEEP_SECONDS", 0.5)
+# A run stops after this long and the next scheduled run resumes from the checkpoint (0 = no limit)
+LOG_RETENTION_MAX_SECONDS = env.float("LOG_RETENTION_MAX_SECONDS", 3000)
+
+# Tag percentage dashboard results are cached per (project, source, range) to absorb polling
+TAG_PERCENTAGE_CACHE_TTL_SECONDS = env.int("TAG_PERCENTAGE_CACHE_TTL_SECONDS", 60)
+
+# Knowledge-base file uploads: parts sent in parallel and retries per failed part
+KB_MULTIPART_UPLOAD_CONCURRENCY = env.int("KB_MULTIPART_UPLOAD_CONCURRENCY", 4)
+KB_MULTIPART_UPLOAD_MAX_RETRIES = env.int("KB_MULTIPART_UPLOAD_MAX_RETRIES", 3)
+
+# Projects per pipelined Redis delete when an edited agent's integrations drop their team caches
+TEAM_CACHE_INVALIDATION_CHUNK_SIZE = env.int("TEAM_CACHE_INVALIDATION_CHUNK_SIZE", 500)
+
+# Agent push: skill Lambdas deployed in parallel, and polling of Lambda update status
+INLINE_AGENT_LAMBDA_DEPLOY_CONCURRENCY = env.int("INLINE_AGENT_LAMBDA_DEPLOY_CONCURRENCY", 4)
+INLINE_AGENT_LAMBDA_WAIT_INITIAL_DELAY = env.float("INLINE_AGENT_LAMBDA_WAIT_INITIAL_DELAY", 0.5)
+INLINE_AGENT_LAMBDA_WAIT_MAX_DELAY = env.float("INLINE_AGENT_LAMBDA_WAIT_MAX_DELAY", 5.0)
+INLINE_AGENT_LAMBDA_WAIT_TIMEOUT = env.float("INLINE_AGENT_LAMBDA_WAIT_TIMEOUT", 300)
+# Background agent push (?stream=true): how long its progress events stay readable
+INLINE_AGENT_PUSH_PROGRESS_TTL = env.int("INLINE_AGENT_PUSH_PROGRESS_TTL", 60 * 60)
+
 # Inline agent latency persistence (Plan B)
 INLINE_AGENT_LATENCY_ENABLED = env.bool("INLINE_AGENT_LATENCY_ENABLED", True)
 INLINE_AGENT_LATENCY_TARGET_MS_LOW = env.int("INLINE_AGENT_LATENCY_TARGET_MS_LOW", 15000)
@@ -511,6 +563,11 @@ INLINE_AGENT_LATENCY_BROKER_OUTLIER_MS = env.int("INLINE_AGENT_LATENCY_BROKER_OU
 INLINE_AGENT_LATENCY_SAMPLE_RATE = env.float("INLINE_AGENT_LATENCY_SAMPLE_RATE", 0.001)
 INLINE_AGENT_LATENCY_ELEVATED_MS = env.int("INLINE_AGENT_LATENCY_ELEVATED_MS", 15000)
 INLINE_AGENT_LATENCY_ELEVATED_SAMPLE_RATE = env.float("INLINE_AGENT_LATENCY_ELEVATED_SAMPLE_RATE", 0.01)
+# Rollups are aggregated per worker and merged into Postgres on this interval (0 = write every turn)
+INLINE_AGENT_LATENCY_FLUSH_INTERVAL_SECONDS = env.float("INLINE_AGENT_LATENCY_FLUSH_INTERVAL_SECONDS", 10)
+INLINE_AGENT_LATENCY_BUFFER_MAX_ROWS = env.int("INLINE_AGENT_LATENCY_BUFFER_MAX_ROWS", 5000)
+# Most days one compaction run rebuilds when catching up after an outage
+INLINE_AGENT_LATENCY_COMPACTION_MAX_DAYS = env.int("INLINE_AGENT_LATENCY_COMPACTION_MAX_DAYS", 31)
 
 
 # Extra models
@@ -612,6 +669,21 @@ BEDROCK_FILE_SIZE_LIMIT = env.int("BEDROCK_FILE_SIZE_LIMIT", 50)
 BEDROCK_INGESTION_JOB_ENABLED = env.bool("BEDROCK_INGESTION_JOB_ENABLED", False)
 BEDROCK_DIRECT_INGEST_MAX_FILES_PER_REQUEST = env.int("BEDROCK_DIRECT_INGEST_MAX_FILES_PER_REQUEST", 25)
 
+# Knowledge-base retrieval cache: shared TTL, per-process LRU size, and how soon other processes see an invalidation
+RETRIEVAL_CACHE_ENABLED = env.bool("RETRIEVAL_CACHE_ENABLED", True)
+RETRIEVAL_CACHE_TTL_SECONDS = env.int("RETRIEVAL_CACHE_TTL_SECONDS", 5 * 60)
+RETRIEVAL_CACHE_LOCAL_MAX_ENTRIES = env.int("RETRIEVAL_CACHE_LOCAL_MAX_ENTRIES", 2048)
+RETRIEVAL_CACHE_GENERATION_REFRESH_SECONDS = env.float("RETRIEVAL_CACHE_GENERATION_REFRESH_SECONDS", 5.0)
+# Deleted documents are served until their deletion is ingested; the cache is skipped meanwhile
+RETRIEVAL_CACHE_DELETE_HOLD_SECONDS = env.int("RETRIEVAL_CACHE_DELETE_HOLD_SECONDS", 30 * 60)
+RETRIEVAL_CACHE_DELETE_POLL_SECONDS = env.int("RETRIEVAL_CACHE_DELETE_POLL_SECONDS", 30)
+
+# Ingestion tracker: one poller per data source, backing off while no job changes status
+BEDROCK_INGESTION_TRACKER_INITIAL_DELAY = env.int("BEDROCK_INGESTION_TRACKER_INITIAL_DELAY", 10)
+BEDROCK_INGESTION_TRACKER_MAX_DELAY = env.int("BEDROCK_INGESTION_TRACKER_MAX_DELAY", 120)
+BEDROCK_INGESTION_TRACKER_LOCK_TIMEOUT = env.int("BEDROCK_INGESTION_TRACKER_LOCK_TIMEOUT", 15 * 60)
+BEDROCK_INGESTION_TRACKER_LOOKBACK_SECONDS = env.int("BEDROCK_INGESTION_TRACKER_LOOKBACK_SECONDS", 24 * 60 * 60)
+
 
 HUMAN_SUPPORT_AGENT_ID = env.str("HUMAN_SUPPORT_AGENT_ID", "")
 HUMAN_SUPPORT_ACTION_GROUP = env.list("HUMAN_SUPPORT_ACTION_GROUP", [])
@@ -630,6 +702,11 @@ SUPERVISOR_SERVICE_AVAILABLE = env.bool("SUPERVISOR_SERVICE_AVAILABLE", False)
 SUPERVISOR_SERVICE_AVAILABLE_PROJECTS = env.list("SUPERVISOR_SERVICE_AVAILABLE_PROJECTS", [])
 
 REPORT_RECIPIENT_EMAILS = env.list("REPORT_RECIPIENT_EMAILS", [])
+# Flows report: gzip CSV built on local disk (resumable), then uploaded to AWS_S3_BUCKET_NAME and emailed as a link
+FLOWS_REPORT_DIR = env.str("FLOWS_REPORT_DIR", default="/tmp/flows_reports")
+FLOWS_REPORT_LINK_EXPIRATION = env.int("FLOWS_REPORT_LINK_EXPIRATION", default=7 * 24 * 60 * 60)
+# A run that has not finished a page for this long is considered gone and may be resumed
+FLOWS_REPORT_HEARTBEAT_TIMEOUT = env.int("FLOWS_REPORT_HEARTBEAT_TIMEOUT", default=10 * 60)
 VTEX_SUPPORT_EMAIL = env.str("VTEX_SUPPORT_EMAIL", default="")
 VTEX_SUPPORT_FROM_EMAIL = env.str("VTEX_SUPPORT_FROM_EMAIL", default="nexus@weni.ai")
 OFFICIAL_SMART_AGENT_EDITORS = env.list("OFFICIAL_SMART_AGENT_EDITORS", default=[])
@@ -651,6 +728,9 @@ else:
 
 FLOWS_DB_COHORT_MAX_RANGE_DAYS = env.int("FLOWS_DB_COHORT_MAX_RANGE_DAYS", default=31)
 FLOWS_DB_COHORT_HTTP_TIMEOUT = env.int("FLOWS_DB_COHORT_HTTP_TIMEOUT", default=300)
+FLOWS_DB_COHORT_CONNECT_TIMEOUT = env.float("FLOWS_DB_COHORT_CONNECT_TIMEOUT", default=10.0)
+# Day windows of one emailed reconcile that may run on workers at the same time
+FLOWS_DB_COHORT_MAX_PARALLEL_WINDOWS = env.int("FLOWS_DB_COHORT_MAX_PARALLEL_WINDOWS", default=8)
 FLOWS_DB_COHORT_TASK_TIME_LIMIT = env.int("FLOWS_DB_COHORT_TASK_TIME_LIMIT", default=3600)
 FLOWS_DB_COHORT_JSON_MAX_RANGE_DAYS = env.int("FLOWS_DB_COHORT_JSON_MAX_RANGE_DAYS", default=1)
 FLOWS_DB_COHORT_EMAIL_UUID_SAMPLE_LIMIT = env.int("FLOWS_DB_COHORT_EMAIL_UUID_SAMPLE_LIMIT", default=10)
@@ -677,6 +757,10 @@ ENABLE_LOGFIRE_OPENAI_AGENTS = env.bool("ENABLE_LOGFIRE_OPENAI_AGENTS", False)
 
 JWT_PUBLIC_KEY_PATH = BASE_DIR / "nexus" / "authentication" / "jwt_keys" / "public_key.perm"
 JWT_SECRET_KEY = env.str("JWT_SECRET_KEY")
+# RS256 by default; EdDSA signs much faster but needs an Ed25519 key pair and consumers that accept it
+JWT_SIGNING_ALGORITHM = env.str("JWT_SIGNING_ALGORITHM", default="RS256")
+JWT_TOKEN_REUSE_MARGIN_SECONDS = env.int("JWT_TOKEN_REUSE_MARGIN_SECONDS", default=5 * 60)
+JWT_TOKEN_CACHE_MAX_ENTRIES = env.int("JWT_TOKEN_CACHE_MAX_ENTRIES", default=10000)
 OPENAI_AGENTS_FOUNDATION_MODEL = env.str("OPENAI_AGENTS_FOUNDATION_MODEL", "gpt-4o-mini")
 
 try:
@@ -797,6 +881,15 @@ GUARDRAILS_BEDROCK_GUARDRAIL_PROFILE_IDENTIFIER = env.str(
 )
 
 GUARDRAILS_PROMPT_INJECTION_FILTER_TEXT = env.str("GUARDRAILS_PROMPT_INJECTION_FILTER_TEXT", default="")
+# ApplyGuardrail verdicts cached per (guardrail, version, normalized input); 0 disables
+GUARDRAILS_VERDICT_CACHE_TTL = env.int("GUARDRAILS_VERDICT_CACHE_TTL", default=10 * 60)
+# Evaluate the input guardrail while the agents generate; a blocked verdict cancels the run and discards
+# the response. Only used for turns that send nothing before the final dispatch (no streaming, rationale,
+# preview, human support or collaborator tools); everything else keeps the blocking check.
+GUARDRAILS_SPECULATIVE_INPUT_CHECK = env.bool("GUARDRAILS_SPECULATIVE_INPUT_CHECK", default=False)
+GUARDRAILS_SPECULATIVE_MAX_WORKERS = env.int("GUARDRAILS_SPECULATIVE_MAX_WORKERS", default=8)
+# Seconds to wait for the speculative verdict after generation before running the blocking check instead
+GUARDRAILS_SPECULATIVE_RESULT_TIMEOUT = env.float("GUARDRAILS_SPECULATIVE_RESULT_TIMEOUT", default=5.0)
 
 # Lambda architecture configuration
 AWS_LAMBDA_ARCHITECTURE = env.str("AWS_LAMBDA_ARCHITECTURE", "x86_64")
@@ -823,6 +916,10 @@ AWS_COMPONENTS_FUNCTION_ARN = env.str("AWS_COMPONENTS_FUNCTION_ARN", "")
 LOCKED_FOUNDATION_MODELS = env.list("LOCKED_FOUNDATION_MODELS", default=[])
 
 CELERY_WORKER_PREFETCH_MULTIPLIER = env.int("CELERY_WORKER_PREFETCH_MULTIPLIER", 1)
+# Redis redelivers an unacknowledged task after this many seconds; keep it above the longest acks_late time limit
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "visibility_timeout": env.int("CELERY_BROKER_VISIBILITY_TIMEOUT", default=FLOWS_DB_COHORT_TASK_TIME_LIMIT + 1800)
+}
 PROJECTS_WITH_SPECIAL_SESSION_ID = env.list("PROJECTS_WITH_SPECIAL_SESSION_ID", [])
 PROJECTS_WITH_LARGE_DATASOURCE = env.list("PROJECTS_WITH_LARGE_DATASOURCE", [])
 
@@ -863,6 +960,7 @@ def get_datasource_id(project_uuid: str | None) -> str:
 # DynamoDB
 DYNAMODB_REGION = env.str("DYNAMODB_REGION", default="us-east-1")
 DYNAMODB_MESSAGE_TABLE = env.str("DYNAMODB_MESSAGE_TABLE", default="NexusMessages")
+DYNAMODB_QUERY_CONCURRENCY = env.int("DYNAMODB_QUERY_CONCURRENCY", default=10)
 
 # SQS (conversation events for microservice consumer)
 CONVERSATION_EVENTS_SQS_QUEUE_URL = env.str("CONVERSATION_EVENTS_SQS_QUEUE_URL", default="")
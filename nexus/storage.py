@@ -45,6 +45,15 @@ class AgentSystemLogoStorage(S3Boto3Storage):
     custom_domain = False
 
 
+class UploadClaimCheckStorage(S3Boto3Storage):
+    """Short-lived copies of uploads waiting for a worker (see file_manager.claim_check)."""
+
+    bucket_name = settings.AWS_S3_BUCKET_NAME
+    location = "media/uploads/pending/"
+    file_overwrite = False
+    custom_domain = False
+
+
 class DeleteStorageFile:
     def __init__(self):
         self.s3_client = boto3.client("s3", region_name=settings.AWS_S3_REGION_NAME)
@@ -10,6 +10,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -22,8 +23,11 @@ from django.template.defaultfilters import slugify
 
 from nexus.agents.components import get_all_formats_list
 from nexus.agents.models import Agent, Credential, Team
+from nexus.cache import retrieval_cache
 from nexus.projects.models import Project
 from nexus.task_managers.file_database.file_database import FileDataBase, FileResponseDTO
+from nexus.task_managers.file_database.multipart import ConcurrentMultipartUploader
+from nexus.usecases.inline_agents.lambda_deploy import wait_for_lambda_updated
 from nexus.utils import get_datasource_id
 
 logger = logging.getLogger(__name__)
@@ -193,40 +197,19 @@ class BedrockFileDatabase(FileDataBase):
         bytes_stream = BytesIO(json.dumps(data).encode("utf-8"))
         self.s3_client.upload_fileobj(bytes_stream, self.bucket_name, key)
 
-    def multipart_upload(self, file, content_base_uuid: str, file_uuid: str, part_size: int = 5 * 1024 * 1024):
-        s3_client = self.s3_client
-        bucket_name = self.bucket_name
+    def multipart_upload(self, file, content_base_uuid: str, file_uuid: str, part_size: Optional[int] = None):
         file_name = self.__create_unique_filename(basename(file.name))
         key = self._build_s3_key(content_base_uuid, file_name)
 
-        response = s3_client.create_multipart_upload(Bucket=bucket_name, Key=key)
-        upload_id = response["UploadId"]
-
-        parts = []
+        uploader = ConcurrentMultipartUploader(self.s3_client, self.bucket_name, key, part_size=part_size)
         try:
-            part_number = 1
-            while True:
-                data = file.read(part_size)
-                if not data:
-                    break
-
-                response = s3_client.upload_part(
-                    Bucket=bucket_name, Key=key, PartNumber=part_number, UploadId=upload_id, Body=data
-                )
-                part_info = {"PartNumber": part_number, "ETag": response["ETag"]}
-                parts.append(part_info)
-                part_number += 1
-
-            response = s3_client.complete_multipart_upload(
-                Bucket=bucket_name, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
-            )
-
-            logger.info("Upload finished", extra={"location": response["Location"]})
-            return file_name, response["Location"]
-
+            response = uploader.upload(file, size=getattr(file, "size", None))
         except Exception as e:
             logger.error("Error on upload: %s", e, exc_info=True)
-            s3_client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+            raise
+
+        logger.info("Upload finished", extra={"location": response["Location"]})
+        return file_name, response["Location"]
 
     def add_file(self, file, content_base_uuid: str, file_uuid: str) -> FileResponseDTO:
         try:
@@ -484,6 +467,7 @@ class BedrockFileDatabase(FileDataBase):
 
         file_metadata = f"{content_base_uuid}/{filename}.metadata.json"
         self.s3_client.delete_object(Bucket=self.bucket_name, Key=file_metadata)
+        retrieval_cache.invalidate(content_base_uuid)
 
     def delete(self, content_base_uuid: str, content_base_file_uuid: str, filename: str):
         self.delete_file_and_metadata(content_base_uuid, filename)
@@ -702,6 +686,7 @@ class BedrockFileDatabase(FileDataBase):
                 }
             ],
         )
+        retrieval_cache.invalidate(content_base_uuid)
         return response.get("documentDetails", [])
 
     def get_agent(self, agent_id: str):
@@ -857,12 +842,42 @@ class BedrockFileDatabase(FileDataBase):
         )
         return response.get("ingestionJobSummaries")
 
+    def iter_bedrock_ingestion_jobs(self, page_size: int = 100) -> Iterator[Dict]:
+        """Yield the data source's ingestion job summaries, most recently started first."""
+        kwargs = {
+            "dataSourceId": self.data_source_id,
+            "knowledgeBaseId": self.knowledge_base_id,
+            "sortBy": {"attribute": "STARTED_AT", "order": "DESCENDING"},
+            "maxResults": page_size,
+        }
+        while True:
+            response = self.bedrock_agent.list_ingestion_jobs(**kwargs)
+            yield from response.get("ingestionJobSummaries", [])
+            next_token = response.get("nextToken")
+            if not next_token:
+                return
+            kwargs["nextToken"] = next_token
+
     def prepare_agent(self, agent_id: str):
         self.bedrock_agent.prepare_agent(agentId=agent_id)
         time.sleep(5)
         return
 
-    def search_data(self, content_base_uuid: str, text: str, number_of_results: int = 5) -> Dict[str, Any]:
+    def search_data(
+        self, content_base_uuid: str, text: str, number_of_results: int = 5, use_cache: bool = True
+    ) -> Dict[str, Any]:
+        if not use_cache:
+            return self._retrieve(content_base_uuid, text, number_of_results)
+        return retrieval_cache.get_or_retrieve(
+            self.knowledge_base_id,
+            self.data_source_id,
+            content_base_uuid,
+            text,
+            number_of_results,
+            lambda: self._retrieve(content_base_uuid, text, number_of_results),
+        )
+
+    def _retrieve(self, content_base_uuid: str, text: str, number_of_results: int) -> Dict[str, Any]:
         combined_filter = {
             "andAll": [
                 {"equals": {"key": "contentBaseUuid", "value": content_base_uuid}},
@@ -990,8 +1005,7 @@ class BedrockFileDatabase(FileDataBase):
 
             # Wait for the function to be updated
             logger.info("Waiting for function to be updated")
-            waiter = self.lambda_client.get_waiter("function_updated")
-            waiter.wait(FunctionName=lambda_name, WaiterConfig={"Delay": 5, "MaxAttempts": 60})
+            wait_for_lambda_updated(self.lambda_client, lambda_name)
 
             # Get the new version number from the response
             new_version = response["Version"]
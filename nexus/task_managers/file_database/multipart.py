@@ -0,0 +1,130 @@
+"""Concurrent S3 multipart upload with bounded memory, per-part retries and abort on failure."""
+
+import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MIN_PART_SIZE = 5 * 1024 * 1024  # S3 minimum for every part but the last
+MAX_PART_SIZE = 64 * 1024 * 1024
+MAX_PARTS = 10_000
+
+
+def choose_part_size(size: Optional[int], workers: int) -> int:
+    """
+    Part size for a file of ``size`` bytes.
+
+    Aims for about four parts per worker so the pool stays busy, within
+    S3's 5 MB minimum, a 64 MB cap and the 10,000-part limit.
+    """
+    if not size:
+        return MIN_PART_SIZE
+    part_size = min(max(math.ceil(size / (workers * 4)), MIN_PART_SIZE), MAX_PART_SIZE)
+    return max(part_size, math.ceil(size / MAX_PARTS))
+
+
+class ConcurrentMultipartUploader:
+    """
+    Uploads a file object to S3 as a multipart upload with parts sent concurrently.
+
+    Parts are read on the calling thread and handed to a pool of
+    ``max_workers`` threads; at most ``max_in_flight`` parts are held in
+    memory at once, so memory use is bounded by ``max_in_flight * part_size``
+    whatever the file size. A failed part is retried with exponential
+    backoff; if it still fails, the upload is aborted so S3 does not keep
+    the orphaned parts, and the error is raised.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        *,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        part_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: float = 0.5,
+    ):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.max_workers = max_workers or settings.KB_MULTIPART_UPLOAD_CONCURRENCY
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self.part_size = part_size
+        self.max_retries = settings.KB_MULTIPART_UPLOAD_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_delay = retry_delay
+
+    def upload(self, file, size: Optional[int] = None) -> Dict:
+        """Upload ``file`` and return the CompleteMultipartUpload response."""
+        part_size = self.part_size or choose_part_size(size, self.max_workers)
+        upload_id = self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=self.key)["UploadId"]
+
+        try:
+            parts = self._upload_parts(file, upload_id, part_size)
+            return self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            logger.error("Multipart upload failed, aborting", extra={"key": self.key, "upload_id": upload_id})
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=upload_id)
+            raise
+
+    def _upload_parts(self, file, upload_id: str, part_size: int) -> List[Dict]:
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        failed = threading.Event()
+        futures = []
+
+        def send(part_number: int, data: bytes) -> Dict:
+            try:
+                return self._upload_part(upload_id, part_number, data)
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="s3-multipart") as executor:
+            part_number = 1
+            while True:
+                slots.acquire()
+                data = b"" if failed.is_set() else file.read(part_size)
+                # An empty file still needs one (empty) part to complete the upload.
+                if not data and part_number > 1:
+                    slots.release()
+                    break
+                futures.append(executor.submit(send, part_number, data))
+                part_number += 1
+
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in futures:
+                if future.done() and not future.cancelled() and future.exception():
+                    raise future.exception()
+
+        return [future.result() for future in futures]
+
+    def _upload_part(self, upload_id: str, part_number: int, data: bytes) -> Dict:
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket, Key=self.key, PartNumber=part_number, UploadId=upload_id, Body=data
+                )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay * 2**attempt
+                logger.warning(
+                    "Retrying multipart part",
+                    extra={"key": self.key, "part_number": part_number, "attempt": attempt + 1, "error": str(e)},
+                )
+                time.sleep(delay)
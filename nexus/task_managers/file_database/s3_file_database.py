@@ -26,8 +26,6 @@ class s3FileDatabase(FileDataBase):
 
         if isinstance(file, bytes):
             file = BytesIO(file)
-        else:
-            file = BytesIO(file.read())
 
         try:
             self.s3_client.upload_fileobj(file, settings.AWS_S3_BUCKET_NAME, file_name)
@@ -1,10 +1,35 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 from nexus.task_managers.models import TaskManager
 
 from .file_database import FileDataBase
 
+logger = logging.getLogger(__name__)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.SENTENX_POOL_MAXSIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
+def _timeout() -> Tuple[float, float]:
+    return settings.SENTENX_CONNECT_TIMEOUT, settings.SENTENX_READ_TIMEOUT
+
 
 class DefaultSentenXData:
     def __init__(self):
@@ -21,8 +46,7 @@ class SentenXFileDataBase:
             "Authorization": f"Bearer {settings.SENTENX_AUTH_TOKEN}",
         }
 
-    def add_file(self, task: TaskManager, file_database: FileDataBase, load_type: str = None):
-        url = settings.SENTENX_BASE_URL + "/content_base/index"
+    def _file_body(self, task: TaskManager, file_database: FileDataBase, load_type: str = None) -> dict:
         body = {
             "file": file_database.create_presigned_url(task.content_base_file.file_name),
             "filename": task.content_base_file.file_name,
@@ -33,16 +57,10 @@ class SentenXFileDataBase:
         }
         if load_type:
             body.update({"load_type": load_type})
-        response = requests.put(url=url, headers=self.headers, json=body)
+        return body
 
-        if response.status_code == 200:
-            return response.status_code, response.json()
-
-        return response.status_code, response.text
-
-    def add_text_file(self, task: TaskManager, file_database: FileDataBase):
-        url = settings.SENTENX_BASE_URL + "/content_base/index"
-        body = {
+    def _text_file_body(self, task: TaskManager, file_database: FileDataBase) -> dict:
+        return {
             "file": file_database.create_presigned_url(task.content_base_text.file_name),
             "filename": task.content_base_text.file_name,
             "file_uuid": str(task.content_base_text.uuid),
@@ -50,16 +68,9 @@ class SentenXFileDataBase:
             "task_uuid": str(task.uuid),
             "content_base": str(task.content_base_text.content_base.uuid),
         }
-        response = requests.put(url=url, headers=self.headers, json=body)
 
-        if response.status_code == 200:
-            return response.status_code, response.json()
-
-        return response.status_code, response.text
-
-    def add_link(self, task: TaskManager, file_database: FileDataBase):
-        url = settings.SENTENX_BASE_URL + "/content_base/index"
-        body = {
+    def _link_body(self, task: TaskManager) -> dict:
+        return {
             "file": task.content_base_link.link,
             "filename": task.content_base_link.link,
             "file_uuid": str(task.content_base_link.uuid),
@@ -67,12 +78,57 @@ class SentenXFileDataBase:
             "task_uuid": str(task.uuid),
             "content_base": str(task.content_base_link.content_base.uuid),
         }
-        response = requests.put(url=url, headers=self.headers, json=body)
+
+    def _index(self, body: dict):
+        url = settings.SENTENX_BASE_URL + "/content_base/index"
+        try:
+            response = _session.put(url=url, headers=self.headers, json=body, timeout=_timeout())
+        except requests.exceptions.RequestException as e:
+            logger.error(f"SentenX index request failed for task {body.get('task_uuid')}: {e}")
+            return 500, str(e)
 
         if response.status_code == 200:
             return response.status_code, response.json()
+
         return response.status_code, response.text
 
+    def add_file(self, task: TaskManager, file_database: FileDataBase, load_type: str = None):
+        return self._index(self._file_body(task, file_database, load_type))
+
+    def add_text_file(self, task: TaskManager, file_database: FileDataBase):
+        return self._index(self._text_file_body(task, file_database))
+
+    def add_link(self, task: TaskManager, file_database: FileDataBase):
+        return self._index(self._link_body(task))
+
+    def index_documents(
+        self,
+        tasks: Sequence[TaskManager],
+        file_type: str,
+        file_database: FileDataBase,
+        load_type: str = None,
+        max_workers: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Index many documents of one type over the shared connection pool.
+
+        At most ``max_workers`` (SENTENX_INDEX_CONCURRENCY by default)
+        requests are in flight at once. Returns the status codes in the
+        order of ``tasks``.
+        """
+        if file_type == "text":
+            bodies = [self._text_file_body(task, file_database) for task in tasks]
+        elif file_type == "link":
+            bodies = [self._link_body(task) for task in tasks]
+        else:
+            bodies = [self._file_body(task, file_database, load_type) for task in tasks]
+
+        if not bodies:
+            return []
+        workers = min(max_workers or settings.SENTENX_INDEX_CONCURRENCY, len(bodies))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sentenx-index") as executor:
+            return [status_code for status_code, _ in executor.map(self._index, bodies)]
+
     def search_data(self, content_base_uuid: str, text: str):
         url = settings.SENTENX_BASE_URL + "/content_base/search"
 
@@ -82,7 +138,7 @@ class SentenXFileDataBase:
             "filter": {"content_base_uuid": content_base_uuid},
         }
 
-        response = requests.post(url=url, headers=self.headers, json=body)
+        response = _session.post(url=url, headers=self.headers, json=body, timeout=_timeout())
         response.raise_for_status()
 
         if response.status_code == 200:
@@ -97,7 +153,7 @@ class SentenXFileDataBase:
             "filename": filename,
             "file_uuid": content_base_file_uuid,
         }
-        response = requests.delete(url=url, headers=self.headers, json=body)
+        response = _session.delete(url=url, headers=self.headers, json=body, timeout=_timeout())
         if response.status_code == 204:
             return {
                 "status": response.status_code,
@@ -130,7 +186,7 @@ class SentenXDocumentPreview(DefaultSentenXData):
         }
 
         try:
-            response = requests.post(url=url, headers=self.headers, json=body)
+            response = _session.post(url=url, headers=self.headers, json=body, timeout=_timeout())
             response.raise_for_status()
 
             json_response = response.json()
@@ -181,6 +181,7 @@ class TriggerBedrockIngestionTestCase(SimpleTestCase):
             file_type="file",
             post_delete=False,
             project_uuid="project-uuid",
+            content_base_uuid=None,
         )
 
     @patch("nexus.task_managers.tasks_bedrock.direct_ingest")
@@ -238,6 +239,7 @@ class TriggerBedrockIngestionTestCase(SimpleTestCase):
             file_type="file",
             post_delete=True,
             project_uuid="project-uuid",
+            content_base_uuid="cb-uuid",
         )
 
 
@@ -271,6 +273,73 @@ class StartIngestionJobTestCase(SimpleTestCase):
         mock_bedrock_cls.assert_not_called()
 
 
+@override_settings(
+    BEDROCK_INGESTION_JOB_ENABLED=True,
+    RETRIEVAL_CACHE_DELETE_HOLD_SECONDS=90,
+    RETRIEVAL_CACHE_DELETE_POLL_SECONDS=30,
+)
+@patch("nexus.task_managers.tasks_bedrock.retrieval_cache")
+@patch("nexus.task_managers.tasks_bedrock.release_retrieval_hold.apply_async")
+@patch("nexus.task_managers.tasks_bedrock.BedrockFileDatabase")
+class PostDeleteRetrievalHoldTestCase(SimpleTestCase):
+    def test_post_delete_ingestion_holds_the_cache_until_the_job_is_polled(
+        self, mock_bedrock_cls, mock_apply_async, mock_retrieval_cache
+    ):
+        from nexus.task_managers.tasks_bedrock import trigger_bedrock_ingestion
+
+        file_database = mock_bedrock_cls.return_value
+        file_database.list_bedrock_ingestion.return_value = []
+        file_database.start_bedrock_ingestion.return_value = "job-1"
+
+        trigger_bedrock_ingestion("", post_delete=True, content_base_uuid="cb-uuid", filename="file.txt")
+
+        mock_retrieval_cache.hold.assert_called_once_with("cb-uuid", 90)
+        mock_apply_async.assert_called_once_with(
+            kwargs={
+                "content_base_uuid": "cb-uuid",
+                "project_uuid": None,
+                "ingestion_job_id": "job-1",
+                "filename": None,
+                "poll_count": 0,
+            },
+            countdown=30,
+        )
+        mock_retrieval_cache.release.assert_not_called()
+
+    def test_release_waits_for_the_ingestion_job(self, mock_bedrock_cls, mock_apply_async, mock_retrieval_cache):
+        from nexus.task_managers.tasks_bedrock import release_retrieval_hold
+
+        file_database = mock_bedrock_cls.return_value
+        file_database.get_bedrock_ingestion_status.side_effect = ["IN_PROGRESS", "COMPLETE"]
+
+        self.assertFalse(release_retrieval_hold("cb-uuid", ingestion_job_id="job-1"))
+        mock_retrieval_cache.release.assert_not_called()
+        self.assertEqual(mock_apply_async.call_args.kwargs["kwargs"]["poll_count"], 1)
+
+        self.assertTrue(release_retrieval_hold("cb-uuid", ingestion_job_id="job-1", poll_count=1))
+        mock_retrieval_cache.release.assert_called_once_with("cb-uuid")
+
+    def test_release_waits_for_the_direct_delete(self, mock_bedrock_cls, mock_apply_async, mock_retrieval_cache):
+        from nexus.task_managers.tasks_bedrock import release_retrieval_hold
+
+        file_database = mock_bedrock_cls.return_value
+        file_database.get_direct_ingest_document_status.side_effect = [[{"status": "DELETING"}], []]
+
+        self.assertFalse(release_retrieval_hold("cb-uuid", filename="file.txt"))
+        self.assertTrue(release_retrieval_hold("cb-uuid", filename="file.txt", poll_count=1))
+        file_database.get_direct_ingest_document_status.assert_called_with("cb-uuid", "file.txt")
+        mock_retrieval_cache.release.assert_called_once_with("cb-uuid")
+
+    def test_hold_is_released_when_it_would_expire(self, mock_bedrock_cls, mock_apply_async, mock_retrieval_cache):
+        from nexus.task_managers.tasks_bedrock import release_retrieval_hold
+
+        mock_bedrock_cls.return_value.get_bedrock_ingestion_status.return_value = "IN_PROGRESS"
+
+        self.assertTrue(release_retrieval_hold("cb-uuid", ingestion_job_id="job-1", poll_count=2))
+        mock_apply_async.assert_not_called()
+        mock_retrieval_cache.release.assert_called_once_with("cb-uuid")
+
+
 class DirectIngestTaskTestCase(SimpleTestCase):
     @patch("nexus.task_managers.tasks_bedrock.direct_ingest.delay")
     @patch("nexus.task_managers.tasks_bedrock.BedrockFileDatabase")
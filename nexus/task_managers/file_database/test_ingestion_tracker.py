@@ -0,0 +1,171 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from nexus.task_managers.file_database.bedrock import BedrockFileDatabase
+from nexus.task_managers.models import TaskManager
+from nexus.task_managers.tasks_bedrock import (
+    _ingestion_tracker_keys,
+    schedule_ingestion_tracker,
+    track_ingestion_jobs,
+)
+from nexus.usecases.intelligences.tests.intelligence_factory import (
+    ContentBaseFileFactory,
+    IntegratedIntelligenceFactory,
+)
+from nexus.usecases.task_managers.celery_task_manager import CeleryTaskManagerUseCase
+
+
+def _summary(job_id, status, minutes_ago=0):
+    return {"ingestionJobId": job_id, "status": status, "startedAt": timezone.now() - timedelta(minutes=minutes_ago)}
+
+
+@override_settings(
+    AWS_BEDROCK_KNOWLEDGE_BASE_ID="kb-id",
+    AWS_BEDROCK_DATASOURCE_ID="ds-id",
+    BEDROCK_INGESTION_TRACKER_INITIAL_DELAY=10,
+    BEDROCK_INGESTION_TRACKER_MAX_DELAY=60,
+)
+@patch("nexus.task_managers.tasks_bedrock.track_ingestion_jobs.apply_async")
+@patch("nexus.task_managers.tasks_bedrock.BedrockFileDatabase")
+class IngestionTrackerTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.lock_key, self.dirty_key = _ingestion_tracker_keys(None)
+
+    def _task_manager(self, job_id, status=TaskManager.STATUS_PROCESSING):
+        task_manager = CeleryTaskManagerUseCase().create_celery_task_manager(content_base_file=ContentBaseFileFactory())
+        task_manager.ingestion_job_id = job_id
+        task_manager.status = status
+        task_manager.save()
+        return task_manager
+
+    def _file_database(self, mock_bedrock, summaries):
+        file_database = MagicMock(data_source_id="ds-id")
+        file_database.iter_bedrock_ingestion_jobs.side_effect = lambda: iter(summaries)
+        mock_bedrock.return_value = file_database
+        return file_database
+
+    def test_schedules_one_tracker_per_data_source(self, mock_bedrock, mock_apply_async):
+        for _ in range(50):
+            schedule_ingestion_tracker()
+
+        mock_apply_async.assert_called_once_with(kwargs={"project_uuid": None}, countdown=10)
+
+    def test_one_listing_settles_every_outstanding_job(self, mock_bedrock, mock_apply_async):
+        completed = [self._task_manager("job-1") for _ in range(3)]
+        failed = self._task_manager("job-2")
+        file_database = self._file_database(
+            mock_bedrock, [_summary("job-2", "FAILED"), _summary("job-1", "COMPLETE", minutes_ago=1)]
+        )
+        cache.add(self.lock_key, 1)
+
+        track_ingestion_jobs()
+
+        file_database.iter_bedrock_ingestion_jobs.assert_called_once_with()
+        self.assertEqual(file_database.search_data.call_count, 3)
+        for task_manager in completed:
+            task_manager.refresh_from_db()
+            self.assertEqual(task_manager.status, TaskManager.STATUS_SUCCESS)
+        failed.refresh_from_db()
+        self.assertEqual(failed.status, TaskManager.STATUS_FAIL)
+        mock_apply_async.assert_not_called()
+        self.assertIsNone(cache.get(self.lock_key))
+
+    def test_backs_off_while_nothing_changes(self, mock_bedrock, mock_apply_async):
+        self._task_manager("job-1")
+        self._file_database(mock_bedrock, [_summary("job-1", "IN_PROGRESS")])
+
+        track_ingestion_jobs(delay=10)
+        track_ingestion_jobs(delay=40)
+
+        self.assertEqual(
+            [call.kwargs["countdown"] for call in mock_apply_async.call_args_list],
+            [20, 60],
+        )
+
+    def test_resets_delay_when_a_job_changes_status(self, mock_bedrock, mock_apply_async):
+        self._task_manager("job-1", status=TaskManager.STATUS_LOADING)
+        self._file_database(mock_bedrock, [_summary("job-1", "IN_PROGRESS")])
+
+        track_ingestion_jobs(delay=40)
+
+        mock_apply_async.assert_called_once_with(kwargs={"project_uuid": None, "delay": 10}, countdown=10)
+
+    def test_completed_job_waits_until_knowledge_base_is_searchable(self, mock_bedrock, mock_apply_async):
+        task_manager = self._task_manager("job-1")
+        file_database = self._file_database(mock_bedrock, [_summary("job-1", "COMPLETE")])
+        file_database.search_data.side_effect = Exception("not indexed yet")
+
+        track_ingestion_jobs(delay=10)
+
+        task_manager.refresh_from_db()
+        self.assertEqual(task_manager.status, TaskManager.STATUS_PROCESSING)
+        mock_apply_async.assert_called_once_with(kwargs={"project_uuid": None, "delay": 20}, countdown=20)
+
+    @override_settings(AWS_BEDROCK_LARGE_DATASOURCE_ID="large-ds-id")
+    def test_only_tracks_jobs_of_its_own_data_source(self, mock_bedrock, mock_apply_async):
+        own = self._task_manager("job-1")
+        other = self._task_manager("job-2")
+        integrated = IntegratedIntelligenceFactory(intelligence=other.content_base_file.content_base.intelligence)
+        file_database = self._file_database(mock_bedrock, [_summary("job-1", "FAILED")])
+
+        with self.settings(PROJECTS_WITH_LARGE_DATASOURCE=[str(integrated.project.uuid)]):
+            track_ingestion_jobs()
+
+        own.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(own.status, TaskManager.STATUS_FAIL)
+        self.assertEqual(other.status, TaskManager.STATUS_PROCESSING)
+        file_database.iter_bedrock_ingestion_jobs.assert_called_once_with()
+        mock_apply_async.assert_not_called()
+
+    def test_keeps_polling_until_every_own_job_is_listed(self, mock_bedrock, mock_apply_async):
+        self._task_manager("job-1")
+        self._task_manager("job-2")
+        self._file_database(mock_bedrock, [_summary("job-1", "FAILED")])
+
+        track_ingestion_jobs()
+
+        mock_apply_async.assert_called_once_with(kwargs={"project_uuid": None, "delay": 10}, countdown=10)
+
+    def test_job_started_while_stopping_is_picked_up(self, mock_bedrock, mock_apply_async):
+        self._file_database(mock_bedrock, [_summary("old-job", "COMPLETE", minutes_ago=30)])
+        cache.add(self.lock_key, 1)
+
+        def sweep_then_schedule():
+            schedule_ingestion_tracker()
+            return iter([])
+
+        mock_bedrock.return_value.iter_bedrock_ingestion_jobs.side_effect = sweep_then_schedule
+
+        track_ingestion_jobs()
+
+        mock_apply_async.assert_called_once_with(kwargs={"project_uuid": None}, countdown=10)
+        self.assertEqual(cache.get(self.lock_key), 1)
+
+
+class IterBedrockIngestionJobsTestCase(SimpleTestCase):
+    def test_follows_next_token_newest_first(self):
+        bedrock = BedrockFileDatabase.__new__(BedrockFileDatabase)
+        bedrock.knowledge_base_id = "kb-id"
+        bedrock.data_source_id = "ds-id"
+        bedrock.bedrock_agent = MagicMock()
+        bedrock.bedrock_agent.list_ingestion_jobs.side_effect = [
+            {"ingestionJobSummaries": [{"ingestionJobId": "job-2"}], "nextToken": "page-2"},
+            {"ingestionJobSummaries": [{"ingestionJobId": "job-1"}]},
+        ]
+
+        jobs = [summary["ingestionJobId"] for summary in bedrock.iter_bedrock_ingestion_jobs(page_size=1)]
+
+        self.assertEqual(jobs, ["job-2", "job-1"])
+        bedrock.bedrock_agent.list_ingestion_jobs.assert_called_with(
+            dataSourceId="ds-id",
+            knowledgeBaseId="kb-id",
+            sortBy={"attribute": "STARTED_AT", "order": "DESCENDING"},
+            maxResults=1,
+            nextToken="page-2",
+        )
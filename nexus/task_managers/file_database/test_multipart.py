@@ -0,0 +1,133 @@
+import threading
+import time
+from io import BytesIO
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from nexus.task_managers.file_database.multipart import (
+    MAX_PART_SIZE,
+    MIN_PART_SIZE,
+    ConcurrentMultipartUploader,
+    choose_part_size,
+)
+
+MB = 1024 * 1024
+
+
+class FakeS3:
+    """Thread-safe stand-in for the multipart calls of an S3 client."""
+
+    def __init__(self, latency=0.0, failures=None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.lock = threading.Lock()
+        self.parts = {}
+        self.running = self.peak = 0
+        self.completed = None
+        self.aborted = False
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, PartNumber, UploadId, Body):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            failing = self.failures.get(PartNumber, 0)
+            if failing:
+                self.failures[PartNumber] = failing - 1
+        time.sleep(self.latency)
+        with self.lock:
+            self.running -= 1
+        if failing:
+            raise ConnectionError(f"part {PartNumber} reset")
+        self.parts[PartNumber] = Body
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = MultipartUpload["Parts"]
+        return {"Location": f"https://{Bucket}.s3.amazonaws.com/{Key}"}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+class ConcurrentMultipartUploaderTestCase(SimpleTestCase):
+    def _uploader(self, s3, **kwargs):
+        kwargs.setdefault("max_workers", 4)
+        kwargs.setdefault("max_retries", 2)
+        return ConcurrentMultipartUploader(s3, "bucket", "kb/file.pdf", retry_delay=0, **kwargs)
+
+    def test_parts_upload_concurrently_and_complete_in_order(self):
+        s3 = FakeS3(latency=0.02)
+        content = bytes(range(256)) * (40 * 1024)  # 10 MB
+
+        response = self._uploader(s3, part_size=1 * MB).upload(BytesIO(content))
+
+        self.assertEqual(response["Location"], "https://bucket.s3.amazonaws.com/kb/file.pdf")
+        self.assertEqual(s3.peak, 4)
+        self.assertEqual([part["PartNumber"] for part in s3.completed], list(range(1, 11)))
+        self.assertEqual(b"".join(s3.parts[number] for number in sorted(s3.parts)), content)
+        self.assertFalse(s3.aborted)
+
+    def test_in_flight_parts_are_bounded(self):
+        s3 = FakeS3(latency=0.01)
+        file = BytesIO(b"x" * (20 * MB))
+        reads_ahead = []
+        read = file.read
+
+        def tracking_read(size):
+            reads_ahead.append(len(reads_ahead) + 1 - len(s3.parts))
+            return read(size)
+
+        file.read = tracking_read
+
+        self._uploader(s3, max_workers=2, max_in_flight=3, part_size=1 * MB).upload(file)
+
+        self.assertLessEqual(max(reads_ahead), 3)
+
+    def test_failed_part_is_retried(self):
+        s3 = FakeS3(failures={2: 2})
+
+        self._uploader(s3, part_size=1 * MB).upload(BytesIO(b"y" * (3 * MB)))
+
+        self.assertEqual(sorted(s3.parts), [1, 2, 3])
+        self.assertFalse(s3.aborted)
+
+    def test_part_failing_after_retries_aborts_upload(self):
+        s3 = FakeS3(failures={2: 10})
+
+        with self.assertRaisesMessage(ConnectionError, "part 2 reset"):
+            self._uploader(s3, part_size=1 * MB).upload(BytesIO(b"z" * (8 * MB)))
+
+        self.assertTrue(s3.aborted)
+        self.assertIsNone(s3.completed)
+
+    def test_empty_file_uploads_one_empty_part(self):
+        s3 = FakeS3()
+
+        self._uploader(s3).upload(BytesIO(b""))
+
+        self.assertEqual(s3.completed, [{"PartNumber": 1, "ETag": '"etag-1"'}])
+
+    def test_abort_runs_when_complete_fails(self):
+        s3 = Mock(wraps=FakeS3())
+        s3.complete_multipart_upload.side_effect = RuntimeError("complete failed")
+
+        with self.assertRaises(RuntimeError):
+            self._uploader(s3, part_size=1 * MB).upload(BytesIO(b"a" * MB))
+
+        s3.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="kb/file.pdf", UploadId="upload-1")
+
+
+class ChoosePartSizeTestCase(SimpleTestCase):
+    def test_part_size_adapts_to_file_size(self):
+        self.assertEqual(choose_part_size(None, 4), MIN_PART_SIZE)
+        self.assertEqual(choose_part_size(2 * MB, 4), MIN_PART_SIZE)
+        self.assertEqual(choose_part_size(160 * MB, 4), 10 * MB)
+        self.assertEqual(choose_part_size(10 * 1024 * MB, 4), MAX_PART_SIZE)
+
+    def test_part_count_stays_within_s3_limit(self):
+        size = 1024 * 1024 * MB  # 1 TB
+        self.assertLessEqual(-(-size // choose_part_size(size, 4)), 10_000)
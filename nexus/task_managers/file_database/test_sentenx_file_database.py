@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from nexus.task_managers.file_database.sentenx_file_database import SentenXFileDataBase
+from nexus.task_managers.models import TaskManager
+from nexus.task_managers.tasks import add_files
+from nexus.usecases.intelligences.tests.intelligence_factory import ContentBaseLinkFactory
+from nexus.usecases.task_managers.celery_task_manager import CeleryTaskManagerUseCase
+
+
+class StubSentenX(ThreadingHTTPServer):
+    """Local SentenX stand-in that records concurrency and client connections."""
+
+    daemon_threads = True
+
+    def __init__(self, latency=0.0):
+        super().__init__(("127.0.0.1", 0), StubSentenXHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.bodies = []
+        self.connections = set()
+        self.running = self.peak = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StubSentenXHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle and delayed ACKs stall keep-alive clients.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_PUT(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.running += 1
+            server.peak = max(server.peak, server.running)
+            server.connections.add(self.client_address)
+            server.bodies.append(body)
+        time.sleep(server.latency)
+        with server.lock:
+            server.running -= 1
+
+        payload = json.dumps({"task_uuid": body["task_uuid"]}).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up waiting
+
+
+def _link_task(number):
+    return Mock(
+        uuid=f"task-{number}",
+        content_base_link=Mock(
+            link=f"https://example.com/{number}", uuid=f"link-{number}", content_base=Mock(uuid="cb")
+        ),
+    )
+
+
+class SentenXFileDataBaseTestCase(SimpleTestCase):
+    def _serve(self, latency=0.0):
+        server = StubSentenX(latency=latency)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_index_documents_bounds_concurrency_and_reuses_connections(self):
+        server = self._serve(latency=0.02)
+        tasks = [_link_task(number) for number in range(24)]
+
+        with override_settings(SENTENX_BASE_URL=server.url):
+            status_codes = SentenXFileDataBase().index_documents(tasks, "link", Mock(), max_workers=4)
+
+        self.assertEqual(status_codes, [200] * 24)
+        self.assertEqual(server.peak, 4)
+        self.assertLessEqual(len(server.connections), 4)
+        self.assertEqual(sorted(body["task_uuid"] for body in server.bodies), sorted(f"task-{n}" for n in range(24)))
+
+    def test_stalled_upstream_times_out_instead_of_hanging(self):
+        server = self._serve(latency=1.0)
+
+        with override_settings(SENTENX_BASE_URL=server.url, SENTENX_READ_TIMEOUT=0.1):
+            start = time.monotonic()
+            status_code, error = SentenXFileDataBase().add_link(_link_task(1), Mock())
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(status_code, 500)
+        self.assertIn("timed out", error)
+
+
+class AddFilesTaskTestCase(TestCase):
+    def test_batch_statuses_follow_index_results(self):
+        task_managers = [
+            CeleryTaskManagerUseCase().create_celery_link_manager(content_base_link=ContentBaseLinkFactory())
+            for _ in range(3)
+        ]
+
+        with patch.object(SentenXFileDataBase, "index_documents", return_value=[200, 500, 200]) as index_documents:
+            result = add_files([str(task_manager.uuid) for task_manager in task_managers], "link")
+
+        self.assertEqual(result, {"succeeded": 2, "failed": 1})
+        self.assertEqual([task.uuid for task in index_documents.call_args.args[0]], [t.uuid for t in task_managers])
+        statuses = [TaskManager.objects.get(pk=task_manager.pk).status for task_manager in task_managers]
+        self.assertEqual(statuses, [TaskManager.STATUS_SUCCESS, TaskManager.STATUS_FAIL, TaskManager.STATUS_SUCCESS])
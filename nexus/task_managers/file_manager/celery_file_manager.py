@@ -6,6 +6,7 @@ from rest_framework import status as http_status
 from nexus.projects.models import Project
 from nexus.task_managers import tasks, tasks_bedrock
 from nexus.task_managers.file_database.file_database import FileDataBase
+from nexus.task_managers.file_manager.claim_check import stash_upload
 from nexus.task_managers.tasks_bedrock import direct_ingest_batch_submit, trigger_bedrock_ingestion
 from nexus.usecases.intelligences.create import CreateContentBaseFileUseCase
 from nexus.usecases.intelligences.intelligences_dto import (
@@ -257,7 +258,7 @@ class CeleryFileManager:
         load_type: str = None,
         filename: str = None,
     ):
-        bytes_file = file.read()
+        claim_check = stash_upload(file, filename)
 
         content_base_file_dto = ContentBaseFileDTO(
             file=file,
@@ -278,12 +279,12 @@ class CeleryFileManager:
         if indexer_database == Project.BEDROCK:
             logger.info("Using BEDROCK for file upload")
             tasks_bedrock.bedrock_upload_file.delay(
-                bytes_file, content_base_uuid, user_email, str(content_base_file.uuid), filename=filename
+                claim_check, content_base_uuid, user_email, str(content_base_file.uuid), filename=filename
             )
             return {"uuid": str(content_base_file.uuid), "extension_file": extension_file}
 
         tasks.upload_file.delay(
-            bytes_file,
+            claim_check,
             content_base_uuid,
             extension_file,
             user_email,
@@ -302,7 +303,7 @@ class CeleryFileManager:
         load_type: str = None,
         filename: str = None,
     ):
-        bytes_file = file.read()
+        claim_check = stash_upload(file, filename)
 
         content_base_file_dto = ContentBaseFileDTO(
             file=file,
@@ -323,12 +324,12 @@ class CeleryFileManager:
         if indexer_database == Project.BEDROCK:
             logger.info("Using BEDROCK for inline file upload")
             tasks_bedrock.bedrock_upload_inline_file.delay(
-                bytes_file, content_base_uuid, user_email, str(content_base_file.uuid), filename=filename
+                claim_check, content_base_uuid, user_email, str(content_base_file.uuid), filename=filename
             )
             return {"uuid": str(content_base_file.uuid), "extension_file": extension_file}
 
         tasks.upload_sentenx_inline_file.delay(
-            bytes_file,
+            claim_check,
             content_base_uuid,
             extension_file,
             user_email,
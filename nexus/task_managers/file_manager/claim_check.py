@@ -0,0 +1,59 @@
+"""
+Claim-check hand-off of uploaded files from the web tier to Celery workers.
+
+The upload is streamed to the ``upload_claim_checks`` storage (S3 in
+production, any Django storage elsewhere) and only the stored name goes
+through the broker, so message size does not depend on the file size.
+"""
+
+import logging
+import uuid
+from contextlib import contextmanager
+from io import BytesIO
+from os.path import basename
+from typing import Iterator, Union
+
+from django.core.files.base import File
+from django.core.files.storage import storages
+
+logger = logging.getLogger(__name__)
+
+CLAIM_CHECK_STORAGE_ALIAS = "upload_claim_checks"
+
+
+def claim_check_storage():
+    return storages[CLAIM_CHECK_STORAGE_ALIAS]
+
+
+def stash_upload(file, filename: str) -> str:
+    """Stream ``file`` into claim-check storage in chunks and return its claim check."""
+    if hasattr(file, "seek"):
+        file.seek(0)
+    if not isinstance(file, File):
+        file = File(file)
+    name = f"{uuid.uuid4()}/{basename(filename)}"
+    return claim_check_storage().save(name, file)
+
+
+@contextmanager
+def claimed_upload(claim_check: Union[str, bytes], filename: str = "") -> Iterator[File]:
+    """
+    Open a stashed upload for reading and delete it once the block exits.
+
+    Raw bytes are still accepted so tasks enqueued before the claim-check
+    hand-off keep working while they drain from the queue.
+    """
+    if isinstance(claim_check, bytes):
+        yield File(BytesIO(claim_check), name=basename(filename))
+        return
+
+    storage = claim_check_storage()
+    file = storage.open(claim_check, "rb")
+    try:
+        yield file
+    finally:
+        file.close()
+        try:
+            storage.delete(claim_check)
+        except Exception as e:
+            logger.warning("Could not delete claim-checked upload %s: %s", claim_check, e)
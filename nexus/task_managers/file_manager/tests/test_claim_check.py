@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+from unittest.mock import Mock, patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.test import SimpleTestCase, override_settings
+
+from nexus.task_managers.file_database.s3_file_database import s3FileDatabase
+from nexus.task_managers.file_manager.celery_file_manager import CeleryFileManager
+from nexus.task_managers.file_manager.claim_check import claim_check_storage, claimed_upload, stash_upload
+
+MB = 1024 * 1024
+
+
+class ClaimCheckTestCase(SimpleTestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        storages = override_settings(
+            STORAGES={
+                "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+                "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+                "upload_claim_checks": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": self.location},
+                },
+            }
+        )
+        storages.enable()
+        self.addCleanup(storages.disable)
+
+    def test_round_trip_deletes_the_stashed_copy(self):
+        claim_check = stash_upload(SimpleUploadedFile("report.pdf", b"%PDF-1.4 content"), "report.pdf")
+
+        self.assertTrue(claim_check.endswith("/report.pdf"))
+        with claimed_upload(claim_check) as upload:
+            self.assertEqual(os.path.basename(upload.name), "report.pdf")
+            self.assertEqual(upload.read(), b"%PDF-1.4 content")
+        self.assertFalse(claim_check_storage().exists(claim_check))
+
+    def test_accepts_bytes_from_tasks_enqueued_before_the_claim_check(self):
+        with claimed_upload(b"legacy bytes", "legacy.txt") as upload:
+            self.assertEqual(upload.name, "legacy.txt")
+            self.assertEqual(upload.read(), b"legacy bytes")
+
+    @patch("nexus.task_managers.file_manager.celery_file_manager.ProjectsUseCase")
+    @patch("nexus.task_managers.file_manager.celery_file_manager.CreateContentBaseFileUseCase")
+    @patch("nexus.task_managers.file_manager.celery_file_manager.tasks.upload_file.delay")
+    def test_100mb_upload_enqueues_a_reference_with_bounded_memory(self, mock_delay, mock_create, mock_projects):
+        mock_create.return_value.create_content_base_file.return_value = Mock(uuid="file-uuid")
+        mock_projects.return_value.get_project_by_content_base_uuid.return_value = Mock(indexer_database="SENTENX")
+
+        with tempfile.TemporaryFile() as source:
+            source.truncate(100 * MB)
+            upload = UploadedFile(file=source, name="big.pdf", size=100 * MB)
+
+            tracemalloc.start()
+            CeleryFileManager().upload_file(upload, "cb-uuid", "pdf", "user@weni.ai", filename="big.pdf")
+            _, web_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        args, kwargs = mock_delay.call_args
+        self.assertLess(len(json.dumps([args, kwargs])), 512)
+        self.assertLess(web_peak, 8 * MB)
+
+        def drain(file, bucket, key):
+            while file.read(8 * MB):
+                pass
+
+        s3_client = Mock()
+        s3_client.upload_fileobj.side_effect = drain
+        with patch("nexus.task_managers.file_database.s3_file_database.boto3.client", return_value=s3_client):
+            tracemalloc.start()
+            with claimed_upload(args[0], "big.pdf") as stashed:
+                response = s3FileDatabase().add_file(stashed, "big.pdf")
+            _, worker_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        self.assertEqual(response.status, 0)
+        self.assertLess(worker_peak, 24 * MB)
+        self.assertFalse(claim_check_storage().exists(args[0]))
@@ -1,38 +1,60 @@
+from itertools import islice
+
+from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from nexus.intelligences.models import ContentBaseFile, ContentBaseLink, ContentBaseText
-from nexus.task_managers.tasks import add_file
+from nexus.task_managers.tasks import add_files
 from nexus.usecases.task_managers.celery_task_manager import CeleryTaskManagerUseCase
 
 
 class Command(BaseCommand):
     help = "Command to reindex all the content bases into sentenx"
 
-    def handle(self, *args, **options):
-        # Process ContentBaseFile objects
-        for cbf in ContentBaseFile.objects.filter(is_active=True):
-            self.stdout.write(self.style.WARNING(f"Queuing ContentBaseFile: {cbf.uuid}"))
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.SENTENX_INDEX_BATCH_SIZE,
+            help="Documents indexed per task",
+        )
+
+    def _queue_batches(self, objects, create_task_manager, file_type, batch_size, load_type=None):
+        iterator = objects.iterator()
+        while batch := list(islice(iterator, batch_size)):
+            task_manager_uuids = [str(create_task_manager(obj).uuid) for obj in batch]
+            self.stdout.write(self.style.WARNING(f"Queuing {len(batch)} {objects.model.__name__} objects"))
+            add_files.apply_async(args=[task_manager_uuids, file_type, load_type])
 
-            task_manager = CeleryTaskManagerUseCase().create_celery_task_manager(content_base_file=cbf)
-            add_file.apply_async(args=[str(task_manager.uuid), "file", "pdfminer"])
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        task_manager_usecase = CeleryTaskManagerUseCase()
 
+        # Process ContentBaseFile objects
+        self._queue_batches(
+            ContentBaseFile.objects.filter(is_active=True),
+            lambda cbf: task_manager_usecase.create_celery_task_manager(content_base_file=cbf),
+            "file",
+            batch_size,
+            load_type="pdfminer",
+        )
         self.stdout.write(self.style.SUCCESS("Finished queuing ContentBaseFile objects."))
 
         # Process ContentBaseLink objects
-        for cbl in ContentBaseLink.objects.filter(is_active=True):
-            self.stdout.write(self.style.WARNING(f"Queuing ContentBaseLink UUID: {cbl.uuid}"))
-
-            task_manager = CeleryTaskManagerUseCase().create_celery_link_manager(content_base_link=cbl)
-            add_file.apply_async(args=[str(task_manager.uuid), "link"])
-
+        self._queue_batches(
+            ContentBaseLink.objects.filter(is_active=True),
+            lambda cbl: task_manager_usecase.create_celery_link_manager(content_base_link=cbl),
+            "link",
+            batch_size,
+        )
         self.stdout.write(self.style.SUCCESS("Finished queuing ContentBaseLink objects."))
 
         # Process ContentBaseText objects
-        for cbt in ContentBaseText.objects.filter(is_active=True):
-            self.stdout.write(self.style.WARNING(f"Processing ContentBaseText UUID: {cbt.uuid}"))
-
-            task_manager = CeleryTaskManagerUseCase().create_celery_text_file_manager(content_base_text=cbt)
-            add_file.apply_async(args=[str(task_manager.uuid), "text"])
-
+        self._queue_batches(
+            ContentBaseText.objects.filter(is_active=True),
+            lambda cbt: task_manager_usecase.create_celery_text_file_manager(content_base_text=cbt),
+            "text",
+            batch_size,
+        )
         self.stdout.write(self.style.SUCCESS("Finished processing ContentBaseText objects."))
         self.stdout.write(self.style.SUCCESS("Successfully processed all active content base objects"))
@@ -1,9 +1,12 @@
 import logging
-from typing import Dict
+from typing import Dict, List
 
 import redis
+from celery.exceptions import SoftTimeLimitExceeded
 from django.conf import settings
 
+from nexus.analytics.conversation_facts import reconcile_recent_conversation_facts
+from nexus.analytics.latency_compaction import compact_recent_latency_rollups
 from nexus.celery import app
 from nexus.intelligences.models import (
     ContentBaseLink,
@@ -18,7 +21,8 @@ from nexus.task_managers.file_database.s3_file_database import s3FileDatabase
 from nexus.task_managers.file_database.sentenx_file_database import (
     SentenXFileDataBase,
 )
-from nexus.task_managers.models import ContentBaseFileTaskManager
+from nexus.task_managers.file_manager.claim_check import claimed_upload
+from nexus.task_managers.models import ContentBaseFileTaskManager, TaskManager
 from nexus.usecases.intelligences.get_by_uuid import get_by_contentbase_uuid
 from nexus.usecases.intelligences.intelligences_dto import (
     UpdateContentBaseFileDTO,
@@ -64,9 +68,40 @@ def add_file(task_manager_uuid: str, file_type: str, load_type: str = None) -> b
     return False
 
 
+@app.task
+def add_files(task_manager_uuids: List[str], file_type: str, load_type: str = None) -> Dict[str, int]:
+    """
+    Index a batch of documents of one type into SentenX.
+
+    Used by bulk reindexing: one task per batch instead of one per document,
+    with SENTENX_INDEX_CONCURRENCY requests in flight over a pooled session.
+    """
+    task_manager_usecase = CeleryTaskManagerUseCase()
+    task_managers = []
+    for task_manager_uuid in task_manager_uuids:
+        try:
+            task_managers.append(
+                task_manager_usecase.get_task_manager_by_uuid(task_uuid=task_manager_uuid, file_type=file_type)
+            )
+        except Exception as err:
+            logger.error("Error loading task manager %s: %s", task_manager_uuid, err, exc_info=True)
+
+    TaskManager.objects.filter(pk__in=[task_manager.pk for task_manager in task_managers]).update(
+        status=TaskManager.STATUS_LOADING
+    )
+
+    status_codes = SentenXFileDataBase().index_documents(task_managers, file_type, s3FileDatabase(), load_type)
+
+    succeeded = [task_manager.pk for task_manager, code in zip(task_managers, status_codes) if code == 200]
+    failed = [task_manager.pk for task_manager, code in zip(task_managers, status_codes) if code != 200]
+    TaskManager.objects.filter(pk__in=succeeded).update(status=TaskManager.STATUS_SUCCESS)
+    TaskManager.objects.filter(pk__in=failed).update(status=TaskManager.STATUS_FAIL)
+    return {"succeeded": len(succeeded), "failed": len(failed)}
+
+
 @app.task
 def upload_file(
-    file: bytes,
+    file: str,
     content_base_uuid: str,
     extension_file: str,
     user_email: str,
@@ -74,7 +109,8 @@ def upload_file(
     load_type: str = None,
     filename: str = None,
 ):
-    file_database_response = s3FileDatabase().add_file(file, filename)
+    with claimed_upload(file, filename) as upload:
+        file_database_response = s3FileDatabase().add_file(upload, filename)
 
     if file_database_response.status != 0:
         return {"task_status": ContentBaseFileTaskManager.STATUS_FAIL, "error": file_database_response.err}
@@ -105,7 +141,7 @@ def upload_file(
 
 @app.task
 def upload_sentenx_inline_file(
-    file: bytes,
+    file: str,
     content_base_uuid: str,
     extension_file: str,
     user_email: str,
@@ -113,7 +149,8 @@ def upload_sentenx_inline_file(
     load_type: str = None,
     filename: str = None,
 ):
-    file_database_response = s3FileDatabase().add_file(file, filename)
+    with claimed_upload(file, filename) as upload:
+        file_database_response = s3FileDatabase().add_file(upload, filename)
 
     if file_database_response.status != 0:
         return {"task_status": ContentBaseFileTaskManager.STATUS_FAIL, "error": file_database_response.err}
@@ -225,6 +262,16 @@ def delete_old_activities():
     usecase.delete_old_activities(months=3)
 
 
+@app.task(name="compact_inline_agent_latency_rollups")
+def compact_inline_agent_latency_rollups():
+    compact_recent_latency_rollups()
+
+
+@app.task(name="reconcile_conversation_facts")
+def reconcile_conversation_facts():
+    reconcile_recent_conversation_facts()
+
+
 @app.task(name="healthcheck")
 def update_healthcheck():
     notify = HealthCheck()
@@ -245,23 +292,42 @@ def delete_file_task(file_name):
 
 @app.task(
     name="generate_flows_report",
+    bind=True,
     soft_time_limit=7000,
     time_limit=7200,
+    max_retries=3,
 )
-def generate_flows_report(auth_token: str, start_date: str = None, end_date: str = None):
+def generate_flows_report(self, auth_token: str, start_date: str = None, end_date: str = None):
     alt_lock_key = "generate_flows_report_lock"
     lock_id = f"task_lock:{alt_lock_key}"
+    heartbeat_id = f"{lock_id}:heartbeat"
+    task_id = self.request.id
 
-    lock_acquired = REDIS_CLIENT.set(lock_id, "true", ex=LOCK_TIMEOUT, nx=True)
+    lock_acquired = REDIS_CLIENT.set(lock_id, task_id, ex=LOCK_TIMEOUT, nx=True)
 
-    if not lock_acquired:
+    # A retry re-enters its own lock only once the previous run stopped beating (it clears the beat on exit).
+    if not lock_acquired and (REDIS_CLIENT.get(lock_id) != task_id.encode() or REDIS_CLIENT.exists(heartbeat_id)):
         logger.info("Task generate_flows_report is already running. Skipping this execution.")
         return False
+
+    def heartbeat():
+        REDIS_CLIENT.set(heartbeat_id, task_id, ex=settings.FLOWS_REPORT_HEARTBEAT_TIMEOUT)
+        REDIS_CLIENT.expire(lock_id, LOCK_TIMEOUT)
+
+    heartbeat()
+    release_lock = True
     try:
         logger.info("Starting generate_flows_report")
-        result = get_flows_report(auth_token, start_date, end_date)
+        result = get_flows_report(auth_token, start_date, end_date, report_id=task_id, on_page=heartbeat)
         logger.info("generate_flows_report completed successfully")
         return result
+    except SoftTimeLimitExceeded as exc:
+        logger.warning("generate_flows_report hit its time limit, resuming from the last completed page")
+        release_lock = False
+        REDIS_CLIENT.expire(lock_id, LOCK_TIMEOUT)
+        REDIS_CLIENT.delete(heartbeat_id)
+        raise self.retry(exc=exc, countdown=0) from exc
     finally:
-        REDIS_CLIENT.delete(lock_id)
-        logger.info("Lock released for generate_flows_report")
+        if release_lock:
+            REDIS_CLIENT.delete(lock_id, heartbeat_id)
+            logger.info("Lock released for generate_flows_report")
@@ -1,21 +1,28 @@
 import logging
+from collections import defaultdict
+from datetime import timedelta
 from time import sleep
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
 from langchain_community.document_loaders import AsyncChromiumLoader
 from langchain_community.document_transformers import Html2TextTransformer
 
 from nexus.agents.models import Agent
+from nexus.cache import retrieval_cache
 from nexus.celery import app
-from nexus.intelligences.models import ContentBaseLink, ContentBaseText
+from nexus.intelligences.models import ContentBase, ContentBaseLink, ContentBaseText, IntegratedIntelligence
 from nexus.projects.models import Project
 from nexus.task_managers.file_database.bedrock import BedrockFileDatabase
+from nexus.task_managers.file_manager.claim_check import claimed_upload
 from nexus.task_managers.models import ContentBaseFileTaskManager, TaskManager
 from nexus.usecases.intelligences.intelligences_dto import UpdateContentBaseFileDTO
 from nexus.usecases.intelligences.update import UpdateContentBaseFileUseCase
 from nexus.usecases.task_managers.celery_task_manager import CeleryTaskManagerUseCase
+from nexus.utils import get_datasource_id, get_project_datasource_id
 
 logger = logging.getLogger(__name__)
 
@@ -54,61 +61,231 @@ def _get_task_manager_content_info(task_manager, file_type: str) -> tuple[str |
     return None, None
 
 
-@app.task
-def check_ingestion_job_status(
-    celery_task_manager_uuid: str,
-    ingestion_job_id: str,
-    waiting_time: int = 10,
-    file_type: str = "file",
-    project_uuid: str | None = None,
-):
-    if waiting_time:
-        sleep(waiting_time)
+INGESTION_JOB_RUNNING_STATUSES = {"STARTING", "IN_PROGRESS", "STOPPING"}
+INGESTION_JOB_FAILED_STATUSES = {"FAILED", "STOPPED"}
+INGESTION_TRACKER_CHILD_RELATIONS = {
+    "contentbasefiletaskmanager": "file",
+    "contentbasetexttaskmanager": "text",
+    "contentbaselinktaskmanager": "link",
+}
 
-    logger.info(f"🦑 BEDROCK: Checking Ingestion Job {ingestion_job_id} Status")
 
-    file_database = BedrockFileDatabase(project_uuid=project_uuid)
-    ingestion_job_status: str = file_database.get_bedrock_ingestion_status(ingestion_job_id)
-    status = TaskManager.status_map.get(ingestion_job_status)
+def _ingestion_tracker_keys(project_uuid: str | None) -> Tuple[str, str]:
+    key = f"bedrock_ingestion_tracker:{settings.AWS_BEDROCK_KNOWLEDGE_BASE_ID}:{get_datasource_id(project_uuid)}"
+    return f"{key}:lock", f"{key}:dirty"
 
-    task_manager_usecase = CeleryTaskManagerUseCase()
 
-    logger.info(f"🦑 BEDROCK: Ingestion Job {ingestion_job_id} Status: {ingestion_job_status}")
+def schedule_ingestion_tracker(project_uuid: str | None = None) -> None:
+    """
+    Make sure the ingestion tracker for the project's data source is running.
 
-    if ingestion_job_status not in ["COMPLETE", "FAILED"]:
-        task_manager_usecase.update_task_status(celery_task_manager_uuid, status, file_type)
-        check_ingestion_job_status.delay(
-            celery_task_manager_uuid, ingestion_job_id, file_type=file_type, project_uuid=project_uuid
+    The dirty flag is raised before trying the lock so a tracker that is
+    just about to stop sees it and keeps going.
+    """
+    lock_key, dirty_key = _ingestion_tracker_keys(project_uuid)
+    cache.set(dirty_key, 1, timeout=settings.BEDROCK_INGESTION_TRACKER_LOCK_TIMEOUT)
+    if cache.add(lock_key, 1, timeout=settings.BEDROCK_INGESTION_TRACKER_LOCK_TIMEOUT):
+        track_ingestion_jobs.apply_async(
+            kwargs={"project_uuid": project_uuid}, countdown=settings.BEDROCK_INGESTION_TRACKER_INITIAL_DELAY
         )
-    elif ingestion_job_status == "COMPLETE":
-        try:
-            task_manager = task_manager_usecase.get_task_manager_by_uuid(celery_task_manager_uuid, file_type)
 
-            content_base_uuid, _ = _get_task_manager_content_info(task_manager, file_type)
-            if not content_base_uuid:
-                return True
 
-            file_database.search_data(content_base_uuid=content_base_uuid, text="test", number_of_results=1)
-            logger.info(
-                f"🦑 BEDROCK: Knowledge base is accessible for content_base_uuid "
-                f"{content_base_uuid}, marking as success"
-            )
-            task_manager_usecase.update_task_status(celery_task_manager_uuid, status, file_type)
+def _outstanding_task_managers(data_source_id: str) -> Dict[str, List[TaskManager]]:
+    """Outstanding task managers grouped by ingestion job, limited to projects of ``data_source_id``."""
+    since = timezone.now() - timedelta(seconds=settings.BEDROCK_INGESTION_TRACKER_LOOKBACK_SECONDS)
+    task_managers = list(
+        TaskManager.objects.filter(
+            ingestion_job_id__isnull=False,
+            status__in=[TaskManager.STATUS_LOADING, TaskManager.STATUS_PROCESSING],
+            created_at__gte=since,
+        ).select_related(
+            "contentbasefiletaskmanager__content_base_file__content_base",
+            "contentbasetexttaskmanager__content_base_text__content_base",
+            "contentbaselinktaskmanager__content_base_link__content_base",
+        )
+    )
+    content_bases = {task_manager.pk: _task_manager_content_base(task_manager) for task_manager in task_managers}
+    projects = {
+        integrated.intelligence_id: integrated.project
+        for integrated in IntegratedIntelligence.objects.filter(
+            intelligence_id__in={
+                content_base.intelligence_id for content_base in content_bases.values() if content_base
+            }
+        ).select_related("project")
+    }
+
+    by_job = defaultdict(list)
+    for task_manager in task_managers:
+        content_base = content_bases[task_manager.pk]
+        project = projects.get(content_base.intelligence_id) if content_base else None
+        if get_project_datasource_id(project) == data_source_id:
+            by_job[task_manager.ingestion_job_id].append(task_manager)
+    return by_job
+
+
+def _task_manager_content_base(task_manager: TaskManager) -> ContentBase | None:
+    for relation, file_type in INGESTION_TRACKER_CHILD_RELATIONS.items():
+        child = getattr(task_manager, relation, None)
+        if child is not None:
+            content = getattr(child, f"content_base_{file_type}", None)
+            return content.content_base if content is not None else None
+    return None
+
+
+def _task_manager_content_base_uuid(task_manager: TaskManager) -> str | None:
+    for relation, file_type in INGESTION_TRACKER_CHILD_RELATIONS.items():
+        child = getattr(task_manager, relation, None)
+        if child is not None:
+            return _get_task_manager_content_info(child, file_type)[0]
+    return None
+
+
+def _list_ingestion_job_statuses(
+    file_database: BedrockFileDatabase, by_job: Dict[str, List[TaskManager]]
+) -> Tuple[Dict[str, str], bool]:
+    """Statuses of the outstanding jobs found in the data source, and whether any of its jobs is running."""
+    cutoff = min(
+        (task_manager.created_at for task_managers in by_job.values() for task_manager in task_managers),
+        default=timezone.now(),
+    ) - timedelta(minutes=1)
+
+    job_statuses = {}
+    running = False
+    for summary in file_database.iter_bedrock_ingestion_jobs():
+        running = running or summary["status"] in INGESTION_JOB_RUNNING_STATUSES
+        if summary["ingestionJobId"] in by_job:
+            job_statuses[summary["ingestionJobId"]] = summary["status"]
+        # Jobs are listed newest first and start after their task managers were created.
+        if len(job_statuses) == len(by_job) or summary["startedAt"] < cutoff:
+            break
+    return job_statuses, running
+
+
+def _settle_completed_task_managers(
+    file_database: BedrockFileDatabase,
+    completed_by_content_base: Dict[str | None, List[TaskManager]],
+    updates: Dict[str, List[int]],
+) -> bool:
+    """Mark completed task managers as successful once their content base is searchable; True if any must wait."""
+    pending = False
+    for content_base_uuid, task_managers in completed_by_content_base.items():
+        if content_base_uuid:
+            try:
+                file_database.search_data(
+                    content_base_uuid=content_base_uuid, text="test", number_of_results=1, use_cache=False
+                )
+            except Exception as e:
+                logger.warning(
+                    f"🦑 BEDROCK: Knowledge base not yet accessible for content_base_uuid {content_base_uuid}, "
+                    f"will retry. Error: {e}"
+                )
+                pending = True
+                updates[TaskManager.STATUS_PROCESSING].extend(
+                    task_manager.pk
+                    for task_manager in task_managers
+                    if task_manager.status != TaskManager.STATUS_PROCESSING
+                )
+                continue
+            retrieval_cache.invalidate(content_base_uuid)
+        updates[TaskManager.STATUS_SUCCESS].extend(task_manager.pk for task_manager in task_managers)
+    return pending
+
+
+def _sweep_ingestion_jobs(file_database: BedrockFileDatabase) -> Tuple[bool, bool]:
+    """
+    Check every outstanding ingestion job of the data source with one listing.
+
+    Returns ``(changed, pending)``: whether any task manager changed status,
+    and whether there is still something to wait for.
+    """
+    by_job = _outstanding_task_managers(file_database.data_source_id)
+    job_statuses, running = _list_ingestion_job_statuses(file_database, by_job)
+
+    updates = defaultdict(list)
+    # A job missing from the listing may not be visible yet; keep polling until the lookback drops it.
+    pending = running or len(job_statuses) < len(by_job)
+    completed_by_content_base = defaultdict(list)
+    for job_id, job_status in job_statuses.items():
+        for task_manager in by_job[job_id]:
+            if job_status == "COMPLETE":
+                completed_by_content_base[_task_manager_content_base_uuid(task_manager)].append(task_manager)
+                continue
+            if job_status in INGESTION_JOB_FAILED_STATUSES:
+                new_status = TaskManager.STATUS_FAIL
+            else:
+                pending = True
+                new_status = TaskManager.status_map.get(job_status, TaskManager.STATUS_PROCESSING)
+            if task_manager.status != new_status:
+                updates[new_status].append(task_manager.pk)
+
+    pending = _settle_completed_task_managers(file_database, completed_by_content_base, updates) or pending
+
+    now = timezone.now()
+    for new_status, pks in updates.items():
+        if pks:
+            TaskManager.objects.filter(pk__in=pks).update(status=new_status, end_at=now)
+
+    changed = any(updates.values())
+    logger.info(
+        "🦑 BEDROCK: Ingestion jobs swept",
+        extra={
+            "data_source_id": file_database.data_source_id,
+            "jobs": len(job_statuses),
+            "updated": {status: len(pks) for status, pks in updates.items() if pks},
+            "pending": pending,
+        },
+    )
+    return changed, pending
+
+
+@app.task
+def track_ingestion_jobs(project_uuid: str | None = None, delay: int | None = None):
+    """
+    Follow every outstanding ingestion job of one data source.
+
+    One tracker runs per data source, so polling scales with knowledge
+    bases rather than uploaded files. It reschedules itself with a delay that
+    doubles while nothing changes and resets when something does, and stops
+    once no job is running and no task manager is waiting.
+    """
+    lock_key, dirty_key = _ingestion_tracker_keys(project_uuid)
+    cache.touch(lock_key, settings.BEDROCK_INGESTION_TRACKER_LOCK_TIMEOUT)
+    cache.delete(dirty_key)
+
+    try:
+        changed, pending = _sweep_ingestion_jobs(BedrockFileDatabase(project_uuid=project_uuid))
+    except Exception as e:
+        logger.error(f"🦑 BEDROCK: Ingestion tracker sweep failed: {e}", exc_info=True)
+        changed, pending = False, True
+
+    if pending:
+        initial_delay = settings.BEDROCK_INGESTION_TRACKER_INITIAL_DELAY
+        if changed or delay is None:
+            delay = initial_delay
+        else:
+            delay = min(delay * 2, settings.BEDROCK_INGESTION_TRACKER_MAX_DELAY)
+        track_ingestion_jobs.apply_async(kwargs={"project_uuid": project_uuid, "delay": delay}, countdown=delay)
+        return True
+
+    cache.delete(lock_key)
+    # A job started between the sweep and the release above must not be left untracked.
+    if cache.get(dirty_key) and cache.add(lock_key, 1, timeout=settings.BEDROCK_INGESTION_TRACKER_LOCK_TIMEOUT):
+        track_ingestion_jobs.apply_async(
+            kwargs={"project_uuid": project_uuid}, countdown=settings.BEDROCK_INGESTION_TRACKER_INITIAL_DELAY
+        )
+    return True
 
-        except Exception as e:
-            logger.warning(f"🦑 BEDROCK: Knowledge base not yet accessible or data not indexed, will retry. Error: {e}")
-            processing_status = TaskManager.status_map.get("IN_PROGRESS")
-            task_manager_usecase.update_task_status(celery_task_manager_uuid, processing_status, file_type)
-            check_ingestion_job_status.delay(
-                celery_task_manager_uuid,
-                ingestion_job_id,
-                waiting_time=30,
-                file_type=file_type,
-                project_uuid=project_uuid,
-            )
-    elif ingestion_job_status == "FAILED":
-        task_manager_usecase.update_task_status(celery_task_manager_uuid, status, file_type)
 
+@app.task
+def check_ingestion_job_status(
+    celery_task_manager_uuid: str,
+    ingestion_job_id: str,
+    waiting_time: int = 10,
+    file_type: str = "file",
+    project_uuid: str | None = None,
+):
+    """Hand jobs queued before the tracker existed over to it."""
+    schedule_ingestion_tracker(project_uuid)
     return True
 
 
@@ -124,10 +301,11 @@ def _mark_direct_ingest_success(
     file_database: BedrockFileDatabase,
     content_base_uuid: str,
 ) -> bool:
-    file_database.search_data(content_base_uuid=content_base_uuid, text="test", number_of_results=1)
+    file_database.search_data(content_base_uuid=content_base_uuid, text="test", number_of_results=1, use_cache=False)
     logger.info(
         f"🦑 BEDROCK: Knowledge base is accessible for content_base_uuid " f"{content_base_uuid}, marking as success"
     )
+    retrieval_cache.invalidate(content_base_uuid)
     task_manager_usecase.update_task_status(celery_task_manager_uuid, TaskManager.status_map.get("COMPLETE"), file_type)
     return True
 
@@ -307,9 +485,66 @@ def direct_delete(content_base_uuid: str, filename: str, project_uuid: str | Non
     logger.info("🦑 BEDROCK: Direct deleting document from knowledge base")
     file_database = BedrockFileDatabase(project_uuid=project_uuid)
     file_database.direct_delete(content_base_uuid, filename)
+    _schedule_retrieval_release(content_base_uuid, project_uuid, filename=filename)
     return True
 
 
+DELETE_IN_PROGRESS_STATUSES = {"DELETING", "DELETE_IN_PROGRESS"}
+
+
+def _schedule_retrieval_release(
+    content_base_uuid: str,
+    project_uuid: str | None,
+    ingestion_job_id: str | None = None,
+    filename: str | None = None,
+    poll_count: int = 0,
+) -> None:
+    release_retrieval_hold.apply_async(
+        kwargs={
+            "content_base_uuid": content_base_uuid,
+            "project_uuid": project_uuid,
+            "ingestion_job_id": ingestion_job_id,
+            "filename": filename,
+            "poll_count": poll_count,
+        },
+        countdown=settings.RETRIEVAL_CACHE_DELETE_POLL_SECONDS,
+    )
+
+
+@app.task
+def release_retrieval_hold(
+    content_base_uuid: str,
+    project_uuid: str | None = None,
+    ingestion_job_id: str | None = None,
+    filename: str | None = None,
+    poll_count: int = 0,
+):
+    """
+    Release the retrieval cache hold taken when a document was deleted,
+    once the knowledge base stopped serving it: the post-delete ingestion job
+    finished, or the direct delete of ``filename`` is no longer in progress.
+    """
+    file_database = BedrockFileDatabase(project_uuid=project_uuid)
+    try:
+        if ingestion_job_id:
+            status = file_database.get_bedrock_ingestion_status(ingestion_job_id)
+            finished = status not in INGESTION_JOB_RUNNING_STATUSES
+        else:
+            documents = file_database.get_direct_ingest_document_status(content_base_uuid, filename)
+            finished = not any(document.get("status") in DELETE_IN_PROGRESS_STATUSES for document in documents)
+    except Exception as e:
+        logger.warning(f"🦑 BEDROCK: Could not check delete of content_base_uuid {content_base_uuid}: {e}")
+        finished = False
+
+    max_polls = settings.RETRIEVAL_CACHE_DELETE_HOLD_SECONDS // settings.RETRIEVAL_CACHE_DELETE_POLL_SECONDS
+    if finished or poll_count + 1 >= max_polls:
+        retrieval_cache.release(content_base_uuid)
+        return True
+
+    _schedule_retrieval_release(content_base_uuid, project_uuid, ingestion_job_id, filename, poll_count + 1)
+    return False
+
+
 @app.task
 def trigger_bedrock_ingestion(
     celery_task_manager_uuid: str,
@@ -327,6 +562,10 @@ def trigger_bedrock_ingestion(
         except Project.DoesNotExist:
             logger.warning(f"🦑 BEDROCK: Project {project_uuid} not found, using default ingestion strategy")
 
+    if post_delete and content_base_uuid:
+        # The knowledge base keeps serving the document until the delete is ingested.
+        retrieval_cache.hold(content_base_uuid, settings.RETRIEVAL_CACHE_DELETE_HOLD_SECONDS)
+
     if strategy == Project.BEDROCK_INGESTION_DIRECT:
         if post_delete:
             if content_base_uuid and filename:
@@ -336,16 +575,27 @@ def trigger_bedrock_ingestion(
         return direct_ingest.delay(celery_task_manager_uuid, file_type=file_type, project_uuid=project_uuid)
 
     return start_ingestion_job(
-        celery_task_manager_uuid, file_type=file_type, post_delete=post_delete, project_uuid=project_uuid
+        celery_task_manager_uuid,
+        file_type=file_type,
+        post_delete=post_delete,
+        project_uuid=project_uuid,
+        content_base_uuid=content_base_uuid,
     )
 
 
 @app.task
 def start_ingestion_job(
-    celery_task_manager_uuid: str, file_type: str = "file", post_delete: bool = False, project_uuid: str | None = None
+    celery_task_manager_uuid: str,
+    file_type: str = "file",
+    post_delete: bool = False,
+    project_uuid: str | None = None,
+    content_base_uuid: str | None = None,
 ):
     if not settings.BEDROCK_INGESTION_JOB_ENABLED:
         logger.warning("🦑 BEDROCK: Ingestion job disabled via BEDROCK_INGESTION_JOB_ENABLED")
+        if post_delete and content_base_uuid:
+            # No ingestion will run, so holding the cache would not make results any fresher.
+            retrieval_cache.release(content_base_uuid)
         if post_delete or not celery_task_manager_uuid:
             return
         CeleryTaskManagerUseCase().update_task_status(celery_task_manager_uuid, TaskManager.STATUS_FAIL, file_type)
@@ -359,11 +609,19 @@ def start_ingestion_job(
 
         if in_progress_ingestion_jobs:
             sleep(5)
-            return start_ingestion_job.delay(celery_task_manager_uuid, file_type=file_type, project_uuid=project_uuid)
+            return start_ingestion_job.delay(
+                celery_task_manager_uuid,
+                file_type=file_type,
+                post_delete=post_delete,
+                project_uuid=project_uuid,
+                content_base_uuid=content_base_uuid,
+            )
 
         ingestion_job_id: str = file_database.start_bedrock_ingestion()
 
         if post_delete:
+            if content_base_uuid:
+                _schedule_retrieval_release(content_base_uuid, project_uuid, ingestion_job_id=ingestion_job_id)
             return
 
         # TODO: USECASE
@@ -374,9 +632,7 @@ def start_ingestion_job(
 
         status = TaskManager.status_map.get("IN_PROGRESS")
         task_manager_usecase.update_task_status(celery_task_manager_uuid, status, file_type)
-        return check_ingestion_job_status.delay(
-            celery_task_manager_uuid, ingestion_job_id, file_type=file_type, project_uuid=project_uuid
-        )
+        return schedule_ingestion_tracker(project_uuid)
 
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConflictException":
@@ -384,20 +640,25 @@ def start_ingestion_job(
                 "🦑 BEDROCK: Filter didn't catch in progress Ingestion Job. " "Waiting to start new IngestionJob ..."
             )
             sleep(15)
-            return start_ingestion_job.delay(celery_task_manager_uuid, file_type=file_type, project_uuid=project_uuid)
+            return start_ingestion_job.delay(
+                celery_task_manager_uuid,
+                file_type=file_type,
+                post_delete=post_delete,
+                project_uuid=project_uuid,
+                content_base_uuid=content_base_uuid,
+            )
 
 
 @app.task
-def bedrock_upload_file(
-    file: bytes, content_base_uuid: str, user_email: str, content_base_file_uuid: str, filename: str
-):
+def bedrock_upload_file(file: str, content_base_uuid: str, user_email: str, content_base_file_uuid: str, filename: str):
     from nexus.usecases.projects.projects_use_case import ProjectsUseCase
 
     project = ProjectsUseCase().get_project_by_content_base_uuid(content_base_uuid)
     logger.info("🦑 BEDROCK: Task to Upload File")
 
     file_database = BedrockFileDatabase(project_uuid=str(project.uuid))
-    file_database_response = file_database.add_file(file, content_base_uuid, content_base_file_uuid)
+    with claimed_upload(file, filename) as upload:
+        file_database_response = file_database.add_file(upload, content_base_uuid, content_base_file_uuid)
 
     if file_database_response.status != 0:
         file_database.delete_file_and_metadata(content_base_uuid, file_database_response.file_name)
@@ -430,7 +691,7 @@ def bedrock_upload_file(
 
 @app.task
 def bedrock_upload_inline_file(
-    file: bytes, content_base_uuid: str, user_email: str, content_base_file_uuid: str, filename: str
+    file: str, content_base_uuid: str, user_email: str, content_base_file_uuid: str, filename: str
 ):
     from nexus.usecases.projects.projects_use_case import ProjectsUseCase
 
@@ -438,7 +699,8 @@ def bedrock_upload_inline_file(
 
     project = ProjectsUseCase().get_project_by_content_base_uuid(content_base_uuid)
     file_database = BedrockFileDatabase(project_uuid=str(project.uuid))
-    file_database_response = file_database.add_file(file, content_base_uuid, content_base_file_uuid)
+    with claimed_upload(file, filename) as upload:
+        file_database_response = file_database.add_file(upload, content_base_uuid, content_base_file_uuid)
 
     if file_database_response.status != 0:
         file_database.delete_file_and_metadata(content_base_uuid, file_database_response.file_name)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 import boto3
 import sentry_sdk
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 
 from nexus.internals.connect import ConnectRESTClient
@@ -17,8 +21,36 @@ from nexus.usecases.guardrails.bedrock_guardrail_pool import (
 
 _UNSET = object()
 _DEFAULT_BLOCKING_LANGUAGE = "pt-br"
+_VERDICT_CACHE_PREFIX = "guardrail_verdict"
 logger = logging.getLogger(__name__)
 
+# Shared per process: boto3 clients are thread-safe and creating one per call is expensive
+_runtime_client = None
+_runtime_client_lock = threading.Lock()
+_speculative_executor: ThreadPoolExecutor | None = None
+
+
+def get_bedrock_runtime_client():
+    """Get or create the shared bedrock-runtime client used for ApplyGuardrail."""
+    global _runtime_client
+    if _runtime_client is None:
+        with _runtime_client_lock:
+            if _runtime_client is None:
+                _runtime_client = boto3.client("bedrock-runtime", region_name=settings.AWS_BEDROCK_REGION_NAME)
+    return _runtime_client
+
+
+def _get_speculative_executor() -> ThreadPoolExecutor:
+    global _speculative_executor
+    if _speculative_executor is None:
+        with _runtime_client_lock:
+            if _speculative_executor is None:
+                _speculative_executor = ThreadPoolExecutor(
+                    max_workers=settings.GUARDRAILS_SPECULATIVE_MAX_WORKERS,
+                    thread_name_prefix="input_guardrail",
+                )
+    return _speculative_executor
+
 
 @dataclass(frozen=True)
 class GuardrailsConfigPayload:
@@ -277,6 +309,7 @@ class ProjectGuardrailsConfigUseCase:
         Returns the project effective blocking message on GUARDRAIL_INTERVENED (Option A).
         Returns None when the check is skipped or the input is allowed.
         Fail-open on AWS errors (log + Sentry).
+        Verdicts are cached for GUARDRAILS_VERDICT_CACHE_TTL per (guardrail, version, normalized text).
         """
         if not text or not text.strip():
             return None
@@ -293,25 +326,65 @@ class ProjectGuardrailsConfigUseCase:
             )
             return None
 
-        bedrock = client or boto3.client("bedrock-runtime", region_name=settings.AWS_BEDROCK_REGION_NAME)
-        try:
-            response = bedrock.apply_guardrail(
-                guardrailIdentifier=str(identifier),
-                guardrailVersion=str(version),
-                source="INPUT",
-                content=[{"text": {"text": text}}],
-            )
-        except Exception as exc:
-            logger.exception("ApplyGuardrail failed; allowing message (fail-open)")
-            sentry_sdk.capture_exception(exc)
-            return None
+        verdict_key = cls.verdict_cache_key(str(identifier), str(version), text)
+        intervened = cls._get_cached_verdict(verdict_key)
 
-        if response.get("action") != "GUARDRAIL_INTERVENED":
+        if intervened is None:
+            bedrock = client or get_bedrock_runtime_client()
+            try:
+                response = bedrock.apply_guardrail(
+                    guardrailIdentifier=str(identifier),
+                    guardrailVersion=str(version),
+                    source="INPUT",
+                    content=[{"text": {"text": text}}],
+                )
+            except Exception as exc:
+                logger.exception("ApplyGuardrail failed; allowing message (fail-open)")
+                sentry_sdk.capture_exception(exc)
+                return None
+
+            intervened = response.get("action") == "GUARDRAIL_INTERVENED"
+            cls._set_cached_verdict(verdict_key, intervened)
+
+        if not intervened:
             return None
 
         # Option A: ignore Bedrock canned outputs; use project effective message.
         return runtime_config.get("blocking_message") or cls.resolve_default_blocking_message()
 
+    @classmethod
+    def submit_input_guardrail(cls, text: str, runtime_config: dict | None) -> Future:
+        """
+        Start apply_input_guardrail in the background so generation can run in parallel.
+        The future resolves to the blocking message, or None when the input is allowed.
+        """
+        return _get_speculative_executor().submit(cls.apply_input_guardrail, text, runtime_config)
+
+    @staticmethod
+    def verdict_cache_key(identifier: str, version: str, text: str) -> str:
+        normalized = " ".join(text.split()).casefold()
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{_VERDICT_CACHE_PREFIX}:{identifier}:{version}:{digest}"
+
+    @classmethod
+    def _get_cached_verdict(cls, key: str) -> bool | None:
+        if settings.GUARDRAILS_VERDICT_CACHE_TTL <= 0:
+            return None
+        try:
+            return cache.get(key)
+        except Exception:
+            logger.warning("Guardrail verdict cache read failed", exc_info=True)
+            return None
+
+    @classmethod
+    def _set_cached_verdict(cls, key: str, intervened: bool) -> None:
+        if settings.GUARDRAILS_VERDICT_CACHE_TTL <= 0:
+            return
+        try:
+            cache.set(key, intervened, settings.GUARDRAILS_VERDICT_CACHE_TTL)
+        except Exception:
+            logger.warning("Guardrail verdict cache write failed", exc_info=True)
+
     @classmethod
     def update_config(
         cls,
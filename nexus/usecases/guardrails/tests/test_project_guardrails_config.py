@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import RequestFactory, TestCase, override_settings
 from rest_framework.request import Request
@@ -15,6 +16,7 @@ from nexus.usecases.users.tests.user_factory import UserFactory
 
 class ProjectGuardrailsConfigUseCaseTestCase(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.use_case = ProjectGuardrailsConfigUseCase()
         self._pool_patcher = patch(
             "nexus.usecases.guardrails.project_guardrails_config.BedrockGuardrailPoolService.get_or_create_pool",
@@ -464,6 +466,88 @@ class ProjectGuardrailsConfigUseCaseTestCase(TestCase):
             )
         self.assertIsNone(result)
 
+    @override_settings(AWS_BEDROCK_REGION_NAME="us-east-1")
+    def test_apply_input_guardrail_reuses_cached_verdict_for_normalized_text(self):
+        client = MagicMock()
+        client.apply_guardrail.return_value = {"action": "GUARDRAIL_INTERVENED"}
+        runtime_config = {
+            "has_blocked_category": True,
+            "guardrailIdentifier": "gr-1",
+            "guardrailVersion": "1",
+            "blocking_message": "Project refusal message",
+        }
+
+        first = ProjectGuardrailsConfigUseCase.apply_input_guardrail(
+            "Who should I vote for?", runtime_config, client=client
+        )
+        second = ProjectGuardrailsConfigUseCase.apply_input_guardrail(
+            "  who should I   VOTE for? ", runtime_config, client=client
+        )
+
+        self.assertEqual(first, "Project refusal message")
+        self.assertEqual(second, "Project refusal message")
+        client.apply_guardrail.assert_called_once()
+
+    @override_settings(AWS_BEDROCK_REGION_NAME="us-east-1")
+    def test_apply_input_guardrail_verdict_cache_is_scoped_by_version(self):
+        client = MagicMock()
+        client.apply_guardrail.return_value = {"action": "NONE"}
+        runtime_config = {"has_blocked_category": True, "guardrailIdentifier": "gr-1", "guardrailVersion": "1"}
+
+        ProjectGuardrailsConfigUseCase.apply_input_guardrail("Hello", runtime_config, client=client)
+        ProjectGuardrailsConfigUseCase.apply_input_guardrail(
+            "Hello", {**runtime_config, "guardrailVersion": "2"}, client=client
+        )
+
+        self.assertEqual(client.apply_guardrail.call_count, 2)
+
+    @override_settings(AWS_BEDROCK_REGION_NAME="us-east-1")
+    def test_apply_input_guardrail_does_not_cache_failures(self):
+        client = MagicMock()
+        client.apply_guardrail.side_effect = [Exception("throttled"), {"action": "GUARDRAIL_INTERVENED"}]
+        runtime_config = {
+            "has_blocked_category": True,
+            "guardrailIdentifier": "gr-1",
+            "guardrailVersion": "1",
+            "blocking_message": "Custom",
+        }
+
+        with patch("nexus.usecases.guardrails.project_guardrails_config.sentry_sdk.capture_exception"):
+            first = ProjectGuardrailsConfigUseCase.apply_input_guardrail("Hello", runtime_config, client=client)
+        second = ProjectGuardrailsConfigUseCase.apply_input_guardrail("Hello", runtime_config, client=client)
+
+        self.assertIsNone(first)
+        self.assertEqual(second, "Custom")
+
+    @override_settings(AWS_BEDROCK_REGION_NAME="us-east-1")
+    @patch("nexus.usecases.guardrails.project_guardrails_config.boto3.client")
+    def test_runtime_client_is_shared(self, mock_boto_client):
+        from nexus.usecases.guardrails import project_guardrails_config
+
+        with patch.object(project_guardrails_config, "_runtime_client", None):
+            first = project_guardrails_config.get_bedrock_runtime_client()
+            second = project_guardrails_config.get_bedrock_runtime_client()
+
+        self.assertIs(first, second)
+        mock_boto_client.assert_called_once_with("bedrock-runtime", region_name="us-east-1")
+
+    @override_settings(AWS_BEDROCK_REGION_NAME="us-east-1")
+    def test_submit_input_guardrail_resolves_to_blocking_message(self):
+        runtime_config = {
+            "has_blocked_category": True,
+            "guardrailIdentifier": "gr-1",
+            "guardrailVersion": "1",
+            "blocking_message": "Custom",
+        }
+        client = MagicMock()
+        client.apply_guardrail.return_value = {"action": "GUARDRAIL_INTERVENED"}
+
+        with patch(
+            "nexus.usecases.guardrails.project_guardrails_config.get_bedrock_runtime_client", return_value=client
+        ):
+            future = ProjectGuardrailsConfigUseCase.submit_input_guardrail("Who should I vote for?", runtime_config)
+            self.assertEqual(future.result(timeout=5), "Custom")
+
 
 class GuardrailsConfigAdminPermissionTestCase(TestCase):
     def setUp(self) -> None:
@@ -5,6 +5,8 @@ from typing import Dict, List, Optional, Tuple
 import boto3
 from django.conf import settings
 
+from nexus.usecases.inline_agents.lambda_deploy import code_sha256, wait_for_lambda_updated
+
 logger = logging.getLogger(__name__)
 
 APM_INSTRUMENTATION_ENABLED = "enabled"
@@ -223,8 +225,20 @@ class BedrockClient:
         return var_name in apm_var_names
 
     def _wait_for_function_updated(self, lambda_name: str) -> None:
-        waiter = self.lambda_client.get_waiter("function_updated")
-        waiter.wait(FunctionName=lambda_name, WaiterConfig={"Delay": 5, "MaxAttempts": 60})
+        wait_for_lambda_updated(self.lambda_client, lambda_name)
+
+    def _live_version_with_code(self, lambda_name: str, zip_content: bytes) -> Optional[str]:
+        """ARN of the version behind the ``live`` alias if it already runs ``zip_content`` with current settings."""
+        try:
+            live_config = self.lambda_client.get_function_configuration(FunctionName=lambda_name, Qualifier="live")
+        except self.lambda_client.exceptions.ResourceNotFoundException:
+            return None
+        if live_config.get("CodeSha256") != code_sha256(zip_content):
+            return None
+        if self._non_apm_configuration_changes(live_config, live_config.get("MemorySize", 128)):
+            return None
+        function_arn = live_config["FunctionArn"].removesuffix(":live")
+        return f"{function_arn}:{live_config['Version']}"
 
     def _read_lambda_configuration(self, lambda_name: str) -> Tuple[Dict, List[str], Dict[str, str], str, int]:
         current_config = self.lambda_client.get_function_configuration(FunctionName=lambda_name)
@@ -237,30 +251,31 @@ class BedrockClient:
         current_memory_size = current_config.get("MemorySize", 128)
         return current_config, current_layer_arns, existing_vars, current_architecture, current_memory_size
 
-    def _apply_non_apm_configuration_updates(
-        self,
-        lambda_name: str,
-        current_config: Dict,
-        current_memory_size: int,
-    ) -> None:
-        desired_memory_size = getattr(settings, "AWS_LAMBDA_MEMORY_SIZE", 512)
-
-        needs_update = False
-        update_config_params = {"FunctionName": lambda_name}
+    def _non_apm_configuration_changes(self, current_config: Dict, current_memory_size: int) -> Dict:
+        """Non-APM settings whose live value differs from the desired one, as update_function_configuration params."""
+        changes = {}
 
+        desired_memory_size = getattr(settings, "AWS_LAMBDA_MEMORY_SIZE", 512)
         if current_memory_size != desired_memory_size:
-            update_config_params["MemorySize"] = desired_memory_size
-            needs_update = True
+            changes["MemorySize"] = desired_memory_size
 
         desired_log_group = getattr(settings, "AWS_LAMBDA_LOG_GROUP", "")
         if desired_log_group:
             current_log_group = current_config.get("LoggingConfig", {}).get("LogGroup", "")
             if current_log_group != desired_log_group:
-                update_config_params["LoggingConfig"] = {"LogGroup": desired_log_group}
-                needs_update = True
+                changes["LoggingConfig"] = {"LogGroup": desired_log_group}
 
-        if needs_update:
-            self.lambda_client.update_function_configuration(**update_config_params)
+        return changes
+
+    def _apply_non_apm_configuration_updates(
+        self,
+        lambda_name: str,
+        current_config: Dict,
+        current_memory_size: int,
+    ) -> None:
+        changes = self._non_apm_configuration_changes(current_config, current_memory_size)
+        if changes:
+            self.lambda_client.update_function_configuration(FunctionName=lambda_name, **changes)
 
     def _apply_apm_configuration_before_publish(
         self,
@@ -339,7 +354,12 @@ class BedrockClient:
             apm_action,
         )
 
-        if use_apm is not None:
+        if use_apm is None:
+            unchanged_arn = self._live_version_with_code(lambda_name, zip_buffer.getvalue())
+            if unchanged_arn:
+                logger.info("Lambda code unchanged, skipping upload for %s", lambda_name)
+                return {"lambda": unchanged_arn}
+        else:
             self._apply_apm_configuration_before_publish(lambda_name, use_apm=use_apm, apm_action=apm_action)
 
         response = self.lambda_client.update_function_code(
@@ -0,0 +1,114 @@
+"""Helpers for deploying skill Lambdas: adaptive update polling, code hashing and a bounded deploy pool."""
+
+import base64
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class LambdaUpdateFailed(Exception):
+    """Raised when Lambda reports a failed update or the update does not finish in time."""
+
+
+def wait_for_lambda_updated(
+    lambda_client,
+    lambda_name: str,
+    *,
+    initial_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict:
+    """
+    Poll until the function's last update has finished and return its configuration.
+
+    Replaces the ``function_updated`` waiter (fixed 5s delay): the first check
+    runs immediately and the delay doubles from ``initial_delay`` up to
+    ``max_delay``, so quick updates return in well under a second.
+    """
+    delay = settings.INLINE_AGENT_LAMBDA_WAIT_INITIAL_DELAY if initial_delay is None else initial_delay
+    max_delay = settings.INLINE_AGENT_LAMBDA_WAIT_MAX_DELAY if max_delay is None else max_delay
+    timeout = settings.INLINE_AGENT_LAMBDA_WAIT_TIMEOUT if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+
+    while True:
+        config = lambda_client.get_function_configuration(FunctionName=lambda_name)
+        status = config.get("LastUpdateStatus", "Successful")
+        if status == "Successful":
+            return config
+        if status == "Failed":
+            raise LambdaUpdateFailed(f"Lambda {lambda_name} update failed: {config.get('LastUpdateStatusReason', '')}")
+        if time.monotonic() + delay > deadline:
+            raise LambdaUpdateFailed(f"Lambda {lambda_name} update did not finish within {timeout}s")
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+def code_sha256(zip_content: bytes) -> str:
+    """Hash in the format Lambda reports as ``CodeSha256``."""
+    return base64.b64encode(hashlib.sha256(zip_content).digest()).decode("ascii")
+
+
+@dataclass
+class LambdaDeployment:
+    name: str
+    deploy: Callable[[], Any]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def deploy_lambdas(
+    deployments: List[LambdaDeployment],
+    *,
+    max_workers: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    """
+    Run independent Lambda deployments on a bounded thread pool.
+
+    Returns ``{name: result}``. Progress events are reported from the calling
+    thread as deployments finish. Every deployment is allowed to finish before
+    the first failure (in submission order) is re-raised.
+    """
+    if not deployments:
+        return {}
+    max_workers = max_workers or settings.INLINE_AGENT_LAMBDA_DEPLOY_CONCURRENCY
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(deployments))) as executor:
+        futures = {executor.submit(_timed, deployment.deploy): deployment for deployment in deployments}
+        for done, future in enumerate(as_completed(futures), start=1):
+            deployment = futures[future]
+            try:
+                results[deployment.name], seconds = future.result()
+            except Exception as error:
+                errors[deployment.name] = error
+                logger.error(
+                    "Lambda deployment failed",
+                    extra={"lambda_name": deployment.name, "error": str(error)},
+                )
+                event = {"status": "failed", "error": str(error)}
+            else:
+                event = {"status": "deployed", "seconds": round(seconds, 2)}
+            if on_progress:
+                on_progress(
+                    {"lambda": deployment.name, "done": done, "total": len(deployments), **deployment.metadata, **event}
+                )
+
+    for deployment in deployments:
+        if deployment.name in errors:
+            raise errors[deployment.name]
+    return results
+
+
+def _timed(deploy: Callable[[], Any]):
+    started = time.monotonic()
+    return deploy(), time.monotonic() - started
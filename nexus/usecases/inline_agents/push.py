@@ -0,0 +1,92 @@
+"""
+Agent push shared by the synchronous view and the background push task.
+
+Background pushes publish their progress events to the cache under the job id
+so the web tier can serve them to a polling client without holding a worker.
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from nexus.events import notify_async
+from nexus.inline_agents.models import Agent
+from nexus.projects.models import Project
+from nexus.usecases.inline_agents.create import CreateAgentUseCase
+from nexus.usecases.inline_agents.update import UpdateAgentUseCase
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PREFIX = "inline_agents:push:"
+
+
+def existing_agents(agents: Dict, project: Project) -> Dict[str, Agent]:
+    found = {}
+    for key in agents:
+        agent = Agent.objects.filter(slug=key, project=project).first()
+        if agent is not None:
+            found[key] = agent
+    return found
+
+
+def push_agents(
+    agents: Dict,
+    project: Project,
+    files,
+    apm_instrumentation: str,
+    on_progress: Optional[Callable[[Dict], None]] = None,
+) -> None:
+    current_agents = existing_agents(agents, project)
+    agent_usecase = CreateAgentUseCase()
+    update_agent_usecase = UpdateAgentUseCase()
+    if on_progress:
+        agent_usecase.on_progress = update_agent_usecase.on_progress = lambda event: on_progress(
+            {"event": "lambda", **event}
+        )
+
+    for key in agents:
+        action = "update" if key in current_agents else "create"
+        if on_progress:
+            on_progress({"event": "agent", "agent": key, "action": action, "status": "started"})
+        if action == "update":
+            logger.info(f"Updating agent - key: {key}")
+            update_agent_usecase.update_agent(current_agents[key], agents[key], project, files, apm_instrumentation)
+        else:
+            logger.info(f"Creating agent - key: {key}")
+            agent_usecase.create_agent(key, agents[key], project, files, apm_instrumentation)
+        if on_progress:
+            on_progress({"event": "agent", "agent": key, "action": action, "status": "done"})
+
+    # Fire cache invalidation event for team update (agents are part of team) (async observer)
+    notify_async(
+        event="cache_invalidation:team",
+        project_uuid=str(project.uuid),
+    )
+
+
+def _key(job_id: str) -> str:
+    return f"{_CACHE_PREFIX}{job_id}"
+
+
+def start_push_job(job_id: str, owner: str) -> None:
+    cache.set(_key(job_id), {"owner": owner, "events": []}, settings.INLINE_AGENT_PUSH_PROGRESS_TTL)
+
+
+def record_push_event(job_id: str, event: Dict) -> None:
+    """Append a progress event. Only the push task writes to a job, so read-modify-write is safe."""
+    job = cache.get(_key(job_id))
+    if job is None:
+        logger.warning("Push job %s expired before its progress was recorded", job_id)
+        return
+    job["events"].append(event)
+    cache.set(_key(job_id), job, settings.INLINE_AGENT_PUSH_PROGRESS_TTL)
+
+
+def get_push_events(job_id: str, owner: str, since: int = 0) -> Optional[List[Dict]]:
+    """Events of ``job_id`` from index ``since``, or None when the job is unknown to ``owner``."""
+    job = cache.get(_key(job_id))
+    if job is None or job["owner"] != owner:
+        return None
+    return job["events"][since:]
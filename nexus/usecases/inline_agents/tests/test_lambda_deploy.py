@@ -0,0 +1,250 @@
+import threading
+import time
+from io import BytesIO
+from unittest.mock import Mock, patch
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from nexus.inline_agents.models import Agent
+from nexus.usecases.inline_agents.bedrock import BedrockClient
+from nexus.usecases.inline_agents.lambda_deploy import (
+    LambdaDeployment,
+    LambdaUpdateFailed,
+    code_sha256,
+    deploy_lambdas,
+    wait_for_lambda_updated,
+)
+from nexus.usecases.inline_agents.tools import ToolsUseCase
+from nexus.usecases.projects.tests.project_factory import ProjectFactory
+
+
+class WaitForLambdaUpdatedTestCase(TestCase):
+    def _client(self, *statuses):
+        lambda_client = Mock()
+        lambda_client.get_function_configuration.side_effect = [
+            {"LastUpdateStatus": status, "LastUpdateStatusReason": "bad handler"} for status in statuses
+        ]
+        return lambda_client
+
+    @patch("nexus.usecases.inline_agents.lambda_deploy.time.sleep")
+    def test_returns_without_sleeping_when_already_updated(self, mock_sleep):
+        config = wait_for_lambda_updated(self._client("Successful"), "tool-1")
+
+        self.assertEqual(config["LastUpdateStatus"], "Successful")
+        mock_sleep.assert_not_called()
+
+    @patch("nexus.usecases.inline_agents.lambda_deploy.time.sleep")
+    def test_backs_off_up_to_max_delay(self, mock_sleep):
+        lambda_client = self._client("InProgress", "InProgress", "InProgress", "InProgress", "Successful")
+
+        wait_for_lambda_updated(lambda_client, "tool-1", initial_delay=0.5, max_delay=1.5, timeout=60)
+
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.5, 1.0, 1.5, 1.5])
+
+    @patch("nexus.usecases.inline_agents.lambda_deploy.time.sleep")
+    def test_failed_update_raises(self, mock_sleep):
+        with self.assertRaisesMessage(LambdaUpdateFailed, "bad handler"):
+            wait_for_lambda_updated(self._client("InProgress", "Failed"), "tool-1", initial_delay=0.1)
+
+    @patch("nexus.usecases.inline_agents.lambda_deploy.time.sleep")
+    def test_timeout_raises(self, mock_sleep):
+        lambda_client = self._client(*["InProgress"] * 10)
+
+        with self.assertRaisesMessage(LambdaUpdateFailed, "did not finish"):
+            wait_for_lambda_updated(lambda_client, "tool-1", initial_delay=1, max_delay=1, timeout=0)
+
+
+class DeployLambdasTestCase(TestCase):
+    def test_runs_in_parallel_within_the_bound(self):
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+
+        def deploy(name):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+            return {"lambda": f"arn:{name}"}
+
+        deployments = [LambdaDeployment(name=f"tool-{i}", deploy=lambda i=i: deploy(i)) for i in range(6)]
+        events = []
+
+        results = deploy_lambdas(deployments, max_workers=3, on_progress=events.append)
+
+        self.assertEqual(results, {f"tool-{i}": {"lambda": f"arn:{i}"} for i in range(6)})
+        self.assertEqual(running["peak"], 3)
+        self.assertEqual([event["done"] for event in events], [1, 2, 3, 4, 5, 6])
+        self.assertTrue(all(event["status"] == "deployed" and event["total"] == 6 for event in events))
+
+    def test_failure_is_raised_after_every_deployment_finished(self):
+        finished = []
+
+        def ok(name):
+            time.sleep(0.02)
+            finished.append(name)
+            return name
+
+        def fail():
+            raise RuntimeError("upload failed")
+
+        deployments = [
+            LambdaDeployment(name="tool-0", deploy=lambda: ok("tool-0")),
+            LambdaDeployment(name="tool-1", deploy=fail, metadata={"action": "update"}),
+            LambdaDeployment(name="tool-2", deploy=lambda: ok("tool-2")),
+        ]
+        events = []
+
+        with self.assertRaisesMessage(RuntimeError, "upload failed"):
+            deploy_lambdas(deployments, max_workers=3, on_progress=events.append)
+
+        self.assertEqual(sorted(finished), ["tool-0", "tool-2"])
+        failed = [event for event in events if event["status"] == "failed"]
+        self.assertEqual(
+            failed,
+            [
+                {
+                    "lambda": "tool-1",
+                    "done": 1,
+                    "total": 3,
+                    "action": "update",
+                    "status": "failed",
+                    "error": "upload failed",
+                }
+            ],
+        )
+
+
+@override_settings(AWS_BEDROCK_REGION_NAME="us-east-1")
+class UpdateLambdaUnchangedCodeTestCase(TestCase):
+    def setUp(self):
+        self.client = BedrockClient()
+        self.client.lambda_client = Mock()
+        self.zip_content = b"mock zip content"
+
+    def test_skips_upload_when_live_version_runs_same_code(self):
+        self.client.lambda_client.get_function_configuration.return_value = {
+            "FunctionArn": "arn:aws:lambda:us-east-1:123456789012:function:tool-1:live",
+            "Version": "7",
+            "CodeSha256": code_sha256(self.zip_content),
+            "MemorySize": settings.AWS_LAMBDA_MEMORY_SIZE,
+        }
+
+        result = self.client.update_lambda_function("tool-1", BytesIO(self.zip_content))
+
+        self.assertEqual(result, {"lambda": "arn:aws:lambda:us-east-1:123456789012:function:tool-1:7"})
+        self.client.lambda_client.get_function_configuration.assert_called_once_with(
+            FunctionName="tool-1", Qualifier="live"
+        )
+        self.client.lambda_client.update_function_code.assert_not_called()
+
+    @override_settings(AWS_LAMBDA_LOG_GROUP="/aws/lambda/agents")
+    @patch.object(BedrockClient, "update_lambda_alias")
+    def test_redeploys_when_only_the_log_group_changed(self, mock_update_alias):
+        self.client.lambda_client.get_function_configuration.return_value = {
+            "FunctionArn": "arn:aws:lambda:us-east-1:123456789012:function:tool-1:live",
+            "Version": "7",
+            "CodeSha256": code_sha256(self.zip_content),
+            "MemorySize": settings.AWS_LAMBDA_MEMORY_SIZE,
+            "LoggingConfig": {"LogGroup": "/aws/lambda/tool-1"},
+            "Architectures": ["x86_64"],
+            "Layers": [],
+            "Environment": {"Variables": {}},
+        }
+        self.client.lambda_client.update_function_code.return_value = {
+            "Version": "8",
+            "FunctionArn": "arn:aws:lambda:us-east-1:123456789012:function:tool-1:8",
+        }
+
+        self.client.update_lambda_function("tool-1", BytesIO(self.zip_content))
+
+        self.client.lambda_client.update_function_configuration.assert_any_call(
+            FunctionName="tool-1", LoggingConfig={"LogGroup": "/aws/lambda/agents"}
+        )
+        mock_update_alias.assert_called_once_with("tool-1", "8")
+
+    @patch.object(BedrockClient, "update_lambda_alias")
+    def test_uploads_when_code_changed(self, mock_update_alias):
+        self.client.lambda_client.get_function_configuration.return_value = {
+            "FunctionArn": "arn:aws:lambda:us-east-1:123456789012:function:tool-1:live",
+            "Version": "7",
+            "CodeSha256": code_sha256(b"previous zip"),
+            "Architectures": ["x86_64"],
+            "Layers": [],
+            "Environment": {"Variables": {}},
+        }
+        self.client.lambda_client.update_function_code.return_value = {
+            "Version": "8",
+            "FunctionArn": "arn:aws:lambda:us-east-1:123456789012:function:tool-1:8",
+        }
+
+        self.client.update_lambda_function("tool-1", BytesIO(self.zip_content))
+
+        self.client.lambda_client.update_function_code.assert_called_once()
+        mock_update_alias.assert_called_once_with("tool-1", "8")
+
+
+class SlowLambdaClient:
+    def __init__(self):
+        self.lambda_client = Mock()
+        self.lock = threading.Lock()
+        self.running = self.peak = 0
+
+    def create_lambda_function(self, lambda_name, lambda_role, skill_handler, zip_buffer, apm_instrumentation=None):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return f"arn:{lambda_name}:{zip_buffer.getvalue().decode()}"
+
+
+@override_settings(INLINE_AGENT_LAMBDA_DEPLOY_CONCURRENCY=4)
+class HandleToolsTestCase(TestCase):
+    def setUp(self):
+        self.project = ProjectFactory()
+        self.agent = Agent.objects.create(
+            name="Tools Agent",
+            slug="tools-agent",
+            collaboration_instructions="",
+            project=self.project,
+            instruction="",
+            foundation_model="claude",
+        )
+
+    @patch("nexus.usecases.inline_agents.tools.FlowsRESTClient")
+    def test_tools_deploy_concurrently_and_keep_payload_order(self, mock_flows_client):
+        mock_flows_client.return_value.list_project_contact_fields.return_value = {"results": []}
+        tools = [
+            {
+                "key": f"tool_{i}",
+                "slug": f"tool-{i}",
+                "name": f"Tool {i}",
+                "source": {"entrypoint": "lambda_function.lambda_handler"},
+                "parameters": [],
+            }
+            for i in range(4)
+        ]
+        files = {f"tools-agent:tool_{i}": BytesIO(f"zip-{i}".encode()) for i in range(4)}
+        usecase = ToolsUseCase(agent_backend_client=SlowLambdaClient)
+        events = []
+        usecase.on_progress = events.append
+
+        with patch.object(type(self.agent.versions), "create") as mock_create_version:
+            usecase.handle_tools(self.agent, self.project, tools, files, str(self.project.uuid))
+
+        self.assertEqual(usecase.agent_backend_client.peak, 4)
+        version = mock_create_version.call_args.kwargs
+        self.assertEqual(
+            [skill["actionGroupExecutor"]["lambda"] for skill in version["skills"]],
+            [f"arn:tool_{i}-{self.agent.id}:zip-{i}" for i in range(4)],
+        )
+        self.assertEqual(
+            [skill["unique_name"] for skill in version["display_skills"]],
+            [f"tool_{i}-{self.agent.id}" for i in range(4)],
+        )
+        self.assertEqual(len(events), 4)
+        self.assertEqual({event["action"] for event in events}, {"create"})
@@ -3,6 +3,8 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 
 from nexus.usecases.inline_agents.typing import TypingUsecase
 
@@ -47,3 +49,69 @@ class TestTypingUsecase(TestCase):
             },
         }
         self.assertEqual(kwargs["json"], expected_body)
+
+    def test_send_typing_message_uses_pooled_session(self):
+        from nexus.usecases.inline_agents import typing as typing_module
+
+        self.assertIs(self.typing_usecase.auth_client.session, typing_module._session)
+
+
+class TestDispatchTypingMessage(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.typing_usecase = TypingUsecase()
+        self.typing_usecase.auth_client = MagicMock()
+        self.typing_usecase.auth_client.make_request_with_retry.return_value = MagicMock(status_code=200)
+        self.project_uuid = str(uuid.uuid4())
+
+    def _dispatch(self, contact_urn="whatsapp:+5511999999999", preview=False):
+        self.typing_usecase.dispatch_typing_message(
+            contact_urn=contact_urn,
+            msg_external_id="test-msg-id",
+            project_uuid=self.project_uuid,
+            preview=preview,
+        )
+
+    def test_dispatch_skips_preview(self):
+        self._dispatch(preview=True)
+
+        self.typing_usecase.auth_client.make_request_with_retry.assert_not_called()
+
+    def test_dispatch_coalesces_burst_for_same_contact(self):
+        self._dispatch()
+        self._dispatch()
+        self._dispatch()
+
+        self.assertEqual(self.typing_usecase.auth_client.make_request_with_retry.call_count, 1)
+
+    def test_dispatch_does_not_coalesce_different_contacts(self):
+        self._dispatch(contact_urn="whatsapp:+5511000000001")
+        self._dispatch(contact_urn="whatsapp:+5511000000002")
+
+        self.assertEqual(self.typing_usecase.auth_client.make_request_with_retry.call_count, 2)
+
+    @override_settings(TYPING_INDICATOR_COALESCE_SECONDS=0)
+    def test_dispatch_without_window_sends_every_time(self):
+        self._dispatch()
+        self._dispatch()
+
+        self.assertEqual(self.typing_usecase.auth_client.make_request_with_retry.call_count, 2)
+
+    @override_settings(TESTING=False)
+    @patch("nexus.usecases.inline_agents.typing._executor")
+    def test_dispatch_runs_off_the_caller_thread(self, mock_executor):
+        self._dispatch()
+
+        mock_executor.submit.assert_called_once()
+        self.typing_usecase.auth_client.make_request_with_retry.assert_not_called()
+
+    def test_failed_send_is_counted(self):
+        from nexus.usecases.inline_agents.typing import TYPING_OUTCOME_FAILED, typing_indicator_total
+
+        self.typing_usecase.auth_client.make_request_with_retry.side_effect = Exception("flows down")
+        failed = typing_indicator_total.labels(outcome=TYPING_OUTCOME_FAILED)
+        before = failed._value.get()
+
+        self._dispatch()
+
+        self.assertEqual(failed._value.get(), before + 1)
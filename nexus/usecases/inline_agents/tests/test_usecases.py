@@ -10,8 +10,12 @@ from django.utils.datastructures import MultiValueDict
 from nexus.inline_agents.models import Agent, IntegratedAgent
 from nexus.inline_agents.tests import MockBedrockClient
 from nexus.usecases.inline_agents.create import CreateAgentUseCase
-from nexus.usecases.inline_agents.update import invalidate_team_cache_for_agent_integration_projects
+from nexus.usecases.inline_agents.update import (
+    invalidate_integrated_team_caches,
+    invalidate_team_cache_for_agent_integration_projects,
+)
 from nexus.usecases.projects.tests.project_factory import ProjectFactory
+from router.repositories.mocks import MockCacheRepository
 
 
 class TestCreateAgentsUsecase(TestCase):
@@ -109,8 +113,9 @@ class TestCreateAgentsUsecase(TestCase):
 
 
 class TestInvalidateTeamCacheForAgentIntegrations(TestCase):
+    @patch("nexus.inline_agents.tasks.invalidate_integrated_team_caches_task.delay")
     @patch("nexus.usecases.inline_agents.update.notify_async")
-    def test_invalidates_owner_and_active_integrated_projects(self, mock_notify):
+    def test_refreshes_owner_and_enqueues_bulk_invalidation(self, mock_notify, mock_delay):
         owner_project = ProjectFactory(name="Owner", brain_on=True)
         consumer_project = ProjectFactory(name="Consumer", brain_on=True)
         agent = Agent.objects.create(
@@ -122,22 +127,20 @@ class TestInvalidateTeamCacheForAgentIntegrations(TestCase):
         )
         IntegratedAgent.objects.create(agent=agent, project=consumer_project, is_active=True)
 
-        invalidate_team_cache_for_agent_integration_projects(agent)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_team_cache_for_agent_integration_projects(agent)
 
-        self.assertEqual(mock_notify.call_count, 2)
-        called = {(c.kwargs["event"], c.kwargs["project_uuid"]) for c in mock_notify.call_args_list}
-        self.assertEqual(
-            called,
-            {
-                ("cache_invalidation:team", str(owner_project.uuid)),
-                ("cache_invalidation:team", str(consumer_project.uuid)),
-            },
+        mock_notify.assert_called_once_with(
+            event="cache_invalidation:team",
+            project_uuid=str(owner_project.uuid),
         )
+        mock_delay.assert_called_once_with(str(agent.uuid), exclude_project_uuid=str(owner_project.uuid))
 
-    @patch("nexus.usecases.inline_agents.update.notify_async")
-    def test_skips_inactive_integrations(self, mock_notify):
+    @patch("router.repositories.redis.cache.CacheRepository", MockCacheRepository)
+    @patch("router.services.cache_service.CacheService.invalidate_team_caches", autospec=True)
+    def test_bulk_invalidation_covers_active_integrations_in_chunks(self, mock_invalidate):
+        mock_invalidate.side_effect = lambda service, projects: len(projects)
         owner_project = ProjectFactory(name="Owner2", brain_on=True)
-        consumer_project = ProjectFactory(name="Consumer2", brain_on=True)
         agent = Agent.objects.create(
             name="Agent B",
             slug="agent-b",
@@ -145,11 +148,21 @@ class TestInvalidateTeamCacheForAgentIntegrations(TestCase):
             collaboration_instructions="y",
             project=owner_project,
         )
-        IntegratedAgent.objects.create(agent=agent, project=consumer_project, is_active=False)
+        IntegratedAgent.objects.create(agent=agent, project=owner_project, is_active=True)
+        active = [ProjectFactory(name=f"Consumer {i}", brain_on=True) for i in range(5)]
+        for project in active:
+            IntegratedAgent.objects.create(agent=agent, project=project, is_active=True)
+        IntegratedAgent.objects.create(agent=agent, project=ProjectFactory(name="Inactive"), is_active=False)
 
-        invalidate_team_cache_for_agent_integration_projects(agent)
+        invalidated = invalidate_integrated_team_caches(
+            str(agent.uuid), exclude_project_uuid=str(owner_project.uuid), chunk_size=2
+        )
 
-        mock_notify.assert_called_once_with(
-            event="cache_invalidation:team",
-            project_uuid=str(owner_project.uuid),
+        self.assertEqual(invalidated, 5)
+        chunks = [call.args[1] for call in mock_invalidate.call_args_list]
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            sorted(project_uuid for chunk in chunks for project_uuid, _ in chunk),
+            sorted(str(project.uuid) for project in active),
         )
+        self.assertTrue(all(backend == owner_project.agents_backend for chunk in chunks for _, backend in chunk))
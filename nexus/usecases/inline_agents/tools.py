@@ -1,6 +1,7 @@
 import logging
+from functools import partial
 from io import BytesIO
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from django.conf import settings
 
@@ -8,6 +9,7 @@ from nexus.inline_agents.models import Agent, ContactField
 from nexus.internals.flows import FlowsRESTClient
 from nexus.projects.models import Project
 from nexus.usecases.inline_agents.bedrock import APM_INSTRUMENTATION_UNCHANGED, BedrockClient
+from nexus.usecases.inline_agents.lambda_deploy import LambdaDeployment, ProgressCallback, deploy_lambdas
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,9 @@ class ToolsUseCase:
 
     TOOL_NAME_FORMAT = "{tool_key}-{agent_id}"
 
+    # Called with a progress event each time a tool Lambda finishes deploying
+    on_progress: Optional[ProgressCallback] = None
+
     def __init__(self, agent_backend_client=BedrockClient):
         self.agent_backend_client = agent_backend_client()
 
@@ -66,23 +71,6 @@ class ToolsUseCase:
 
         return lambda_arn
 
-    def create_tool(
-        self,
-        agent: Agent,
-        project: Project,
-        agent_tool: Dict,
-        tool_file,
-        tool_name: str,
-        apm_instrumentation: str = APM_INSTRUMENTATION_UNCHANGED,
-    ) -> Tuple[Dict, Dict]:
-        project_uuid = str(project.uuid)
-        action_group_executor: Dict[str, str] = self.create_lambda_function(
-            agent_tool, tool_file, project_uuid, tool_name, apm_instrumentation=apm_instrumentation
-        )
-        parameters: List[Dict] = self.handle_parameters(agent, project, agent_tool.get("parameters", []), project_uuid)
-        response = self._format_tool_response(agent_tool, tool_name, parameters, action_group_executor, str(agent.uuid))
-        return response
-
     def delete_tool(
         self, agent: Agent, project: Project, agent_tool: Dict, tool_file, tool_name: str
     ) -> Tuple[Dict, Dict]:
@@ -91,23 +79,6 @@ class ToolsUseCase:
         self.delete_lambda_function(tool_name)
         return
 
-    def update_tool(
-        self,
-        agent: Agent,
-        project: Project,
-        agent_tool: Dict,
-        tool_file,
-        tool_name: str,
-        apm_instrumentation: str = APM_INSTRUMENTATION_UNCHANGED,
-    ) -> Tuple[Dict, Dict]:
-        project_uuid = str(project.uuid)
-        action_group_executor = self.update_lambda_function(
-            agent_tool, tool_file, project_uuid, tool_name, apm_instrumentation=apm_instrumentation
-        )
-        parameters: List[Dict] = self.handle_parameters(agent, project, agent_tool.get("parameters", []), project_uuid)
-        response = self._format_tool_response(agent_tool, tool_name, parameters, action_group_executor, str(agent.uuid))
-        return response
-
     def create_contact_field(
         self, agent: Agent, project: Project, field_name: str, parameter: Dict, external_create: bool = True
     ):
@@ -235,27 +206,48 @@ class ToolsUseCase:
             skills_to_create = [skill for skill in new_skill_names if skill not in existing_skills]
             skills_to_update = [skill for skill in existing_skills if skill in new_skill_names]
 
+        # Lambda uploads are independent network calls, so they run on a bounded pool;
+        # parameters and contact fields are then handled in order on this thread.
+        deployments = []
+        deployed_tools = []
         for agent_skill in agent_tools:
             skill_name = self.TOOL_NAME_FORMAT.format(tool_key=agent_skill.get("key"), agent_id=agent.id)
             skill_file = files[f"{agent.slug}:{agent_skill['key']}"]
 
             if skill_name in skills_to_create:
                 logger.info("Creating tool", extra={"skill_name": skill_name})
-                skill_file = files[f"{agent.slug}:{agent_skill['key']}"]
-                tool, display_tool = self.create_tool(
-                    agent, project, agent_skill, skill_file, skill_name, apm_instrumentation=apm_instrumentation
-                )
-
-                new_agent_tools.append(tool)
-                new_agent_display_tools.append(display_tool)
-
+                action, deploy_lambda = "create", self.create_lambda_function
             elif skill_name in skills_to_update:
                 logger.info("Updating tool", extra={"skill_name": skill_name})
-                tool, display_tool = self.update_tool(
-                    agent, project, agent_skill, skill_file, skill_name, apm_instrumentation=apm_instrumentation
+                action, deploy_lambda = "update", self.update_lambda_function
+            else:
+                continue
+
+            deployments.append(
+                LambdaDeployment(
+                    name=skill_name,
+                    deploy=partial(
+                        deploy_lambda,
+                        agent_skill,
+                        BytesIO(skill_file.read()),
+                        project_uuid,
+                        skill_name,
+                        apm_instrumentation=apm_instrumentation,
+                    ),
+                    metadata={"agent": agent.slug, "tool": agent_skill.get("key"), "action": action},
                 )
-                new_agent_tools.append(tool)
-                new_agent_display_tools.append(display_tool)
+            )
+            deployed_tools.append((agent_skill, skill_name))
+
+        action_group_executors = deploy_lambdas(deployments, on_progress=self.on_progress)
+
+        for agent_tool, tool_name in deployed_tools:
+            parameters = self.handle_parameters(agent, project, agent_tool.get("parameters", []), project_uuid)
+            tool, display_tool = self._format_tool_response(
+                agent_tool, tool_name, parameters, action_group_executors[tool_name], str(agent.uuid)
+            )
+            new_agent_tools.append(tool)
+            new_agent_display_tools.append(display_tool)
 
         for skill_name in skills_to_delete:
             logger.info("Deleting tool", extra={"skill_name": skill_name})
@@ -1,15 +1,49 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
 from django.conf import settings
+from django.core.cache import cache
+from prometheus_client import Counter
+from requests.adapters import HTTPAdapter
 
 from nexus.internals import InternalAuthentication
 
 logger = logging.getLogger(__name__)
 
+TYPING_OUTCOME_SENT = "sent"
+TYPING_OUTCOME_FAILED = "failed"
+TYPING_OUTCOME_COALESCED = "coalesced"
+
+typing_indicator_total = Counter(
+    "nexus_typing_indicator_total",
+    "Typing indicators handled, by outcome",
+    ["outcome"],
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.TYPING_INDICATOR_MAX_WORKERS,
+    thread_name_prefix="typing_indicator",
+)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.TYPING_INDICATOR_MAX_WORKERS,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+
 
 class TypingUsecase:
     def __init__(self):
-        self.auth_client = InternalAuthentication()
+        self.auth_client = InternalAuthentication(session=_session)
 
     def send_typing_message(
         self,
@@ -36,13 +70,64 @@ class TypingUsecase:
         logger.debug(f"Sending typing indicator to {contact_urn}")
 
         try:
-            response = self.auth_client.make_request_with_retry(method="POST", url=url, json=body, timeout=10)
+            response = self.auth_client.make_request_with_retry(
+                method="POST", url=url, json=body, timeout=settings.TYPING_INDICATOR_TIMEOUT
+            )
 
             if not response.status_code == 200:
+                typing_indicator_total.labels(outcome=TYPING_OUTCOME_FAILED).inc()
                 logger.warning(f"Typing indicator failed with status {response.status_code}")
                 return
 
+            typing_indicator_total.labels(outcome=TYPING_OUTCOME_SENT).inc()
             logger.debug("Typing indicator sent successfully")
 
         except Exception as e:
+            typing_indicator_total.labels(outcome=TYPING_OUTCOME_FAILED).inc()
             logger.error(f"Failed to send typing indicator: {e}")
+
+    def dispatch_typing_message(
+        self,
+        contact_urn: str,
+        msg_external_id: str,
+        project_uuid: str,
+        preview: bool = False,
+    ):
+        """
+        Fire-and-forget variant of send_typing_message for the turn's critical path.
+        Bursts for the same contact are coalesced to one indicator per window.
+        """
+        if preview:
+            logger.debug("Skipping typing indicator for preview mode")
+            return
+
+        if getattr(settings, "TESTING", False):
+            self._send_coalesced(contact_urn, msg_external_id, project_uuid)
+            return
+
+        try:
+            _executor.submit(self._send_coalesced, contact_urn, msg_external_id, project_uuid)
+        except RuntimeError as e:
+            typing_indicator_total.labels(outcome=TYPING_OUTCOME_FAILED).inc()
+            logger.error(f"Failed to dispatch typing indicator: {e}")
+
+    def _send_coalesced(self, contact_urn: str, msg_external_id: str, project_uuid: str):
+        window = settings.TYPING_INDICATOR_COALESCE_SECONDS
+        if window > 0:
+            key = f"typing_indicator:{project_uuid}:{contact_urn}"
+            try:
+                acquired = cache.add(key, 1, timeout=window)
+            except Exception as e:
+                logger.warning(f"Typing indicator coalescing unavailable: {e}")
+                acquired = True
+
+            if not acquired:
+                typing_indicator_total.labels(outcome=TYPING_OUTCOME_COALESCED).inc()
+                logger.debug(f"Typing indicator coalesced for {contact_urn}")
+                return
+
+        self.send_typing_message(
+            contact_urn=contact_urn,
+            msg_external_id=msg_external_id,
+            project_uuid=project_uuid,
+        )
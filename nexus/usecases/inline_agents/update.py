@@ -1,5 +1,9 @@
 import logging
-from typing import Dict
+from itertools import islice
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
 
 from nexus.agents.encryption import encrypt_value
 from nexus.events import notify_async
@@ -26,19 +30,56 @@ def invalidate_team_cache_for_agent_integration_projects(agent: Agent) -> None:
     """Invalidate router team cache for the agent's owner project and all active integrations.
 
     Shared official agents are updated once in the DB; each consuming project has its own
-    Redis team (and composite) keys. Push previously only cleared the pushed project.
+    Redis team (and composite) keys. The owner project is refreshed right away; the
+    integrated projects, which can number in the thousands for official agents, are
+    dropped in bulk by a Celery task so the editing request does constant work.
     """
-    project_uuids: set[str] = set()
+    owner_project_uuid = None
     if agent.project_id:
-        project_uuids.add(str(agent.project.uuid))
-    for pu in IntegratedAgent.objects.filter(agent=agent, is_active=True).values_list("project__uuid", flat=True):
-        project_uuids.add(str(pu))
-    for project_uuid in project_uuids:
+        owner_project_uuid = str(agent.project.uuid)
         notify_async(
             event="cache_invalidation:team",
-            project_uuid=project_uuid,
+            project_uuid=owner_project_uuid,
         )
 
+    from nexus.inline_agents.tasks import invalidate_integrated_team_caches_task
+
+    agent_uuid = str(agent.uuid)
+
+    def enqueue() -> None:
+        invalidate_integrated_team_caches_task.delay(agent_uuid, exclude_project_uuid=owner_project_uuid)
+
+    transaction.on_commit(enqueue)
+
+
+def invalidate_integrated_team_caches(
+    agent_uuid: str, exclude_project_uuid: Optional[str] = None, chunk_size: Optional[int] = None
+) -> int:
+    """Drop team caches of every project with an active integration of the agent. Returns projects touched."""
+    from router.services.cache_service import CacheService
+
+    chunk_size = chunk_size or settings.TEAM_CACHE_INVALIDATION_CHUNK_SIZE
+    integrations = IntegratedAgent.objects.filter(agent__uuid=agent_uuid, is_active=True)
+    if exclude_project_uuid:
+        integrations = integrations.exclude(project__uuid=exclude_project_uuid)
+    projects = (
+        (str(project_uuid), agents_backend)
+        for project_uuid, agents_backend in integrations.values_list("project__uuid", "project__agents_backend")
+        .order_by()
+        .iterator(chunk_size=chunk_size)
+    )
+
+    cache_service = CacheService()
+    invalidated = 0
+    while chunk := list(islice(projects, chunk_size)):
+        invalidated += cache_service.invalidate_team_caches(chunk)
+
+    logger.info(
+        "Invalidated team caches for agent integrations",
+        extra={"agent_uuid": agent_uuid, "projects": invalidated},
+    )
+    return invalidated
+
 
 class UpdateAgentUseCase(ToolsUseCase, InstructionsUseCase):
     def __init__(self, agent_backend_client=BedrockClient):
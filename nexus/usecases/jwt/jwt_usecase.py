@@ -1,25 +1,70 @@
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Hashable, Tuple
 
 import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from django.conf import settings
 
+TOKEN_LIFETIME = timedelta(hours=1)
+
+_signed_tokens: Dict[Hashable, Tuple[str, float]] = {}
+_signed_tokens_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_signing_key(pem: str):
+    """Parsing and validating a PEM key costs far more than signing with it, so do it once."""
+    try:
+        return load_pem_private_key(pem.encode(), password=None)
+    except (ValueError, TypeError):
+        return pem
+
+
+def clear_jwt_token_cache() -> None:
+    with _signed_tokens_lock:
+        _signed_tokens.clear()
+
 
 class JWTUsecase:
-    def generate_jwt_token(self, project_uuid: str):
+    """
+    Mints the JWTs handed to tools and broadcasts.
+
+    Signed tokens are cached per process and per claim set, and reused until
+    JWT_TOKEN_REUSE_MARGIN_SECONDS before they expire, so a turn does not pay
+    for a private-key signature every time.
+    """
+
+    def _encode(self, claims: Dict) -> str:
+        now = datetime.now(timezone.utc)
         payload = {
-            "project_uuid": project_uuid,
-            "exp": datetime.now(timezone.utc) + timedelta(hours=1),
-            "iat": datetime.now(timezone.utc),
+            **claims,
+            "exp": now + TOKEN_LIFETIME,
+            "iat": now,
         }
-        token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm="RS256")
+        signing_key = _load_signing_key(settings.JWT_SECRET_KEY)
+        return jwt.encode(payload, signing_key, algorithm=settings.JWT_SIGNING_ALGORITHM)
+
+    def _get_or_sign(self, claims: Dict) -> str:
+        cache_key = (settings.JWT_SIGNING_ALGORITHM, tuple(sorted(claims.items())))
+        now = time.time()
+
+        cached = _signed_tokens.get(cache_key)
+        if cached and now < cached[1]:
+            return cached[0]
+
+        token = self._encode(claims)
+        reuse_until = now + TOKEN_LIFETIME.total_seconds() - settings.JWT_TOKEN_REUSE_MARGIN_SECONDS
+        with _signed_tokens_lock:
+            if cache_key not in _signed_tokens and len(_signed_tokens) >= settings.JWT_TOKEN_CACHE_MAX_ENTRIES:
+                _signed_tokens.pop(next(iter(_signed_tokens)))
+            _signed_tokens[cache_key] = (token, reuse_until)
         return token
 
+    def generate_jwt_token(self, project_uuid: str):
+        return self._get_or_sign({"project_uuid": project_uuid})
+
     def generate_broadcast_jwt_token(self):
-        oidc_email = settings.OIDC_RP_EMAIL
-        payload = {
-            "email": oidc_email,
-            "exp": datetime.now(timezone.utc) + timedelta(hours=1),
-            "iat": datetime.now(timezone.utc),
-        }
-        token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm="RS256")
-        return token
+        return self._get_or_sign({"email": settings.OIDC_RP_EMAIL})
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.test import SimpleTestCase, override_settings
+
+from nexus.usecases.jwt.jwt_usecase import JWTUsecase, clear_jwt_token_cache
+
+
+def _pem_pair(private_key):
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+RSA_PRIVATE, RSA_PUBLIC = _pem_pair(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+ED25519_PRIVATE, ED25519_PUBLIC = _pem_pair(ed25519.Ed25519PrivateKey.generate())
+
+
+@override_settings(JWT_SECRET_KEY=RSA_PRIVATE, JWT_SIGNING_ALGORITHM="RS256")
+class JWTUsecaseTestCase(SimpleTestCase):
+    def setUp(self):
+        clear_jwt_token_cache()
+        self.usecase = JWTUsecase()
+
+    def test_token_is_reused_for_same_project(self):
+        with patch("nexus.usecases.jwt.jwt_usecase.jwt.encode", wraps=jwt.encode) as mock_encode:
+            first = self.usecase.generate_jwt_token("project-1")
+            second = JWTUsecase().generate_jwt_token("project-1")
+
+        self.assertEqual(first, second)
+        mock_encode.assert_called_once()
+
+    def test_tokens_are_scoped_per_project(self):
+        first = self.usecase.generate_jwt_token("project-1")
+        second = self.usecase.generate_jwt_token("project-2")
+
+        self.assertNotEqual(first, second)
+        payload = jwt.decode(second, RSA_PUBLIC, algorithms=["RS256"])
+        self.assertEqual(payload["project_uuid"], "project-2")
+
+    @override_settings(JWT_TOKEN_REUSE_MARGIN_SECONDS=3600)
+    def test_token_is_resigned_inside_reuse_margin(self):
+        with patch("nexus.usecases.jwt.jwt_usecase.jwt.encode", wraps=jwt.encode) as mock_encode:
+            self.usecase.generate_jwt_token("project-1")
+            self.usecase.generate_jwt_token("project-1")
+
+        self.assertEqual(mock_encode.call_count, 2)
+
+    @override_settings(JWT_TOKEN_CACHE_MAX_ENTRIES=2)
+    def test_cache_is_bounded(self):
+        from nexus.usecases.jwt import jwt_usecase
+
+        for project in ("project-1", "project-2", "project-3"):
+            self.usecase.generate_jwt_token(project)
+
+        self.assertEqual(len(jwt_usecase._signed_tokens), 2)
+
+    def test_broadcast_token_is_cached(self):
+        self.assertEqual(self.usecase.generate_broadcast_jwt_token(), self.usecase.generate_broadcast_jwt_token())
+
+    @override_settings(JWT_SECRET_KEY=ED25519_PRIVATE, JWT_SIGNING_ALGORITHM="EdDSA")
+    def test_eddsa_signing(self):
+        token = self.usecase.generate_jwt_token("project-1")
+
+        self.assertEqual(jwt.get_unverified_header(token)["alg"], "EdDSA")
+        payload = jwt.decode(token, ED25519_PUBLIC, algorithms=["EdDSA"])
+        self.assertEqual(payload["project_uuid"], "project-1")
@@ -3,19 +3,19 @@ import logging
 import pendulum
 
 from nexus.logs.models import Message, RecentActivities
+from nexus.usecases.logs.retention import RetentionDeleter, RetentionResult
 
 logger = logging.getLogger(__name__)
 
 
 class DeleteLogUsecase:
-    def delete_logs_routine(self, **kwargs) -> None:
-        datetime = pendulum.now().subtract(**kwargs).date()
-        logs = Message.objects.filter(created_at__date__lte=datetime)
-        logs.delete()
+    def delete_logs_routine(self, **kwargs) -> RetentionResult:
+        # Everything up to the end of the cutoff day, as a range the created_at index can serve.
+        cutoff = pendulum.now().subtract(**kwargs).add(days=1).start_of("day")
+        return RetentionDeleter(Message, cutoff).run()
 
-    def delete_old_activities(self, **kwargs) -> None:
-        datetime = pendulum.now().subtract(**kwargs).date()
-        old_activities = RecentActivities.objects.filter(created_at__lt=datetime)
-        count = old_activities.count()
-        old_activities.delete()
-        logger.info("Deleted old RecentActivities", extra={"count": count})
+    def delete_old_activities(self, **kwargs) -> RetentionResult:
+        cutoff = pendulum.now().subtract(**kwargs).start_of("day")
+        result = RetentionDeleter(RecentActivities, cutoff).run()
+        logger.info("Deleted old RecentActivities", extra={"count": result.deleted})
+        return result
@@ -0,0 +1,148 @@
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, models, transaction
+from django.utils.dateparse import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+@dataclass
+class RetentionResult:
+    table: str
+    deleted: int
+    batches: int
+    seconds: float
+    completed: bool
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.deleted / self.seconds, 2) if self.seconds > 0 else float(self.deleted)
+
+
+class RetentionDeleter:
+    """
+    Deletes rows older than ``cutoff`` in bounded batches.
+
+    Each batch selects up to ``batch_size`` primary keys with a range
+    predicate on ``created_at`` (so the created_at index is used), deletes
+    the rows that cascade from them with plain ``DELETE ... WHERE fk IN``,
+    then the rows themselves, and commits. Nothing is loaded through
+    Django's delete collector and no transaction outlives a batch.
+
+    The created_at of the last deleted row is kept in the cache, so the next
+    batch (or the next run, after an interruption or ``max_seconds``) starts
+    its index range scan there instead of walking dead index entries again.
+    """
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        cutoff: datetime,
+        *,
+        batch_size: Optional[int] = None,
+        sleep_seconds: Optional[float] = None,
+        max_seconds: Optional[float] = None,
+    ):
+        self.model = model
+        self.cutoff = cutoff
+        self.batch_size = batch_size or settings.LOG_RETENTION_BATCH_SIZE
+        self.sleep_seconds = settings.LOG_RETENTION_BATCH_SLEEP_SECONDS if sleep_seconds is None else sleep_seconds
+        self.max_seconds = settings.LOG_RETENTION_MAX_SECONDS if max_seconds is None else max_seconds
+        self.cascades = self._cascade_targets(model)
+        self.checkpoint_key = f"retention_checkpoint:{model._meta.db_table}"
+
+    @staticmethod
+    def _cascade_targets(model: Type[models.Model]) -> List[Tuple[str, str]]:
+        targets = []
+        for relation in model._meta.related_objects:
+            if relation.on_delete is not models.CASCADE:
+                raise ValueError(
+                    f"{model.__name__} has a non-cascading relation from {relation.related_model.__name__}"
+                )
+            if relation.related_model._meta.related_objects:
+                raise ValueError(f"Nested cascades from {relation.related_model.__name__} are not supported")
+            targets.append((relation.related_model._meta.db_table, relation.field.column))
+        return targets
+
+    def _load_checkpoint(self) -> Optional[datetime]:
+        value = cache.get(self.checkpoint_key)
+        checkpoint = parse_datetime(value) if value else None
+        if checkpoint is not None and checkpoint < self.cutoff:
+            return checkpoint
+        return None
+
+    def _next_batch(self, checkpoint: Optional[datetime]) -> List[Tuple]:
+        queryset = self.model.objects.filter(created_at__lt=self.cutoff)
+        if checkpoint is not None:
+            queryset = queryset.filter(created_at__gte=checkpoint)
+        return list(queryset.order_by("created_at").values_list("pk", "created_at")[: self.batch_size])
+
+    def _delete_batch(self, pks: List) -> int:
+        placeholders = ", ".join(["%s"] * len(pks))
+        params = [self.model._meta.pk.get_db_prep_value(pk, connection) for pk in pks]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        pk_column = connection.ops.quote_name(self.model._meta.pk.column)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for cascade_table, fk_column in self.cascades:
+                cursor.execute(
+                    f"DELETE FROM {connection.ops.quote_name(cascade_table)} "
+                    f"WHERE {connection.ops.quote_name(fk_column)} IN ({placeholders})",
+                    params,
+                )
+            cursor.execute(f"DELETE FROM {table} WHERE {pk_column} IN ({placeholders})", params)
+            return cursor.rowcount
+
+    def run(self) -> RetentionResult:
+        started = time.monotonic()
+        checkpoint = self._load_checkpoint()
+        deleted = batches = 0
+        completed = False
+
+        while True:
+            rows = self._next_batch(checkpoint)
+            if not rows:
+                completed = True
+                break
+
+            deleted += self._delete_batch([pk for pk, _ in rows])
+            batches += 1
+            checkpoint = rows[-1][1]
+            cache.set(self.checkpoint_key, checkpoint.isoformat(), CHECKPOINT_TTL_SECONDS)
+
+            if len(rows) < self.batch_size:
+                completed = True
+                break
+            if self.max_seconds and time.monotonic() - started >= self.max_seconds:
+                break
+            if self.sleep_seconds:
+                # Give replicas time to catch up before the next batch.
+                time.sleep(self.sleep_seconds)
+
+        result = RetentionResult(
+            table=self.model._meta.db_table,
+            deleted=deleted,
+            batches=batches,
+            seconds=round(time.monotonic() - started, 3),
+            completed=completed,
+        )
+        logger.info(
+            "Retention delete finished" if completed else "Retention delete paused, will resume on next run",
+            extra={
+                "table": result.table,
+                "deleted": result.deleted,
+                "batches": result.batches,
+                "seconds": result.seconds,
+                "rows_per_second": result.rows_per_second,
+                "cutoff": self.cutoff.isoformat(),
+            },
+        )
+        return result
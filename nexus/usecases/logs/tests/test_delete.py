@@ -1,9 +1,14 @@
+import itertools
+from unittest.mock import patch
+
 import pendulum
+from django.core.cache import cache
 from django.test import TestCase
 from freezegun import freeze_time
 
 from nexus.logs.models import Message, MessageLog, RecentActivities
 from nexus.usecases.logs.delete import DeleteLogUsecase
+from nexus.usecases.logs.retention import RetentionDeleter
 
 from .logs_factory import RecentActivitiesFactory
 
@@ -26,6 +31,7 @@ class DeleteMessageLogsTestCase(TestCase):
         MessageLog.objects.create(message=message, created_at=pendulum.now())
 
     def setUp(self) -> None:
+        cache.clear()
         self.create_logs()
 
     def test_delete_log_routine(self):
@@ -37,6 +43,7 @@ class DeleteMessageLogsTestCase(TestCase):
 
 class DeleteOldActivitiesTestCase(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         RecentActivitiesFactory()
         with freeze_time(str(pendulum.now("UTC").subtract(months=4))):
             RecentActivitiesFactory.create_batch(
@@ -50,3 +57,54 @@ class DeleteOldActivitiesTestCase(TestCase):
         after_delete = RecentActivities.objects.count()
         self.assertEqual(before_delete, 11)
         self.assertEqual(1, after_delete)
+
+
+class RetentionDeleterTestCase(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        for day in range(10):
+            with freeze_time(str(pendulum.now().subtract(days=30 + day))):
+                message = Message.objects.create(text=f"Old {day}", contact_urn="contact_urn", status="S")
+                MessageLog.objects.create(message=message)
+        self.recent = Message.objects.create(text="Recent", contact_urn="contact_urn", status="S")
+        MessageLog.objects.create(message=self.recent)
+        self.cutoff = pendulum.now().subtract(days=7)
+
+    def test_deletes_in_batches_with_cascades(self):
+        result = RetentionDeleter(Message, self.cutoff, batch_size=3, sleep_seconds=0).run()
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.deleted, 10)
+        self.assertEqual(result.batches, 4)
+        self.assertEqual(list(Message.objects.values_list("pk", flat=True)), [self.recent.pk])
+        self.assertEqual(MessageLog.objects.get().message_id, self.recent.pk)
+
+    @patch("nexus.usecases.logs.retention.time.sleep")
+    def test_pauses_between_batches(self, mock_sleep):
+        RetentionDeleter(Message, self.cutoff, batch_size=4, sleep_seconds=0.25).run()
+
+        self.assertEqual(mock_sleep.call_count, 2)
+        mock_sleep.assert_called_with(0.25)
+
+    @patch("nexus.usecases.logs.retention.time.monotonic", side_effect=itertools.count(0, 100))
+    def test_resumes_from_checkpoint(self, _mock_monotonic):
+        first = RetentionDeleter(Message, self.cutoff, batch_size=4, sleep_seconds=0, max_seconds=50).run()
+
+        self.assertFalse(first.completed)
+        self.assertEqual(first.deleted, 4)
+        self.assertEqual(Message.objects.count(), 7)
+
+        oldest_left = Message.objects.order_by("created_at").first().created_at
+        deleter = RetentionDeleter(Message, self.cutoff, batch_size=100, sleep_seconds=0, max_seconds=0)
+        self.assertLessEqual(deleter._load_checkpoint(), oldest_left)
+
+        second = deleter.run()
+        self.assertTrue(second.completed)
+        self.assertEqual(second.deleted, 6)
+        self.assertEqual(Message.objects.count(), 1)
+
+    def test_rejects_nested_cascades(self):
+        from nexus.projects.models import Project
+
+        with self.assertRaises(ValueError):
+            RetentionDeleter(Project, self.cutoff)
@@ -8,14 +8,25 @@ def get_datasource_id(project_uuid: str | None) -> str:
 
             from nexus.projects.models import Project
 
-            project = Project.objects.get(uuid=project_uuid)
-            if (
-                project.bedrock_ingestion_strategy == Project.BEDROCK_INGESTION_DIRECT
-                and settings.AWS_BEDROCK_DIRECT_DATASOURCE_ID
-            ):
-                return settings.AWS_BEDROCK_DIRECT_DATASOURCE_ID
+            return get_project_datasource_id(Project.objects.get(uuid=project_uuid))
         except (Project.DoesNotExist, ValidationError):
             pass
     if project_uuid in settings.PROJECTS_WITH_LARGE_DATASOURCE:
         return settings.AWS_BEDROCK_LARGE_DATASOURCE_ID
     return settings.AWS_BEDROCK_DATASOURCE_ID
+
+
+def get_project_datasource_id(project) -> str:
+    """Same as get_datasource_id for an already loaded project, or None for no project."""
+    from nexus.projects.models import Project
+
+    if project is None:
+        return settings.AWS_BEDROCK_DATASOURCE_ID
+    if (
+        project.bedrock_ingestion_strategy == Project.BEDROCK_INGESTION_DIRECT
+        and settings.AWS_BEDROCK_DIRECT_DATASOURCE_ID
+    ):
+        return settings.AWS_BEDROCK_DIRECT_DATASOURCE_ID
+    if str(project.uuid) in settings.PROJECTS_WITH_LARGE_DATASOURCE:
+        return settings.AWS_BEDROCK_LARGE_DATASOURCE_ID
+    return settings.AWS_BEDROCK_DATASOURCE_ID
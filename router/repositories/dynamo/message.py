@@ -3,8 +3,11 @@ import json
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import pendulum
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 
 from router.infrastructure.database.dynamo import get_message_table
 from router.repositories import Repository
@@ -113,6 +116,51 @@ class MessageRepository(Repository):
                 logger.error(f"Error querying messages: {str(e)}")
                 raise e
 
+    def _conversation_query_params(
+        self,
+        project_uuid: str,
+        contact_urn: str,
+        channel_uuid: str,
+        start_date: str = None,
+        end_date: str = None,
+        resolution_status: int = None,
+    ) -> dict:
+        conversation_key = f"{project_uuid}#{contact_urn}#{channel_uuid}"
+
+        # Build query parameters
+        expression_values = {":conv_key": conversation_key}
+
+        # Use KeyConditionExpression for efficient querying
+        if start_date and end_date:
+            start_sortable = self._convert_to_dynamo_sortable_timestamp(start_date)
+            end_sortable = self._convert_to_dynamo_sortable_timestamp(end_date)
+            # Use sort key in KeyConditionExpression for better performance
+            key_condition = "conversation_key = :conv_key AND message_timestamp BETWEEN :start AND :end"
+            expression_values[":start"] = f"{start_sortable}#"
+            expression_values[":end"] = f"{end_sortable}#"
+        else:
+            # No time range - just query by conversation
+            key_condition = "conversation_key = :conv_key"
+
+        # Build FilterExpression only for non-key attributes
+        filter_parts = []
+        if resolution_status is not None:
+            filter_parts.append("resolution_status = :resolution")
+            expression_values[":resolution"] = resolution_status
+
+        # Build query parameters
+        query_params = {
+            "KeyConditionExpression": key_condition,
+            "ExpressionAttributeValues": expression_values,
+            "ScanIndexForward": True,  # Chronological order
+        }
+
+        # Only add FilterExpression if we have filters
+        if filter_parts:
+            query_params["FilterExpression"] = " AND ".join(filter_parts)
+
+        return query_params
+
     def get_messages_for_conversation(
         self,
         project_uuid: str,
@@ -123,44 +171,60 @@ class MessageRepository(Repository):
         resolution_status: int = None,
     ) -> list:
         """Get messages for a specific conversation, optionally filtered by time range and resolution."""
-        conversation_key = f"{project_uuid}#{contact_urn}#{channel_uuid}"
+        query_params = self._conversation_query_params(
+            project_uuid, contact_urn, channel_uuid, start_date, end_date, resolution_status
+        )
 
         with get_message_table() as table:
-            # Build query parameters
-            expression_values = {":conv_key": conversation_key}
-
-            # Use KeyConditionExpression for efficient querying
-            if start_date and end_date:
-                start_sortable = self._convert_to_dynamo_sortable_timestamp(start_date)
-                end_sortable = self._convert_to_dynamo_sortable_timestamp(end_date)
-                # Use sort key in KeyConditionExpression for better performance
-                key_condition = "conversation_key = :conv_key AND message_timestamp BETWEEN :start AND :end"
-                expression_values[":start"] = f"{start_sortable}#"
-                expression_values[":end"] = f"{end_sortable}#"
-            else:
-                # No time range - just query by conversation
-                key_condition = "conversation_key = :conv_key"
-
-            # Build FilterExpression only for non-key attributes
-            filter_parts = []
-            if resolution_status is not None:
-                filter_parts.append("resolution_status = :resolution")
-                expression_values[":resolution"] = resolution_status
+            response = table.query(**query_params)
 
-            # Build query parameters
-            query_params = {
-                "KeyConditionExpression": key_condition,
-                "ExpressionAttributeValues": expression_values,
-                "ScanIndexForward": True,  # Chronological order
-            }
+            return [self._format_message(item) for item in response["Items"]]
 
-            # Only add FilterExpression if we have filters
-            if filter_parts:
-                query_params["FilterExpression"] = " AND ".join(filter_parts)
+    def get_messages_for_conversations(
+        self, project_uuid: str, conversations: List[dict], max_workers: int = 10
+    ) -> List[Optional[list]]:
+        """
+        Get messages for many conversations at once, in the order given.
+
+        Each item of ``conversations`` holds the keyword arguments of
+        get_messages_for_conversation except project_uuid. DynamoDB cannot
+        query several partitions in one call, and BatchGetItem needs full
+        keys rather than time ranges, so the queries run in parallel on the
+        table's low-level client, which unlike the resource is thread-safe.
+        A conversation whose query fails is logged and returned as None, so
+        one failure does not lose the rest of the batch.
+        """
+        if not conversations:
+            return []
 
-            response = table.query(**query_params)
+        serializer = TypeSerializer()
+        deserializer = TypeDeserializer()
 
-            return [self._format_message(item) for item in response["Items"]]
+        with get_message_table() as table:
+            client = table.meta.client
+
+            def query(conversation: dict) -> Optional[list]:
+                query_params = self._conversation_query_params(project_uuid, **conversation)
+                query_params["ExpressionAttributeValues"] = {
+                    name: serializer.serialize(value)
+                    for name, value in query_params["ExpressionAttributeValues"].items()
+                }
+                try:
+                    response = client.query(TableName=table.name, **query_params)
+                except Exception as e:
+                    logger.warning(
+                        f"Error querying conversation messages: {str(e)}",
+                        extra={"project_uuid": project_uuid, "contact_urn": conversation.get("contact_urn")},
+                    )
+                    return None
+                return [
+                    self._format_message({key: deserializer.deserialize(value) for key, value in item.items()})
+                    for item in response["Items"]
+                ]
+
+            workers = min(max_workers, len(conversations))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dynamo-messages") as executor:
+                return list(executor.map(query, conversations))
 
     def _format_message(self, item: dict) -> dict:
         """Format message item for consistent output."""
@@ -1,6 +1,6 @@
 # Mock repositories for unit tests and local development
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from router.repositories import Repository
 from router.repositories.entities import ResolutionEntities
@@ -34,6 +34,11 @@ class MockRepository(Repository):
     ) -> list:
         return []
 
+    def get_messages_for_conversations(
+        self, project_uuid: str, conversations: List[dict], max_workers: int = 10
+    ) -> List[list]:
+        return [[] for _ in conversations]
+
     def _format_message(self, item: dict) -> dict:
         return {
             "text": item["message_text"],
@@ -92,6 +97,11 @@ class MockCacheRepository(Repository):
         if key in self._cache:
             del self._cache[key]
 
+    def delete_many(self, keys: Iterable[str], batch_size: int = 1000) -> None:
+        """Delete many keys."""
+        for key in keys:
+            self._cache.pop(key, None)
+
     def delete_pattern(self, pattern: str) -> None:
         """Delete all keys matching pattern."""
         import fnmatch
@@ -1,5 +1,5 @@
 import json
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from redis import Redis
 
@@ -34,6 +34,15 @@ class CacheRepository(Repository):
         """Delete key from cache - uses primary."""
         self._write_client.delete(key)
 
+    def delete_many(self, keys: Iterable[str], batch_size: int = 1000) -> None:
+        """Delete many keys with pipelined UNLINKs (one round trip per batch) - uses primary."""
+        keys = list(keys)
+        for start in range(0, len(keys), batch_size):
+            pipeline = self._write_client.pipeline(transaction=False)
+            for key in keys[start : start + batch_size]:
+                pipeline.unlink(key)
+            pipeline.execute()
+
     def delete_pattern(self, pattern: str) -> None:
         """Delete all keys matching pattern - uses primary."""
         keys = self._read_client.keys(pattern)
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from router.repositories import Repository
 
@@ -334,6 +334,22 @@ class CacheService:
         else:
             self._invalidate_cache_type(project_uuid, "team", fetch_func, agents_backend)
 
+    def invalidate_team_caches(self, projects: Iterable[Tuple[str, str]]) -> int:
+        """
+        Drop team caches for many (project_uuid, agents_backend) pairs in one pipelined delete.
+
+        Unlike invalidate_team_cache nothing is refetched here: the team,
+        inline agent config and composite keys are removed and the next
+        request for each project rebuilds them on a cache miss.
+        """
+        keys = []
+        for project_uuid, agents_backend in projects:
+            keys.append(self._get_cache_key(project_uuid, "team", agents_backend))
+            keys.append(self._get_cache_key(project_uuid, "inline_agent_config"))
+            keys.append(f"project:{project_uuid}:all")
+        self.cache_repository.delete_many(keys)
+        return len(keys) // 3
+
     def invalidate_guardrails_cache(
         self,
         project_uuid: str,
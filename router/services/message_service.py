@@ -122,6 +122,10 @@ class MessageService:
             project_uuid, contact_urn, channel_uuid, start_date, end_date, resolution_status
         )
 
+    def get_messages_for_conversations(self, project_uuid: str, conversations: list, max_workers: int = 10) -> list:
+        """Get messages for many conversations of a project at once, in the order given; None where a query failed."""
+        return self.message_repository.get_messages_for_conversations(project_uuid, conversations, max_workers)
+
     def _get_conversation_service(self):
         """Get conversation service instance, creating it if it doesn't exist."""
         if self._conversation_service is None:
@@ -252,6 +252,47 @@ class GuardrailsCompositeCacheTestCase(SimpleTestCase):
         self.assertEqual(self.repository.get(composite_key)["guardrails"], fresh_guardrails)
 
 
+class BulkTeamCacheInvalidationTestCase(SimpleTestCase):
+    def setUp(self):
+        self.repository = MockCacheRepository()
+        self.cache_service = CacheService(cache_repository=self.repository)
+
+    def test_drops_team_config_and_composite_keys_only(self):
+        for project_uuid in ("p1", "p2", "p3"):
+            for suffix in ("team:BedrockBackend", "inline_agent_config", "all", "data"):
+                self.repository.set(f"project:{project_uuid}:{suffix}", {"x": 1}, ttl=3600)
+
+        invalidated = self.cache_service.invalidate_team_caches([("p1", "BedrockBackend"), ("p2", "BedrockBackend")])
+
+        self.assertEqual(invalidated, 2)
+        self.assertEqual(
+            sorted(self.repository.get_all_keys()),
+            [
+                "project:p1:data",
+                "project:p2:data",
+                "project:p3:all",
+                "project:p3:data",
+                "project:p3:inline_agent_config",
+                "project:p3:team:BedrockBackend",
+            ],
+        )
+
+    def test_redis_repository_pipelines_deletes_in_batches(self):
+        from unittest.mock import Mock
+
+        from router.repositories.redis.cache import CacheRepository
+
+        redis_client = Mock()
+        repository = CacheRepository(redis_client=redis_client)
+
+        repository.delete_many([f"key:{i}" for i in range(5)], batch_size=2)
+
+        self.assertEqual(redis_client.pipeline.call_count, 3)
+        self.assertEqual(redis_client.pipeline.return_value.unlink.call_count, 5)
+        self.assertEqual(redis_client.pipeline.return_value.execute.call_count, 3)
+        redis_client.delete.assert_not_called()
+
+
 class CacheRepositoryTestCase(SimpleTestCase):
     """Example test case using MockCacheRepository directly."""
 
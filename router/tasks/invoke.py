@@ -1,7 +1,10 @@
 import json
 import logging
 import os
+import threading
 import uuid
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, Optional, Tuple
 from uuid import UUID
 
@@ -14,6 +17,7 @@ import sentry_sdk
 from django.conf import settings
 
 from inline_agents.backends import BackendsRegistry
+from inline_agents.backends.openai.grpc.streaming_client import is_grpc_enabled
 from inline_agents.backends.openai.invoke_result import InvokeAgentsResult
 from inline_agents.backends.openai.legacy_formatter_pipeline import is_new_pipeline_sentinel
 from inline_agents.backends.openai.message_context import extract_message_context
@@ -303,9 +307,11 @@ def _preprocess_message_input(
     message: Dict,
     backend: str,
     guardrails_config: Optional[Dict] = None,
+    speculative_guardrail: bool = False,
 ) -> Tuple[Dict, Optional[str], bool]:
     """
     Handles project ApplyGuardrail gate, complexity layer, attachments, and product items.
+    With speculative_guardrail the gate is left to the caller (see _resolve_speculative_guardrail).
     """
     from nexus.usecases.guardrails.project_guardrails_config import ProjectGuardrailsConfigUseCase
 
@@ -326,9 +332,10 @@ def _preprocess_message_input(
     if overwrite_message:
         text = handle_overwrite_message(text, overwrite_message)
 
-    blocking_message = ProjectGuardrailsConfigUseCase.apply_input_guardrail(text, guardrails_config)
-    if blocking_message:
-        raise UnsafeMessageException(blocking_message)
+    if not speculative_guardrail:
+        blocking_message = ProjectGuardrailsConfigUseCase.apply_input_guardrail(text, guardrails_config)
+        if blocking_message:
+            raise UnsafeMessageException(blocking_message)
 
     if not text.strip():
         raise EmptyTextException(
@@ -341,6 +348,57 @@ def _preprocess_message_input(
     return processed_message, foundation_model, turn_off_rationale
 
 
+def _speculative_guardrail_allowed(
+    agents_backend: str,
+    project_dict: Dict,
+    team: list,
+    preview: bool,
+    preview_websocket: bool,
+    stream_support: bool,
+) -> bool:
+    """
+    Speculate only when nothing can reach the contact before the verdict: no token streaming,
+    rationale, preview traces, human handoff, or collaborator tools that send messages themselves.
+    """
+    if not settings.GUARDRAILS_SPECULATIVE_INPUT_CHECK or agents_backend != "OpenAIBackend":
+        return False
+    if preview or preview_websocket or team:
+        return False
+    if project_dict.get("rationale_switch") or project_dict.get("human_support"):
+        return False
+    return not is_grpc_enabled(project_dict.get("uuid"), project_dict.get("use_components", False), stream_support)
+
+
+def _cancel_generation_on_block(pending_guardrail: Future, cancel_event: threading.Event) -> None:
+    """Done-callback of the speculative guardrail: stop the running generation when the input is blocked."""
+    if pending_guardrail.cancelled() or pending_guardrail.exception() is not None:
+        return
+    if pending_guardrail.result():
+        cancel_event.set()
+
+
+def _resolve_speculative_guardrail(
+    pending_guardrail: Optional[Future],
+    text: str = "",
+    guardrails_config: Optional[Dict] = None,
+) -> None:
+    """
+    Wait for a guardrail started alongside generation; discard the response if it blocked the input.
+    A verdict that is not ready within GUARDRAILS_SPECULATIVE_RESULT_TIMEOUT falls back to the blocking check.
+    """
+    from nexus.usecases.guardrails.project_guardrails_config import ProjectGuardrailsConfigUseCase
+
+    if pending_guardrail is None:
+        return
+    try:
+        blocking_message = pending_guardrail.result(timeout=settings.GUARDRAILS_SPECULATIVE_RESULT_TIMEOUT)
+    except FutureTimeoutError:
+        logger.warning("Speculative guardrail verdict timed out; running the blocking check")
+        blocking_message = ProjectGuardrailsConfigUseCase.apply_input_guardrail(text, guardrails_config)
+    if blocking_message:
+        raise UnsafeMessageException(blocking_message)
+
+
 def _manage_pending_task(task_manager: RedisTaskManager, message_obj, current_task_id: str) -> str:
     """
     Handles revoking old tasks and concatenating messages for rapid inputs.
@@ -444,6 +502,7 @@ def _invoke_backend(
     *,
     replace_manager_pipeline_version: bool = False,
     manager_pipeline_version: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Tuple[str, bool]:
     """
     Invoke backend with cached data to avoid database queries.
@@ -462,6 +521,9 @@ def _invoke_backend(
     if replace_manager_pipeline_version:
         invoke_kwargs["manager_pipeline_version"] = manager_pipeline_version
 
+    if cancel_event is not None:
+        invoke_kwargs["cancel_event"] = cancel_event
+
     # Add non-cached parameters that come from the message/request
     invoke_kwargs.update(
         {
@@ -537,13 +599,15 @@ def start_inline_agents(  # noqa: C901
     status = TURN_STATUS_SUCCESS
     flows_user_email = os.environ.get("FLOW_USER_EMAIL")
     agents_backend = "OpenAIBackend"
+    pending_guardrail = None
+    cancel_generation = None
 
     try:
         try:
             incoming_created_at = None
 
             with recorder.phase(PHASE_ORCHESTRATION):
-                TypingUsecase().send_typing_message(
+                TypingUsecase().dispatch_typing_message(
                     contact_urn=message.get("contact_urn"),
                     msg_external_id=message.get("msg_event", {}).get("msg_external_id", ""),
                     project_uuid=project_uuid,
@@ -571,11 +635,30 @@ def start_inline_agents(  # noqa: C901
                     stream_support=message.get("stream_support", False),
                 )
 
+                speculative_guardrail = _speculative_guardrail_allowed(
+                    agents_backend,
+                    project_dict,
+                    team_cached,
+                    preview=preview,
+                    preview_websocket=preview_websocket,
+                    stream_support=message.get("stream_support", False),
+                )
                 processed_message, foundation_model, turn_off_rationale = _preprocess_message_input(
                     message,
                     agents_backend,
                     guardrails_config=guardrails_config,
+                    speculative_guardrail=speculative_guardrail,
                 )
+                if speculative_guardrail:
+                    from nexus.usecases.guardrails.project_guardrails_config import ProjectGuardrailsConfigUseCase
+
+                    cancel_generation = threading.Event()
+                    pending_guardrail = ProjectGuardrailsConfigUseCase.submit_input_guardrail(
+                        processed_message["text"], guardrails_config
+                    )
+                    pending_guardrail.add_done_callback(
+                        lambda future: _cancel_generation_on_block(future, cancel_generation)
+                    )
                 foundation_model = apply_simulation_foundation_model_override(
                     simulation_channel_effective,
                     project_uuid or "",
@@ -662,8 +745,11 @@ def start_inline_agents(  # noqa: C901
                     injected_context=injected_context,
                     replace_manager_pipeline_version=True,
                     manager_pipeline_version=effective_manager_pipeline_version,
+                    cancel_event=cancel_generation,
                 )
 
+            _resolve_speculative_guardrail(pending_guardrail, processed_message["text"], guardrails_config)
+
             if (response is None or response == "") and not skip_dispatch:
                 raise EmptyFinalResponseException("Final response is empty")
 
@@ -1,8 +1,16 @@
+import threading
+from concurrent.futures import Future
 from unittest.mock import patch
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 
-from router.tasks.invoke import UnsafeMessageException, _preprocess_message_input
+from router.tasks.invoke import (
+    UnsafeMessageException,
+    _cancel_generation_on_block,
+    _preprocess_message_input,
+    _resolve_speculative_guardrail,
+    _speculative_guardrail_allowed,
+)
 
 
 class PreprocessApplyGuardrailTestCase(SimpleTestCase):
@@ -75,3 +83,84 @@ class PreprocessApplyGuardrailTestCase(SimpleTestCase):
         self.assertIn("https://example.com/a.png", composed_text)
         self.assertIn("product items", composed_text)
         self.assertIn("blocked politics payload", composed_text)
+
+    @patch("nexus.usecases.guardrails.project_guardrails_config.ProjectGuardrailsConfigUseCase.apply_input_guardrail")
+    def test_speculative_mode_leaves_gate_to_caller(self, mock_apply):
+        message = {"text": "politics question", "attachments": [], "metadata": {}}
+
+        processed, _, _ = _preprocess_message_input(
+            message,
+            "OpenAIBackend",
+            guardrails_config={"has_blocked_category": True},
+            speculative_guardrail=True,
+        )
+
+        self.assertEqual(processed["text"], "politics question")
+        mock_apply.assert_not_called()
+
+
+class ResolveSpeculativeGuardrailTestCase(SimpleTestCase):
+    def _future(self, result):
+        future = Future()
+        future.set_result(result)
+        return future
+
+    def test_blocked_verdict_discards_response(self):
+        with self.assertRaises(UnsafeMessageException) as ctx:
+            _resolve_speculative_guardrail(self._future("Project blocked this topic"))
+
+        self.assertEqual(ctx.exception.message, "Project blocked this topic")
+
+    def test_allowed_verdict_passes(self):
+        _resolve_speculative_guardrail(self._future(None))
+
+    def test_no_pending_check_passes(self):
+        _resolve_speculative_guardrail(None)
+
+    @override_settings(GUARDRAILS_SPECULATIVE_RESULT_TIMEOUT=0.01)
+    @patch("nexus.usecases.guardrails.project_guardrails_config.ProjectGuardrailsConfigUseCase.apply_input_guardrail")
+    def test_slow_verdict_falls_back_to_blocking_check(self, mock_apply):
+        mock_apply.return_value = "Project blocked this topic"
+
+        with self.assertRaises(UnsafeMessageException):
+            _resolve_speculative_guardrail(Future(), "politics question", {"has_blocked_category": True})
+
+        mock_apply.assert_called_once_with("politics question", {"has_blocked_category": True})
+
+    def test_blocked_verdict_cancels_generation(self):
+        cancel_event = threading.Event()
+        _cancel_generation_on_block(self._future(None), cancel_event)
+        self.assertFalse(cancel_event.is_set())
+
+        _cancel_generation_on_block(self._future("Project blocked this topic"), cancel_event)
+        self.assertTrue(cancel_event.is_set())
+
+
+@override_settings(GUARDRAILS_SPECULATIVE_INPUT_CHECK=True, GRPC_ENABLED_PROJECTS=["*"])
+class SpeculativeGuardrailAllowedTestCase(SimpleTestCase):
+    project = {"uuid": "p1", "use_components": False, "rationale_switch": False, "human_support": False}
+
+    def _allowed(self, project=None, team=(), preview=False, stream_support=False, backend="OpenAIBackend"):
+        return _speculative_guardrail_allowed(
+            backend,
+            {**self.project, **(project or {})},
+            list(team),
+            preview=preview,
+            preview_websocket=False,
+            stream_support=stream_support,
+        )
+
+    def test_allowed_when_nothing_is_sent_before_the_final_dispatch(self):
+        self.assertTrue(self._allowed())
+
+    def test_off_when_messages_can_reach_the_contact_mid_run(self):
+        self.assertFalse(self._allowed(stream_support=True))
+        self.assertFalse(self._allowed(team=[{"name": "Orders agent"}]))
+        self.assertFalse(self._allowed(project={"rationale_switch": True}))
+        self.assertFalse(self._allowed(project={"human_support": True}))
+        self.assertFalse(self._allowed(preview=True))
+        self.assertFalse(self._allowed(backend="BedrockBackend"))
+
+    @override_settings(GUARDRAILS_SPECULATIVE_INPUT_CHECK=False)
+    def test_off_unless_enabled(self):
+        self.assertFalse(self._allowed())
@@ -104,9 +104,8 @@ class TypingIndicatorObserver(EventObserver):
         try:
             usecase = self._get_typing_usecase()
 
-            # TypingUsecase is synchronous, but we're in an async observer
-            # The call is quick (HTTP request with timeout), so we run it directly
-            usecase.send_typing_message(
+            # Hands the HTTP call to the typing pool so the event loop is not blocked
+            usecase.dispatch_typing_message(
                 contact_urn=contact_urn,
                 msg_external_id=msg_external_id or "",
                 project_uuid=project_uuid,
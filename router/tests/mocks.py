@@ -222,6 +222,21 @@ class MockTypingUsecase:
         if self.should_fail:
             raise Exception(self.fail_message)
 
+    def dispatch_typing_message(
+        self,
+        contact_urn: str,
+        msg_external_id: str,
+        project_uuid: str,
+        preview: bool = False,
+    ) -> None:
+        """Mock dispatch_typing_message; recorded the same way as send_typing_message."""
+        self.send_typing_message(
+            contact_urn=contact_urn,
+            msg_external_id=msg_external_id,
+            project_uuid=project_uuid,
+            preview=preview,
+        )
+
     def reset(self) -> None:
         """Clear all recorded calls."""
         self.calls.clear()